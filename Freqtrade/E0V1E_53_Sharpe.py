@@ -1,7 +1,11 @@
 from datetime import datetime, timedelta
+import json
+import os
+from pathlib import Path
 import talib.abstract as ta
 import pandas_ta as pta
-from freqtrade.persistence import Trade
+from freqtrade.enums import RunMode
+from freqtrade.persistence import Order, Trade
 from freqtrade.strategy.interface import IStrategy
 from pandas import DataFrame
 from freqtrade.strategy import DecimalParameter, IntParameter
@@ -9,8 +13,9 @@ from functools import reduce
 import warnings
 
 warnings.simplefilter(action="ignore", category=RuntimeWarning)
-TMP_HOLD = []
-TMP_HOLD1 = []
+
+# Last candle fields read by custom_exit
+EXIT_CANDLE_COLUMNS = ['close', 'high', 'ma120', 'ma240', 'fastk', 'cci']
 
 class E0V1E_53_Sharpe(IStrategy):
     # Optimized minimal ROI
@@ -52,6 +57,53 @@ class E0V1E_53_Sharpe(IStrategy):
     sell_loss_cci = IntParameter(low=0, high=600, default=112, space='sell', optimize=True)
     sell_loss_cci_profit = DecimalParameter(-0.15, 0, default=-0.15, decimals=2, space='sell', optimize=True)
 
+    def __init__(self, config: dict) -> None:
+        super().__init__(config)
+        # Per trade state, trade ids: seen above ma120/ma240 (hold) / below both (hold1)
+        self.tmp_hold = set()
+        self.tmp_hold1 = set()
+        # pair -> (candle date, last candle fields), built once per candle
+        self.exit_candles = {}
+        self.trade_state_path = None
+        if config.get('runmode') in (RunMode.LIVE, RunMode.DRY_RUN) and config.get('user_data_dir'):
+            self.trade_state_path = Path(config['user_data_dir']) / f'{self.__class__.__name__}-trade-state.json'
+
+    def bot_start(self, **kwargs) -> None:
+        if self.trade_state_path is None or not self.trade_state_path.is_file():
+            return
+        with self.trade_state_path.open() as f:
+            state = json.load(f)
+        # Trades closed while the bot was down
+        open_trade_ids = {trade.id for trade in Trade.get_trades_proxy(is_open=True)}
+        self.tmp_hold = set(state.get('tmp_hold', [])) & open_trade_ids
+        self.tmp_hold1 = set(state.get('tmp_hold1', [])) & open_trade_ids
+
+    def save_trade_state(self) -> None:
+        if self.trade_state_path is None:
+            return
+        tmp_path = self.trade_state_path.with_suffix('.tmp')
+        with tmp_path.open('w') as f:
+            json.dump({'tmp_hold': sorted(self.tmp_hold), 'tmp_hold1': sorted(self.tmp_hold1)}, f)
+        os.replace(tmp_path, self.trade_state_path)
+
+    def order_filled(self, pair: str, trade: Trade, order: Order, current_time: datetime, **kwargs) -> None:
+        # Backtesting calls this before trade.close(), detect the closing fill from the order
+        closing_fill = order.ft_order_side == trade.exit_side and order.safe_filled >= trade.amount
+        if (closing_fill or not trade.is_open) and (trade.id in self.tmp_hold or trade.id in self.tmp_hold1):
+            self.tmp_hold.discard(trade.id)
+            self.tmp_hold1.discard(trade.id)
+            self.save_trade_state()
+
+    def get_exit_candle(self, pair: str) -> dict:
+        dataframe, _ = self.dp.get_analyzed_dataframe(pair=pair, timeframe=self.timeframe)
+        candle_date = dataframe['date'].iat[-1]
+        cached = self.exit_candles.get(pair)
+        if cached is None or cached[0] != candle_date:
+            last_index = len(dataframe) - 1
+            cached = (candle_date, {column: dataframe[column].iat[last_index] for column in EXIT_CANDLE_COLUMNS})
+            self.exit_candles[pair] = cached
+        return cached[1]
+
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         dataframe['sma_15'] = ta.SMA(dataframe, timeperiod=15)
         dataframe['cti'] = pta.cti(dataframe["close"], length=20)
@@ -102,17 +154,18 @@ class E0V1E_53_Sharpe(IStrategy):
 
     def custom_exit(self, pair: str, trade: 'Trade', current_time: 'datetime', current_rate: float,
                     current_profit: float, **kwargs):
-        dataframe, _ = self.dp.get_analyzed_dataframe(pair=pair, timeframe=self.timeframe)
-        current_candle = dataframe.iloc[-1].squeeze()
+        current_candle = self.get_exit_candle(pair)
 
         min_profit = trade.calc_profit_ratio(trade.min_rate)
 
         if current_candle['close'] > current_candle["ma120"] or current_candle['close'] > current_candle["ma240"]:
-            if trade.id not in TMP_HOLD:
-                TMP_HOLD.append(trade.id)
+            if trade.id not in self.tmp_hold:
+                self.tmp_hold.add(trade.id)
+                self.save_trade_state()
         else:
-            if trade.id not in TMP_HOLD1:
-                TMP_HOLD1.append(trade.id)
+            if trade.id not in self.tmp_hold1:
+                self.tmp_hold1.add(trade.id)
+                self.save_trade_state()
 
         if current_profit > 0:
             if current_candle["fastk"] > self.sell_fastx.value:
@@ -123,16 +176,18 @@ class E0V1E_53_Sharpe(IStrategy):
                 if current_candle["cci"] > self.sell_loss_cci.value:
                     return "cci_loss_sell"
 
-        if trade.id in TMP_HOLD and current_candle["close"] < current_candle["ma120"] and current_candle["close"] < \
+        if trade.id in self.tmp_hold and current_candle["close"] < current_candle["ma120"] and current_candle["close"] < \
                 current_candle["ma240"]:
             if min_profit <= -0.05:
-                TMP_HOLD.remove(trade.id)
+                self.tmp_hold.discard(trade.id)
+                self.save_trade_state()
                 return "ma120_sell"
 
-        if trade.id in TMP_HOLD1:
+        if trade.id in self.tmp_hold1:
             if current_candle["high"] > current_candle["ma120"] or current_candle["high"] > current_candle["ma240"]:
                 if current_time - timedelta(minutes=5) > trade.open_date_utc:
-                    TMP_HOLD1.remove(trade.id)
+                    self.tmp_hold1.discard(trade.id)
+                    self.save_trade_state()
                     return "cross_120_or_240_sell"
 
         return None
@@ -1,6 +1,15 @@
+import ast
+import atexit
+import bisect
 import copy
+import hashlib
+import inspect
 import logging
+import operator
+import os
 import pathlib
+import re
+import shutil
 import rapidjson
 import numpy as np
 import talib.abstract as ta
@@ -9,7 +18,7 @@ import pandas_ta as pta
 from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy import merge_informative_pair
 from pandas import DataFrame, Series
-from functools import reduce
+from functools import lru_cache, reduce
 from freqtrade.persistence import Trade
 from datetime import datetime, timedelta
 import time
@@ -98,6 +107,23 @@ class NostalgiaForInfinityX6(IStrategy):
   # Do you want to use the hold feature? (with hold-trades.json)
   hold_support_enabled = True
 
+  # Memory compact mode for the analyzed dataframes (lossless float32 only, bool protections,
+  # only the columns read by the exit/adjust logic are kept after the entry signals are set)
+  memory_compact_mode = False
+
+  # Compute only the indicators read by the enabled entry signals and by the exit logic
+  prune_unused_indicators = False
+
+  # Precompute the long/short exit signals per candle and profit band, the per trade check is a lookup
+  precompute_exit_signals = False
+
+  # Collect the timings per pair and per function, dumped as a summary table and a flamegraph file at exit
+  profiling_mode = False
+
+  # Reuse the informative timeframes indicators while their candles are unchanged, and persist them at
+  # shutdown (live/dry-run), so a restart only recomputes the timeframes that got new candles
+  cache_informative_frames = False
+
   # Run "populate_indicators()" only for new candle.
   process_only_new_candles = True
 
@@ -644,6 +670,23 @@ class NostalgiaForInfinityX6(IStrategy):
 
   hold_trades_cache = None
   target_profit_cache = None
+  # The hold trades config is checked for changes at most once per bot loop
+  hold_trades_config_checked = False
+  # Analyzed dataframe bytes per pair, before and after the memory compaction
+  memory_compact_stats = None
+  # Columns read from the analyzed candles at runtime (parsed once from the source)
+  _runtime_candle_columns = None
+  _float64_checked_columns = None
+  # Per trade sums of the filled orders (set per instance in __init__)
+  filled_orders_aggregates_cache = None
+  # Open trades snapshot, rebuilt on every bot loop (set per instance in __init__)
+  open_trades_index = None
+  # Exit signals precomputed per candle (set per instance in __init__)
+  exit_signals_precompute = None
+  # Timings registry (set per instance in __init__ when profiling_mode is enabled)
+  profiler = None
+  # Informative timeframes indicators (set per instance in __init__ when cache_informative_frames is enabled)
+  informative_frames = None
   #############################################################
   #
   #
@@ -699,6 +742,11 @@ class NostalgiaForInfinityX6(IStrategy):
       "grind_mode_max_slots",
       "grind_mode_coins",
       "max_slippage",
+      "memory_compact_mode",
+      "prune_unused_indicators",
+      "precompute_exit_signals",
+      "profiling_mode",
+      "cache_informative_frames",
     ]
 
     if "ccxt_config" not in config["exchange"]:
@@ -787,9 +835,68 @@ class NostalgiaForInfinityX6(IStrategy):
     # If the cached data hasn't changed, it's a no-op
     self.target_profit_cache.save()
 
+    self.filled_orders_aggregates_cache = {}
+    self.memory_compact_stats = {}
+
+    # One bitmask per mode (X_mode_tags -> X_mode_mask), the enter tags are dispatched with integer tests
+    self.mode_tag_masks = ModeTagMasks({name: getattr(self, name) for name in MODE_TAGS_ATTRIBUTES})
+    for name, mask in self.mode_tag_masks.masks.items():
+      setattr(self, f"{name[: -len('_tags')]}_mask", mask)
+
+    self.open_trades_index = OpenTradesIndex(
+      self.mode_tag_masks,
+      {
+        self.long_normal_mode_name: self.long_normal_mode_mask,
+        self.long_pump_mode_name: self.long_pump_mode_mask,
+        self.long_quick_mode_name: self.long_quick_mode_mask,
+        self.long_rebuy_mode_name: self.long_rebuy_mode_mask,
+        self.long_high_profit_mode_name: self.long_mode_mask,
+        self.long_rapid_mode_name: self.long_rapid_mode_mask,
+        self.long_grind_mode_name: self.long_grind_mode_mask,
+        self.long_top_coins_mode_name: self.long_top_coins_mode_mask,
+        self.long_scalp_mode_name: self.long_scalp_mode_mask,
+        self.short_normal_mode_name: self.short_normal_mode_mask,
+        self.short_pump_mode_name: self.short_pump_mode_mask,
+        self.short_quick_mode_name: self.short_quick_mode_mask,
+        self.short_rebuy_mode_name: self.short_rebuy_mode_mask,
+        self.short_high_profit_mode_name: self.short_mode_mask,
+        self.short_rapid_mode_name: self.short_rapid_mode_mask,
+        self.short_top_coins_mode_name: self.short_top_coins_mode_mask,
+        self.short_scalp_mode_name: self.short_scalp_mode_mask,
+      }
+    )
+
     # Parameter settings. Backward compatibility with the old configuration style.
     self.update_signals_from_config(self.config)
 
+    if self.prune_unused_indicators:
+      self.apply_indicator_pruning()
+
+    if self.precompute_exit_signals:
+      self.apply_exit_signals_precompute()
+
+    if self.profiling_mode:
+      self.apply_profiling()
+
+    if self.cache_informative_frames:
+      self.informative_frames = InformativeFramesCache(
+        self.config["user_data_dir"]
+        / "nfix6-informative-frames"
+        / (
+          (self.config["bot_name"] + "-" if "bot_name" in self.config else "")
+          + self.config["exchange"]["name"]
+          + "-"
+          + self.config["stake_currency"]
+        ),
+        strategy_version_hash(
+          f"{self.prune_unused_indicators}-{self.long_entry_signal_params}-{self.short_entry_signal_params}"
+        ),
+        self.startup_candle_count,
+      )
+      if self.config["runmode"].value in ("live", "dry_run"):
+        self.informative_frames.load()
+        atexit.register(self.informative_frames.save)
+
   # Plot configuration for FreqUI
   # ---------------------------------------------------------------------------------------------
   @property
@@ -881,17 +988,19 @@ class NostalgiaForInfinityX6(IStrategy):
           break
       if not is_derisk:
         is_derisk = trade.amount < (filled_entries[0].safe_filled * 0.95)
+    enter_tags_mask = self.get_enter_tags_mask(enter_tags)
     if previous_sell_reason in [f"exit_{mode_name}_stoploss_doom", f"exit_{mode_name}_stoploss"]:
-      is_rapid_mode = all(c in self.long_rapid_mode_tags for c in enter_tags)
-      is_rebuy_mode = all(c in self.long_rebuy_mode_tags for c in enter_tags) or (
-        any(c in self.long_rebuy_mode_tags for c in enter_tags)
-        and all(c in (self.long_rebuy_mode_tags + self.long_grind_mode_tags) for c in enter_tags)
+      is_rapid_mode = (enter_tags_mask & ~self.long_rapid_mode_mask) == 0
+      is_rebuy_mode = (enter_tags_mask & ~self.long_rebuy_mode_mask) == 0 or (
+        (enter_tags_mask & self.long_rebuy_mode_mask) != 0
+        and (enter_tags_mask & ~(self.long_rebuy_mode_mask | self.long_grind_mode_mask)) == 0
       )
-      is_scalp_mode = all(c in self.long_scalp_mode_tags for c in enter_tags) or (
-        any(c in self.long_scalp_mode_tags for c in enter_tags)
-        and all(
-          c in (self.long_scalp_mode_tags + self.long_rebuy_mode_tags + self.long_grind_mode_tags) for c in enter_tags
+      is_scalp_mode = (enter_tags_mask & ~self.long_scalp_mode_mask) == 0 or (
+        (enter_tags_mask & self.long_scalp_mode_mask) != 0
+        and (
+          enter_tags_mask & ~(self.long_scalp_mode_mask | self.long_rebuy_mode_mask | self.long_grind_mode_mask)
         )
+        == 0
       )
       if profit_init_ratio > 0.0:
         # profit is over the threshold, don't exit
@@ -960,7 +1069,7 @@ class NostalgiaForInfinityX6(IStrategy):
         self._remove_profit_target(pair)
         return False, None
       if trade.is_short:
-        is_scalp_mode = all(c in self.short_scalp_mode_tags for c in enter_tags)
+        is_scalp_mode = (enter_tags_mask & ~self.short_scalp_mode_mask) == 0
         if is_scalp_mode:
           if 0.001 <= profit_init_ratio < 0.01:
             if profit_init_ratio < (previous_profit - 0.008):
@@ -1223,7 +1332,7 @@ class NostalgiaForInfinityX6(IStrategy):
           elif profit_init_ratio < (previous_profit - 0.05) and (last_candle["ROC_9_4h"] < -40.0):
             return True, f"exit_profit_{mode_name}_t_12_3"
       else:
-        is_scalp_mode = all(c in self.long_scalp_mode_tags for c in enter_tags)
+        is_scalp_mode = (enter_tags_mask & ~self.long_scalp_mode_mask) == 0
         if is_scalp_mode:
           if 0.001 <= profit_init_ratio < 0.01:
             if profit_init_ratio < (previous_profit - 0.008):
@@ -1508,10 +1617,55 @@ class NostalgiaForInfinityX6(IStrategy):
     fee_open_rate = trade.fee_open if self.custom_fee_open_rate is None else self.custom_fee_open_rate
     fee_close_rate = trade.fee_close if self.custom_fee_close_rate is None else self.custom_fee_close_rate
 
+    total_amount, total_stake, total_profit = self._calc_filled_orders_aggregates(
+      trade, filled_entries, filled_exits, fee_open_rate, fee_close_rate
+    )
+    current_stake = 0.0
+    if trade.is_short:
+      current_stake = total_amount * exit_rate * (1 + fee_close_rate)
+      total_profit -= current_stake
+    else:
+      current_stake = total_amount * exit_rate * (1 - fee_close_rate)
+      total_profit += current_stake
+    if self.is_futures_mode:
+      total_profit += trade.funding_fees
+    total_profit_ratio = total_profit / total_stake
+    current_profit_ratio = total_profit / current_stake
+    init_profit_ratio = total_profit / filled_entries[0].cost
+    return total_profit, total_profit_ratio, current_profit_ratio, init_profit_ratio
+
+  # Calc Filled Orders Aggregates
+  # ---------------------------------------------------------------------------------------------
+  def _calc_filled_orders_aggregates(
+    self,
+    trade: "Trade",
+    filled_entries: "Orders",
+    filled_exits: "Orders",
+    fee_open_rate: float,
+    fee_close_rate: float,
+  ) -> tuple:
+    """
+    Returns the filled amount, the stake with fees and the running profit of the filled orders.
+
+    Filled orders don't change anymore, so the sums are cached per trade and only rebuilt when the
+    number of filled entries/exits (or the fee rates) change. The sums are accumulated in the exact same
+    order as before, so the results are bit-identical to looping over the orders on every call.
+
+    :param trade: trade object.
+    :param filled_entries: Filled entries list.
+    :param filled_exits: Filled exits list.
+    :param fee_open_rate: The open fee rate.
+    :param fee_close_rate: The close fee rate.
+    :return tuple: The filled amount, the total stake (with fees) and the profit without the current stake.
+    """
+    cache_key = (trade.open_date, len(filled_entries), len(filled_exits), fee_open_rate, fee_close_rate)
+    cached = self.filled_orders_aggregates_cache.get(trade.id)
+    if cached is not None and cached[0] == cache_key:
+      return cached[1]
+
     total_amount = 0.0
     total_stake = 0.0
     total_profit = 0.0
-    current_stake = 0.0
     for entry_order in filled_entries:
       if trade.is_short:
         entry_stake = entry_order.safe_filled * entry_order.safe_price * (1 - fee_open_rate)
@@ -1532,18 +1686,10 @@ class NostalgiaForInfinityX6(IStrategy):
         exit_stake = exit_order.safe_filled * exit_order.safe_price * (1 - fee_close_rate)
         total_amount -= exit_order.safe_filled
         total_profit += exit_stake
-    if trade.is_short:
-      current_stake = total_amount * exit_rate * (1 + fee_close_rate)
-      total_profit -= current_stake
-    else:
-      current_stake = total_amount * exit_rate * (1 - fee_close_rate)
-      total_profit += current_stake
-    if self.is_futures_mode:
-      total_profit += trade.funding_fees
-    total_profit_ratio = total_profit / total_stake
-    current_profit_ratio = total_profit / current_stake
-    init_profit_ratio = total_profit / filled_entries[0].cost
-    return total_profit, total_profit_ratio, current_profit_ratio, init_profit_ratio
+
+    aggregates = (total_amount, total_stake, total_profit)
+    self.filled_orders_aggregates_cache[trade.id] = (cache_key, aggregates)
+    return aggregates
 
   # Custom Exit
   # ---------------------------------------------------------------------------------------------
@@ -1562,6 +1708,7 @@ class NostalgiaForInfinityX6(IStrategy):
     if hasattr(trade, "enter_tag") and trade.enter_tag is not None:
       enter_tag = trade.enter_tag
     enter_tags = enter_tag.split()
+    enter_tags_mask = self.get_enter_tags_mask(enter_tag)
 
     filled_entries = trade.select_filled_orders(trade.entry_side)
     filled_exits = trade.select_filled_orders(trade.exit_side)
@@ -1578,7 +1725,7 @@ class NostalgiaForInfinityX6(IStrategy):
     max_loss = 0.0
 
     # Long Normal mode
-    if any(c in self.long_normal_mode_tags for c in enter_tags):
+    if (enter_tags_mask & self.long_normal_mode_mask) != 0:
       sell, signal_name = self.long_exit_normal(
         pair,
         current_rate,
@@ -1604,7 +1751,7 @@ class NostalgiaForInfinityX6(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Long Pump mode
-    if any(c in self.long_pump_mode_tags for c in enter_tags):
+    if (enter_tags_mask & self.long_pump_mode_mask) != 0:
       sell, signal_name = self.long_exit_pump(
         pair,
         current_rate,
@@ -1630,7 +1777,7 @@ class NostalgiaForInfinityX6(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Long Quick mode
-    if any(c in self.long_quick_mode_tags for c in enter_tags):
+    if (enter_tags_mask & self.long_quick_mode_mask) != 0:
       sell, signal_name = self.long_exit_quick(
         pair,
         current_rate,
@@ -1656,9 +1803,9 @@ class NostalgiaForInfinityX6(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Long Rebuy mode
-    if all(c in self.long_rebuy_mode_tags for c in enter_tags) or (
-      any(c in self.long_rebuy_mode_tags for c in enter_tags)
-      and all(c in (self.long_rebuy_mode_tags + self.long_grind_mode_tags) for c in enter_tags)
+    if (enter_tags_mask & ~self.long_rebuy_mode_mask) == 0 or (
+      (enter_tags_mask & self.long_rebuy_mode_mask) != 0
+      and (enter_tags_mask & ~(self.long_rebuy_mode_mask | self.long_grind_mode_mask)) == 0
     ):
       sell, signal_name = self.long_exit_rebuy(
         pair,
@@ -1685,7 +1832,7 @@ class NostalgiaForInfinityX6(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Long high profit mode
-    if any(c in self.long_mode_tags for c in enter_tags):
+    if (enter_tags_mask & self.long_mode_mask) != 0:
       sell, signal_name = self.long_exit_high_profit(
         pair,
         current_rate,
@@ -1711,15 +1858,13 @@ class NostalgiaForInfinityX6(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Long rapid mode
-    if all(c in self.long_rapid_mode_tags for c in enter_tags) or (
-      any(c in self.long_rapid_mode_tags for c in enter_tags)
-      and all(
-        c
-        in (
-          self.long_rapid_mode_tags + self.long_rebuy_mode_tags + self.long_grind_mode_tags + self.long_scalp_mode_tags
-        )
-        for c in enter_tags
+    if (enter_tags_mask & ~self.long_rapid_mode_mask) == 0 or (
+      (enter_tags_mask & self.long_rapid_mode_mask) != 0
+      and (
+        enter_tags_mask
+        & ~(self.long_rapid_mode_mask | self.long_rebuy_mode_mask | self.long_grind_mode_mask | self.long_scalp_mode_mask)
       )
+      == 0
     ):
       sell, signal_name = self.long_exit_rapid(
         pair,
@@ -1746,7 +1891,7 @@ class NostalgiaForInfinityX6(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Long grind mode
-    if all(c in self.long_grind_mode_tags for c in enter_tags):
+    if (enter_tags_mask & ~self.long_grind_mode_mask) == 0:
       sell, signal_name = self.long_exit_grind(
         pair,
         current_rate,
@@ -1772,7 +1917,7 @@ class NostalgiaForInfinityX6(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Long Top Coins mode
-    if any(c in self.long_top_coins_mode_tags for c in enter_tags):
+    if (enter_tags_mask & self.long_top_coins_mode_mask) != 0:
       sell, signal_name = self.long_exit_top_coins(
         pair,
         current_rate,
@@ -1798,11 +1943,9 @@ class NostalgiaForInfinityX6(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Long scalp mode
-    if all(c in self.long_scalp_mode_tags for c in enter_tags) or (
-      any(c in self.long_scalp_mode_tags for c in enter_tags)
-      and all(
-        c in (self.long_scalp_mode_tags + self.long_rebuy_mode_tags + self.long_grind_mode_tags) for c in enter_tags
-      )
+    if (enter_tags_mask & ~self.long_scalp_mode_mask) == 0 or (
+      (enter_tags_mask & self.long_scalp_mode_mask) != 0
+      and (enter_tags_mask & ~(self.long_scalp_mode_mask | self.long_rebuy_mode_mask | self.long_grind_mode_mask)) == 0
     ):
       sell, signal_name = self.long_exit_scalp(
         pair,
@@ -1829,7 +1972,7 @@ class NostalgiaForInfinityX6(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Short normal mode
-    if any(c in self.short_normal_mode_tags for c in enter_tags):
+    if (enter_tags_mask & self.short_normal_mode_mask) != 0:
       sell, signal_name = self.short_exit_normal(
         pair,
         current_rate,
@@ -1855,7 +1998,7 @@ class NostalgiaForInfinityX6(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Short Pump mode
-    if any(c in self.short_pump_mode_tags for c in enter_tags):
+    if (enter_tags_mask & self.short_pump_mode_mask) != 0:
       sell, signal_name = self.short_exit_pump(
         pair,
         current_rate,
@@ -1881,7 +2024,7 @@ class NostalgiaForInfinityX6(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Short Quick mode
-    if any(c in self.short_quick_mode_tags for c in enter_tags):
+    if (enter_tags_mask & self.short_quick_mode_mask) != 0:
       sell, signal_name = self.short_exit_quick(
         pair,
         current_rate,
@@ -1907,7 +2050,7 @@ class NostalgiaForInfinityX6(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Short Rebuy mode
-    if all(c in self.short_rebuy_mode_tags for c in enter_tags):
+    if (enter_tags_mask & ~self.short_rebuy_mode_mask) == 0:
       sell, signal_name = self.short_exit_rebuy(
         pair,
         current_rate,
@@ -1933,7 +2076,7 @@ class NostalgiaForInfinityX6(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Short high profit mode
-    if any(c in self.short_mode_tags for c in enter_tags):
+    if (enter_tags_mask & self.short_mode_mask) != 0:
       sell, signal_name = self.short_exit_high_profit(
         pair,
         current_rate,
@@ -1959,7 +2102,7 @@ class NostalgiaForInfinityX6(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Short rapid mode
-    if any(c in self.short_rapid_mode_tags for c in enter_tags):
+    if (enter_tags_mask & self.short_rapid_mode_mask) != 0:
       sell, signal_name = self.short_exit_rapid(
         pair,
         current_rate,
@@ -1985,11 +2128,12 @@ class NostalgiaForInfinityX6(IStrategy):
         return f"{signal_name} ( {enter_tag})"
 
     # Short scalp mode
-    if all(c in self.short_scalp_mode_tags for c in enter_tags) or (
-      any(c in self.short_scalp_mode_tags for c in enter_tags)
-      and all(
-        c in (self.short_scalp_mode_tags + self.short_rebuy_mode_tags + self.short_grind_mode_tags) for c in enter_tags
+    if (enter_tags_mask & ~self.short_scalp_mode_mask) == 0 or (
+      (enter_tags_mask & self.short_scalp_mode_mask) != 0
+      and (
+        enter_tags_mask & ~(self.short_scalp_mode_mask | self.short_rebuy_mode_mask | self.short_grind_mode_mask)
       )
+      == 0
     ):
       sell, signal_name = self.short_exit_scalp(
         pair,
@@ -2017,21 +2161,21 @@ class NostalgiaForInfinityX6(IStrategy):
 
     # Trades not opened by X5
     if not trade.is_short and (
-      not any(
-        c
-        in (
-          self.long_normal_mode_tags
-          + self.long_pump_mode_tags
-          + self.long_quick_mode_tags
-          + self.long_rebuy_mode_tags
-          + self.long_mode_tags
-          + self.long_rapid_mode_tags
-          + self.long_grind_mode_tags
-          + self.long_top_coins_mode_tags
-          + self.long_scalp_mode_tags
-        )
-        for c in enter_tags
-      )
+      (
+        enter_tags_mask
+        & (
+          self.long_normal_mode_mask
+          | self.long_pump_mode_mask
+          | self.long_quick_mode_mask
+          | self.long_rebuy_mode_mask
+          | self.long_mode_mask
+          | self.long_rapid_mode_mask
+          | self.long_grind_mode_mask
+          | self.long_top_coins_mode_mask
+          | self.long_scalp_mode_mask
+        )
+      )
+      == 0
     ):
       # use normal mode for such trades
       sell, signal_name = self.long_exit_normal(
@@ -2060,20 +2204,20 @@ class NostalgiaForInfinityX6(IStrategy):
 
     # Trades not opened by X5
     if trade.is_short and (
-      not any(
-        c
-        in (
-          self.short_normal_mode_tags
-          + self.short_pump_mode_tags
-          + self.short_quick_mode_tags
-          + self.short_rebuy_mode_tags
-          + self.short_mode_tags
-          + self.short_rapid_mode_tags
-          + self.short_grind_mode_tags
-          + self.short_scalp_mode_tags
-        )
-        for c in enter_tags
-      )
+      (
+        enter_tags_mask
+        & (
+          self.short_normal_mode_mask
+          | self.short_pump_mode_mask
+          | self.short_quick_mode_mask
+          | self.short_rebuy_mode_mask
+          | self.short_mode_mask
+          | self.short_rapid_mode_mask
+          | self.short_grind_mode_mask
+          | self.short_scalp_mode_mask
+        )
+      )
+      == 0
     ):
       # use normal mode for such trades
       sell, signal_name = self.short_exit_normal(
@@ -2117,12 +2261,12 @@ class NostalgiaForInfinityX6(IStrategy):
     side: str,
     **kwargs,
   ) -> float:
-    enter_tags = entry_tag.split()
+    enter_tags_mask = self.get_enter_tags_mask(entry_tag)
     if side == "long":
       # Rebuy mode
-      if all(c in self.long_rebuy_mode_tags for c in enter_tags) or (
-        any(c in self.long_rebuy_mode_tags for c in enter_tags)
-        and all(c in (self.long_rebuy_mode_tags + self.long_grind_mode_tags) for c in enter_tags)
+      if (enter_tags_mask & ~self.long_rebuy_mode_mask) == 0 or (
+        (enter_tags_mask & self.long_rebuy_mode_mask) != 0
+        and (enter_tags_mask & ~(self.long_rebuy_mode_mask | self.long_grind_mode_mask)) == 0
       ):
         stake_multiplier = self.rebuy_mode_stake_multiplier
         stake = proposed_stake * stake_multiplier
@@ -2131,11 +2275,12 @@ class NostalgiaForInfinityX6(IStrategy):
         else:
           return min_stake
       # Rapid mode
-      if all(c in self.long_rapid_mode_tags for c in enter_tags) or (
-        any(c in self.long_rapid_mode_tags for c in enter_tags)
-        and all(
-          c in (self.long_rapid_mode_tags + self.long_rebuy_mode_tags + self.long_grind_mode_tags) for c in enter_tags
+      if (enter_tags_mask & ~self.long_rapid_mode_mask) == 0 or (
+        (enter_tags_mask & self.long_rapid_mode_mask) != 0
+        and (
+          enter_tags_mask & ~(self.long_rapid_mode_mask | self.long_rebuy_mode_mask | self.long_grind_mode_mask)
         )
+        == 0
       ):
         stake_multiplier = (
           self.rapid_mode_stake_multiplier_futures[0]
@@ -2147,7 +2292,7 @@ class NostalgiaForInfinityX6(IStrategy):
         else:
           return min_stake
       # Grind mode
-      elif all(c in self.long_grind_mode_tags for c in enter_tags):
+      elif (enter_tags_mask & ~self.long_grind_mode_mask) == 0:
         for _, item in enumerate(
           self.grind_mode_stake_multiplier_futures if self.is_futures_mode else self.grind_mode_stake_multiplier_spot
         ):
@@ -2166,9 +2311,9 @@ class NostalgiaForInfinityX6(IStrategy):
           return min_stake
     else:
       # Rebuy mode
-      if all(c in self.short_rebuy_mode_tags for c in enter_tags) or (
-        any(c in self.short_rebuy_mode_tags for c in enter_tags)
-        and all(c in (self.short_rebuy_mode_tags + self.short_grind_mode_tags) for c in enter_tags)
+      if (enter_tags_mask & ~self.short_rebuy_mode_mask) == 0 or (
+        (enter_tags_mask & self.short_rebuy_mode_mask) != 0
+        and (enter_tags_mask & ~(self.short_rebuy_mode_mask | self.short_grind_mode_mask)) == 0
       ):
         stake_multiplier = self.rebuy_mode_stake_multiplier
         # Low stakes, on Binance mostly
@@ -2176,7 +2321,7 @@ class NostalgiaForInfinityX6(IStrategy):
           stake_multiplier = self.rebuy_mode_stake_multiplier_alt
         return proposed_stake * stake_multiplier
       # Grind mode
-      elif all(c in self.short_grind_mode_tags for c in enter_tags):
+      elif (enter_tags_mask & ~self.short_grind_mode_mask) == 0:
         for _, item in enumerate(
           self.grind_mode_stake_multiplier_futures if self.is_futures_mode else self.grind_mode_stake_multiplier_spot
         ):
@@ -2219,18 +2364,19 @@ class NostalgiaForInfinityX6(IStrategy):
     if hasattr(trade, "enter_tag") and trade.enter_tag is not None:
       enter_tag = trade.enter_tag
     enter_tags = enter_tag.split()
+    enter_tags_mask = self.get_enter_tags_mask(enter_tag)
 
     is_backtest = self.is_backtest_mode()
-    is_long_grind_mode = all(c in self.long_grind_mode_tags for c in enter_tags)
-    is_short_grind_mode = all(c in self.short_grind_mode_tags for c in enter_tags)
+    is_long_grind_mode = (enter_tags_mask & ~self.long_grind_mode_mask) == 0
+    is_short_grind_mode = (enter_tags_mask & ~self.short_grind_mode_mask) == 0
     is_v2_date = trade.open_date_utc.replace(tzinfo=None) >= datetime(2025, 2, 13) or is_backtest
 
     # Rebuy mode
     if not trade.is_short and (
-      all(c in self.long_rebuy_mode_tags for c in enter_tags)
+      (enter_tags_mask & ~self.long_rebuy_mode_mask) == 0
       or (
-        any(c in self.long_rebuy_mode_tags for c in enter_tags)
-        and all(c in (self.long_rebuy_mode_tags + self.long_grind_mode_tags) for c in enter_tags)
+        (enter_tags_mask & self.long_rebuy_mode_mask) != 0
+        and (enter_tags_mask & ~(self.long_rebuy_mode_mask | self.long_grind_mode_mask)) == 0
       )
     ):
       return self.long_rebuy_adjust_trade_position(
@@ -2263,32 +2409,35 @@ class NostalgiaForInfinityX6(IStrategy):
           current_entry_profit,
           current_exit_profit,
         )
-      elif any(
-        c
-        in (
-          self.long_normal_mode_tags
-          + self.long_pump_mode_tags
-          + self.long_quick_mode_tags
-          + self.long_mode_tags
-          + self.long_rapid_mode_tags
-          + self.long_top_coins_mode_tags
-          + self.long_scalp_mode_tags
-        )
-        for c in enter_tags
-      ) or not any(
-        c
-        in (
-          self.long_normal_mode_tags
-          + self.long_pump_mode_tags
-          + self.long_quick_mode_tags
-          + self.long_rebuy_mode_tags
-          + self.long_mode_tags
-          + self.long_rapid_mode_tags
-          + self.long_grind_mode_tags
-          + self.long_top_coins_mode_tags
-          + self.long_scalp_mode_tags
-        )
-        for c in enter_tags
+      elif (
+        (
+          enter_tags_mask
+          & (
+            self.long_normal_mode_mask
+            | self.long_pump_mode_mask
+            | self.long_quick_mode_mask
+            | self.long_mode_mask
+            | self.long_rapid_mode_mask
+            | self.long_top_coins_mode_mask
+            | self.long_scalp_mode_mask
+          )
+        )
+        != 0
+        or (
+          enter_tags_mask
+          & (
+            self.long_normal_mode_mask
+            | self.long_pump_mode_mask
+            | self.long_quick_mode_mask
+            | self.long_rebuy_mode_mask
+            | self.long_mode_mask
+            | self.long_rapid_mode_mask
+            | self.long_grind_mode_mask
+            | self.long_top_coins_mode_mask
+            | self.long_scalp_mode_mask
+          )
+        )
+        == 0
       ):
         return self.long_grind_adjust_trade_position_v2(
           trade,
@@ -2320,32 +2469,35 @@ class NostalgiaForInfinityX6(IStrategy):
           current_exit_profit,
         )
       else:
-        if any(
-          c
-          in (
-            self.short_normal_mode_tags
-            + self.short_pump_mode_tags
-            + self.short_quick_mode_tags
-            + self.short_mode_tags
-            + self.short_rapid_mode_tags
-            + self.short_top_coins_mode_tags
-            + self.short_scalp_mode_tags
-          )
-          for c in enter_tags
-        ) or not any(
-          c
-          in (
-            self.short_normal_mode_tags
-            + self.short_pump_mode_tags
-            + self.short_quick_mode_tags
-            + self.short_rebuy_mode_tags
-            + self.short_mode_tags
-            + self.short_rapid_mode_tags
-            + self.short_grind_mode_tags
-            + self.short_top_coins_mode_tags
-            + self.short_scalp_mode_tags
-          )
-          for c in enter_tags
+        if (
+          (
+            enter_tags_mask
+            & (
+              self.short_normal_mode_mask
+              | self.short_pump_mode_mask
+              | self.short_quick_mode_mask
+              | self.short_mode_mask
+              | self.short_rapid_mode_mask
+              | self.short_top_coins_mode_mask
+              | self.short_scalp_mode_mask
+            )
+          )
+          != 0
+          or (
+            enter_tags_mask
+            & (
+              self.short_normal_mode_mask
+              | self.short_pump_mode_mask
+              | self.short_quick_mode_mask
+              | self.short_rebuy_mode_mask
+              | self.short_mode_mask
+              | self.short_rapid_mode_mask
+              | self.short_grind_mode_mask
+              | self.short_top_coins_mode_mask
+              | self.short_scalp_mode_mask
+            )
+          )
+          == 0
         ):
           return self.short_grind_adjust_trade_position_v2(
             trade,
@@ -2525,6 +2677,8 @@ class NostalgiaForInfinityX6(IStrategy):
     # -----------------------------------------------------------------------------------------
     tok = time.perf_counter()
     log.debug(f"[{metadata['pair']}] informative_1d_indicators took: {tok - tik:0.4f} seconds.")
+    if self.profiler is not None:
+      self.profiler.record(metadata["pair"], "informative_1d_indicators", tik, tok)
 
     return informative_1d
 
@@ -2695,7 +2849,9 @@ class NostalgiaForInfinityX6(IStrategy):
     # Performance logging
     # -----------------------------------------------------------------------------------------
     tok = time.perf_counter()
-    log.debug(f"[{metadata['pair']}] informative_1d_indicators took: {tok - tik:0.4f} seconds.")
+    log.debug(f"[{metadata['pair']}] informative_4h_indicators took: {tok - tik:0.4f} seconds.")
+    if self.profiler is not None:
+      self.profiler.record(metadata["pair"], "informative_4h_indicators", tik, tok)
 
     return informative_4h
 
@@ -2862,6 +3018,8 @@ class NostalgiaForInfinityX6(IStrategy):
     # -----------------------------------------------------------------------------------------
     tok = time.perf_counter()
     log.debug(f"[{metadata['pair']}] informative_1h_indicators took: {tok - tik:0.4f} seconds.")
+    if self.profiler is not None:
+      self.profiler.record(metadata["pair"], "informative_1h_indicators", tik, tok)
 
     return informative_1h
 
@@ -2984,6 +3142,8 @@ class NostalgiaForInfinityX6(IStrategy):
     # -----------------------------------------------------------------------------------------
     tok = time.perf_counter()
     log.debug(f"[{metadata['pair']}] informative_15m_indicators took: {tok - tik:0.4f} seconds.")
+    if self.profiler is not None:
+      self.profiler.record(metadata["pair"], "informative_15m_indicators", tik, tok)
 
     return informative_15m
 
@@ -3137,12 +3297,38 @@ class NostalgiaForInfinityX6(IStrategy):
     # -----------------------------------------------------------------------------------------
     tok = time.perf_counter()
     log.debug(f"[{metadata['pair']}] base_tf_5m_indicators took: {tok - tik:0.4f} seconds.")
+    if self.profiler is not None:
+      self.profiler.record(metadata["pair"], "base_tf_5m_indicators", tik, tok)
 
     return df
 
+  # Compute On Candles
+  # ---------------------------------------------------------------------------------------------
+  def compute_on_candles(self, pair: str, timeframe: str, candles: DataFrame, compute) -> DataFrame:
+    """Runs compute with the DataProvider returning candles for the pair and timeframe."""
+    dp = self.dp
+    self.dp = CandlesOverrideProvider(dp, pair, timeframe, candles)
+    try:
+      return compute()
+    finally:
+      self.dp = dp
+
   # Coin Pair Indicator Switch Case
   # ---------------------------------------------------------------------------------------------
   def info_switcher(self, metadata: dict, info_timeframe) -> DataFrame:
+    # Every backtest pair is analyzed once, only the live/dry-run frames are worth keeping
+    if self.informative_frames is not None and not self.is_backtest_mode():
+      return self.informative_frames.get_or_compute(
+        metadata["pair"],
+        info_timeframe,
+        self.dp.get_pair_dataframe(metadata["pair"], info_timeframe),
+        lambda candles: self.compute_on_candles(
+          metadata["pair"], info_timeframe, candles, lambda: self.info_switcher_compute(metadata, info_timeframe)
+        ),
+      )
+    return self.info_switcher_compute(metadata, info_timeframe)
+
+  def info_switcher_compute(self, metadata: dict, info_timeframe) -> DataFrame:
     if info_timeframe == "1d":
       return self.informative_1d_indicators(metadata, info_timeframe)
     elif info_timeframe == "4h":
@@ -3189,6 +3375,8 @@ class NostalgiaForInfinityX6(IStrategy):
 
     tok = time.perf_counter()
     log.debug(f"[{metadata['pair']}] btc_info_1d_indicators took: {tok - tik:0.4f} seconds.")
+    if self.profiler is not None:
+      self.profiler.record(metadata["pair"], "btc_info_1d_indicators", tik, tok)
 
     return btc_info_1d
 
@@ -3207,6 +3395,8 @@ class NostalgiaForInfinityX6(IStrategy):
 
     tok = time.perf_counter()
     log.debug(f"[{metadata['pair']}] btc_info_4h_indicators took: {tok - tik:0.4f} seconds.")
+    if self.profiler is not None:
+      self.profiler.record(metadata["pair"], "btc_info_4h_indicators", tik, tok)
 
     return btc_info_4h
 
@@ -3225,6 +3415,8 @@ class NostalgiaForInfinityX6(IStrategy):
 
     tok = time.perf_counter()
     log.debug(f"[{metadata['pair']}] btc_info_1h_indicators took: {tok - tik:0.4f} seconds.")
+    if self.profiler is not None:
+      self.profiler.record(metadata["pair"], "btc_info_1h_indicators", tik, tok)
 
     return btc_info_1h
 
@@ -3243,6 +3435,8 @@ class NostalgiaForInfinityX6(IStrategy):
 
     tok = time.perf_counter()
     log.debug(f"[{metadata['pair']}] btc_info_15m_indicators took: {tok - tik:0.4f} seconds.")
+    if self.profiler is not None:
+      self.profiler.record(metadata["pair"], "btc_info_15m_indicators", tik, tok)
 
     return btc_info_15m
 
@@ -3261,12 +3455,30 @@ class NostalgiaForInfinityX6(IStrategy):
 
     tok = time.perf_counter()
     log.debug(f"[{metadata['pair']}] btc_info_5m_indicators took: {tok - tik:0.4f} seconds.")
+    if self.profiler is not None:
+      self.profiler.record(metadata["pair"], "btc_info_5m_indicators", tik, tok)
 
     return btc_info_5m
 
   # BTC Indicator Switch Case
   # ---------------------------------------------------------------------------------------------
   def btc_info_switcher(self, btc_info_pair, btc_info_timeframe, metadata: dict) -> DataFrame:
+    # The BTC informative frames are the same for all the pairs
+    if self.informative_frames is not None:
+      return self.informative_frames.get_or_compute(
+        btc_info_pair,
+        btc_info_timeframe,
+        self.dp.get_pair_dataframe(btc_info_pair, btc_info_timeframe),
+        lambda candles: self.compute_on_candles(
+          btc_info_pair,
+          btc_info_timeframe,
+          candles,
+          lambda: self.btc_info_switcher_compute(btc_info_pair, btc_info_timeframe, metadata),
+        ),
+      )
+    return self.btc_info_switcher_compute(btc_info_pair, btc_info_timeframe, metadata)
+
+  def btc_info_switcher_compute(self, btc_info_pair, btc_info_timeframe, metadata: dict) -> DataFrame:
     if btc_info_timeframe == "1d":
       return self.btc_info_1d_indicators(btc_info_pair, btc_info_timeframe, metadata)
     elif btc_info_timeframe == "4h":
@@ -3359,813 +3571,8 @@ class NostalgiaForInfinityX6(IStrategy):
     # df["RSI_14_1d"] = df["RSI_14_1d"].astype(np.float64).replace(to_replace=[np.nan, None], value=(50.0))
     df["RSI_14_1h"] = df["RSI_14_1h"].astype(np.float64).replace(to_replace=[np.nan, None], value=(50.0))
 
-    # Global protections Long
-    df["protections_long_global"] = (
-      # 5m & 4h & 1d down move, 15m & 1h & 4h still not low enough, 1d still high
-      (
-        (df["RSI_3"] > 1.0)
-        | (df["RSI_3_4h"] > 10.0)
-        | (df["RSI_3_1d"] > 35.0)
-        | (df["RSI_14_15m"] < 30.0)
-        | (df["RSI_14_1h"] < 30.0)
-        | (df["RSI_14_4h"] < 30.0)
-        | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0)
-        | (df["STOCHRSIk_14_14_3_3_1d"] < 50.0)
-      )
-      # 1h & 4h down move, 15m & 1h & 4h downtrend, 1h still high
-      & (
-        (df["RSI_3"] > 5.0)
-        | (df["RSI_3_15m"] > 10.0)
-        | (df["RSI_3_1h"] > 40.0)
-        | (df["RSI_3_4h"] > 55.0)
-        | (df["CMF_20_15m"] > -0.25)
-        | (df["AROONU_14_4h"] < 60.0)
-        | (df["ROC_9_1d"] < 80.0)
-      )
-      # 5m & 15m & 1h & 4h down move, 4h high
-      & (
-        (df["RSI_3"] > 5.0)
-        | (df["RSI_3_15m"] > 15.0)
-        | (df["RSI_3_1h"] > 45.0)
-        | (df["RSI_3_4h"] > 55.0)
-        | (df["RSI_14_4h"] < 50.0)
-        | (df["AROONU_14_4h"] < 80.0)
-        | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
-      )
-      # 15m & 1h & 4h down move, 15m & 1h downtrend, 4h still high
-      & (
-        (df["RSI_3_15m"] > 5.0)
-        | (df["RSI_3_1h"] > 5.0)
-        | (df["RSI_14_1h"] < 20.0)
-        | (df["CMF_20_15m"] > -0.25)
-        | (df["CMF_20_15m"] > -0.40)
-        | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
-      )
-      # 15m & 1h down move, 1h & 4h high
-      & (
-        (df["RSI_3_15m"] > 5.0)
-        | (df["RSI_3_1h"] > 20.0)
-        | (df["RSI_14_1h"] < 50.0)
-        | (df["RSI_14_4h"] < 70.0)
-        | (df["AROONU_14_1h"] < 80.0)
-        | (df["AROONU_14_4h"] < 100.0)
-      )
-      # 15m & 1h & 4h & 1d down move, 15m downtrend
-      & (
-        (df["RSI_3_15m"] > 5.0)
-        | (df["RSI_3_1h"] > 20.0)
-        | (df["RSI_3_4h"] > 25.0)
-        | (df["RSI_3_1d"] > 5.0)
-        | (df["CMF_20_15m"] > -0.40)
-      )
-      # 15m & 1h & 4h down move, 1h & 4h still high, 15m downtrend
-      & (
-        (df["RSI_3_15m"] > 5.0)
-        | (df["RSI_3_1h"] > 30.0)
-        | (df["RSI_3_4h"] > 50.0)
-        | (df["RSI_14_1h"] < 40.0)
-        | (df["RSI_14_4h"] < 50.0)
-        | (df["CMF_20_15m"] > -0.30)
-        | (df["AROONU_14_4h"] < 50.0)
-        | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
-      )
-      # 15m & 1h & 3h down move, 1h & 4h still not low enough, 15m downtrend, 1h still high
-      & (
-        (df["RSI_3_15m"] > 5.0)
-        | (df["RSI_3_1h"] > 35.0)
-        | (df["RSI_3_4h"] > 35.0)
-        | (df["RSI_14_1h"] < 30.0)
-        | (df["RSI_14_4h"] < 30.0)
-        | (df["CMF_20_15m"] > -0.30)
-        | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
-      )
-      # 15m & 1h & 4h down move, 1h downtrend, 4h high
-      & (
-        (df["RSI_3_15m"] > 10.0)
-        | (df["RSI_3_1h"] > 15.0)
-        | (df["RSI_3_4h"] > 55.0)
-        | (df["RSI_14_4h"] < 50.0)
-        | (df["CMF_20_1h"] > -0.4)
-        | (df["AROONU_14_4h"] < 80.0)
-        | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
-      )
-      # 15m & 1h & 4h down move, 15m still not low enough, 1h & 4h high
-      & (
-        (df["RSI_3_15m"] > 10.0)
-        | (df["RSI_3_1h"] > 20.0)
-        | (df["RSI_3_4h"] > 25.0)
-        | (df["AROONU_14_15m"] < 30.0)
-        | (df["AROONU_14_1h"] < 60.0)
-        | (df["AROONU_14_4h"] < 100.0)
-      )
-      # 15m & 1h & 4h down move, 15m still not low enough, 1h & 4h still high, 4h overbought
-      & (
-        (df["RSI_3_15m"] > 10.0)
-        | (df["RSI_3_1h"] > 20.0)
-        | (df["RSI_3_4h"] > 35.0)
-        | (df["RSI_14_15m"] < 30.0)
-        | (df["RSI_14_1h"] < 40.0)
-        | (df["RSI_14_4h"] < 40.0)
-        | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
-        | (df["ROC_9_4h"] < 10.0)
-      )
-      # 15m & 1h & 4h down move, 1h & 4h not low enouhg, 15m downtrend, 4h high, 1d overbought
-      & (
-        (df["RSI_3_15m"] > 10.0)
-        | (df["RSI_3_1h"] > 25.0)
-        | (df["RSI_3_4h"] > 25.0)
-        | (df["RSI_14_1h"] < 30.0)
-        | (df["RSI_14_4h"] < 30.0)
-        | (df["CMF_20_15m"] > -0.30)
-        | (df["AROONU_14_4h"] < 60.0)
-        | (df["ROC_9_1d"] < 25.0)
-      )
-      # 15m & 1h down move, 4h high, 1d downtrend, 1h still not low enough, 1d overbought
-      & (
-        (df["RSI_3_15m"] > 10.0)
-        | (df["RSI_3_1h"] > 30.0)
-        | (df["RSI_14_4h"] < 70.0)
-        | (df["CMF_20_1d"] > -0.3)
-        | (df["AROONU_14_1h"] < 30.0)
-        | (df["ROC_9_1d"] < 100.0)
-      )
-      # 15m & 1h & 4h & 1d down move, 15m & 1h not low enough, 4h high
-      & (
-        (df["RSI_3_15m"] > 10.0)
-        | (df["RSI_3_1h"] > 35.0)
-        | (df["RSI_3_4h"] > 35.0)
-        | (df["RSI_3_1d"] > 15.0)
-        | (df["RSI_14_15m"] < 30.0)
-        | (df["RSI_14_1h"] < 35.0)
-        | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0)
-        | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
-      )
-      # 15m & 1h down move, 4h still high, 15m downtrend, 1h & 1d high
-      & (
-        (df["RSI_3_15m"] > 10.0)
-        | (df["RSI_3_1h"] > 40.0)
-        | (df["RSI_14_4h"] < 50.0)
-        | (df["CMF_20_15m"] > -0.3)
-        | (df["AROONU_14_1h"] < 60.0)
-        | (df["AROONU_14_1d"] < 90.0)
-        | (df["STOCHRSIk_14_14_3_3_1d"] < 80.0)
-      )
-      # 15m & 1h down move, 15m & 1h still high, 1h & 4h high, 1d overbought
-      & (
-        (df["RSI_3_15m"] > 10.0)
-        | (df["RSI_3_1h"] > 40.0)
-        | (df["RSI_14_15m"] < 40.0)
-        | (df["RSI_14_1h"] < 50.0)
-        | (df["RSI_14_4h"] < 70.0)
-        | (df["AROONU_14_1h"] < 80.0)
-        | (df["AROONU_14_4h"] < 100.0)
-        | (df["ROC_9_1d"] < 50.0)
-      )
-      # 15m & 1h & 4h down move, 15m & 1h & 4h still high, 1h & 4h high, 4h overbought
-      & (
-        (df["RSI_3_15m"] > 10.0)
-        | (df["RSI_3_1h"] > 45.0)
-        | (df["RSI_3_4h"] > 60.0)
-        | (df["RSI_14_15m"] < 40.0)
-        | (df["RSI_14_1h"] < 50.0)
-        | (df["RSI_14_4h"] < 50.0)
-        | (df["AROONU_14_1h"] < 70.0)
-        | (df["AROONU_14_4h"] < 100.0)
-        | (df["ROC_9_4h"] < 25.0)
-      )
-      # 15m & 1h down move, 15m still not low enough, 1h & 4h high, 4h overbought
-      & (
-        (df["RSI_3_15m"] > 10.0)
-        | (df["RSI_3_1h"] > 50.0)
-        | (df["RSI_14_4h"] < 70.0)
-        | (df["AROONU_14_15m"] < 20.0)
-        | (df["AROONU_14_1h"] < 80.0)
-        | (df["AROONU_14_4h"] < 100.0)
-        | (df["ROC_9_4h"] < 30.0)
-      )
-      # 15m & 1h & 4h down move, 1h & 4h downtrend, 15m still high, 1h high
-      & (
-        (df["RSI_3_15m"] > 10.0)
-        | (df["RSI_3_1h"] > 55.0)
-        | (df["RSI_3_4h"] > 55.0)
-        | (df["CMF_20_1h"] > -0.0)
-        | (df["CMF_20_4h"] > -0.4)
-        | (df["AROONU_14_15m"] < 50.0)
-        | (df["STOCHRSIk_14_14_3_3_1h"] < 90.0)
-      )
-      # 15m & 1h down move, 15m & 4h high, 4h overbought
-      & (
-        (df["RSI_3_15m"] > 10.0)
-        | (df["RSI_3_1h"] > 65.0)
-        | (df["AROONU_14_15m"] < 80.0)
-        | (df["AROONU_14_4h"] < 85.0)
-        | (df["ROC_9_4h"] < 100.0)
-      )
-      # 15m & 1h & 4h down move, 1h still not low enough, 4h high, 1h downtrend
-      & (
-        (df["RSI_3_15m"] > 15.0)
-        | (df["RSI_3_1h"] > 15.0)
-        | (df["RSI_3_4h"] > 45.0)
-        | (df["RSI_14_1h"] < 30.0)
-        | (df["RSI_14_4h"] < 45.0)
-        | (df["AROONU_14_1h"] < 40.0)
-        | (df["AROONU_14_4h"] < 90.0)
-        | (df["ROC_9_1h"] > -30.0)
-      )
-      # 15m & 1h & 4h down move, 4h high, 1d overbought
-      & (
-        (df["RSI_3_15m"] > 15.0)
-        | (df["RSI_3_1h"] > 15.0)
-        | (df["RSI_3_4h"] > 45.0)
-        | (df["AROONU_14_4h"] < 80.0)
-        | (df["ROC_9_1d"] < 150.0)
-      )
-      # 15m & 1h & 4h down move, 1h still high, 4h high, 4h & 1d overbought
-      & (
-        (df["RSI_3_15m"] > 15.0)
-        | (df["RSI_3_1h"] > 30.0)
-        | (df["RSI_3_4h"] > 45.0)
-        | (df["RSI_14_1h"] < 35.0)
-        | (df["RSI_14_4h"] < 50.0)
-        | (df["AROONU_14_4h"] < 70.0)
-        | (df["ROC_9_4h"] < 25.0)
-        | (df["ROC_9_1d"] < 100.0)
-      )
-      # 15m & 1h down move, 15m still not low enough, 1h still high, 4h high
-      & (
-        (df["RSI_3_15m"] > 15.0)
-        | (df["RSI_3_1h"] > 30.0)
-        | (df["RSI_14_15m"] < 30.0)
-        | (df["RSI_14_1h"] < 50.0)
-        | (df["RSI_14_4h"] < 70.0)
-        | (df["AROONU_14_1h"] < 60.0)
-        | (df["AROONU_14_4h"] < 100.0)
-      )
-      # 15m & 1h down move, 15m still high, 1h & dh high, 1d overbought
-      & (
-        (df["RSI_3_15m"] > 15.0)
-        | (df["RSI_3_1h"] > 30.0)
-        | (df["RSI_14_15m"] < 40.0)
-        | (df["AROONU_14_1h"] < 70.0)
-        | (df["AROONU_14_4h"] < 100.0)
-        | (df["ROC_9_1d"] < 50.0)
-      )
-      # 15m & 1h & 4h & 1d down move, 1h still high, 4h still not low enough, 4h downtrend
-      & (
-        (df["RSI_3_15m"] > 15.0)
-        | (df["RSI_3_1h"] > 40.0)
-        | (df["RSI_3_4h"] > 20.0)
-        | (df["RSI_3_1d"] > 30.0)
-        | (df["RSI_14_1h"] < 30.0)
-        | (df["RSI_14_4h"] < 30.0)
-        | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
-        | (df["CCI_20_1h"] < -250.0)
-        | (df["CCI_20_4h"] < -250.0)
-        | (df["ROC_9_4h"] > -15.0)
-      )
-      # 15m & 1h & 1d down move, 15m still not low enough, 1h & 4h still high, 1d overbought
-      & (
-        (df["RSI_3_15m"] > 15.0)
-        | (df["RSI_3_1h"] > 60.0)
-        | (df["RSI_3_1d"] > 60.0)
-        | (df["RSI_14_15m"] < 30.0)
-        | (df["RSI_14_1h"] < 50.0)
-        | (df["RSI_14_4h"] < 50.0)
-        | (df["AROONU_14_1h"] < 70.0)
-        | (df["ROC_9_1d"] < 80.0)
-      )
-      # 15m & 4h & 1d down move, 15m & 1h & 4h still not low enough, 15m & 1d downtrend
-      & (
-        (df["RSI_3_15m"] > 15.0)
-        | (df["RSI_3_4h"] > 15.0)
-        | (df["RSI_3_1d"] > 25.0)
-        | (df["RSI_14_15m"] > 25.0)
-        | (df["RSI_14_1h"] < 30.0)
-        | (df["RSI_14_4h"] < 30.0)
-        | (df["CMF_20_15m"] > -0.3)
-        | (df["CMF_20_1d"] > -0.3)
-        | (df["AROONU_14_15m"] < 30.0)
-      )
-      # 15m & 1d down move, 15m still not low enough, 1h & 4h high
-      & (
-        (df["RSI_3_15m"] > 15.0)
-        | (df["RSI_3_1d"] > 5.0)
-        | (df["RSI_14_15m"] < 30.0)
-        | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
-        | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
-      )
-      # 15m down move, 15m still not low enough, 1h & 4h high, 1d overbought
-      & (
-        (df["RSI_3_15m"] > 15.0)
-        | (df["AROONU_14_15m"] < 30.0)
-        | (df["AROONU_14_1h"] < 85.0)
-        | (df["AROONU_14_4h"] < 100.0)
-        | (df["ROC_9_1d"] < 250.0)
-      )
-      # 15m & 1h down move, 15m still not low enough, 1h & 4h still high, 1d overbought
-      & (
-        (df["RSI_3_15m"] > 20.0)
-        | (df["RSI_3_1h"] > 25.0)
-        | (df["RSI_14_15m"] < 30.0)
-        | (df["RSI_14_1h"] < 40.0)
-        | (df["RSI_14_4h"] < 50.0)
-        | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
-        | (df["ROC_9_1d"] < 150.0)
-      )
-      # 15m & 1h & 1d down move, 1h & 4h still high, 15m downtrend, 1d overbought
-      & (
-        (df["RSI_3_15m"] > 20.0)
-        | (df["RSI_3_1h"] > 25.0)
-        | (df["RSI_3_1d"] > 55.0)
-        | (df["RSI_14_1h"] < 40.0)
-        | (df["RSI_14_4h"] < 50.0)
-        | (df["CMF_20_15m"] > -0.3)
-        | (df["ROC_9_1d"] < 80.0)
-      )
-      # 15m & 1h & 4h & 1d down move, 1d still high, 1h still high, 4h high
-      & (
-        (df["RSI_3_15m"] > 20.0)
-        | (df["RSI_3_1h"] > 35.0)
-        | (df["RSI_3_4h"] > 45.0)
-        | (df["RSI_3_1d"] > 25.0)
-        | (df["MFI_14_1d"] < 50.0)
-        | (df["AROONU_14_1h"] < 50.0)
-        | (df["AROONU_14_4h"] < 85.0)
-      )
-      # 15m & 1h & 4h down move, 15m still not low enough, 1h still high, 4h high & overbought
-      & (
-        (df["RSI_3_15m"] > 20.0)
-        | (df["RSI_3_1h"] > 40.0)
-        | (df["RSI_3_4h"] > 60.0)
-        | (df["RSI_14_15m"] < 30.0)
-        | (df["AROONU_14_15m"] < 30.0)
-        | (df["AROONU_14_1h"] < 50.0)
-        | (df["AROONU_14_4h"] < 85.0)
-        | (df["ROC_9_4h"] < 30.0)
-      )
-      # 15m & 1h & 4h down move, 1h & 4h high, 4h & 1d overbought
-      & (
-        (df["RSI_3_15m"] > 20.0)
-        | (df["RSI_3_1h"] > 45.0)
-        | (df["RSI_3_4h"] > 60.0)
-        | (df["RSI_14_1h"] < 40.0)
-        | (df["RSI_14_4h"] < 60.0)
-        | (df["AROONU_14_4h"] < 75.0)
-        | (df["ROC_9_4h"] < 25.0)
-        | (df["ROC_9_1d"] < 150.0)
-      )
-      # 15m & 1h down move, 15m still high, 1h high & overbought
-      & (
-        (df["RSI_3_15m"] > 20.0)
-        | (df["RSI_3_1h"] > 60.0)
-        | (df["RSI_14_15m"] < 40.0)
-        | (df["RSI_14_1h"] < 50.0)
-        | (df["AROONU_14_1h"] < 70.0)
-        | (df["ROC_9_1h"] < 80.0)
-      )
-      # 15m & 1h down move, 15m still not low enough, 1h still high, 4h high & overbought
-      & (
-        (df["RSI_3_15m"] > 25.0)
-        | (df["RSI_3_1h"] > 30.0)
-        | (df["RSI_14_15m"] < 30.0)
-        | (df["RSI_14_1h"] < 40.0)
-        | (df["RSI_14_4h"] < 70.0)
-        | (df["AROONU_14_1h"] < 70.0)
-        | (df["AROONU_14_4h"] < 100.0)
-        | (df["ROC_9_4h"] < 50.0)
-      )
-      # 15m & 1h & 1d down move, 4h & 1d downtrend, 1h & 4h high, 1d downtrend
-      & (
-        (df["RSI_3_15m"] > 25.0)
-        | (df["RSI_3_1h"] > 35.0)
-        | (df["RSI_3_1d"] > 35.0)
-        | (df["CMF_20_4h"] > -0.1)
-        | (df["CMF_20_1d"] > -0.1)
-        | (df["AROONU_14_1h"] < 75.0)
-        | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
-        | (df["ROC_2_1d"] > -20.0)
-      )
-      # 15m & 1h down move, 1h & 4h high, 4h overbought
-      & (
-        (df["RSI_3_15m"] > 25.0)
-        | (df["RSI_3_1h"] > 60.0)
-        | (df["RSI_14_1h"] < 50.0)
-        | (df["RSI_14_4h"] < 70.0)
-        | (df["AROONU_14_1h"] < 80.0)
-        | (df["AROONU_14_4h"] < 90.0)
-        | (df["ROC_9_4h"] < 120.0)
-      )
-      # 15m down move, 15m still high, 1h & 4h high, 1d downtrend, 4h overbought
-      & (
-        (df["RSI_3_15m"] > 25.0)
-        | (df["RSI_14_15m"] < 40.0)
-        | (df["RSI_14_1h"] < 70.0)
-        | (df["RSI_14_4h"] < 75.0)
-        | (df["CMF_20_1d"] > -0.0)
-        | (df["AROONU_14_4h"] < 90.0)
-        | (df["ROC_9_4h"] < 50.0)
-      )
-      # 15m & 1h down move, 15m still high, 1h & 4h high & overbought
-      & (
-        (df["RSI_3_15m"] > 30.0)
-        | (df["RSI_3_1h"] > 60.0)
-        | (df["RSI_14_15m"] < 40.0)
-        | (df["RSI_14_1h"] < 50.0)
-        | (df["RSI_14_4h"] < 80.0)
-        | (df["AROONU_14_1h"] < 60.0)
-        | (df["AROONU_14_4h"] < 90.0)
-        | (df["ROC_9_1h"] < 50.0)
-        | (df["ROC_9_4h"] < 100.0)
-      )
-      # 15m & 1h down move, 15m still high, 1h & 4h high, 4h overbought
-      & (
-        (df["RSI_3_15m"] > 30.0)
-        | (df["RSI_3_1h"] > 65.0)
-        | (df["RSI_14_15m"] < 40.0)
-        | (df["RSI_14_1h"] < 60.0)
-        | (df["RSI_14_4h"] < 80.0)
-        | (df["AROONU_14_4h"] < 90.0)
-        | (df["ROC_9_4h"] < 130.0)
-      )
-      # 15m & 1h down move, 15m & 1h & 4h high, 1h overbought
-      & (
-        (df["RSI_3_15m"] > 35.0)
-        | (df["RSI_3_1h"] > 65.0)
-        | (df["RSI_14_15m"] < 50.0)
-        | (df["AROONU_14_1h"] < 80.0)
-        | (df["AROONU_14_4h"] < 90.0)
-        | (df["ROC_9_1h"] < 30.0)
-      )
-      # 1h & 4h down move, 1h & 4h downtrend
-      & ((df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 10.0) | (df["CMF_20_1h"] > -0.5) | (df["CMF_20_4h"] > -0.5))
-      # 1h & 4h down move, 1h still high, 4h high, 1d overbought
-      & (
-        (df["RSI_3_1h"] > 5.0)
-        | (df["RSI_3_4h"] > 30.0)
-        | (df["AROONU_14_1h"] < 50.0)
-        | (df["AROONU_14_4h"] < 85.0)
-        | (df["ROC_9_1d"] < 50.0)
-      )
-      # 5m & 15m & 1h & 4h down move, 15m downtrend, 4h high, 1d overbought
-      & (
-        (df["RSI_3_1h"] > 25.0)
-        | (df["RSI_3_4h"] > 25.0)
-        | (df["CMF_20_15m"] > -0.5)
-        | (df["CMF_20_1h"] > -0.3)
-        | (df["CMF_20_4h"] > -0.3)
-        | (df["AROONU_14_1h"] < 50.0)
-      )
-      # 1h & 1d down move, 1h & 4h & 1d still high, 1h & 4h high, 4h overbought
-      & (
-        (df["RSI_3_1h"] > 60.0)
-        | (df["RSI_3_1d"] > 25.0)
-        | (df["RSI_14_1h"] < 50.0)
-        | (df["RSI_14_4h"] < 60.0)
-        | (df["MFI_14_1d"] < 50.0)
-        | (df["AROONU_14_1h"] < 70.0)
-        | (df["AROONU_14_4h"] < 90.0)
-        | (df["ROC_9_4h"] < 25.0)
-      )
-      # 4h down move, 1h & 4h downtrend, 15m high
-      & (
-        (df["RSI_3_4h"] > 3.0)
-        | (df["CMF_20_1h"] > -0.25)
-        | (df["CMF_20_4h"] > -0.30)
-        | (df["STOCHRSIk_14_14_3_3_15m"] < 70.0)
-      )
-      # 1d down move, 15m high, 1h & 4h downtrend
-      & (
-        (df["RSI_3_1d"] > 5.0)
-        | (df["STOCHRSIk_14_14_3_3_15m"] < 70.0)
-        | (df["ROC_9_1h"] > -60.0)
-        | (df["ROC_9_4h"] > -60.0)
-      )
-      # 4h green with top wick, 15m & 1h down move, 15m still not low enough, 1h & 4h high
-      & (
-        (df["change_pct_4h"] < 10.0)
-        | (df["top_wick_pct_4h"] < 10.0)
-        | (df["RSI_3_15m"] > 5.0)
-        | (df["RSI_3_1h"] > 40.0)
-        | (df["RSI_14_15m"] < 30.0)
-        | (df["RSI_14_1h"] < 50.0)
-        | (df["RSI_14_4h"] < 50.0)
-        | (df["AROONU_14_1h"] < 60.0)
-        | (df["AROONU_14_4h"] < 90.0)
-      )
-      # 4h green with top wick, 1h down move, 1h still high, 4h high, 1d overbought
-      & (
-        (df["change_pct_4h"] < 10.0)
-        | (df["top_wick_pct_4h"] < 10.0)
-        | (df["RSI_3_1h"] > 45.0)
-        | (df["RSI_14_1h"] < 40.0)
-        | (df["RSI_14_4h"] < 60.0)
-        | (df["AROONU_14_1h"] < 70.0)
-        | (df["AROONU_14_4h"] < 90.0)
-        | (df["ROC_9_1d"] < 20.0)
-      )
-      # 4h green with top wick, 15m & 1h down move, 1h still high, 4h high
-      & (
-        (df["change_pct_4h"] < 15.0)
-        | (df["top_wick_pct_4h"] < 15.0)
-        | (df["RSI_3_15m"] > 10.0)
-        | (df["RSI_3_1h"] > 35.0)
-        | (df["AROONU_14_1h"] < 50.0)
-        | (df["AROONU_14_4h"] < 100.0)
-      )
-      # 4h green with top wick, 15m & 1h down move, 1h & 4h high
-      & (
-        (df["change_pct_4h"] < 15.0)
-        | (df["top_wick_pct_4h"] < 10.0)
-        | (df["RSI_3_15m"] > 20.0)
-        | (df["RSI_3_1h"] > 40.0)
-        | (df["AROONU_14_1h"] < 80.0)
-        | (df["AROONU_14_4h"] < 100.0)
-      )
-      # 1d red, 1h & 4h down move, 1h still high, 4d downtrend
-      & (
-        (df["change_pct_1d"] > -40.0)
-        | (df["RSI_3_1h"] > 55.0)
-        | (df["RSI_3_4h"] > 10.0)
-        | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
-        | (df["ROC_9_4h"] > -35.0)
-      )
-      # 1d P&D, 15m & 1h & 4h & 1d down move, 4h still not low enough
-      & (
-        (df["change_pct_1d"] > -10.0)
-        | (df["change_pct_1d"].shift(288) < 10.0)
-        | (df["RSI_3_15m"] > 10.0)
-        | (df["RSI_3_1h"] > 25.0)
-        | (df["RSI_3_4h"] > 10.0)
-        | (df["RSI_3_1d"] > 40.0)
-        | (df["RSI_14_4h"] < 30.0)
-      )
-      # 1d red with top wick, 15m & 1h down move, 1h downtrend, 1h high
-      & (
-        (df["change_pct_1d"] > -10.0)
-        | (df["top_wick_pct_1d"] < 10.0)
-        | (df["RSI_3_15m"] > 10.0)
-        | (df["RSI_3_1h"] > 25.0)
-        | (df["CMF_20_1h"] > -0.2)
-        | (df["AROONU_14_1h"] < 70.0)
-        | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
-      )
-      # 1d P&D, 15m & 1h down move, 15m still not low enough, 1h & 4h still high, 1d overbought
-      & (
-        (df["change_pct_1d"] > -5.0)
-        | (df["change_pct_1d"].shift(288) < 10.0)
-        | (df["RSI_3_15m"] > 20.0)
-        | (df["RSI_3_1h"] > 45.0)
-        | (df["RSI_14_15m"] < 30.0)
-        | (df["RSI_14_1h"] < 40.0)
-        | (df["RSI_14_4h"] < 50.0)
-        | (df["ROC_9_1d"] < 100.0)
-      )
-      # 1d P&D, 15m & 1h & 4h down move, 1h & 4h still not low enough, 1h & 4h downtrend, 1d overbought
-      & (
-        (df["change_pct_1d"] > -5.0)
-        | (df["change_pct_1d"].shift(288) < 10.0)
-        | (df["RSI_3_15m"] > 25.0)
-        | (df["RSI_3_1h"] > 30.0)
-        | (df["RSI_3_4h"] > 30.0)
-        | (df["AROONU_14_1h"] < 30.0)
-        | (df["AROONU_14_4h"] < 30.0)
-        | (df["ROC_9_1h"] > -25.0)
-        | (df["ROC_9_4h"] > -25.0)
-        | (df["ROC_9_1d"] < 50.0)
-      )
-      # 1d green with top wick, 15m down move, 1h & 4h high, 1d overbought
-      & (
-        (df["change_pct_1d"] < 10.0)
-        | (df["top_wick_pct_1d"] < 10.0)
-        | (df["RSI_3_15m"] > 10.0)
-        | (df["RSI_14_1h"] < 70.0)
-        | (df["RSI_14_4h"] < 80.0)
-        | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
-        | (df["ROC_9_1d"] < 40.0)
-      )
-      # 1d green with top wick, 1h & 4h down move, 1h & 4h still high
-      & (
-        (df["change_pct_1d"] < 10.0)
-        | (df["top_wick_pct_1d"] < 10.0)
-        | (df["RSI_3_1h"] > 55.0)
-        | (df["RSI_3_4h"] > 55.0)
-        | (df["AROONU_14_1h"] < 50.0)
-        | (df["AROONU_14_4h"] < 50.0)
-      )
-      # 1d green with top wick, 15m & 1h & 4h down move, 15m still not low enough, 4h high, 1d overbought
-      & (
-        (df["change_pct_1d"] < 30.0)
-        | (df["top_wick_pct_1d"] < 10.0)
-        | (df["RSI_3_15m"] > 30.0)
-        | (df["RSI_3_1h"] > 30.0)
-        | (df["RSI_3_4h"] > 70.0)
-        | (df["RSI_14_4h"] < 60.0)
-        | (df["AROONU_14_15m"] < 25.0)
-        | (df["AROONU_14_4h"] < 70.0)
-        | (df["ROC_9_1d"] < 40.0)
-      )
-      # 1d green with top wick, 15m & 1h & 4h down move, 1h still not low enough, 4h still high, 1d overbought
-      & (
-        (df["change_pct_1d"] < 30.0)
-        | (df["top_wick_pct_1d"] < 20.0)
-        | (df["RSI_3_15m"] > 10.0)
-        | (df["RSI_3_1h"] > 40.0)
-        | (df["RSI_3_4h"] > 40.0)
-        | (df["AROONU_14_1h"] < 20.0)
-        | (df["AROONU_14_4h"] < 50.0)
-        | (df["ROC_9_1d"] < 100.0)
-      )
-      # 1d green with top wick, 1h down move, 1h still high, 4h high & overbought, 1d overbought
-      & (
-        (df["change_pct_1d"] < 30.0)
-        | (df["top_wick_pct_1d"] < 20.0)
-        | (df["RSI_3_1h"] > 50.0)
-        | (df["RSI_14_1h"] < 40.0)
-        | (df["RSI_14_4h"] < 60.0)
-        | (df["AROONU_14_4h"] < 70.0)
-        | (df["ROC_9_4h"] < 40.0)
-        | (df["ROC_9_1d"] < 50.0)
-      )
-      # 1d top wick, 1h & 4h down move, 15m downtrend, 4h still high, 1d overbought
-      & (
-        (df["top_wick_pct_1d"] < 20.0)
-        | (df["RSI_3_1h"] > 10.0)
-        | (df["RSI_3_4h"] > 45.0)
-        | (df["CMF_20_15m"] > -0.2)
-        | (df["AROONU_14_4h"] < 50.0)
-        | (df["ROC_9_1d"] < 80.0)
-      )
-      # 1d top wick, 4h down move, 4h still high, 1d overbought
-      & (
-        (df["top_wick_pct_1d"] < 25.0)
-        | (df["RSI_3_4h"] > 25.0)
-        | (df["RSI_14_4h"] < 45.0)
-        | (df["AROONU_14_4h"] < 40.0)
-        | (df["ROC_9_1d"] < 200.0)
-      )
-      # 1d top wick, 15m & 1h & 4h down move, 15m & 1h downtrend, 4h still high
-      & (
-        (df["top_wick_pct_1d"] < 25.0)
-        | (df["RSI_3_15m"] > 10.0)
-        | (df["RSI_3_1h"] > 30.0)
-        | (df["RSI_3_4h"] > 50.0)
-        | (df["CMF_20_15m"] > -0.25)
-        | (df["CMF_20_1h"] > -0.25)
-        | (df["AROONU_14_4h"] < 50.0)
-      )
-      # pump, drop but not yet near the previous lows, 15m & 1h & 4h & 1d down move, 1d overbought
-      & (
-        (((df["high_max_6_1d"] - df["low_min_6_1d"]) / df["low_min_6_1d"]) < 1.5)
-        | (df["close"] > (df["high_max_6_4h"] * 0.70))
-        | (df["close"] < (df["low_min_6_1d"] * 1.25))
-        | (df["RSI_3_15m"] > 15.0)
-        | (df["RSI_3_1h"] > 25.0)
-        | (df["RSI_3_4h"] > 25.0)
-        | (df["RSI_3_1d"] > 45.0)
-        | (df["ROC_9_1d"] < 20.0)
-      )
-      # drop in last 12 hours, 1h & 4h down move, 1h & 4h downtrend
-      & (
-        (df["close"] > (df["high_max_12_1h"] * 0.35))
-        | (df["RSI_3_1h"] > 15.0)
-        | (df["RSI_3_4h"] > 5.0)
-        | (df["ROC_9_1h"] > -50.0)
-        | (df["ROC_9_4h"] > -50.0)
-      )
-      # drop in last 4 days, 15m & 1h & 4h down move, 15m still not low enough, 1h still high, 4h overbought
-      & (
-        (df["close"] > (df["high_max_24_4h"] * 0.40))
-        | (df["RSI_3_15m"] > 10.0)
-        | (df["RSI_3_1h"] > 25.0)
-        | (df["RSI_3_4h"] > 50.0)
-        | (df["RSI_14_15m"] < 30.0)
-        | (df["RSI_14_1h"] < 40.0)
-        | (df["ROC_9_4h"] < 20.0)
-      )
-      # drop in last 4 days, 15m & 1h & 4h & 1d down move, 4h high
-      & (
-        (df["close"] > (df["high_max_24_4h"] * 0.40))
-        | (df["RSI_3_15m"] > 10.0)
-        | (df["RSI_3_1h"] > 40.0)
-        | (df["RSI_3_4h"] > 60.0)
-        | (df["RSI_3_1d"] > 10.0)
-        | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0)
-      )
-      # drop in last 6 days, 15m & 1h & 4h & 1d down move, 1d high, 4h downtrend
-      & (
-        (df["close"] > (df["high_max_24_4h"] * 0.35))
-        | (df["RSI_3_15m"] > 5.0)
-        | (df["RSI_3_1h"] > 25.0)
-        | (df["RSI_3_4h"] > 25.0)
-        | (df["RSI_3_1d"] > 30.0)
-        | (df["AROONU_14_1d"] < 80.0)
-        | (df["ROC_9_4h"] > -40.0)
-      )
-      # drop in last 4 days, 15m & 1d down move, 15m still not low enough, 1h still high, 1d high, 4h downtrend
-      & (
-        (df["close"] > (df["high_max_24_4h"] * 0.35))
-        | (df["RSI_3_15m"] > 15.0)
-        | (df["RSI_3_1d"] > 30.0)
-        | (df["AROONU_14_15m"] < 25.0)
-        | (df["AROONU_14_1h"] < 40.0)
-        | (df["AROONU_14_1d"] < 80.0)
-        | (df["ROC_9_4h"] > -50.0)
-      )
-      # drop in last 4 days, 1h & 5h & 1d down move, 1h still high, 1h & 4h downtrend
-      & (
-        (df["close"] > (df["high_max_24_4h"] * 0.25))
-        | (df["RSI_3_1h"] > 20.0)
-        | (df["RSI_3_4h"] > 25.0)
-        | (df["RSI_3_1d"] > 25.0)
-        | (df["AROONU_14_1h"] < 50.0)
-        | (df["ROC_9_1h"] > -20.0)
-        | (df["ROC_9_4h"] > -35.0)
-      )
-      # drop in last 4 days, 1d down move, 1h & 4h downtrend, 15m & 4h downtrend
-      & (
-        (df["close"] > (df["high_max_24_4h"] * 0.25))
-        | (df["RSI_3_1d"] > 15.0)
-        | (df["CMF_20_1h"] > -0.20)
-        | (df["CMF_20_4h"] > -0.20)
-        | (df["ROC_9_15m"] > -15.0)
-        | (df["ROC_9_4h"] > -20.0)
-      )
-      # drop in last 6 days, 15m & 1d down move, 1h still high, 4h high, 4h downtrend
-      & (
-        (df["close"] > (df["high_max_6_1d"] * 0.25))
-        | (df["RSI_3_15m"] > 15.0)
-        | (df["RSI_3_1d"] > 15.0)
-        | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
-        | (df["STOCHRSIk_14_14_3_3_4h"] < 60.0)
-        | (df["ROC_9_4h"] > -25.0)
-      )
-      # drop in last 6 days, 15m & 1h down move, 15m & 1h still not low enough, 15m & 1h & 4h & 1d downtrend
-      & (
-        (df["close"] > (df["high_max_6_1d"] * 0.25))
-        | (df["RSI_3_15m"] > 25.0)
-        | (df["RSI_3_1h"] > 30.0)
-        | (df["RSI_14_15m"] < 30.0)
-        | (df["CMF_20_15m"] > -0.10)
-        | (df["CMF_20_1h"] > -0.10)
-        | (df["CMF_20_4h"] > -0.40)
-        | (df["CMF_20_1d"] > -0.50)
-        | (df["AROONU_14_1h"] < 30.0)
-      )
-      # drop in last 4 days, 1d down move, 1d downtrendm 1h still high, 1d downtrend
-      & (
-        (df["close"] > (df["high_max_24_4h"] * 0.15))
-        | (df["RSI_3_1d"] > 20.0)
-        | (df["CMF_20_1d"] > -0.30)
-        | (df["AROONU_14_1h"] < 50.0)
-        | (df["ROC_2_1d"] > -40.0)
-      )
-      # drop in last 6 days, 1d down move, 1h & 4h & 1d downtrend, 1d still high, 4h downtrend
-      & (
-        (df["close"] > (df["high_max_6_1d"] * 0.15))
-        | (df["RSI_3_1d"] > 20.0)
-        | (df["CMF_20_1h"] > -0.10)
-        | (df["CMF_20_4h"] > -0.40)
-        | (df["CMF_20_1d"] > -0.50)
-        | (df["AROONU_14_1d"] < 50.0)
-        | (df["ROC_9_4h"] > -30.0)
-      )
-      # drop in last 12 days, 15m & 1h down move, 1h still not low enough, 4h high
-      & (
-        (df["close"] > (df["high_max_12_1d"] * 0.25))
-        | (df["RSI_3_15m"] > 15.0)
-        | (df["RSI_3_1h"] > 30.0)
-        | (df["RSI_14_1h"] < 30.0)
-        | (df["RSI_14_4h"] < 30.0)
-        | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
-        | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
-      )
-      # drop in last 20 days, 15m & 1h & 1d down move, 15m still not low enough, 1h high
-      & (
-        (df["close"] > (df["high_max_20_1d"] * 0.05))
-        | (df["RSI_3_15m"] > 10.0)
-        | (df["RSI_3_1h"] > 25.0)
-        | (df["RSI_3_1d"] > 25.0)
-        | (df["AROONU_14_15m"] < 30.0)
-        | (df["AROONU_14_1h"] < 80.0)
-      )
-      # drop in last 30 days, 15m & 1h down move, 1h still high, 4h high & overbought
-      & (
-        (df["close"] > (df["high_max_30_1d"] * 0.10))
-        | (df["RSI_3_15m"] > 10.0)
-        | (df["RSI_3_1h"] > 55.0)
-        | (df["AROONU_14_1h"] < 40.0)
-        | (df["AROONU_14_4h"] < 85.0)
-        | (df["ROC_9_4h"] < 80.0)
-      )
-      # drop in last 30 days, 15m down move, 15m & 1h high
-      & (
-        (df["close"] > (df["high_max_30_1d"] * 0.05))
-        | (df["RSI_3_15m"] > 15.0)
-        | (df["RSI_3_4h"] > 50.0)
-        | (df["AROONU_14_15m"] < 80.0)
-        | (df["STOCHRSIk_14_14_3_3_1h"] < 85.0)
-      )
-    )
+    # Global protections Long (the clauses are in PROTECTIONS_LONG_GLOBAL)
+    df["protections_long_global"] = evaluate_protections(df, PROTECTIONS_LONG_GLOBAL)
 
     df["global_protections_long_pump"] = True
 
@@ -4173,347 +3580,23 @@ class NostalgiaForInfinityX6(IStrategy):
 
     df["protections_long_rebuy"] = True
 
-    # Global protections Short
+    # Global protections Short (the clauses are in PROTECTIONS_SHORT_GLOBAL_PUMP/PROTECTIONS_SHORT_GLOBAL_DUMP)
     df["protections_short_global"] = True
 
-    df["global_protections_short_pump"] = (
-      # 15m & 1h & 4h & 1d up move, 15m & 1h & 4h still not high enough, 1d still not high enough & uptrend
-      (
-        (df["RSI_3_15m"] < 40.0)
-        | (df["RSI_3_1h"] < 40.0)
-        | (df["RSI_3_4h"] < 85.0)
-        | (df["RSI_3_1d"] < 85.0)
-        | (df["RSI_14_15m"] > 70.0)
-        | (df["CCI_20_15m"] > 350.0)
-        | (df["RSI_14_1h"] > 75.0)
-        | (df["CCI_20_1h"] > 250.0)
-        | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0)
-        | (df["RSI_14_4h"] > 95.0)
-        | (df["AROOND_14_4h"] < 50.0)
-        | (df["CCI_20_4h"] > 250.0)
-        | (df["RSI_14_1d"] > 60.0)
-        | (df["AROOND_14_1d"] < 75.0)
-        | (df["STOCHRSIk_14_14_3_3_1d"] > 70.0)
-        | (df["ROC_9_1d"] < 40.0)
-      )
-      # 15m & 1h & 4h & 1d up move, 15m & 1h & 4h still not high enough, 1d still not high enough & uptrend
-      & (
-        (df["RSI_3_15m"] < 60.0)
-        | (df["RSI_3_1h"] < 60.0)
-        | (df["RSI_3_4h"] < 80.0)
-        | (df["RSI_3_1d"] < 90.0)
-        | (df["RSI_14_15m"] > 90.0)
-        | (df["CCI_20_15m"] > 350.0)
-        | (df["RSI_14_1h"] > 90.0)
-        | (df["CCI_20_1h"] > 300.0)
-        | (df["RSI_14_4h"] > 80.0)
-        | (df["CCI_20_4h"] > 200.0)
-        | (df["RSI_14_1d"] > 95.0)
-        | (df["ROC_9_1d"] < 80.0)
-      )
-      # 1d green, 15m & 1h & 4h & 1d up move, 4h & 1d still not high enough & uptrend
-      & (
-        (df["RSI_3_15m"] < 60.0)
-        | (df["RSI_3_1h"] < 70.0)
-        | (df["RSI_3_4h"] < 70.0)
-        | (df["RSI_3_1d"] < 80.0)
-        | (df["RSI_14_4h"] > 70.0)
-        | (df["WILLR_14_4h"] > -10.0)
-        | (df["STOCHRSIk_14_14_3_3_4h"] > 80.0)
-        | (df["ROC_9_4h"] < 40.0)
-        | (df["RSI_14_1d"] > 80.0)
-        | (df["ROC_9_1d"] < 100.0)
-      )
-      # 15m & 1h & 1d up move, 15m & 1h & 4h still not high enough, 1d still not high enough & uptrend
-      & (
-        (df["RSI_3_15m"] < 65.0)
-        | (df["RSI_3_1h"] < 70.0)
-        | (df["RSI_3_1d"] < 60.0)
-        | (df["RSI_14_15m"] > 90.0)
-        | (df["CMF_20_15m"] > 0.40)
-        | (df["WILLR_14_15m"] > -10.0)
-        | (df["CCI_20_15m"] > 450.0)
-        | (df["STOCHk_14_3_3_15m"] > 90.0)
-        | (df["RSI_14_1h"] > 90.0)
-        | (df["CMF_20_1h"] > 0.20)
-        | (df["WILLR_14_1h"] > -5.0)
-        | (df["CCI_20_1h"] > 250.0)
-        | (df["RSI_14_4h"] > 90.0)
-        | (df["CMF_20_4h"] > 0.10)
-        | (df["CCI_20_4h"] > 250.0)
-        | (df["RSI_14_1d"] > 90.0)
-        | (df["ROC_9_1d"] < 25.0)
-      )
-      # 15m & 1h & 4h & 1d up move, 15m & 1h & 4h & 1d still not high enough, 1d uptrend
-      & (
-        (df["RSI_3_15m"] < 70.0)
-        | (df["RSI_3_1h"] < 80.0)
-        | (df["RSI_3_4h"] < 80.0)
-        | (df["RSI_3_1d"] < 80.0)
-        | (df["MFI_14_15m"] > 90.0)
-        | (df["STOCHRSIk_14_14_3_3_15m"] > 90.0)
-        | (df["MFI_14_1h"] > 90.0)
-        | (df["MFI_14_4h"] > 80.0)
-        | (df["WILLR_14_4h"] > -5.0)
-        | (df["AROOND_14_4h"] < 50.0)
-        | (df["ROC_9_1d"] < 40.0)
-      )
-      # 15m & 1h up move, 15m & 1h & 4h still not high enough, 1d still not high enough & uptrend
-      & (
-        (df["RSI_3_15m"] < 70.0)
-        | (df["RSI_3_1h"] < 85.0)
-        | (df["MFI_14_15m"] > 90.0)
-        | (df["STOCHRSIk_14_14_3_3_15m"] > 80.0)
-        | (df["RSI_14_1h"] > 80.0)
-        | (df["MFI_14_1h"] > 80.0)
-        | (df["STOCHRSIk_14_14_3_3_1h"] > 70.0)
-        | (df["RSI_14_4h"] > 80.0)
-        | (df["RSI_14_1d"] > 80.0)
-        | (df["ROC_9_1d"] < 40.0)
-      )
-      # 15m & 1h & 4h & 1d up move, 15m & 1h still not high enough, 4h & 1d stil not high enough & uptrend
-      & (
-        (df["RSI_3_15m"] < 80.0)
-        | (df["RSI_3_1h"] < 80.0)
-        | (df["RSI_3_4h"] < 80.0)
-        | (df["RSI_3_1d"] < 95.0)
-        | (df["RSI_14_15m"] > 85.0)
-        | (df["CCI_20_15m"] > 250.0)
-        | (df["RSI_14_1h"] > 85.0)
-        | (df["CCI_20_1h"] > 250.0)
-        | (df["CCI_20_change_pct_1h"] < -0.0)
-        | (df["STOCHRSIk_14_14_3_3_1h"] > 90.0)
-        | (df["RSI_14_4h"] > 85.0)
-        | (df["CCI_20_4h"] > 250.0)
-        | (df["CCI_20_change_pct_4h"] < -0.0)
-        | (df["STOCHRSIk_14_14_3_3_4h"] > 90.0)
-        | (df["ROC_9_4h"] < 30.0)
-        | (df["RSI_14_1d"] > 90.0)
-        | (df["WILLR_14_1d"] > -10.0)
-        | (df["ROC_9_1d"] < 50.0)
-      )
-      # 15m & 1h & 4h up move, 15m & 1h still not high enough, 4h still not high enough & uptrend
-      & (
-        (df["RSI_3_15m"] < 80.0)
-        | (df["RSI_3_1h"] < 80.0)
-        | (df["RSI_3_4h"] < 90.0)
-        | (df["RSI_14_15m"] > 90.0)
-        | (df["CCI_20_15m"] > 400.0)
-        | (df["RSI_14_1h"] > 90.0)
-        | (df["CCI_20_1h"] > 400.0)
-        | (df["CCI_20_4h"] > 400.0)
-        | (df["ROC_9_4h"] < 200.0)
-      )
-      # 15m & 1h up move, 15m & 1h & 4h still not high enough, 1d still not high enough & uptrend
-      & (
-        (df["RSI_3_15m"] < 80.0)
-        | (df["RSI_3_1h"] < 90.0)
-        | (df["RSI_14_15m"] > 85.0)
-        | (df["CCI_20_15m"] > 250.0)
-        | (df["RSI_14_1h"] > 75.0)
-        | (df["AROOND_14_1h"] < 50.0)
-        | (df["CCI_20_1h"] > 350.0)
-        | (df["CCI_20_change_pct_1h"] < -0.0)
-        | (df["RSI_14_4h"] > 85.0)
-        | (df["CCI_20_4h"] > 150.0)
-        | (df["CCI_20_change_pct_4h"] < -0.0)
-        | (df["STOCHRSIk_14_14_3_3_4h"] > 70.0)
-        | (df["RSI_14_1d"] > 85.0)
-        | (df["ROC_9_1d"] < 50.0)
-      )
-      # 15m & 1h & 4h & 1d up move, 15m & 1h & 4h & 1d still not high enough
-      & (
-        (df["RSI_3_15m"] < 80.0)
-        | (df["RSI_3_1h"] < 90.0)
-        | (df["RSI_3_4h"] < 70.0)
-        | (df["RSI_3_1d"] < 70.0)
-        | (df["RSI_14_15m"] > 85.0)
-        | (df["RSI_14_1h"] > 85.0)
-        | (df["CCI_20_1h"] > 250.0)
-        | (df["CCI_20_change_pct_1h"] < -0.0)
-        | (df["RSI_14_4h"] > 70.0)
-        | (df["AROOND_14_4h"] < 75.0)
-        | (df["CCI_20_4h"] > 200.0)
-        | (df["CCI_20_change_pct_4h"] < -0.0)
-        | (df["STOCHk_14_3_3_4h"] > 70.0)
-        | (df["RSI_14_1d"] > 70.0)
-      )
-      # 15m & 1h & 4h & 1d up move, 1h still not high enough, 1d still low, 4h & 1d uptrend
-      & (
-        (df["RSI_3_15m"] < 80.0)
-        | (df["RSI_3_1h"] < 85.0)
-        | (df["RSI_3_4h"] < 90.0)
-        | (df["RSI_3_1d"] < 95.0)
-        | (df["STOCHRSIk_14_14_3_3_1h"] > 60.0)
-        | (df["AROOND_14_1d"] < 50.0)
-        | (df["ROC_9_4h"] < 100.0)
-        | (df["ROC_9_1d"] < 100.0)
-      )
-      # 15m & 1h & 4h & 1d up move, 15m & 1h still not high enough, 4h & 1d still not high enough & uptrend
-      & (
-        (df["RSI_3_15m"] < 80.0)
-        | (df["RSI_3_1h"] < 80.0)
-        | (df["RSI_3_4h"] < 90.0)
-        | (df["RSI_3_1d"] < 95.0)
-        | (df["RSI_14_15m"] > 85.0)
-        | (df["STOCHk_14_3_3_15m"] > 90.0)
-        | (df["RSI_14_1h"] > 90.0)
-        | (df["STOCHk_14_3_3_1h"] > 90.0)
-        | (df["RSI_14_4h"] > 95.0)
-        | (df["STOCHk_14_3_3_4h"] > 90.0)
-        | (df["ROC_9_4h"] < 50.0)
-        | (df["RSI_14_1d"] > 95.0)
-        | (df["STOCHk_14_3_3_1d"] > 70.0)
-        | (df["AROOND_14_1d"] < 50.0)
-        | (df["ROC_9_1d"] < 50.0)
-      )
-      # 15m & 1h & 4h up move, 1h & 4h still not high enough, 1d uptrend
-      & (
-        (df["RSI_3_15m"] < 85.0)
-        | (df["RSI_3_1h"] < 80.0)
-        | (df["RSI_3_4h"] < 60.0)
-        | (df["WILLR_14_1h"] > -5.0)
-        | (df["AROOND_14_1h"] < 25.0)
-        | (df["WILLR_14_4h"] > -10.0)
-        | (df["AROOND_14_4h"] < 50.0)
-        | (df["STOCHRSIk_14_14_3_3_4h"] > 60.0)
-        | (df["ROC_9_1d"] < 50.0)
-      )
-      # 15m & 1h & 4h up move, 15m still not high enough, 1h & 4h still not high enough & uptrend, 1d still not high enough
-      & (
-        (df["RSI_3_15m"] < 85.0)
-        | (df["RSI_3_1h"] < 85.0)
-        | (df["RSI_3_4h"] < 90.0)
-        | (df["RSI_14_15m"] > 95.0)
-        | (df["CMF_20_15m"] > 0.50)
-        | (df["UO_7_14_28_15m"] > 80.0)
-        | (df["UO_7_14_28_change_pct_15m"] < -0.0)
-        | (df["CCI_20_15m"] > 250.0)
-        | (df["STOCHk_14_3_3_15m"] > 90.0)
-        | (df["RSI_14_1h"] > 95.0)
-        | (df["CMF_20_1h"] > 0.50)
-        | (df["UO_7_14_28_1h"] > 80.0)
-        | (df["CCI_20_1h"] > 350.0)
-        | (df["ROC_9_1h"] < 10.0)
-        | (df["RSI_14_4h"] > 90.0)
-        | (df["CMF_20_4h"] > 0.35)
-        | (df["UO_7_14_28_4h"] > 75.0)
-        | (df["CCI_20_4h"] > 500.0)
-        | (df["ROC_2_4h"] < 10.0)
-        | (df["ROC_9_4h"] < 10.0)
-        | (df["RSI_14_1d"] > 70.0)
-      )
-      # 15m & 1h & 4h up move, 15m & 1h & 4h still not high enough, 1d still not high enough & overbought
-      & (
-        (df["RSI_3_15m"] < 90.0)
-        | (df["RSI_3_1h"] < 60.0)
-        | (df["RSI_3_4h"] < 60.0)
-        | (df["RSI_14_15m"] > 85.0)
-        | (df["CCI_20_15m"] > 250.0)
-        | (df["RSI_14_1h"] > 70.0)
-        | (df["CCI_20_1h"] > 200.0)
-        | (df["STOCHk_14_3_3_1h"] > 90.0)
-        | (df["RSI_14_4h"] > 65.0)
-        | (df["CCI_20_4h"] > 200.0)
-        | (df["STOCHk_14_3_3_4h"] > 90.0)
-        | (df["RSI_14_1d"] > 65.0)
-        | (df["STOCHk_14_3_3_1d"] > 70.0)
-        | (df["ROC_9_1d"] < 30.0)
-      )
-      # 15m & 1h & 4h & 1d up move, 15m & 1h & 4h still not high enough. 1d still not high enough & uptrend
-      & (
-        (df["RSI_3_15m"] < 95.0)
-        | (df["RSI_3_1h"] < 80.0)
-        | (df["RSI_3_4h"] < 80.0)
-        | (df["RSI_3_1d"] < 80.0)
-        | (df["RSI_14_15m"] > 90.0)
-        | (df["RSI_14_1h"] > 90.0)
-        | (df["STOCHRSIk_14_14_3_3_1h"] > 70.0)
-        | (df["RSI_14_4h"] > 90.0)
-        | (df["WILLR_14_4h"] > -5.0)
-        | (df["RSI_14_1d"] > 80.0)
-        | (df["STOCHRSIk_14_14_3_3_1d"] > 80.0)
-        | (df["ROC_9_1d"] < 40.0)
-      )
-      # 15m & 1h & 4h up move, 15m & 1h still not high enough, 4h still not high enough & uptrend
-      & (
-        (df["RSI_3_15m"] < 95.0)
-        | (df["RSI_3_1h"] < 90.0)
-        | (df["RSI_3_4h"] < 90.0)
-        | (df["RSI_14_15m"] > 90.0)
-        | (df["CCI_20_15m"] > 250.0)
-        | (df["RSI_14_1h"] > 90.0)
-        | (df["AROOND_14_1h"] < 25.0)
-        | (df["CCI_20_1h"] > 300.0)
-        | (df["STOCHk_14_3_3_1h"] > 90.0)
-        | (df["RSI_14_4h"] > 95.0)
-        | (df["CCI_20_4h"] > 300.0)
-        | (df["ROC_9_4h"] < 20.0)
-      )
-      # 1h & 4h & 1d up move, 15m still not high enough, 1h & 4h & 1d still not high enough, 1d uptrend
-      & (
-        (df["RSI_3_1h"] < 80.0)
-        | (df["RSI_3_4h"] < 60.0)
-        | (df["RSI_3_1d"] < 90.0)
-        | (df["STOCHRSIk_14_14_3_3_15m"] > 80.0)
-        | (df["WILLR_14_1h"] > -20.0)
-        | (df["WILLR_14_4h"] > -25.0)
-        | (df["STOCHRSIk_14_14_3_3_4h"] > 20.0)
-        | (df["AROOND_14_1d"] < 50.0)
-        | (df["ROC_9_1d"] < 20.0)
-      )
-    )
+    df["global_protections_short_pump"] = evaluate_protections(df, PROTECTIONS_SHORT_GLOBAL_PUMP)
 
-    df["global_protections_short_dump"] = (
-      # 15m & 1h up move, 15m & 1h still not high enough, 4h still low, 1d still low & downtrend
-      (
-        (df["RSI_3_15m"] < 80.0)
-        | (df["RSI_3_1h"] < 70.0)
-        | (df["RSI_14_15m"] > 80.0)
-        | (df["CCI_20_15m"] > 400.0)
-        | (df["RSI_14_1h"] > 75.0)
-        | (df["CCI_20_1h"] > 250.0)
-        | (df["RSI_14_4h"] > 60.0)
-        | (df["AROOND_14_4h"] < 50.0)
-        | (df["CCI_20_4h"] > 200.0)
-        | (df["RSI_14_1d"] > 50.0)
-        | (df["AROOND_14_1d"] < 75.0)
-        | (df["ROC_9_1d"] > -30.0)
-      )
-      # 15m up move, 15m still low, 1h & 4h & 1d still not high
-      & (
-        (df["RSI_3_15m"] < 85.0)
-        | (df["AROOND_14_15m"] < 50.0)
-        | (df["RSI_14_1h"] > 70.0)
-        | (df["WILLR_14_1h"] > -50.0)
-        | (df["STOCHRSIk_14_14_3_3_1h"] > 80.0)
-        | (df["AROOND_14_1h"] < 75.0)
-        | (df["RSI_14_4h"] > 70.0)
-        | (df["WILLR_14_4h"] > -50.0)
-        | (df["AROOND_14_4h"] < 25.0)
-        | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0)
-        | (df["RSI_14_1d"] > 70.0)
-      )
-      # 1h & 4h up move, 15m & 1h & 4h still not high enough, 1d still low & downtrend
-      & (
-        (df["RSI_3_1h"] < 70.0)
-        | (df["RSI_3_4h"] < 90.0)
-        | (df["RSI_14_15m"] > 95.0)
-        | (df["CCI_20_15m"] > 600.0)
-        | (df["RSI_14_1h"] > 95.0)
-        | (df["CCI_20_1h"] > 600.0)
-        | (df["RSI_14_4h"] > 95.0)
-        | (df["WILLR_14_4h"] > -10.0)
-        | (df["CCI_20_4h"] > 600.0)
-        | (df["RSI_14_1d"] > 40.0)
-        | (df["ROC_9_1d"] > -20.0)
-      )
-    )
+    df["global_protections_short_dump"] = evaluate_protections(df, PROTECTIONS_SHORT_GLOBAL_DUMP)
 
     df["protections_short_rebuy"] = True
 
+    # Exit signals per candle and profit band
+    if self.exit_signals_precompute is not None:
+      df = self.exit_signals_precompute.populate(df)
+
     tok = time.perf_counter()
     log.debug(f"[{metadata['pair']}] Populate indicators took a total of: {tok - tik:0.4f} seconds.")
+    if self.profiler is not None:
+      self.profiler.record(metadata["pair"], "populate_indicators", tik, tok, is_root=True)
 
     return df
 
@@ -4538,38 +3621,47 @@ class NostalgiaForInfinityX6(IStrategy):
     # Mode configurations (dynamic structure)
     mode_configs = {
       "grind": {
-        "tags": self.long_grind_mode_tags,
+        "mask": self.long_grind_mode_mask,
         "coins": self.grind_mode_coins,
         "max_slots": self.grind_mode_max_slots,
         "log_message": "grind mode",
       },
       "top_coins": {
-        "tags": self.long_top_coins_mode_tags,
+        "mask": self.long_top_coins_mode_mask,
         "coins": self.top_coins_mode_coins,
         "log_message": "top coins mode",
       },
       "scalp": {
-        "tags": self.long_scalp_mode_tags,
+        "mask": self.long_scalp_mode_mask,
         "min_free_slots": self.min_free_slots_scalp_mode,
         "log_message": "scalp mode",
       },
     }
 
     # Mode Validation
+    entry_tags_mask = self.get_enter_tags_mask(entry_tag)
     for mode, config in mode_configs.items():
-      if all(c in config["tags"] for c in entry_tag.split()):
+      if (entry_tags_mask & ~config["mask"]) == 0:
+        is_confirmed = True
         if mode == "grind":
-          return self._handle_grind_mode(pair, config, current_time)
+          is_confirmed = self._handle_grind_mode(pair, config, current_time)
         elif mode == "top_coins":
-          return self._handle_top_coins_mode(pair, config, current_time)
+          is_confirmed = self._handle_top_coins_mode(pair, config, current_time)
         elif mode == "scalp":
-          return self._handle_scalp_mode(pair, config, current_time)
+          is_confirmed = self._handle_scalp_mode(pair, config, current_time)
+        if is_confirmed:
+          self.open_trades_index.add_pending_entry(entry_tag, side)
+        return is_confirmed
 
     # Long/Short Slot Validation (only in futures mode)
     if self.is_futures_mode and (self.futures_max_open_trades_long != 0 or self.futures_max_open_trades_short != 0):
-      open_trades = Trade.get_trades_proxy(is_open=True)
-      long_trades = sum(1 for t in open_trades if t.trade_direction == "long")
-      short_trades = sum(1 for t in open_trades if t.trade_direction == "short")
+      if self.open_trades_index.is_built:
+        long_trades = self.open_trades_index.num_long
+        short_trades = self.open_trades_index.num_short
+      else:
+        open_trades = Trade.get_trades_proxy(is_open=True)
+        long_trades = sum(1 for t in open_trades if t.trade_direction == "long")
+        short_trades = sum(1 for t in open_trades if t.trade_direction == "short")
 
       # Long trade limit validation
       if (
@@ -4598,11 +3690,13 @@ class NostalgiaForInfinityX6(IStrategy):
       if (side == "long" and rate > last_candle["close"]) or (side == "short" and rate < last_candle["close"]):
         slippage = (rate / last_candle["close"]) - 1.0
         if (side == "long" and slippage < self.max_slippage) or (side == "short" and slippage > -self.max_slippage):
+          self.open_trades_index.add_pending_entry(entry_tag, side)
           return True
         else:
           log.warning(f"[{current_time}] Cancelling entry for {pair} due to slippage {(slippage * 100.0):.2f}%")
           return False
 
+    self.open_trades_index.add_pending_entry(entry_tag, side)
     return True
 
   def _handle_grind_mode(self, pair: str, config: dict, current_time: datetime) -> bool:
@@ -4611,8 +3705,13 @@ class NostalgiaForInfinityX6(IStrategy):
       log.info(f"[{current_time}] Cancelling entry for {pair} due to not being in grind mode coins list.")
       return False
 
-    open_trades = Trade.get_trades_proxy(is_open=True)
-    num_open_grind_mode = sum(1 for t in open_trades if all(c in config["tags"] for c in t.enter_tag.split()))
+    if self.open_trades_index.is_built:
+      num_open_grind_mode = self.open_trades_index.num_by_mode[self.long_grind_mode_name]
+    else:
+      open_trades = Trade.get_trades_proxy(is_open=True)
+      num_open_grind_mode = sum(
+        1 for t in open_trades if (self.get_enter_tags_mask(t.enter_tag) & ~config["mask"]) == 0
+      )
     if num_open_grind_mode >= config["max_slots"]:
       log.info(f"[{current_time}] Cancelling entry for {pair} due to grind mode slots limit reached.")
       return False
@@ -4627,7 +3726,7 @@ class NostalgiaForInfinityX6(IStrategy):
     return True
 
   def _handle_scalp_mode(self, pair: str, config: dict, current_time: datetime) -> bool:
-    current_free_slots = self.config["max_open_trades"] - Trade.get_open_trade_count()
+    current_free_slots = self.config["max_open_trades"] - self.get_open_trade_count()
     if current_free_slots < config["min_free_slots"]:
       log.info(f"[{current_time}] Cancelling entry for {pair} due to insufficient free slots.")
       return False
@@ -4666,6 +3765,7 @@ class NostalgiaForInfinityX6(IStrategy):
           return False
 
     self._remove_profit_target(pair)
+    self.filled_orders_aggregates_cache.pop(trade.id, None)
     return True
 
   # Bot Loop Start
@@ -4674,7 +3774,10 @@ class NostalgiaForInfinityX6(IStrategy):
     if self.config["runmode"].value not in ("live", "dry_run"):
       return super().bot_loop_start(datetime, **kwargs)
 
+    self.open_trades_index.rebuild(Trade.get_trades_proxy(is_open=True))
+
     if self.hold_support_enabled:
+      self.hold_trades_config_checked = False
       self.load_hold_trades_config()
 
     return super().bot_loop_start(current_time, **kwargs)
@@ -4692,10 +3795,10 @@ class NostalgiaForInfinityX6(IStrategy):
     side: str,
     **kwargs,
   ) -> float:
-    enter_tags = entry_tag.split()
-    if all(c in self.long_rebuy_mode_tags for c in enter_tags):
+    enter_tags_mask = self.get_enter_tags_mask(entry_tag)
+    if (enter_tags_mask & ~self.long_rebuy_mode_mask) == 0:
       return self.futures_mode_leverage_rebuy_mode
-    elif all(c in self.long_grind_mode_tags for c in enter_tags):
+    elif (enter_tags_mask & ~self.long_grind_mode_mask) == 0:
       return self.futures_mode_leverage_grind_mode
     return self.futures_mode_leverage
 
@@ -4708,6 +3811,16 @@ class NostalgiaForInfinityX6(IStrategy):
           min_stake = 5.0 / self.futures_mode_leverage
     return min_stake
 
+  def get_enter_tags_mask(self, enter_tags) -> int:
+    """Mode tags bitmask of an enter tag (string or split tags), parsed once per distinct enter tag"""
+    return self.mode_tag_masks.enter_tags_mask(enter_tags)
+
+  def get_open_trade_count(self) -> int:
+    """Number of open trades, from the bot loop snapshot when available"""
+    if self.open_trades_index.is_built:
+      return self.open_trades_index.num_open
+    return Trade.get_open_trade_count()
+
   def is_backtest_mode(self) -> bool:
     """Check if the current run mode is backtest or hyperopt"""
     return self.dp.runmode.value in ["backtest", "hyperopt"]
@@ -4744,19 +3857,22 @@ class NostalgiaForInfinityX6(IStrategy):
   def _set_profit_target(
     self, pair: str, sell_reason: str, rate: float, current_profit: float, current_time: datetime
   ):
-    self.target_profit_cache.data[pair] = {
-      "rate": rate,
-      "profit": current_profit,
-      "sell_reason": sell_reason,
-      "time_profit_reached": current_time.isoformat(),
-    }
+    self.target_profit_cache.set(
+      pair,
+      {
+        "rate": rate,
+        "profit": current_profit,
+        "sell_reason": sell_reason,
+        "time_profit_reached": current_time.isoformat(),
+      },
+    )
     self.target_profit_cache.save()
 
   # Remove Profit Target
   # ---------------------------------------------------------------------------------------------
   def _remove_profit_target(self, pair: str):
     if self.target_profit_cache is not None:
-      self.target_profit_cache.data.pop(pair, None)
+      self.target_profit_cache.pop(pair)
       self.target_profit_cache.save()
 
   # Get Hold Trades Config File
@@ -4789,11 +3905,16 @@ class NostalgiaForInfinityX6(IStrategy):
   # Load Hold Trades Config
   # ---------------------------------------------------------------------------------------------
   def load_hold_trades_config(self):
+    if self.hold_trades_config_checked:
+      return
+    self.hold_trades_config_checked = True
+
     if self.hold_trades_cache is None:
       hold_trades_config_file = self.get_hold_trades_config_file()
       if hold_trades_config_file:
         log.warning("Loading hold support data from %s", hold_trades_config_file)
-        self.hold_trades_cache = HoldsCache(hold_trades_config_file)
+        self.hold_trades_cache = HoldsCache(hold_trades_config_file, self.open_trades_index)
+        return
 
     if self.hold_trades_cache:
       self.hold_trades_cache.load()
@@ -4807,23 +3928,22 @@ class NostalgiaForInfinityX6(IStrategy):
     if not self.hold_support_enabled:
       return False
 
-    # Just to be sure our hold data is loaded, should be a no-op call after the first bot loop
+    # Just to be sure our hold data is loaded, a no-op call after the first check in the bot loop
     self.load_hold_trades_config()
 
     if not self.hold_trades_cache:
       # Cache hasn't been setup, likely because the corresponding file does not exist, sell
       return False
 
-    if not self.hold_trades_cache.data:
+    if not self.hold_trades_cache.trade_ids and not self.hold_trades_cache.trade_pairs:
       # We have no pairs we want to hold until profit, sell
       return False
 
     # By default, no hold should be done
     hold_trade = False
 
-    trade_ids: dict = self.hold_trades_cache.data.get("trade_ids")
-    if trade_ids and trade.id in trade_ids:
-      trade_profit_ratio = trade_ids[trade.id]
+    trade_profit_ratio = self.hold_trades_cache.trade_ids.get(trade.id)
+    if trade_profit_ratio is not None:
       filled_entries = trade.select_filled_orders(trade.entry_side)
       filled_exits = trade.select_filled_orders(trade.exit_side)
       profit_stake, profit_ratio, profit_current_stake_ratio, profit_init_ratio = self.calc_total_profit(
@@ -4855,9 +3975,8 @@ class NostalgiaForInfinityX6(IStrategy):
       # This pair is on the list to hold, and we haven't reached minimum profit, hold
       hold_trade = True
 
-    trade_pairs: dict = self.hold_trades_cache.data.get("trade_pairs")
-    if trade_pairs and trade.pair in trade_pairs:
-      trade_profit_ratio = trade_pairs[trade.pair]
+    trade_profit_ratio = self.hold_trades_cache.trade_pairs.get(trade.pair)
+    if trade_profit_ratio is not None:
       filled_entries = trade.select_filled_orders(trade.entry_side)
       filled_exits = trade.select_filled_orders(trade.exit_side)
       profit_stake, profit_ratio, profit_current_stake_ratio, profit_init_ratio = self.calc_total_profit(
@@ -4897,8 +4016,119 @@ class NostalgiaForInfinityX6(IStrategy):
     df.loc[:, "exit_long"] = 0
     df.loc[:, "exit_short"] = 0
 
+    # Last step of the analysis, the entry signals are already set
+    if self.memory_compact_mode:
+      df = self.compact_analyzed_dataframe(df, metadata)
+
     return df
 
+  # Apply Indicator Pruning
+  # ---------------------------------------------------------------------------------------------
+  def apply_indicator_pruning(self) -> None:
+    """
+    Replaces the indicator functions with copies that only compute the columns needed by the enabled
+    entry signals (long_entry_signal_params/short_entry_signal_params) and by the exit/adjust logic.
+    """
+    analyzer = IndicatorDependencyAnalyzer(pathlib.Path(__file__).read_text(encoding="utf-8"), type(self).__name__)
+    extra_columns = set(RUNTIME_BASE_COLUMNS) | set(self.get_runtime_candle_columns())
+    required_columns = analyzer.required_columns(
+      self.long_entry_signal_params, self.short_entry_signal_params, extra_columns
+    )
+    for function_name in analyzer.indicator_functions:
+      pruned_function = analyzer.pruned_function(function_name, required_columns, dict(globals()))
+      setattr(self, function_name, pruned_function.__get__(self, type(self)))
+    num_columns = len(analyzer.dependencies)
+    num_pruned = len([c for c in analyzer.dependencies if c not in required_columns])
+    log.info(f"Indicator pruning: skipping {num_pruned} of {num_columns} indicator columns not used by the enabled signals.")
+
+  # Apply Exit Signals Precompute
+  # ---------------------------------------------------------------------------------------------
+  def apply_exit_signals_precompute(self) -> None:
+    """
+    Replaces the long/short exit signal functions with lookups of the exit codes precomputed per candle
+    (in populate_indicators). Candles without the precomputed columns fall back to the original functions.
+    """
+    self.exit_signals_precompute = PrecomputedExitSignals(
+      pathlib.Path(__file__).read_text(encoding="utf-8"), type(self).__name__, PRECOMPUTED_EXIT_FUNCTIONS
+    )
+    for function_name in self.exit_signals_precompute.functions:
+      setattr(self, function_name, self.exit_signals_precompute.lookup(function_name, getattr(self, function_name)))
+    log.info(
+      f"Exit signals precompute: {len(self.exit_signals_precompute.functions)} exit functions, "
+      f"{len(self.exit_signals_precompute.columns())} exit code columns per candle."
+    )
+
+  # Apply Profiling
+  # ---------------------------------------------------------------------------------------------
+  def apply_profiling(self) -> None:
+    """
+    Collects the indicator functions timings, and the populate_entry_trend, custom_exit and
+    adjust_trade_position ones, per pair and per function. The summary table and the folded stacks
+    (for flamegraph.pl or speedscope) are written to the user data dir at exit.
+    """
+    self.profiler = ProfilingRegistry()
+    for function_name in PROFILED_FUNCTIONS:
+      setattr(self, function_name, self.profiler.wrap(getattr(self, function_name), function_name))
+    runmode = self.config["runmode"].value
+    atexit.register(
+      self.profiler.dump,
+      self.config["user_data_dir"] / f"nfix6-profiling-{runmode}.txt",
+      self.config["user_data_dir"] / f"nfix6-profiling-{runmode}.folded",
+    )
+
+  # Compact Analyzed Dataframe
+  # ---------------------------------------------------------------------------------------------
+  def compact_analyzed_dataframe(self, df: DataFrame, metadata: dict) -> DataFrame:
+    """
+    Reduces the memory of the analyzed dataframe, once the entry signals are computed.
+
+    Drops the columns that are not read by the exit/adjust logic, downcasts the columns without
+    precision loss to float32, and stores the protections as bool. The values read by the exit
+    logic are unchanged.
+
+    :param df: The analyzed dataframe.
+    :param metadata: The pair metadata.
+    :return DataFrame: The compacted dataframe.
+    """
+    bytes_before = int(df.memory_usage(deep=True).sum())
+    keep_columns = self.get_runtime_candle_columns()
+    if self.exit_signals_precompute is not None:
+      keep_columns = keep_columns | set(self.exit_signals_precompute.columns())
+    df = compact_dataframe(df, keep_columns, self.get_float64_checked_columns())
+    bytes_after = int(df.memory_usage(deep=True).sum())
+    self.memory_compact_stats[metadata["pair"]] = (bytes_before, bytes_after)
+    log.info(
+      f"[{metadata['pair']}] Analyzed dataframe memory: {bytes_before / 1048576:0.2f} MB -> {bytes_after / 1048576:0.2f} MB"
+    )
+    return df
+
+  # Get Runtime Candle Columns
+  # ---------------------------------------------------------------------------------------------
+  def get_runtime_candle_columns(self) -> frozenset:
+    """The columns read from the analyzed candles by the exit, adjust and confirm logic."""
+    if NostalgiaForInfinityX6._runtime_candle_columns is None:
+      source = pathlib.Path(__file__).read_text(encoding="utf-8")
+      columns = set(RUNTIME_BASE_COLUMNS)
+      for line in source.splitlines():
+        if line.lstrip().startswith("#"):
+          continue
+        columns.update(RUNTIME_CANDLE_COLUMN_RE.findall(line))
+      plot_config = self.plot_config
+      columns.update(plot_config.get("main_plot", {}))
+      for subplot in plot_config.get("subplots", {}).values():
+        columns.update(subplot)
+      NostalgiaForInfinityX6._runtime_candle_columns = frozenset(columns)
+    return NostalgiaForInfinityX6._runtime_candle_columns
+
+  # Get Float64 Checked Columns
+  # ---------------------------------------------------------------------------------------------
+  def get_float64_checked_columns(self) -> frozenset:
+    """The columns checked with isinstance(..., np.float64) by the exit logic, these must stay float64."""
+    if NostalgiaForInfinityX6._float64_checked_columns is None:
+      source = pathlib.Path(__file__).read_text(encoding="utf-8")
+      NostalgiaForInfinityX6._float64_checked_columns = frozenset(FLOAT64_CHECKED_COLUMN_RE.findall(source))
+    return NostalgiaForInfinityX6._float64_checked_columns
+
   #
   # $$$$$$$$\ $$\   $$\ $$$$$$$$\ $$$$$$$\ $$\     $$\
   # $$  _____|$$$\  $$ |\__$$  __|$$  __$$\\$$\   $$  |
@@ -4935,18 +4165,21 @@ class NostalgiaForInfinityX6(IStrategy):
     # the number of free slots
     current_free_slots = self.config["max_open_trades"]
     if not is_backtest:
-      current_free_slots = self.config["max_open_trades"] - Trade.get_open_trade_count()
+      current_free_slots = self.config["max_open_trades"] - self.get_open_trade_count()
     # Grind mode
     num_open_long_grind_mode = 0
     is_pair_long_grind_mode = metadata["pair"].split("/")[0] in self.grind_mode_coins
     if not is_backtest:
-      open_trades = Trade.get_trades_proxy(is_open=True)
-      for open_trade in open_trades:
-        enter_tag = open_trade.enter_tag
-        if enter_tag is not None:
-          enter_tags = enter_tag.split()
-          if all(c in self.long_grind_mode_tags for c in enter_tags):
-            num_open_long_grind_mode += 1
+      if self.open_trades_index.is_built:
+        num_open_long_grind_mode = self.open_trades_index.num_by_mode[self.long_grind_mode_name]
+      else:
+        open_trades = Trade.get_trades_proxy(is_open=True)
+        for open_trade in open_trades:
+          enter_tag = open_trade.enter_tag
+          if enter_tag is not None:
+            enter_tags_mask = self.get_enter_tags_mask(enter_tag)
+            if (enter_tags_mask & ~self.long_grind_mode_mask) == 0:
+              num_open_long_grind_mode += 1
     # Top Coins mode
     is_pair_long_top_coins_mode = metadata["pair"].split("/")[0] in self.top_coins_mode_coins
     is_pair_short_top_coins_mode = metadata["pair"].split("/")[0] in self.top_coins_mode_coins
@@ -30140,9 +29373,10 @@ class NostalgiaForInfinityX6(IStrategy):
       ((exit_rate - filled_exits[-1].safe_price) / filled_exits[-1].safe_price) if count_of_exits > 0 else 0.0
     )
 
-    is_rebuy_mode = all(c in self.long_rebuy_mode_tags for c in enter_tags) or (
-      any(c in self.long_rebuy_mode_tags for c in enter_tags)
-      and all(c in (self.long_rebuy_mode_tags + self.long_grind_mode_tags) for c in enter_tags)
+    enter_tags_mask = self.get_enter_tags_mask(enter_tags)
+    is_rebuy_mode = (enter_tags_mask & ~self.long_rebuy_mode_mask) == 0 or (
+      (enter_tags_mask & self.long_rebuy_mode_mask) != 0
+      and (enter_tags_mask & ~(self.long_rebuy_mode_mask | self.long_grind_mode_mask)) == 0
     )
 
     has_order_tags = False
@@ -31931,11 +31165,12 @@ class NostalgiaForInfinityX6(IStrategy):
     current_stake_amount = trade.amount * current_rate
     is_derisk = trade.amount < (filled_entries[0].safe_filled * 0.95)
     is_derisk_calc = False
-    is_rebuy_mode = all(c in self.long_rebuy_mode_tags for c in enter_tags) or (
-      any(c in self.long_rebuy_mode_tags for c in enter_tags)
-      and all(c in (self.long_rebuy_mode_tags + self.long_grind_mode_tags) for c in enter_tags)
+    enter_tags_mask = self.get_enter_tags_mask(enter_tags)
+    is_rebuy_mode = (enter_tags_mask & ~self.long_rebuy_mode_mask) == 0 or (
+      (enter_tags_mask & self.long_rebuy_mode_mask) != 0
+      and (enter_tags_mask & ~(self.long_rebuy_mode_mask | self.long_grind_mode_mask)) == 0
     )
-    is_grind_mode = all(c in self.long_grind_mode_tags for c in enter_tags)
+    is_grind_mode = (enter_tags_mask & ~self.long_grind_mode_mask) == 0
 
     fee_open_rate = trade.fee_open if self.custom_fee_open_rate is None else self.custom_fee_open_rate
     fee_close_rate = trade.fee_close if self.custom_fee_close_rate is None else self.custom_fee_close_rate
@@ -34224,7 +33459,8 @@ class NostalgiaForInfinityX6(IStrategy):
       + grind_6_sub_grind_count
     )
 
-    is_scalp_mode = all(c in self.long_scalp_mode_tags for c in enter_tags)
+    enter_tags_mask = self.get_enter_tags_mask(enter_tags)
+    is_scalp_mode = (enter_tags_mask & ~self.long_scalp_mode_mask) == 0
 
     fee_open_rate = trade.fee_open if self.custom_fee_open_rate is None else self.custom_fee_open_rate
     fee_close_rate = trade.fee_close if self.custom_fee_close_rate is None else self.custom_fee_close_rate
@@ -52888,9 +52124,10 @@ class NostalgiaForInfinityX6(IStrategy):
       ((exit_rate - filled_exits[-1].safe_price) / filled_exits[-1].safe_price) if count_of_exits > 0 else 0.0
     )
 
-    is_rebuy_mode = all(c in self.short_rebuy_mode_tags for c in enter_tags) or (
-      any(c in self.short_rebuy_mode_tags for c in enter_tags)
-      and all(c in (self.short_rebuy_mode_tags + self.short_grind_mode_tags) for c in enter_tags)
+    enter_tags_mask = self.get_enter_tags_mask(enter_tags)
+    is_rebuy_mode = (enter_tags_mask & ~self.short_rebuy_mode_mask) == 0 or (
+      (enter_tags_mask & self.short_rebuy_mode_mask) != 0
+      and (enter_tags_mask & ~(self.short_rebuy_mode_mask | self.short_grind_mode_mask)) == 0
     )
 
     has_order_tags = False
@@ -54679,11 +53916,12 @@ class NostalgiaForInfinityX6(IStrategy):
     current_stake_amount = trade.amount * current_rate
     is_derisk = trade.amount < (filled_entries[0].safe_filled * 0.95)
     is_derisk_calc = False
-    is_rebuy_mode = all(c in self.short_rebuy_mode_tags for c in enter_tags) or (
-      any(c in self.short_rebuy_mode_tags for c in enter_tags)
-      and all(c in (self.short_rebuy_mode_tags + self.short_grind_mode_tags) for c in enter_tags)
+    enter_tags_mask = self.get_enter_tags_mask(enter_tags)
+    is_rebuy_mode = (enter_tags_mask & ~self.short_rebuy_mode_mask) == 0 or (
+      (enter_tags_mask & self.short_rebuy_mode_mask) != 0
+      and (enter_tags_mask & ~(self.short_rebuy_mode_mask | self.short_grind_mode_mask)) == 0
     )
-    is_grind_mode = all(c in self.short_grind_mode_tags for c in enter_tags)
+    is_grind_mode = (enter_tags_mask & ~self.short_grind_mode_mask) == 0
 
     fee_open_rate = trade.fee_open if self.custom_fee_open_rate is None else self.custom_fee_open_rate
     fee_close_rate = trade.fee_close if self.custom_fee_close_rate is None else self.custom_fee_close_rate
@@ -56910,7 +56148,8 @@ class NostalgiaForInfinityX6(IStrategy):
       + grind_6_sub_grind_count
     )
 
-    is_scalp_mode = all(c in self.short_scalp_mode_tags for c in enter_tags)
+    enter_tags_mask = self.get_enter_tags_mask(enter_tags)
+    is_scalp_mode = (enter_tags_mask & ~self.short_scalp_mode_mask) == 0
 
     fee_open_rate = trade.fee_open if self.custom_fee_open_rate is None else self.custom_fee_open_rate
     fee_close_rate = trade.fee_close if self.custom_fee_close_rate is None else self.custom_fee_close_rate
@@ -57947,11 +57186,2258 @@ def top_percent_change(self, df: DataFrame, length: int) -> float:
     return (df["open"].rolling(length).max() - df["close"]) / df["close"]
 
 
+# +---------------------------------------------------------------------------+
+# |                              Protections                                  |
+# +---------------------------------------------------------------------------+
+
+# Shifted columns in the protections conditions, "change_pct_1d__shift_288" is df["change_pct_1d"].shift(288)
+PROTECTIONS_SHIFT_RE = re.compile(r"^(\w+?)__shift_(\d+)$")
+
+# evaluate_protections works on blocks of rows, and gathers the undecided rows of a block once they are
+# fewer than 1/8 of the block
+PROTECTIONS_BLOCK_ROWS = 65536
+PROTECTIONS_GATHER_FRACTION = 8
+
+# Global protections Long, all the clauses must be true, a clause is true when any of its conditions is true
+PROTECTIONS_LONG_GLOBAL = (
+  # 5m & 4h & 1d down move, 15m & 1h & 4h still not low enough, 1d still high
+  (
+    "RSI_3 > 1.0",
+    "RSI_3_4h > 10.0",
+    "RSI_3_1d > 35.0",
+    "RSI_14_15m < 30.0",
+    "RSI_14_1h < 30.0",
+    "RSI_14_4h < 30.0",
+    "STOCHRSIk_14_14_3_3_15m < 20.0",
+    "STOCHRSIk_14_14_3_3_1d < 50.0",
+  ),
+  # 1h & 4h down move, 15m & 1h & 4h downtrend, 1h still high
+  (
+    "RSI_3 > 5.0",
+    "RSI_3_15m > 10.0",
+    "RSI_3_1h > 40.0",
+    "RSI_3_4h > 55.0",
+    "CMF_20_15m > -0.25",
+    "AROONU_14_4h < 60.0",
+    "ROC_9_1d < 80.0",
+  ),
+  # 5m & 15m & 1h & 4h down move, 4h high
+  (
+    "RSI_3 > 5.0",
+    "RSI_3_15m > 15.0",
+    "RSI_3_1h > 45.0",
+    "RSI_3_4h > 55.0",
+    "RSI_14_4h < 50.0",
+    "AROONU_14_4h < 80.0",
+    "STOCHRSIk_14_14_3_3_4h < 70.0",
+  ),
+  # 15m & 1h & 4h down move, 15m & 1h downtrend, 4h still high
+  (
+    "RSI_3_15m > 5.0",
+    "RSI_3_1h > 5.0",
+    "RSI_14_1h < 20.0",
+    "CMF_20_15m > -0.25",
+    "CMF_20_15m > -0.4",
+    "STOCHRSIk_14_14_3_3_4h < 50.0",
+  ),
+  # 15m & 1h down move, 1h & 4h high
+  (
+    "RSI_3_15m > 5.0",
+    "RSI_3_1h > 20.0",
+    "RSI_14_1h < 50.0",
+    "RSI_14_4h < 70.0",
+    "AROONU_14_1h < 80.0",
+    "AROONU_14_4h < 100.0",
+  ),
+  # 15m & 1h & 4h & 1d down move, 15m downtrend
+  (
+    "RSI_3_15m > 5.0",
+    "RSI_3_1h > 20.0",
+    "RSI_3_4h > 25.0",
+    "RSI_3_1d > 5.0",
+    "CMF_20_15m > -0.4",
+  ),
+  # 15m & 1h & 4h down move, 1h & 4h still high, 15m downtrend
+  (
+    "RSI_3_15m > 5.0",
+    "RSI_3_1h > 30.0",
+    "RSI_3_4h > 50.0",
+    "RSI_14_1h < 40.0",
+    "RSI_14_4h < 50.0",
+    "CMF_20_15m > -0.3",
+    "AROONU_14_4h < 50.0",
+    "STOCHRSIk_14_14_3_3_4h < 50.0",
+  ),
+  # 15m & 1h & 3h down move, 1h & 4h still not low enough, 15m downtrend, 1h still high
+  (
+    "RSI_3_15m > 5.0",
+    "RSI_3_1h > 35.0",
+    "RSI_3_4h > 35.0",
+    "RSI_14_1h < 30.0",
+    "RSI_14_4h < 30.0",
+    "CMF_20_15m > -0.3",
+    "STOCHRSIk_14_14_3_3_1h < 50.0",
+  ),
+  # 15m & 1h & 4h down move, 1h downtrend, 4h high
+  (
+    "RSI_3_15m > 10.0",
+    "RSI_3_1h > 15.0",
+    "RSI_3_4h > 55.0",
+    "RSI_14_4h < 50.0",
+    "CMF_20_1h > -0.4",
+    "AROONU_14_4h < 80.0",
+    "STOCHRSIk_14_14_3_3_4h < 70.0",
+  ),
+  # 15m & 1h & 4h down move, 15m still not low enough, 1h & 4h high
+  (
+    "RSI_3_15m > 10.0",
+    "RSI_3_1h > 20.0",
+    "RSI_3_4h > 25.0",
+    "AROONU_14_15m < 30.0",
+    "AROONU_14_1h < 60.0",
+    "AROONU_14_4h < 100.0",
+  ),
+  # 15m & 1h & 4h down move, 15m still not low enough, 1h & 4h still high, 4h overbought
+  (
+    "RSI_3_15m > 10.0",
+    "RSI_3_1h > 20.0",
+    "RSI_3_4h > 35.0",
+    "RSI_14_15m < 30.0",
+    "RSI_14_1h < 40.0",
+    "RSI_14_4h < 40.0",
+    "STOCHRSIk_14_14_3_3_4h < 50.0",
+    "ROC_9_4h < 10.0",
+  ),
+  # 15m & 1h & 4h down move, 1h & 4h not low enouhg, 15m downtrend, 4h high, 1d overbought
+  (
+    "RSI_3_15m > 10.0",
+    "RSI_3_1h > 25.0",
+    "RSI_3_4h > 25.0",
+    "RSI_14_1h < 30.0",
+    "RSI_14_4h < 30.0",
+    "CMF_20_15m > -0.3",
+    "AROONU_14_4h < 60.0",
+    "ROC_9_1d < 25.0",
+  ),
+  # 15m & 1h down move, 4h high, 1d downtrend, 1h still not low enough, 1d overbought
+  (
+    "RSI_3_15m > 10.0",
+    "RSI_3_1h > 30.0",
+    "RSI_14_4h < 70.0",
+    "CMF_20_1d > -0.3",
+    "AROONU_14_1h < 30.0",
+    "ROC_9_1d < 100.0",
+  ),
+  # 15m & 1h & 4h & 1d down move, 15m & 1h not low enough, 4h high
+  (
+    "RSI_3_15m > 10.0",
+    "RSI_3_1h > 35.0",
+    "RSI_3_4h > 35.0",
+    "RSI_3_1d > 15.0",
+    "RSI_14_15m < 30.0",
+    "RSI_14_1h < 35.0",
+    "STOCHRSIk_14_14_3_3_15m < 30.0",
+    "STOCHRSIk_14_14_3_3_4h < 90.0",
+  ),
+  # 15m & 1h down move, 4h still high, 15m downtrend, 1h & 1d high
+  (
+    "RSI_3_15m > 10.0",
+    "RSI_3_1h > 40.0",
+    "RSI_14_4h < 50.0",
+    "CMF_20_15m > -0.3",
+    "AROONU_14_1h < 60.0",
+    "AROONU_14_1d < 90.0",
+    "STOCHRSIk_14_14_3_3_1d < 80.0",
+  ),
+  # 15m & 1h down move, 15m & 1h still high, 1h & 4h high, 1d overbought
+  (
+    "RSI_3_15m > 10.0",
+    "RSI_3_1h > 40.0",
+    "RSI_14_15m < 40.0",
+    "RSI_14_1h < 50.0",
+    "RSI_14_4h < 70.0",
+    "AROONU_14_1h < 80.0",
+    "AROONU_14_4h < 100.0",
+    "ROC_9_1d < 50.0",
+  ),
+  # 15m & 1h & 4h down move, 15m & 1h & 4h still high, 1h & 4h high, 4h overbought
+  (
+    "RSI_3_15m > 10.0",
+    "RSI_3_1h > 45.0",
+    "RSI_3_4h > 60.0",
+    "RSI_14_15m < 40.0",
+    "RSI_14_1h < 50.0",
+    "RSI_14_4h < 50.0",
+    "AROONU_14_1h < 70.0",
+    "AROONU_14_4h < 100.0",
+    "ROC_9_4h < 25.0",
+  ),
+  # 15m & 1h down move, 15m still not low enough, 1h & 4h high, 4h overbought
+  (
+    "RSI_3_15m > 10.0",
+    "RSI_3_1h > 50.0",
+    "RSI_14_4h < 70.0",
+    "AROONU_14_15m < 20.0",
+    "AROONU_14_1h < 80.0",
+    "AROONU_14_4h < 100.0",
+    "ROC_9_4h < 30.0",
+  ),
+  # 15m & 1h & 4h down move, 1h & 4h downtrend, 15m still high, 1h high
+  (
+    "RSI_3_15m > 10.0",
+    "RSI_3_1h > 55.0",
+    "RSI_3_4h > 55.0",
+    "CMF_20_1h > -0.0",
+    "CMF_20_4h > -0.4",
+    "AROONU_14_15m < 50.0",
+    "STOCHRSIk_14_14_3_3_1h < 90.0",
+  ),
+  # 15m & 1h down move, 15m & 4h high, 4h overbought
+  (
+    "RSI_3_15m > 10.0",
+    "RSI_3_1h > 65.0",
+    "AROONU_14_15m < 80.0",
+    "AROONU_14_4h < 85.0",
+    "ROC_9_4h < 100.0",
+  ),
+  # 15m & 1h & 4h down move, 1h still not low enough, 4h high, 1h downtrend
+  (
+    "RSI_3_15m > 15.0",
+    "RSI_3_1h > 15.0",
+    "RSI_3_4h > 45.0",
+    "RSI_14_1h < 30.0",
+    "RSI_14_4h < 45.0",
+    "AROONU_14_1h < 40.0",
+    "AROONU_14_4h < 90.0",
+    "ROC_9_1h > -30.0",
+  ),
+  # 15m & 1h & 4h down move, 4h high, 1d overbought
+  (
+    "RSI_3_15m > 15.0",
+    "RSI_3_1h > 15.0",
+    "RSI_3_4h > 45.0",
+    "AROONU_14_4h < 80.0",
+    "ROC_9_1d < 150.0",
+  ),
+  # 15m & 1h & 4h down move, 1h still high, 4h high, 4h & 1d overbought
+  (
+    "RSI_3_15m > 15.0",
+    "RSI_3_1h > 30.0",
+    "RSI_3_4h > 45.0",
+    "RSI_14_1h < 35.0",
+    "RSI_14_4h < 50.0",
+    "AROONU_14_4h < 70.0",
+    "ROC_9_4h < 25.0",
+    "ROC_9_1d < 100.0",
+  ),
+  # 15m & 1h down move, 15m still not low enough, 1h still high, 4h high
+  (
+    "RSI_3_15m > 15.0",
+    "RSI_3_1h > 30.0",
+    "RSI_14_15m < 30.0",
+    "RSI_14_1h < 50.0",
+    "RSI_14_4h < 70.0",
+    "AROONU_14_1h < 60.0",
+    "AROONU_14_4h < 100.0",
+  ),
+  # 15m & 1h down move, 15m still high, 1h & dh high, 1d overbought
+  (
+    "RSI_3_15m > 15.0",
+    "RSI_3_1h > 30.0",
+    "RSI_14_15m < 40.0",
+    "AROONU_14_1h < 70.0",
+    "AROONU_14_4h < 100.0",
+    "ROC_9_1d < 50.0",
+  ),
+  # 15m & 1h & 4h & 1d down move, 1h still high, 4h still not low enough, 4h downtrend
+  (
+    "RSI_3_15m > 15.0",
+    "RSI_3_1h > 40.0",
+    "RSI_3_4h > 20.0",
+    "RSI_3_1d > 30.0",
+    "RSI_14_1h < 30.0",
+    "RSI_14_4h < 30.0",
+    "STOCHRSIk_14_14_3_3_1h < 50.0",
+    "CCI_20_1h < -250.0",
+    "CCI_20_4h < -250.0",
+    "ROC_9_4h > -15.0",
+  ),
+  # 15m & 1h & 1d down move, 15m still not low enough, 1h & 4h still high, 1d overbought
+  (
+    "RSI_3_15m > 15.0",
+    "RSI_3_1h > 60.0",
+    "RSI_3_1d > 60.0",
+    "RSI_14_15m < 30.0",
+    "RSI_14_1h < 50.0",
+    "RSI_14_4h < 50.0",
+    "AROONU_14_1h < 70.0",
+    "ROC_9_1d < 80.0",
+  ),
+  # 15m & 4h & 1d down move, 15m & 1h & 4h still not low enough, 15m & 1d downtrend
+  (
+    "RSI_3_15m > 15.0",
+    "RSI_3_4h > 15.0",
+    "RSI_3_1d > 25.0",
+    "RSI_14_15m > 25.0",
+    "RSI_14_1h < 30.0",
+    "RSI_14_4h < 30.0",
+    "CMF_20_15m > -0.3",
+    "CMF_20_1d > -0.3",
+    "AROONU_14_15m < 30.0",
+  ),
+  # 15m & 1d down move, 15m still not low enough, 1h & 4h high
+  (
+    "RSI_3_15m > 15.0",
+    "RSI_3_1d > 5.0",
+    "RSI_14_15m < 30.0",
+    "STOCHRSIk_14_14_3_3_1h < 70.0",
+    "STOCHRSIk_14_14_3_3_4h < 70.0",
+  ),
+  # 15m down move, 15m still not low enough, 1h & 4h high, 1d overbought
+  (
+    "RSI_3_15m > 15.0",
+    "AROONU_14_15m < 30.0",
+    "AROONU_14_1h < 85.0",
+    "AROONU_14_4h < 100.0",
+    "ROC_9_1d < 250.0",
+  ),
+  # 15m & 1h down move, 15m still not low enough, 1h & 4h still high, 1d overbought
+  (
+    "RSI_3_15m > 20.0",
+    "RSI_3_1h > 25.0",
+    "RSI_14_15m < 30.0",
+    "RSI_14_1h < 40.0",
+    "RSI_14_4h < 50.0",
+    "STOCHRSIk_14_14_3_3_1h < 50.0",
+    "ROC_9_1d < 150.0",
+  ),
+  # 15m & 1h & 1d down move, 1h & 4h still high, 15m downtrend, 1d overbought
+  (
+    "RSI_3_15m > 20.0",
+    "RSI_3_1h > 25.0",
+    "RSI_3_1d > 55.0",
+    "RSI_14_1h < 40.0",
+    "RSI_14_4h < 50.0",
+    "CMF_20_15m > -0.3",
+    "ROC_9_1d < 80.0",
+  ),
+  # 15m & 1h & 4h & 1d down move, 1d still high, 1h still high, 4h high
+  (
+    "RSI_3_15m > 20.0",
+    "RSI_3_1h > 35.0",
+    "RSI_3_4h > 45.0",
+    "RSI_3_1d > 25.0",
+    "MFI_14_1d < 50.0",
+    "AROONU_14_1h < 50.0",
+    "AROONU_14_4h < 85.0",
+  ),
+  # 15m & 1h & 4h down move, 15m still not low enough, 1h still high, 4h high & overbought
+  (
+    "RSI_3_15m > 20.0",
+    "RSI_3_1h > 40.0",
+    "RSI_3_4h > 60.0",
+    "RSI_14_15m < 30.0",
+    "AROONU_14_15m < 30.0",
+    "AROONU_14_1h < 50.0",
+    "AROONU_14_4h < 85.0",
+    "ROC_9_4h < 30.0",
+  ),
+  # 15m & 1h & 4h down move, 1h & 4h high, 4h & 1d overbought
+  (
+    "RSI_3_15m > 20.0",
+    "RSI_3_1h > 45.0",
+    "RSI_3_4h > 60.0",
+    "RSI_14_1h < 40.0",
+    "RSI_14_4h < 60.0",
+    "AROONU_14_4h < 75.0",
+    "ROC_9_4h < 25.0",
+    "ROC_9_1d < 150.0",
+  ),
+  # 15m & 1h down move, 15m still high, 1h high & overbought
+  (
+    "RSI_3_15m > 20.0",
+    "RSI_3_1h > 60.0",
+    "RSI_14_15m < 40.0",
+    "RSI_14_1h < 50.0",
+    "AROONU_14_1h < 70.0",
+    "ROC_9_1h < 80.0",
+  ),
+  # 15m & 1h down move, 15m still not low enough, 1h still high, 4h high & overbought
+  (
+    "RSI_3_15m > 25.0",
+    "RSI_3_1h > 30.0",
+    "RSI_14_15m < 30.0",
+    "RSI_14_1h < 40.0",
+    "RSI_14_4h < 70.0",
+    "AROONU_14_1h < 70.0",
+    "AROONU_14_4h < 100.0",
+    "ROC_9_4h < 50.0",
+  ),
+  # 15m & 1h & 1d down move, 4h & 1d downtrend, 1h & 4h high, 1d downtrend
+  (
+    "RSI_3_15m > 25.0",
+    "RSI_3_1h > 35.0",
+    "RSI_3_1d > 35.0",
+    "CMF_20_4h > -0.1",
+    "CMF_20_1d > -0.1",
+    "AROONU_14_1h < 75.0",
+    "STOCHRSIk_14_14_3_3_4h < 70.0",
+    "ROC_2_1d > -20.0",
+  ),
+  # 15m & 1h down move, 1h & 4h high, 4h overbought
+  (
+    "RSI_3_15m > 25.0",
+    "RSI_3_1h > 60.0",
+    "RSI_14_1h < 50.0",
+    "RSI_14_4h < 70.0",
+    "AROONU_14_1h < 80.0",
+    "AROONU_14_4h < 90.0",
+    "ROC_9_4h < 120.0",
+  ),
+  # 15m down move, 15m still high, 1h & 4h high, 1d downtrend, 4h overbought
+  (
+    "RSI_3_15m > 25.0",
+    "RSI_14_15m < 40.0",
+    "RSI_14_1h < 70.0",
+    "RSI_14_4h < 75.0",
+    "CMF_20_1d > -0.0",
+    "AROONU_14_4h < 90.0",
+    "ROC_9_4h < 50.0",
+  ),
+  # 15m & 1h down move, 15m still high, 1h & 4h high & overbought
+  (
+    "RSI_3_15m > 30.0",
+    "RSI_3_1h > 60.0",
+    "RSI_14_15m < 40.0",
+    "RSI_14_1h < 50.0",
+    "RSI_14_4h < 80.0",
+    "AROONU_14_1h < 60.0",
+    "AROONU_14_4h < 90.0",
+    "ROC_9_1h < 50.0",
+    "ROC_9_4h < 100.0",
+  ),
+  # 15m & 1h down move, 15m still high, 1h & 4h high, 4h overbought
+  (
+    "RSI_3_15m > 30.0",
+    "RSI_3_1h > 65.0",
+    "RSI_14_15m < 40.0",
+    "RSI_14_1h < 60.0",
+    "RSI_14_4h < 80.0",
+    "AROONU_14_4h < 90.0",
+    "ROC_9_4h < 130.0",
+  ),
+  # 15m & 1h down move, 15m & 1h & 4h high, 1h overbought
+  (
+    "RSI_3_15m > 35.0",
+    "RSI_3_1h > 65.0",
+    "RSI_14_15m < 50.0",
+    "AROONU_14_1h < 80.0",
+    "AROONU_14_4h < 90.0",
+    "ROC_9_1h < 30.0",
+  ),
+  # 1h & 4h down move, 1h & 4h downtrend
+  (
+    "RSI_3_1h > 5.0",
+    "RSI_3_4h > 10.0",
+    "CMF_20_1h > -0.5",
+    "CMF_20_4h > -0.5",
+  ),
+  # 1h & 4h down move, 1h still high, 4h high, 1d overbought
+  (
+    "RSI_3_1h > 5.0",
+    "RSI_3_4h > 30.0",
+    "AROONU_14_1h < 50.0",
+    "AROONU_14_4h < 85.0",
+    "ROC_9_1d < 50.0",
+  ),
+  # 5m & 15m & 1h & 4h down move, 15m downtrend, 4h high, 1d overbought
+  (
+    "RSI_3_1h > 25.0",
+    "RSI_3_4h > 25.0",
+    "CMF_20_15m > -0.5",
+    "CMF_20_1h > -0.3",
+    "CMF_20_4h > -0.3",
+    "AROONU_14_1h < 50.0",
+  ),
+  # 1h & 1d down move, 1h & 4h & 1d still high, 1h & 4h high, 4h overbought
+  (
+    "RSI_3_1h > 60.0",
+    "RSI_3_1d > 25.0",
+    "RSI_14_1h < 50.0",
+    "RSI_14_4h < 60.0",
+    "MFI_14_1d < 50.0",
+    "AROONU_14_1h < 70.0",
+    "AROONU_14_4h < 90.0",
+    "ROC_9_4h < 25.0",
+  ),
+  # 4h down move, 1h & 4h downtrend, 15m high
+  (
+    "RSI_3_4h > 3.0",
+    "CMF_20_1h > -0.25",
+    "CMF_20_4h > -0.3",
+    "STOCHRSIk_14_14_3_3_15m < 70.0",
+  ),
+  # 1d down move, 15m high, 1h & 4h downtrend
+  (
+    "RSI_3_1d > 5.0",
+    "STOCHRSIk_14_14_3_3_15m < 70.0",
+    "ROC_9_1h > -60.0",
+    "ROC_9_4h > -60.0",
+  ),
+  # 4h green with top wick, 15m & 1h down move, 15m still not low enough, 1h & 4h high
+  (
+    "change_pct_4h < 10.0",
+    "top_wick_pct_4h < 10.0",
+    "RSI_3_15m > 5.0",
+    "RSI_3_1h > 40.0",
+    "RSI_14_15m < 30.0",
+    "RSI_14_1h < 50.0",
+    "RSI_14_4h < 50.0",
+    "AROONU_14_1h < 60.0",
+    "AROONU_14_4h < 90.0",
+  ),
+  # 4h green with top wick, 1h down move, 1h still high, 4h high, 1d overbought
+  (
+    "change_pct_4h < 10.0",
+    "top_wick_pct_4h < 10.0",
+    "RSI_3_1h > 45.0",
+    "RSI_14_1h < 40.0",
+    "RSI_14_4h < 60.0",
+    "AROONU_14_1h < 70.0",
+    "AROONU_14_4h < 90.0",
+    "ROC_9_1d < 20.0",
+  ),
+  # 4h green with top wick, 15m & 1h down move, 1h still high, 4h high
+  (
+    "change_pct_4h < 15.0",
+    "top_wick_pct_4h < 15.0",
+    "RSI_3_15m > 10.0",
+    "RSI_3_1h > 35.0",
+    "AROONU_14_1h < 50.0",
+    "AROONU_14_4h < 100.0",
+  ),
+  # 4h green with top wick, 15m & 1h down move, 1h & 4h high
+  (
+    "change_pct_4h < 15.0",
+    "top_wick_pct_4h < 10.0",
+    "RSI_3_15m > 20.0",
+    "RSI_3_1h > 40.0",
+    "AROONU_14_1h < 80.0",
+    "AROONU_14_4h < 100.0",
+  ),
+  # 1d red, 1h & 4h down move, 1h still high, 4d downtrend
+  (
+    "change_pct_1d > -40.0",
+    "RSI_3_1h > 55.0",
+    "RSI_3_4h > 10.0",
+    "STOCHRSIk_14_14_3_3_1h < 50.0",
+    "ROC_9_4h > -35.0",
+  ),
+  # 1d P&D, 15m & 1h & 4h & 1d down move, 4h still not low enough
+  (
+    "change_pct_1d > -10.0",
+    "change_pct_1d__shift_288 < 10.0",
+    "RSI_3_15m > 10.0",
+    "RSI_3_1h > 25.0",
+    "RSI_3_4h > 10.0",
+    "RSI_3_1d > 40.0",
+    "RSI_14_4h < 30.0",
+  ),
+  # 1d red with top wick, 15m & 1h down move, 1h downtrend, 1h high
+  (
+    "change_pct_1d > -10.0",
+    "top_wick_pct_1d < 10.0",
+    "RSI_3_15m > 10.0",
+    "RSI_3_1h > 25.0",
+    "CMF_20_1h > -0.2",
+    "AROONU_14_1h < 70.0",
+    "STOCHRSIk_14_14_3_3_1h < 40.0",
+  ),
+  # 1d P&D, 15m & 1h down move, 15m still not low enough, 1h & 4h still high, 1d overbought
+  (
+    "change_pct_1d > -5.0",
+    "change_pct_1d__shift_288 < 10.0",
+    "RSI_3_15m > 20.0",
+    "RSI_3_1h > 45.0",
+    "RSI_14_15m < 30.0",
+    "RSI_14_1h < 40.0",
+    "RSI_14_4h < 50.0",
+    "ROC_9_1d < 100.0",
+  ),
+  # 1d P&D, 15m & 1h & 4h down move, 1h & 4h still not low enough, 1h & 4h downtrend, 1d overbought
+  (
+    "change_pct_1d > -5.0",
+    "change_pct_1d__shift_288 < 10.0",
+    "RSI_3_15m > 25.0",
+    "RSI_3_1h > 30.0",
+    "RSI_3_4h > 30.0",
+    "AROONU_14_1h < 30.0",
+    "AROONU_14_4h < 30.0",
+    "ROC_9_1h > -25.0",
+    "ROC_9_4h > -25.0",
+    "ROC_9_1d < 50.0",
+  ),
+  # 1d green with top wick, 15m down move, 1h & 4h high, 1d overbought
+  (
+    "change_pct_1d < 10.0",
+    "top_wick_pct_1d < 10.0",
+    "RSI_3_15m > 10.0",
+    "RSI_14_1h < 70.0",
+    "RSI_14_4h < 80.0",
+    "STOCHRSIk_14_14_3_3_4h < 90.0",
+    "ROC_9_1d < 40.0",
+  ),
+  # 1d green with top wick, 1h & 4h down move, 1h & 4h still high
+  (
+    "change_pct_1d < 10.0",
+    "top_wick_pct_1d < 10.0",
+    "RSI_3_1h > 55.0",
+    "RSI_3_4h > 55.0",
+    "AROONU_14_1h < 50.0",
+    "AROONU_14_4h < 50.0",
+  ),
+  # 1d green with top wick, 15m & 1h & 4h down move, 15m still not low enough, 4h high, 1d overbought
+  (
+    "change_pct_1d < 30.0",
+    "top_wick_pct_1d < 10.0",
+    "RSI_3_15m > 30.0",
+    "RSI_3_1h > 30.0",
+    "RSI_3_4h > 70.0",
+    "RSI_14_4h < 60.0",
+    "AROONU_14_15m < 25.0",
+    "AROONU_14_4h < 70.0",
+    "ROC_9_1d < 40.0",
+  ),
+  # 1d green with top wick, 15m & 1h & 4h down move, 1h still not low enough, 4h still high, 1d overbought
+  (
+    "change_pct_1d < 30.0",
+    "top_wick_pct_1d < 20.0",
+    "RSI_3_15m > 10.0",
+    "RSI_3_1h > 40.0",
+    "RSI_3_4h > 40.0",
+    "AROONU_14_1h < 20.0",
+    "AROONU_14_4h < 50.0",
+    "ROC_9_1d < 100.0",
+  ),
+  # 1d green with top wick, 1h down move, 1h still high, 4h high & overbought, 1d overbought
+  (
+    "change_pct_1d < 30.0",
+    "top_wick_pct_1d < 20.0",
+    "RSI_3_1h > 50.0",
+    "RSI_14_1h < 40.0",
+    "RSI_14_4h < 60.0",
+    "AROONU_14_4h < 70.0",
+    "ROC_9_4h < 40.0",
+    "ROC_9_1d < 50.0",
+  ),
+  # 1d top wick, 1h & 4h down move, 15m downtrend, 4h still high, 1d overbought
+  (
+    "top_wick_pct_1d < 20.0",
+    "RSI_3_1h > 10.0",
+    "RSI_3_4h > 45.0",
+    "CMF_20_15m > -0.2",
+    "AROONU_14_4h < 50.0",
+    "ROC_9_1d < 80.0",
+  ),
+  # 1d top wick, 4h down move, 4h still high, 1d overbought
+  (
+    "top_wick_pct_1d < 25.0",
+    "RSI_3_4h > 25.0",
+    "RSI_14_4h < 45.0",
+    "AROONU_14_4h < 40.0",
+    "ROC_9_1d < 200.0",
+  ),
+  # 1d top wick, 15m & 1h & 4h down move, 15m & 1h downtrend, 4h still high
+  (
+    "top_wick_pct_1d < 25.0",
+    "RSI_3_15m > 10.0",
+    "RSI_3_1h > 30.0",
+    "RSI_3_4h > 50.0",
+    "CMF_20_15m > -0.25",
+    "CMF_20_1h > -0.25",
+    "AROONU_14_4h < 50.0",
+  ),
+  # pump, drop but not yet near the previous lows, 15m & 1h & 4h & 1d down move, 1d overbought
+  (
+    "(high_max_6_1d - low_min_6_1d) / low_min_6_1d < 1.5",
+    "close > high_max_6_4h * 0.7",
+    "close < low_min_6_1d * 1.25",
+    "RSI_3_15m > 15.0",
+    "RSI_3_1h > 25.0",
+    "RSI_3_4h > 25.0",
+    "RSI_3_1d > 45.0",
+    "ROC_9_1d < 20.0",
+  ),
+  # drop in last 12 hours, 1h & 4h down move, 1h & 4h downtrend
+  (
+    "close > high_max_12_1h * 0.35",
+    "RSI_3_1h > 15.0",
+    "RSI_3_4h > 5.0",
+    "ROC_9_1h > -50.0",
+    "ROC_9_4h > -50.0",
+  ),
+  # drop in last 4 days, 15m & 1h & 4h down move, 15m still not low enough, 1h still high, 4h overbought
+  (
+    "close > high_max_24_4h * 0.4",
+    "RSI_3_15m > 10.0",
+    "RSI_3_1h > 25.0",
+    "RSI_3_4h > 50.0",
+    "RSI_14_15m < 30.0",
+    "RSI_14_1h < 40.0",
+    "ROC_9_4h < 20.0",
+  ),
+  # drop in last 4 days, 15m & 1h & 4h & 1d down move, 4h high
+  (
+    "close > high_max_24_4h * 0.4",
+    "RSI_3_15m > 10.0",
+    "RSI_3_1h > 40.0",
+    "RSI_3_4h > 60.0",
+    "RSI_3_1d > 10.0",
+    "STOCHRSIk_14_14_3_3_4h < 80.0",
+  ),
+  # drop in last 6 days, 15m & 1h & 4h & 1d down move, 1d high, 4h downtrend
+  (
+    "close > high_max_24_4h * 0.35",
+    "RSI_3_15m > 5.0",
+    "RSI_3_1h > 25.0",
+    "RSI_3_4h > 25.0",
+    "RSI_3_1d > 30.0",
+    "AROONU_14_1d < 80.0",
+    "ROC_9_4h > -40.0",
+  ),
+  # drop in last 4 days, 15m & 1d down move, 15m still not low enough, 1h still high, 1d high, 4h downtrend
+  (
+    "close > high_max_24_4h * 0.35",
+    "RSI_3_15m > 15.0",
+    "RSI_3_1d > 30.0",
+    "AROONU_14_15m < 25.0",
+    "AROONU_14_1h < 40.0",
+    "AROONU_14_1d < 80.0",
+    "ROC_9_4h > -50.0",
+  ),
+  # drop in last 4 days, 1h & 5h & 1d down move, 1h still high, 1h & 4h downtrend
+  (
+    "close > high_max_24_4h * 0.25",
+    "RSI_3_1h > 20.0",
+    "RSI_3_4h > 25.0",
+    "RSI_3_1d > 25.0",
+    "AROONU_14_1h < 50.0",
+    "ROC_9_1h > -20.0",
+    "ROC_9_4h > -35.0",
+  ),
+  # drop in last 4 days, 1d down move, 1h & 4h downtrend, 15m & 4h downtrend
+  (
+    "close > high_max_24_4h * 0.25",
+    "RSI_3_1d > 15.0",
+    "CMF_20_1h > -0.2",
+    "CMF_20_4h > -0.2",
+    "ROC_9_15m > -15.0",
+    "ROC_9_4h > -20.0",
+  ),
+  # drop in last 6 days, 15m & 1d down move, 1h still high, 4h high, 4h downtrend
+  (
+    "close > high_max_6_1d * 0.25",
+    "RSI_3_15m > 15.0",
+    "RSI_3_1d > 15.0",
+    "STOCHRSIk_14_14_3_3_1h < 40.0",
+    "STOCHRSIk_14_14_3_3_4h < 60.0",
+    "ROC_9_4h > -25.0",
+  ),
+  # drop in last 6 days, 15m & 1h down move, 15m & 1h still not low enough, 15m & 1h & 4h & 1d downtrend
+  (
+    "close > high_max_6_1d * 0.25",
+    "RSI_3_15m > 25.0",
+    "RSI_3_1h > 30.0",
+    "RSI_14_15m < 30.0",
+    "CMF_20_15m > -0.1",
+    "CMF_20_1h > -0.1",
+    "CMF_20_4h > -0.4",
+    "CMF_20_1d > -0.5",
+    "AROONU_14_1h < 30.0",
+  ),
+  # drop in last 4 days, 1d down move, 1d downtrendm 1h still high, 1d downtrend
+  (
+    "close > high_max_24_4h * 0.15",
+    "RSI_3_1d > 20.0",
+    "CMF_20_1d > -0.3",
+    "AROONU_14_1h < 50.0",
+    "ROC_2_1d > -40.0",
+  ),
+  # drop in last 6 days, 1d down move, 1h & 4h & 1d downtrend, 1d still high, 4h downtrend
+  (
+    "close > high_max_6_1d * 0.15",
+    "RSI_3_1d > 20.0",
+    "CMF_20_1h > -0.1",
+    "CMF_20_4h > -0.4",
+    "CMF_20_1d > -0.5",
+    "AROONU_14_1d < 50.0",
+    "ROC_9_4h > -30.0",
+  ),
+  # drop in last 12 days, 15m & 1h down move, 1h still not low enough, 4h high
+  (
+    "close > high_max_12_1d * 0.25",
+    "RSI_3_15m > 15.0",
+    "RSI_3_1h > 30.0",
+    "RSI_14_1h < 30.0",
+    "RSI_14_4h < 30.0",
+    "STOCHRSIk_14_14_3_3_1h < 40.0",
+    "STOCHRSIk_14_14_3_3_4h < 70.0",
+  ),
+  # drop in last 20 days, 15m & 1h & 1d down move, 15m still not low enough, 1h high
+  (
+    "close > high_max_20_1d * 0.05",
+    "RSI_3_15m > 10.0",
+    "RSI_3_1h > 25.0",
+    "RSI_3_1d > 25.0",
+    "AROONU_14_15m < 30.0",
+    "AROONU_14_1h < 80.0",
+  ),
+  # drop in last 30 days, 15m & 1h down move, 1h still high, 4h high & overbought
+  (
+    "close > high_max_30_1d * 0.1",
+    "RSI_3_15m > 10.0",
+    "RSI_3_1h > 55.0",
+    "AROONU_14_1h < 40.0",
+    "AROONU_14_4h < 85.0",
+    "ROC_9_4h < 80.0",
+  ),
+  # drop in last 30 days, 15m down move, 15m & 1h high
+  (
+    "close > high_max_30_1d * 0.05",
+    "RSI_3_15m > 15.0",
+    "RSI_3_4h > 50.0",
+    "AROONU_14_15m < 80.0",
+    "STOCHRSIk_14_14_3_3_1h < 85.0",
+  ),
+)
+
+# Global protections Short pump, same form as PROTECTIONS_LONG_GLOBAL
+PROTECTIONS_SHORT_GLOBAL_PUMP = (
+  # 15m & 1h & 4h & 1d up move, 15m & 1h & 4h still not high enough, 1d still not high enough & uptrend
+  (
+    "RSI_3_15m < 40.0",
+    "RSI_3_1h < 40.0",
+    "RSI_3_4h < 85.0",
+    "RSI_3_1d < 85.0",
+    "RSI_14_15m > 70.0",
+    "CCI_20_15m > 350.0",
+    "RSI_14_1h > 75.0",
+    "CCI_20_1h > 250.0",
+    "STOCHRSIk_14_14_3_3_1h > 50.0",
+    "RSI_14_4h > 95.0",
+    "AROOND_14_4h < 50.0",
+    "CCI_20_4h > 250.0",
+    "RSI_14_1d > 60.0",
+    "AROOND_14_1d < 75.0",
+    "STOCHRSIk_14_14_3_3_1d > 70.0",
+    "ROC_9_1d < 40.0",
+  ),
+  # 15m & 1h & 4h & 1d up move, 15m & 1h & 4h still not high enough, 1d still not high enough & uptrend
+  (
+    "RSI_3_15m < 60.0",
+    "RSI_3_1h < 60.0",
+    "RSI_3_4h < 80.0",
+    "RSI_3_1d < 90.0",
+    "RSI_14_15m > 90.0",
+    "CCI_20_15m > 350.0",
+    "RSI_14_1h > 90.0",
+    "CCI_20_1h > 300.0",
+    "RSI_14_4h > 80.0",
+    "CCI_20_4h > 200.0",
+    "RSI_14_1d > 95.0",
+    "ROC_9_1d < 80.0",
+  ),
+  # 1d green, 15m & 1h & 4h & 1d up move, 4h & 1d still not high enough & uptrend
+  (
+    "RSI_3_15m < 60.0",
+    "RSI_3_1h < 70.0",
+    "RSI_3_4h < 70.0",
+    "RSI_3_1d < 80.0",
+    "RSI_14_4h > 70.0",
+    "WILLR_14_4h > -10.0",
+    "STOCHRSIk_14_14_3_3_4h > 80.0",
+    "ROC_9_4h < 40.0",
+    "RSI_14_1d > 80.0",
+    "ROC_9_1d < 100.0",
+  ),
+  # 15m & 1h & 1d up move, 15m & 1h & 4h still not high enough, 1d still not high enough & uptrend
+  (
+    "RSI_3_15m < 65.0",
+    "RSI_3_1h < 70.0",
+    "RSI_3_1d < 60.0",
+    "RSI_14_15m > 90.0",
+    "CMF_20_15m > 0.4",
+    "WILLR_14_15m > -10.0",
+    "CCI_20_15m > 450.0",
+    "STOCHk_14_3_3_15m > 90.0",
+    "RSI_14_1h > 90.0",
+    "CMF_20_1h > 0.2",
+    "WILLR_14_1h > -5.0",
+    "CCI_20_1h > 250.0",
+    "RSI_14_4h > 90.0",
+    "CMF_20_4h > 0.1",
+    "CCI_20_4h > 250.0",
+    "RSI_14_1d > 90.0",
+    "ROC_9_1d < 25.0",
+  ),
+  # 15m & 1h & 4h & 1d up move, 15m & 1h & 4h & 1d still not high enough, 1d uptrend
+  (
+    "RSI_3_15m < 70.0",
+    "RSI_3_1h < 80.0",
+    "RSI_3_4h < 80.0",
+    "RSI_3_1d < 80.0",
+    "MFI_14_15m > 90.0",
+    "STOCHRSIk_14_14_3_3_15m > 90.0",
+    "MFI_14_1h > 90.0",
+    "MFI_14_4h > 80.0",
+    "WILLR_14_4h > -5.0",
+    "AROOND_14_4h < 50.0",
+    "ROC_9_1d < 40.0",
+  ),
+  # 15m & 1h up move, 15m & 1h & 4h still not high enough, 1d still not high enough & uptrend
+  (
+    "RSI_3_15m < 70.0",
+    "RSI_3_1h < 85.0",
+    "MFI_14_15m > 90.0",
+    "STOCHRSIk_14_14_3_3_15m > 80.0",
+    "RSI_14_1h > 80.0",
+    "MFI_14_1h > 80.0",
+    "STOCHRSIk_14_14_3_3_1h > 70.0",
+    "RSI_14_4h > 80.0",
+    "RSI_14_1d > 80.0",
+    "ROC_9_1d < 40.0",
+  ),
+  # 15m & 1h & 4h & 1d up move, 15m & 1h still not high enough, 4h & 1d stil not high enough & uptrend
+  (
+    "RSI_3_15m < 80.0",
+    "RSI_3_1h < 80.0",
+    "RSI_3_4h < 80.0",
+    "RSI_3_1d < 95.0",
+    "RSI_14_15m > 85.0",
+    "CCI_20_15m > 250.0",
+    "RSI_14_1h > 85.0",
+    "CCI_20_1h > 250.0",
+    "CCI_20_change_pct_1h < -0.0",
+    "STOCHRSIk_14_14_3_3_1h > 90.0",
+    "RSI_14_4h > 85.0",
+    "CCI_20_4h > 250.0",
+    "CCI_20_change_pct_4h < -0.0",
+    "STOCHRSIk_14_14_3_3_4h > 90.0",
+    "ROC_9_4h < 30.0",
+    "RSI_14_1d > 90.0",
+    "WILLR_14_1d > -10.0",
+    "ROC_9_1d < 50.0",
+  ),
+  # 15m & 1h & 4h up move, 15m & 1h still not high enough, 4h still not high enough & uptrend
+  (
+    "RSI_3_15m < 80.0",
+    "RSI_3_1h < 80.0",
+    "RSI_3_4h < 90.0",
+    "RSI_14_15m > 90.0",
+    "CCI_20_15m > 400.0",
+    "RSI_14_1h > 90.0",
+    "CCI_20_1h > 400.0",
+    "CCI_20_4h > 400.0",
+    "ROC_9_4h < 200.0",
+  ),
+  # 15m & 1h up move, 15m & 1h & 4h still not high enough, 1d still not high enough & uptrend
+  (
+    "RSI_3_15m < 80.0",
+    "RSI_3_1h < 90.0",
+    "RSI_14_15m > 85.0",
+    "CCI_20_15m > 250.0",
+    "RSI_14_1h > 75.0",
+    "AROOND_14_1h < 50.0",
+    "CCI_20_1h > 350.0",
+    "CCI_20_change_pct_1h < -0.0",
+    "RSI_14_4h > 85.0",
+    "CCI_20_4h > 150.0",
+    "CCI_20_change_pct_4h < -0.0",
+    "STOCHRSIk_14_14_3_3_4h > 70.0",
+    "RSI_14_1d > 85.0",
+    "ROC_9_1d < 50.0",
+  ),
+  # 15m & 1h & 4h & 1d up move, 15m & 1h & 4h & 1d still not high enough
+  (
+    "RSI_3_15m < 80.0",
+    "RSI_3_1h < 90.0",
+    "RSI_3_4h < 70.0",
+    "RSI_3_1d < 70.0",
+    "RSI_14_15m > 85.0",
+    "RSI_14_1h > 85.0",
+    "CCI_20_1h > 250.0",
+    "CCI_20_change_pct_1h < -0.0",
+    "RSI_14_4h > 70.0",
+    "AROOND_14_4h < 75.0",
+    "CCI_20_4h > 200.0",
+    "CCI_20_change_pct_4h < -0.0",
+    "STOCHk_14_3_3_4h > 70.0",
+    "RSI_14_1d > 70.0",
+  ),
+  # 15m & 1h & 4h & 1d up move, 1h still not high enough, 1d still low, 4h & 1d uptrend
+  (
+    "RSI_3_15m < 80.0",
+    "RSI_3_1h < 85.0",
+    "RSI_3_4h < 90.0",
+    "RSI_3_1d < 95.0",
+    "STOCHRSIk_14_14_3_3_1h > 60.0",
+    "AROOND_14_1d < 50.0",
+    "ROC_9_4h < 100.0",
+    "ROC_9_1d < 100.0",
+  ),
+  # 15m & 1h & 4h & 1d up move, 15m & 1h still not high enough, 4h & 1d still not high enough & uptrend
+  (
+    "RSI_3_15m < 80.0",
+    "RSI_3_1h < 80.0",
+    "RSI_3_4h < 90.0",
+    "RSI_3_1d < 95.0",
+    "RSI_14_15m > 85.0",
+    "STOCHk_14_3_3_15m > 90.0",
+    "RSI_14_1h > 90.0",
+    "STOCHk_14_3_3_1h > 90.0",
+    "RSI_14_4h > 95.0",
+    "STOCHk_14_3_3_4h > 90.0",
+    "ROC_9_4h < 50.0",
+    "RSI_14_1d > 95.0",
+    "STOCHk_14_3_3_1d > 70.0",
+    "AROOND_14_1d < 50.0",
+    "ROC_9_1d < 50.0",
+  ),
+  # 15m & 1h & 4h up move, 1h & 4h still not high enough, 1d uptrend
+  (
+    "RSI_3_15m < 85.0",
+    "RSI_3_1h < 80.0",
+    "RSI_3_4h < 60.0",
+    "WILLR_14_1h > -5.0",
+    "AROOND_14_1h < 25.0",
+    "WILLR_14_4h > -10.0",
+    "AROOND_14_4h < 50.0",
+    "STOCHRSIk_14_14_3_3_4h > 60.0",
+    "ROC_9_1d < 50.0",
+  ),
+  # 15m & 1h & 4h up move, 15m still not high enough, 1h & 4h still not high enough & uptrend, 1d still not high enough
+  (
+    "RSI_3_15m < 85.0",
+    "RSI_3_1h < 85.0",
+    "RSI_3_4h < 90.0",
+    "RSI_14_15m > 95.0",
+    "CMF_20_15m > 0.5",
+    "UO_7_14_28_15m > 80.0",
+    "UO_7_14_28_change_pct_15m < -0.0",
+    "CCI_20_15m > 250.0",
+    "STOCHk_14_3_3_15m > 90.0",
+    "RSI_14_1h > 95.0",
+    "CMF_20_1h > 0.5",
+    "UO_7_14_28_1h > 80.0",
+    "CCI_20_1h > 350.0",
+    "ROC_9_1h < 10.0",
+    "RSI_14_4h > 90.0",
+    "CMF_20_4h > 0.35",
+    "UO_7_14_28_4h > 75.0",
+    "CCI_20_4h > 500.0",
+    "ROC_2_4h < 10.0",
+    "ROC_9_4h < 10.0",
+    "RSI_14_1d > 70.0",
+  ),
+  # 15m & 1h & 4h up move, 15m & 1h & 4h still not high enough, 1d still not high enough & overbought
+  (
+    "RSI_3_15m < 90.0",
+    "RSI_3_1h < 60.0",
+    "RSI_3_4h < 60.0",
+    "RSI_14_15m > 85.0",
+    "CCI_20_15m > 250.0",
+    "RSI_14_1h > 70.0",
+    "CCI_20_1h > 200.0",
+    "STOCHk_14_3_3_1h > 90.0",
+    "RSI_14_4h > 65.0",
+    "CCI_20_4h > 200.0",
+    "STOCHk_14_3_3_4h > 90.0",
+    "RSI_14_1d > 65.0",
+    "STOCHk_14_3_3_1d > 70.0",
+    "ROC_9_1d < 30.0",
+  ),
+  # 15m & 1h & 4h & 1d up move, 15m & 1h & 4h still not high enough. 1d still not high enough & uptrend
+  (
+    "RSI_3_15m < 95.0",
+    "RSI_3_1h < 80.0",
+    "RSI_3_4h < 80.0",
+    "RSI_3_1d < 80.0",
+    "RSI_14_15m > 90.0",
+    "RSI_14_1h > 90.0",
+    "STOCHRSIk_14_14_3_3_1h > 70.0",
+    "RSI_14_4h > 90.0",
+    "WILLR_14_4h > -5.0",
+    "RSI_14_1d > 80.0",
+    "STOCHRSIk_14_14_3_3_1d > 80.0",
+    "ROC_9_1d < 40.0",
+  ),
+  # 15m & 1h & 4h up move, 15m & 1h still not high enough, 4h still not high enough & uptrend
+  (
+    "RSI_3_15m < 95.0",
+    "RSI_3_1h < 90.0",
+    "RSI_3_4h < 90.0",
+    "RSI_14_15m > 90.0",
+    "CCI_20_15m > 250.0",
+    "RSI_14_1h > 90.0",
+    "AROOND_14_1h < 25.0",
+    "CCI_20_1h > 300.0",
+    "STOCHk_14_3_3_1h > 90.0",
+    "RSI_14_4h > 95.0",
+    "CCI_20_4h > 300.0",
+    "ROC_9_4h < 20.0",
+  ),
+  # 1h & 4h & 1d up move, 15m still not high enough, 1h & 4h & 1d still not high enough, 1d uptrend
+  (
+    "RSI_3_1h < 80.0",
+    "RSI_3_4h < 60.0",
+    "RSI_3_1d < 90.0",
+    "STOCHRSIk_14_14_3_3_15m > 80.0",
+    "WILLR_14_1h > -20.0",
+    "WILLR_14_4h > -25.0",
+    "STOCHRSIk_14_14_3_3_4h > 20.0",
+    "AROOND_14_1d < 50.0",
+    "ROC_9_1d < 20.0",
+  ),
+)
+
+# Global protections Short dump, same form as PROTECTIONS_LONG_GLOBAL
+PROTECTIONS_SHORT_GLOBAL_DUMP = (
+  # 15m & 1h up move, 15m & 1h still not high enough, 4h still low, 1d still low & downtrend
+  (
+    "RSI_3_15m < 80.0",
+    "RSI_3_1h < 70.0",
+    "RSI_14_15m > 80.0",
+    "CCI_20_15m > 400.0",
+    "RSI_14_1h > 75.0",
+    "CCI_20_1h > 250.0",
+    "RSI_14_4h > 60.0",
+    "AROOND_14_4h < 50.0",
+    "CCI_20_4h > 200.0",
+    "RSI_14_1d > 50.0",
+    "AROOND_14_1d < 75.0",
+    "ROC_9_1d > -30.0",
+  ),
+  # 15m up move, 15m still low, 1h & 4h & 1d still not high
+  (
+    "RSI_3_15m < 85.0",
+    "AROOND_14_15m < 50.0",
+    "RSI_14_1h > 70.0",
+    "WILLR_14_1h > -50.0",
+    "STOCHRSIk_14_14_3_3_1h > 80.0",
+    "AROOND_14_1h < 75.0",
+    "RSI_14_4h > 70.0",
+    "WILLR_14_4h > -50.0",
+    "AROOND_14_4h < 25.0",
+    "STOCHRSIk_14_14_3_3_4h > 30.0",
+    "RSI_14_1d > 70.0",
+  ),
+  # 1h & 4h up move, 15m & 1h & 4h still not high enough, 1d still low & downtrend
+  (
+    "RSI_3_1h < 70.0",
+    "RSI_3_4h < 90.0",
+    "RSI_14_15m > 95.0",
+    "CCI_20_15m > 600.0",
+    "RSI_14_1h > 95.0",
+    "CCI_20_1h > 600.0",
+    "RSI_14_4h > 95.0",
+    "WILLR_14_4h > -10.0",
+    "CCI_20_4h > 600.0",
+    "RSI_14_1d > 40.0",
+    "ROC_9_1d > -20.0",
+  ),
+)
+
+# The protections tables, by name (for the indicator dependency analyzer)
+PROTECTIONS_TABLES = {
+  "PROTECTIONS_LONG_GLOBAL": PROTECTIONS_LONG_GLOBAL,
+  "PROTECTIONS_SHORT_GLOBAL_PUMP": PROTECTIONS_SHORT_GLOBAL_PUMP,
+  "PROTECTIONS_SHORT_GLOBAL_DUMP": PROTECTIONS_SHORT_GLOBAL_DUMP,
+}
+
+
+# Compile Protection Condition
+# ---------------------------------------------------------------------------------------------
+@lru_cache(maxsize=None)
+def compile_protection_condition(condition: str):
+  """
+  Compiles a protection condition, "close > high_max_30_1d * 0.05"
+
+  :param condition: The condition, with the columns as names
+  :return: The code object and the column names it reads
+  """
+  code = compile(condition, f"<protection {condition}>", "eval")
+  return code, code.co_names
+
+
+# Protection Columns
+# ---------------------------------------------------------------------------------------------
+def protection_columns(clauses) -> set:
+  """
+  The columns read by the protections clauses
+
+  :param clauses: The protections clauses
+  :return set: The column names
+  """
+  columns = set()
+  for clause in clauses:
+    for condition in clause:
+      for name in compile_protection_condition(condition)[1]:
+        match = PROTECTIONS_SHIFT_RE.match(name)
+        columns.add(match.group(1) if match else name)
+  return columns
+
+
+# Evaluate Protections
+# ---------------------------------------------------------------------------------------------
+def evaluate_protections(df: DataFrame, clauses) -> np.ndarray:
+  """
+  AND of the clauses, each clause an OR of conditions, the same as the chained (a | b) & (c | d) expression.
+
+  The rows are evaluated in blocks of PROTECTIONS_BLOCK_ROWS, written in place into the result column: the
+  temporaries (condition results, shifted values, "close > high_max_30_1d * 0.05" products) are block sized,
+  not column sized. In a block, each condition is only evaluated on the rows not decided yet: a clause stops
+  at its first true condition, and the rows of a false clause are dropped for all the next clauses. While
+  most of the rows are undecided the condition is evaluated on the whole block, once few are left only the
+  undecided rows are gathered.
+
+  :param df: DataFrame The dataframe with the indicators
+  :param clauses: The protections clauses
+  :return np.ndarray: The bool column
+  """
+  num_rows = len(df)
+  result = np.ones(num_rows, dtype=bool)
+  conditions = [[compile_protection_condition(condition) for condition in clause] for clause in clauses]
+  columns = {}
+  for clause in conditions:
+    for _, names in clause:
+      for name in names:
+        if name not in columns:
+          match = PROTECTIONS_SHIFT_RE.match(name)
+          column = match.group(1) if match else name
+          columns[name] = (df[column].to_numpy(), int(match.group(2)) if match else 0)
+
+  def block_values(name: str, start: int, stop: int) -> np.ndarray:
+    values, shift = columns[name]
+    if start >= shift:
+      return values[start - shift : stop - shift]
+    # The first rows of a shifted column are missing
+    shifted = np.full(stop - start, np.nan)
+    shifted[shift - start :] = values[: max(stop - shift, 0)]
+    return shifted
+
+  pending = np.empty(min(num_rows, PROTECTIONS_BLOCK_ROWS), dtype=bool)
+  with np.errstate(invalid="ignore", divide="ignore"):
+    for start in range(0, num_rows, PROTECTIONS_BLOCK_ROWS):
+      stop = min(start + PROTECTIONS_BLOCK_ROWS, num_rows)
+      num_block_rows = stop - start
+      alive = result[start:stop]
+      num_alive = num_block_rows
+      for clause in conditions:
+        # the alive rows without a true condition yet
+        block_pending = pending[:num_block_rows]
+        np.copyto(block_pending, alive)
+        num_pending = num_alive
+        for code, names in clause:
+          if num_pending == 0:
+            break
+          if num_pending * PROTECTIONS_GATHER_FRACTION > num_block_rows:
+            is_true = eval(code, {"__builtins__": {}}, {n: block_values(n, start, stop) for n in names})
+            np.greater(block_pending, is_true, out=block_pending)
+            num_pending = int(np.count_nonzero(block_pending))
+          else:
+            rows = np.flatnonzero(block_pending)
+            is_true = np.asarray(
+              eval(code, {"__builtins__": {}}, {n: block_values(n, start, stop)[rows] for n in names}), dtype=bool
+            )
+            block_pending[rows[is_true]] = False
+            num_pending -= int(np.count_nonzero(is_true))
+        if num_pending > 0:
+          np.greater(alive, block_pending, out=alive)
+          num_alive -= num_pending
+        if num_alive == 0:
+          break
+
+  return result
+
+
+# +---------------------------------------------------------------------------+
+# |                              Mode Tags                                    |
+# +---------------------------------------------------------------------------+
+
+# The mode tags lists of the strategy, each one gets a X_mode_mask bitmask
+MODE_TAGS_ATTRIBUTES = (
+  "long_normal_mode_tags",
+  "long_pump_mode_tags",
+  "long_quick_mode_tags",
+  "long_rebuy_mode_tags",
+  "long_mode_tags",
+  "long_rapid_mode_tags",
+  "long_grind_mode_tags",
+  "long_top_coins_mode_tags",
+  "long_scalp_mode_tags",
+  "short_normal_mode_tags",
+  "short_pump_mode_tags",
+  "short_quick_mode_tags",
+  "short_rebuy_mode_tags",
+  "short_mode_tags",
+  "short_rapid_mode_tags",
+  "short_grind_mode_tags",
+  "short_top_coins_mode_tags",
+  "short_scalp_mode_tags",
+)
+
+
+# +---------------------------------------------------------------------------+
+# |                              Memory Compaction                            |
+# +---------------------------------------------------------------------------+
+
+# Columns read from a candle row by the exit/adjust/confirm logic
+RUNTIME_CANDLE_COLUMN_RE = re.compile(r'\b(?:last_candle|previous_candle(?:_\d+)?)\["([^"]+)"\]')
+
+# Columns whose candle values are type checked, isinstance(last_candle["ROC_9_1d"], np.float64)
+FLOAT64_CHECKED_COLUMN_RE = re.compile(r'isinstance\(\w+\["([^"]+)"\], np\.float64\)')
+
+# Columns that are always kept (freqtrade and plotting)
+RUNTIME_BASE_COLUMNS = (
+  "date",
+  "open",
+  "high",
+  "low",
+  "close",
+  "volume",
+  "enter_long",
+  "enter_short",
+  "enter_tag",
+  "exit_long",
+  "exit_short",
+  "exit_tag",
+)
+
+# Compact Dataframe
+# ---------------------------------------------------------------------------------------------
+def compact_dataframe(df: DataFrame, keep_columns, float64_columns=()) -> DataFrame:
+  """
+  Drops the columns not in keep_columns and downcasts to float32 the columns without precision loss
+
+  Lossy columns stay float64: the oscillators are compared with constant thresholds (rsi_14 < 30.0,
+  cti_20 > -0.8), a value next to a threshold can flip sides after rounding.
+
+  :param df: DataFrame The analyzed df
+  :param keep_columns: The columns to keep
+  :param float64_columns: The columns that must stay float64
+  """
+  df = df.drop(columns=[c for c in df.columns if c not in keep_columns])
+  for column in df.columns:
+    values = df[column]
+    if "protections" in column and values.dtype != bool:
+      df[column] = values.fillna(False).astype(bool)
+    elif values.dtype == np.float64 and column not in float64_columns:
+      downcast = values.to_numpy().astype(np.float32)
+      if np.array_equal(downcast.astype(np.float64), values.to_numpy(), equal_nan=True):
+        df[column] = downcast
+  return df
+
+
+# +---------------------------------------------------------------------------+
+# |                              Exit Signals Precompute                      |
+# +---------------------------------------------------------------------------+
+
+# Exit functions depending only on the candles and on the current profit band
+PRECOMPUTED_EXIT_FUNCTIONS = (
+  "long_exit_signals",
+  "long_exit_main",
+  "long_exit_williams_r",
+  "long_exit_dec",
+  "short_exit_signals",
+  "short_exit_main",
+  "short_exit_williams_r",
+  "short_exit_dec",
+)
+
+
+# +---------------------------------------------------------------------------+
+# |                              Informative Frames                           |
+# +---------------------------------------------------------------------------+
+
+
+# Strategy Version Hash
+# ---------------------------------------------------------------------------------------------
+def strategy_version_hash(settings: str = "") -> str:
+  """
+  Hash of the strategy source, of the indicator libraries versions and of the settings changing the
+  computed columns, persisted indicators computed by another version are not reused
+
+  :param settings: The settings changing the computed columns
+  :return str: The hash
+  """
+  version = hashlib.sha256(pathlib.Path(__file__).read_bytes())
+  version.update(f"{pd.__version__}-{np.__version__}-{getattr(pta, 'version', '')}-{settings}".encode())
+  return version.hexdigest()[:16]
+
+
+# Candles Fingerprint
+# ---------------------------------------------------------------------------------------------
+def candle_row_hashes(df: DataFrame) -> np.ndarray:
+  """
+  Hash of each OHLCV candle an informative frame is computed from
+
+  :param df: DataFrame The candles
+  :return np.ndarray: The uint64 hash per candle
+  """
+  columns = [c for c in ("date", "open", "high", "low", "close", "volume") if c in df.columns]
+  return pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+
+
+# +---------------------------------------------------------------------------+
+# |                              Profiling                                    |
+# +---------------------------------------------------------------------------+
+
+# Strategy callbacks timed as a whole in profiling mode (the indicator functions record their own timings)
+PROFILED_FUNCTIONS = (
+  "populate_entry_trend",
+  "custom_exit",
+  "adjust_trade_position",
+)
+
+
 # +---------------------------------------------------------------------------+
 # |                              Classes                                      |
 # +---------------------------------------------------------------------------+
 
 
+# DataProvider Proxy Class
+# ---------------------------------------------------------------------------------------------
+class CandlesOverrideProvider:
+  """
+  DataProvider proxy returning the given candles for one pair and timeframe (the informative
+  indicators functions fetch their own candles), everything else goes to the DataProvider.
+  """
+
+  def __init__(self, dp, pair: str, timeframe: str, candles: DataFrame):
+    self.dp = dp
+    self.key = (pair, timeframe)
+    self.candles = candles
+
+  def get_pair_dataframe(self, pair: str, timeframe: str = None, *args, **kwargs) -> DataFrame:
+    if (pair, timeframe) == self.key:
+      return self.candles.copy()
+    return self.dp.get_pair_dataframe(pair, timeframe, *args, **kwargs)
+
+  def __getattr__(self, name):
+    return getattr(self.dp, name)
+
+
+# Informative Frames Cache Class
+# ---------------------------------------------------------------------------------------------
+class InformativeFramesCache:
+  """
+  The informative timeframes indicators, per pair and timeframe, with the hash of each candle they are
+  computed from (one indicators row per candle).
+
+  A frame is reused as long as the candles are unchanged. When the window has moved on (new candles
+  while running, or while the bot was down), only the new candles and warmup_candles candles before them
+  are computed, and the new rows are appended to the cached ones still in the window. The rows are then
+  the ones a run started with warmup_candles candles before them gives (the startup_candle_count contract):
+  the recursive indicators (EMA, RSI) can differ in the last decimals from a full window recompute.
+  The whole window is computed when the cached candles don't overlap, changed, or there are too many
+  new candles for the tail to be cheaper.
+
+  The frames are saved as feather files at shutdown, in a folder named after the strategy version hash,
+  and loaded back at startup. The path is per bot, exchange and stake currency (bots sharing a user data
+  dir have their own folder), and only the version folders created by this class (with an index.json)
+  are pruned.
+  """
+
+  def __init__(self, path: pathlib.Path, version: str, warmup_candles: int):
+    self.path = path
+    self.version = version
+    self.warmup_candles = warmup_candles
+    # (pair, timeframe) -> (candle row hashes, indicators frame)
+    self.frames = {}
+
+  def get_or_compute(self, pair: str, timeframe: str, candles: DataFrame, compute) -> DataFrame:
+    """
+    :param compute: Function computing the indicators frame of the candles it is given
+    """
+    hashes = candle_row_hashes(candles)
+    cached = self.frames.get((pair, timeframe))
+    frame = None
+    if cached is not None:
+      if np.array_equal(cached[0], hashes):
+        return cached[1].copy()
+      frame = self._extend(cached[0], cached[1], hashes, candles, compute)
+    if frame is None:
+      frame = compute(candles)
+    if len(frame) == len(hashes):
+      self.frames[(pair, timeframe)] = (hashes, frame.copy())
+    return frame
+
+  def _extend(self, cached_hashes, cached_frame, hashes, candles, compute):
+    """The cached rows still in the window with the new candles rows appended, None if not possible"""
+    if len(cached_frame) != len(cached_hashes):
+      return None
+    matches = np.flatnonzero(hashes == cached_hashes[-1])
+    if len(matches) == 0:
+      return None
+    num_overlap = matches[-1] + 1
+    num_new = len(hashes) - num_overlap
+    num_tail = num_new + self.warmup_candles
+    if num_new <= 0 or num_overlap > len(cached_hashes) or num_tail >= len(hashes):
+      return None
+    if not np.array_equal(hashes[:num_overlap], cached_hashes[-num_overlap:]):
+      return None
+    tail_frame = compute(candles.iloc[-num_tail:].reset_index(drop=True))
+    if len(tail_frame) != num_tail or list(tail_frame.columns) != list(cached_frame.columns):
+      return None
+    return pd.concat(
+      [cached_frame.iloc[-num_overlap:], tail_frame.iloc[-num_new:]], ignore_index=True
+    )
+
+  @staticmethod
+  def _file_name(pair: str, timeframe: str, suffix: str = "") -> str:
+    return f"{pair.replace('/', '_').replace(':', '_')}-{timeframe}{suffix}.feather"
+
+  def load(self) -> None:
+    index_path = self.path / self.version / "index.json"
+    try:
+      with index_path.open("r") as rfh:
+        index = rapidjson.load(rfh)
+    except FileNotFoundError:
+      return
+    except rapidjson.JSONDecodeError as exc:
+      log.error("Failed to load JSON from %s: %s", index_path, exc)
+      return
+    for pair, timeframe in index:
+      try:
+        frame = pd.read_feather(self.path / self.version / self._file_name(pair, timeframe))
+        hashes = pd.read_feather(self.path / self.version / self._file_name(pair, timeframe, "-candles"))
+      except Exception as exc:
+        log.warning(f"Failed to load the {pair} {timeframe} informative frame: {exc}")
+        continue
+      self.frames[(pair, timeframe)] = (hashes["hash"].to_numpy(), frame)
+    log.info(f"Loaded {len(self.frames)} informative frames from {self.path / self.version}")
+
+  def save(self) -> None:
+    folder = self.path / self.version
+    folder.mkdir(parents=True, exist_ok=True)
+    index = []
+    for (pair, timeframe), (hashes, frame) in self.frames.items():
+      try:
+        frame.reset_index(drop=True).to_feather(folder / self._file_name(pair, timeframe))
+        DataFrame({"hash": hashes}).to_feather(folder / self._file_name(pair, timeframe, "-candles"))
+      except Exception as exc:
+        log.warning(f"Failed to save the {pair} {timeframe} informative frame: {exc}")
+        continue
+      index.append([pair, timeframe])
+    tmp_path = folder / ".index.json.tmp"
+    with tmp_path.open("w") as wfh:
+      rapidjson.dump(index, wfh)
+    os.replace(tmp_path, folder / "index.json")
+    # The frames of the other strategy versions can't be reused
+    for other_folder in self.path.iterdir():
+      if other_folder.name != self.version and (other_folder / "index.json").is_file():
+        shutil.rmtree(other_folder, ignore_errors=True)
+    log.info(f"Saved {len(index)} informative frames to {folder}")
+
+
+# Profiling Registry Class
+# ---------------------------------------------------------------------------------------------
+class ProfilingRegistry:
+  """
+  Timings of the strategy functions, per pair and per function.
+
+  Every timing goes in a log2 histogram (in microseconds). The timings recorded while a root call runs
+  (the informative indicators inside populate_indicators) are folded under it, giving the flamegraph
+  stacks ("populate_indicators;informative_1d_indicators <microseconds>").
+  """
+
+  num_buckets = 32
+  max_pending = 1000
+
+  def __init__(self):
+    # (pair, function name) -> [calls, total seconds, max seconds, histogram]
+    self.timings = {}
+    # folded stack -> self time in seconds
+    self.stacks = {}
+    # finished nested timings, waiting for their root call: (start, end, folded stacks)
+    self._pending = []
+
+  def record(self, pair: str, function_name: str, start: float, end: float, is_root: bool = False) -> None:
+    duration = end - start
+    timing = self.timings.get((pair, function_name))
+    if timing is None:
+      timing = self.timings[(pair, function_name)] = [0, 0.0, 0.0, [0] * self.num_buckets]
+    timing[0] += 1
+    timing[1] += duration
+    timing[2] = max(timing[2], duration)
+    timing[3][min(self.num_buckets - 1, int(duration * 1e6).bit_length())] += 1
+
+    # The nested timings that started after this one are its children
+    self_time = duration
+    stacks = {}
+    while self._pending and self._pending[-1][0] >= start:
+      child_start, child_end, child_stacks = self._pending.pop()
+      self_time -= child_end - child_start
+      for stack, seconds in child_stacks.items():
+        stacks[f"{function_name};{stack}"] = stacks.get(f"{function_name};{stack}", 0.0) + seconds
+    stacks[function_name] = self_time
+
+    if is_root:
+      for stack, seconds in stacks.items():
+        self.stacks[stack] = self.stacks.get(stack, 0.0) + seconds
+    else:
+      self._pending.append((start, end, stacks))
+      del self._pending[: -self.max_pending]
+
+  def wrap(self, function, function_name: str):
+    """Times each call of the function as a root call, the pair is taken from its pair/trade/metadata argument."""
+    signature = inspect.signature(function)
+
+    def profiled(*args, **kwargs):
+      start = time.perf_counter()
+      try:
+        return function(*args, **kwargs)
+      finally:
+        end = time.perf_counter()
+        arguments = signature.bind_partial(*args, **kwargs).arguments
+        if "pair" in arguments:
+          pair = arguments["pair"]
+        elif "trade" in arguments:
+          pair = arguments["trade"].pair
+        else:
+          pair = arguments.get("metadata", {}).get("pair", "")
+        self.record(pair, function_name, start, end, is_root=True)
+
+    return profiled
+
+  def _percentile(self, histogram: list, ratio: float) -> float:
+    # Upper bound of the histogram bucket, in seconds
+    target = ratio * sum(histogram)
+    count = 0
+    for bucket, bucket_count in enumerate(histogram):
+      count += bucket_count
+      if count >= target:
+        return (1 << bucket) / 1e6
+    return 0.0
+
+  def summary(self, by_pair: bool = False) -> list:
+    """Rows of (function, pair, calls, total, mean, p50, p95, max), sorted by the total time."""
+    merged = {}
+    for (pair, function_name), (calls, total, maximum, histogram) in self.timings.items():
+      key = (function_name, pair if by_pair else "")
+      if key not in merged:
+        merged[key] = [0, 0.0, 0.0, [0] * self.num_buckets]
+      row = merged[key]
+      row[0] += calls
+      row[1] += total
+      row[2] = max(row[2], maximum)
+      row[3] = [a + b for a, b in zip(row[3], histogram)]
+    rows = [
+      (
+        function_name,
+        pair,
+        calls,
+        total,
+        total / calls,
+        min(self._percentile(histogram, 0.5), maximum),
+        min(self._percentile(histogram, 0.95), maximum),
+        maximum,
+      )
+      for (function_name, pair), (calls, total, maximum, histogram) in merged.items()
+    ]
+    return sorted(rows, key=lambda row: row[3], reverse=True)
+
+  def format_summary(self, by_pair: bool = False) -> str:
+    lines = [
+      f"{'function':<32} {'pair':<20} {'calls':>9} {'total s':>10} "
+      f"{'mean ms':>10} {'p50 ms':>10} {'p95 ms':>10} {'max ms':>10}"
+    ]
+    for function_name, pair, calls, total, mean, p50, p95, maximum in self.summary(by_pair):
+      lines.append(
+        f"{function_name:<32} {pair:<20} {calls:>9} {total:>10.3f} {mean * 1e3:>10.3f} "
+        f"{p50 * 1e3:>10.3f} {p95 * 1e3:>10.3f} {maximum * 1e3:>10.3f}"
+      )
+    return "\n".join(lines)
+
+  def dump(self, summary_path, folded_path) -> None:
+    """Writes the summary tables (per function, then per function and pair) and the folded stacks."""
+    if not self.timings:
+      return
+    summary = self.format_summary()
+    log.info(f"Profiling summary:\n{summary}")
+    with open(summary_path, "w", encoding="utf-8") as summary_file:
+      summary_file.write(summary + "\n\n" + self.format_summary(by_pair=True) + "\n")
+    with open(folded_path, "w", encoding="utf-8") as folded_file:
+      for stack, seconds in sorted(self.stacks.items()):
+        if seconds > 0.0:
+          folded_file.write(f"{stack} {int(round(seconds * 1e6))}\n")
+    log.info(f"Profiling data written to {summary_path} and {folded_path}")
+
+
+# Mode Tag Masks Class
+# ---------------------------------------------------------------------------------------------
+class ModeTagMasks:
+  """
+  Bitmasks of the mode tags, one bit per tag (bit 0 for the tags not in any mode).
+
+  With the mask of the enter tags, any(c in mode_tags for c in enter_tags) is (mask & mode_mask) != 0,
+  and all(c in mode_tags for c in enter_tags) is (mask & ~mode_mask) == 0.
+  """
+
+  unknown_tag_bit = 1
+
+  def __init__(self, mode_tags: dict):
+    # tag -> bit
+    self.tag_bits = {}
+    # X_mode_tags -> bitmask of its tags
+    self.masks = {}
+    for name, tags in mode_tags.items():
+      mask = 0
+      for tag in tags:
+        if tag not in self.tag_bits:
+          self.tag_bits[tag] = 1 << (len(self.tag_bits) + 1)
+        mask |= self.tag_bits[tag]
+      self.masks[name] = mask
+    # enter tag (string or tuple of the split tags) -> bitmask
+    self.enter_tags_masks = {}
+
+  def enter_tags_mask(self, enter_tags) -> int:
+    key = enter_tags if isinstance(enter_tags, str) else tuple(enter_tags)
+    mask = self.enter_tags_masks.get(key)
+    if mask is None:
+      mask = 0
+      for tag in key.split() if isinstance(key, str) else key:
+        mask |= self.tag_bits.get(tag, self.unknown_tag_bit)
+      self.enter_tags_masks[key] = mask
+    return mask
+
+
+# Open Trades Index Class
+# ---------------------------------------------------------------------------------------------
+class OpenTradesIndex:
+  """
+  Snapshot of the open trades, rebuilt once per bot loop.
+
+  Keeps the open trades by id and by pair, and the number of open trades per direction and per mode,
+  so the entry and confirm paths don't need to scan all the open trades for every pair.
+  """
+
+  def __init__(self, mode_tag_masks: "ModeTagMasks", mode_masks: dict):
+    self.mode_tag_masks = mode_tag_masks
+    # mode name -> bitmask of the enter tags of the mode
+    self.mode_masks = mode_masks
+    self.is_built = False
+    self.trades_by_id = {}
+    self.trades_by_pair = {}
+    self.num_open = 0
+    self.num_long = 0
+    self.num_short = 0
+    self.num_by_mode = dict.fromkeys(mode_masks, 0)
+
+  def rebuild(self, open_trades) -> None:
+    self.trades_by_id = {}
+    self.trades_by_pair = {}
+    self.num_open = 0
+    self.num_long = 0
+    self.num_short = 0
+    self.num_by_mode = dict.fromkeys(self.mode_masks, 0)
+    for trade in open_trades:
+      self.trades_by_id[trade.id] = self.trades_by_pair[trade.pair] = trade
+      self._count(trade.enter_tag, trade.trade_direction)
+    self.is_built = True
+
+  def add_pending_entry(self, entry_tag: Optional[str], side: str) -> None:
+    # Entries confirmed during the current bot loop, until the next rebuild
+    if self.is_built:
+      self._count(entry_tag, side)
+
+  def _count(self, enter_tag: Optional[str], direction: str) -> None:
+    self.num_open += 1
+    if direction == "short":
+      self.num_short += 1
+    else:
+      self.num_long += 1
+    if enter_tag is None:
+      return
+    enter_tags_mask = self.mode_tag_masks.enter_tags_mask(enter_tag)
+    for mode_name, mode_mask in self.mode_masks.items():
+      if (enter_tags_mask & ~mode_mask) == 0:
+        self.num_by_mode[mode_name] += 1
+
+
+# Indicator Dependency Analyzer Class
+# ---------------------------------------------------------------------------------------------
+class IndicatorDependencyAnalyzer:
+  """
+  Static analysis of the strategy source, to find the indicator columns used by the enabled signals.
+
+  Lists the columns read by each entry condition (df["..."] in populate_entry_trend) and by each exit/adjust
+  function (last_candle["..."], previous_candle_N["..."]), builds the dependency graph of the indicator
+  columns, and builds copies of the indicator functions that only compute the required columns.
+  """
+
+  entry_function = "populate_entry_trend"
+  # indicator function -> (dataframe variable, column suffix after merging)
+  indicator_functions = {
+    "informative_1d_indicators": ("informative_1d", "_1d"),
+    "informative_4h_indicators": ("informative_4h", "_4h"),
+    "informative_1h_indicators": ("informative_1h", "_1h"),
+    "informative_15m_indicators": ("informative_15m", "_15m"),
+    "base_tf_5m_indicators": ("df", ""),
+    "populate_indicators": ("df", ""),
+  }
+
+  def __init__(self, source: str, class_name: str):
+    self.functions = {}
+    for node in ast.parse(source).body:
+      if isinstance(node, ast.ClassDef) and node.name == class_name:
+        for item in node.body:
+          if isinstance(item, ast.FunctionDef):
+            self.functions[item.name] = item
+    self.long_entry_columns = {}
+    self.short_entry_columns = {}
+    self.entry_common_columns = set()
+    self._parse_entry_conditions()
+    self.exit_columns = {}
+    self._parse_exit_functions()
+    self.dependencies = {}
+    for function_name in self.indicator_functions:
+      self._parse_indicator_function(function_name)
+
+  @staticmethod
+  def _column_reads(node, frame_name: str) -> set:
+    columns = set()
+    for child in ast.walk(node):
+      if (
+        isinstance(child, ast.Subscript)
+        and isinstance(child.ctx, ast.Load)
+        and isinstance(child.value, ast.Name)
+        and child.value.id == frame_name
+        and isinstance(child.slice, ast.Constant)
+        and isinstance(child.slice.value, str)
+      ):
+        columns.add(child.slice.value)
+    return columns
+
+  @staticmethod
+  def _condition_index(node):
+    # if long_entry_condition_index == N / if short_entry_condition_index == N
+    if (
+      isinstance(node, ast.If)
+      and isinstance(node.test, ast.Compare)
+      and isinstance(node.test.left, ast.Name)
+      and node.test.left.id in ("long_entry_condition_index", "short_entry_condition_index")
+      and len(node.test.comparators) == 1
+      and isinstance(node.test.comparators[0], ast.Constant)
+    ):
+      return node.test.left.id.split("_")[0], node.test.comparators[0].value
+    return None, None
+
+  def _parse_entry_conditions(self):
+    def visit(node):
+      side, index = self._condition_index(node)
+      if side == "long":
+        self.long_entry_columns.setdefault(index, set()).update(self._column_reads(node, "df"))
+        return
+      if side == "short":
+        self.short_entry_columns.setdefault(index, set()).update(self._column_reads(node, "df"))
+        return
+      if isinstance(node, ast.Subscript):
+        self.entry_common_columns.update(self._column_reads(node, "df"))
+      for child in ast.iter_child_nodes(node):
+        visit(child)
+
+    visit(self.functions[self.entry_function])
+
+  def _parse_exit_functions(self):
+    for function_name, function in self.functions.items():
+      if function_name == self.entry_function or function_name in self.indicator_functions:
+        continue
+      columns = set()
+      for frame_name in ("last_candle", "previous_candle", *(f"previous_candle_{i}" for i in range(1, 6))):
+        columns.update(self._column_reads(function, frame_name))
+      if columns:
+        self.exit_columns[function_name] = columns
+
+  @staticmethod
+  def _column_target(statement, frame_name: str):
+    if (
+      isinstance(statement, ast.Assign)
+      and len(statement.targets) == 1
+      and isinstance(statement.targets[0], ast.Subscript)
+      and isinstance(statement.targets[0].value, ast.Name)
+      and statement.targets[0].value.id == frame_name
+      and isinstance(statement.targets[0].slice, ast.Constant)
+      and isinstance(statement.targets[0].slice.value, str)
+    ):
+      return statement.targets[0].slice.value
+    return None
+
+  @staticmethod
+  def _iter_statements(statements):
+    for statement in statements:
+      yield statement
+      for field in ("body", "orelse", "finalbody"):
+        yield from IndicatorDependencyAnalyzer._iter_statements(getattr(statement, field, []))
+      for handler in getattr(statement, "handlers", []):
+        yield from IndicatorDependencyAnalyzer._iter_statements(handler.body)
+
+  def _parse_indicator_function(self, function_name: str):
+    frame_name, suffix = self.indicator_functions[function_name]
+    # temporary variable (bbands_20_2, stochrsi etc.) -> columns it was computed from
+    variable_reads = {}
+    for statement in self._iter_statements(self.functions[function_name].body):
+      if not isinstance(statement, ast.Assign):
+        continue
+      reads = {f"{c}{suffix}" for c in self._column_reads(statement.value, frame_name)}
+      for child in ast.walk(statement.value):
+        if isinstance(child, ast.Name) and child.id in variable_reads:
+          reads.update(variable_reads[child.id])
+        elif isinstance(child, ast.Name) and child.id in PROTECTIONS_TABLES:
+          reads.update(f"{c}{suffix}" for c in protection_columns(PROTECTIONS_TABLES[child.id]))
+      column = self._column_target(statement, frame_name)
+      if column is not None:
+        self.dependencies.setdefault(f"{column}{suffix}", set()).update(reads)
+      elif len(statement.targets) == 1 and isinstance(statement.targets[0], ast.Name):
+        variable_reads[statement.targets[0].id] = reads
+
+  def signal_columns(self, long_entry_signal_params: dict, short_entry_signal_params: dict) -> dict:
+    """The columns read by each enabled entry signal and by each exit/adjust function."""
+    signal_columns = {}
+    for signal_params, entry_columns, side in (
+      (long_entry_signal_params, self.long_entry_columns, "long"),
+      (short_entry_signal_params, self.short_entry_columns, "short"),
+    ):
+      for condition_key, is_enabled in signal_params.items():
+        index = int(condition_key.split("_")[3])
+        if is_enabled and index in entry_columns:
+          signal_columns[f"{side}_entry_condition_{index}"] = entry_columns[index]
+    signal_columns.update(self.exit_columns)
+    return signal_columns
+
+  def required_columns(self, long_entry_signal_params: dict, short_entry_signal_params: dict, extra_columns=()) -> set:
+    """The columns needed by the enabled signals, including the columns they are computed from."""
+    pending = set(self.entry_common_columns) | set(extra_columns)
+    for columns in self.signal_columns(long_entry_signal_params, short_entry_signal_params).values():
+      pending.update(columns)
+    required = set()
+    while pending:
+      column = pending.pop()
+      if column not in required:
+        required.add(column)
+        pending.update(self.dependencies.get(column, ()))
+    return required
+
+  def pruned_function(self, function_name: str, required_columns: set, namespace: dict):
+    """Compiles a copy of the indicator function without the columns that are not required."""
+    frame_name, suffix = self.indicator_functions[function_name]
+    function = copy.deepcopy(self.functions[function_name])
+
+    def prune_columns(statements):
+      kept = []
+      for statement in statements:
+        column = self._column_target(statement, frame_name)
+        if column is not None and f"{column}{suffix}" not in required_columns:
+          continue
+        for field in ("body", "orelse", "finalbody"):
+          if getattr(statement, field, None):
+            setattr(statement, field, prune_columns(getattr(statement, field)))
+        for handler in getattr(statement, "handlers", []):
+          handler.body = prune_columns(handler.body)
+        kept.append(statement)
+      return kept or [ast.Pass()]
+
+    def prune_variables(statements, loaded_names):
+      kept = []
+      for statement in statements:
+        if (
+          isinstance(statement, ast.Assign)
+          and len(statement.targets) == 1
+          and isinstance(statement.targets[0], ast.Name)
+          and statement.targets[0].id not in loaded_names
+          and statement.targets[0].id != frame_name
+        ):
+          continue
+        for field in ("body", "orelse", "finalbody"):
+          if getattr(statement, field, None):
+            setattr(statement, field, prune_variables(getattr(statement, field), loaded_names))
+        for handler in getattr(statement, "handlers", []):
+          handler.body = prune_variables(handler.body, loaded_names)
+        kept.append(statement)
+      return kept or [ast.Pass()]
+
+    function.body = prune_columns(function.body)
+    loaded_names = {n.id for n in ast.walk(function) if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Load)}
+    function.body = prune_variables(function.body, loaded_names)
+    function.decorator_list = []
+
+    module = ast.fix_missing_locations(ast.Module(body=[function], type_ignores=[]))
+    exec(compile(module, filename=f"<pruned {function_name}>", mode="exec"), namespace)
+    return namespace.pop(function_name)
+
+
+# Precomputed Exit Signals Class
+# ---------------------------------------------------------------------------------------------
+class PrecomputedExitSignals:
+  """
+  Per candle precomputation of the long_exit_*/short_exit_* signal ladders.
+
+  The ladders only depend on the candles and on current_profit, which is only compared against constants.
+  The profit axis is split in bands (each threshold, and the ranges between them) and, for each band, the
+  ladder is evaluated vectorized over all the candles, giving the exit code of every candle. The per trade
+  check then only picks the band of the current profit and looks up the code in the last candle.
+  """
+
+  column_prefix = "exit_signal_"
+  candle_shifts = {
+    "last_candle": 0,
+    "previous_candle_1": 1,
+    "previous_candle_2": 2,
+    "previous_candle_3": 3,
+    "previous_candle_4": 4,
+    "previous_candle_5": 5,
+  }
+  binary_operators = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+  }
+  compare_operators = {
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+  }
+
+  def __init__(self, source: str, class_name: str, function_names):
+    functions = {}
+    for node in ast.parse(source).body:
+      if isinstance(node, ast.ClassDef) and node.name == class_name:
+        for item in node.body:
+          if isinstance(item, ast.FunctionDef) and item.name in function_names:
+            functions[item.name] = item
+    # function name -> (function node, profit thresholds, exit templates, return codes, profit dependent nodes)
+    self.functions = {}
+    for function_name, function in functions.items():
+      try:
+        self.functions[function_name] = self._parse_function(function)
+      except ValueError as exc:
+        log.warning(f"Exit signals of {function_name} can't be precomputed: {exc}")
+
+  def _parse_function(self, function: ast.FunctionDef) -> tuple:
+    thresholds = set()
+    templates = []
+    return_codes = {}
+    profit_nodes = set()
+    for node in ast.walk(function):
+      if isinstance(node, ast.Return):
+        return_codes[id(node)] = self._parse_return(node, templates)
+      elif isinstance(node, ast.Compare):
+        operands = [node.left, *node.comparators]
+        if any(isinstance(o, ast.Name) and o.id == "current_profit" for o in operands):
+          for operand in operands:
+            if isinstance(operand, ast.Name) and operand.id == "current_profit":
+              continue
+            value = ast.literal_eval(operand)
+            if not isinstance(value, (int, float)):
+              raise ValueError(f"unsupported profit comparison {ast.unparse(node)}")
+            thresholds.add(float(value))
+          for child in ast.walk(node):
+            profit_nodes.add(id(child))
+      elif isinstance(node, ast.Name) and node.id in ("max_profit", "max_loss", "trade", "current_time", "buy_tag"):
+        raise ValueError(f"uses {node.id}")
+    # Nodes containing a profit comparison depend on the band
+    for node in ast.walk(function):
+      if any(id(child) in profit_nodes for child in ast.walk(node)):
+        profit_nodes.add(id(node))
+    return function, sorted(thresholds), templates, return_codes, profit_nodes
+
+  @staticmethod
+  def _parse_return(node: ast.Return, templates: list) -> int:
+    if isinstance(node.value, ast.Tuple) and len(node.value.elts) == 2:
+      is_exit, signal_name = node.value.elts
+      if isinstance(is_exit, ast.Constant) and is_exit.value is False:
+        return -1
+      if isinstance(is_exit, ast.Constant) and is_exit.value is True:
+        if isinstance(signal_name, ast.Constant) and isinstance(signal_name.value, str):
+          templates.append(signal_name.value.replace("{", "{{").replace("}", "}}"))
+          return len(templates) - 1
+        if isinstance(signal_name, ast.JoinedStr):
+          template = ""
+          for value in signal_name.values:
+            if isinstance(value, ast.Constant):
+              template += value.value.replace("{", "{{").replace("}", "}}")
+            elif (
+              isinstance(value, ast.FormattedValue)
+              and isinstance(value.value, ast.Name)
+              and value.value.id == "mode_name"
+              and value.conversion == -1
+              and value.format_spec is None
+            ):
+              template += "{mode_name}"
+            else:
+              raise ValueError(f"unsupported exit name {ast.unparse(signal_name)}")
+          templates.append(template)
+          return len(templates) - 1
+    raise ValueError(f"unsupported return {ast.unparse(node)}")
+
+  @staticmethod
+  def band(thresholds: list, profit: float) -> int:
+    # Even bands are the ranges between the thresholds, odd bands the thresholds themselves
+    index = bisect.bisect_left(thresholds, profit)
+    if index < len(thresholds) and thresholds[index] == profit:
+      return 2 * index + 1
+    return 2 * index
+
+  @staticmethod
+  def band_profit(thresholds: list, band: int) -> float:
+    index = band // 2
+    if band % 2 == 1:
+      return thresholds[index]
+    if not thresholds:
+      return 0.0
+    if index == 0:
+      return thresholds[0] - 1.0
+    if index == len(thresholds):
+      return thresholds[-1] + 1.0
+    return (thresholds[index - 1] + thresholds[index]) / 2.0
+
+  def columns(self) -> list:
+    return [
+      f"{self.column_prefix}{function_name}_{band}"
+      for function_name, (_, thresholds, _, _, _) in self.functions.items()
+      for band in range(2 * len(thresholds) + 1)
+    ]
+
+  def populate(self, df: DataFrame) -> DataFrame:
+    """Adds the exit code columns (-1 for no exit) for every function and profit band."""
+    candles = {}
+    memo = {}
+    new_columns = {}
+    with np.errstate(invalid="ignore", divide="ignore"):
+      for function_name, (function, thresholds, _, return_codes, profit_nodes) in self.functions.items():
+        memo.clear()
+        for band in range(2 * len(thresholds) + 1):
+          codes = np.full(len(df), -1, dtype=np.int16)
+          state = (df, candles, memo, self.band_profit(thresholds, band), return_codes, profit_nodes)
+          self._exec(function.body, np.ones(len(df), dtype=bool), codes, state)
+          new_columns[f"{self.column_prefix}{function_name}_{band}"] = codes
+    return pd.concat([df.drop(columns=df.columns.intersection(list(new_columns))), DataFrame(new_columns, index=df.index)], axis=1)
+
+  def _exec(self, statements, active, codes, state) -> np.ndarray:
+    for statement in statements:
+      if not active.any():
+        break
+      if isinstance(statement, ast.Return):
+        codes[active] = state[4][id(statement)]
+        return np.zeros_like(active)
+      elif isinstance(statement, ast.If):
+        test = self._eval(statement.test, state)
+        if np.ndim(test) == 0:
+          active = self._exec(statement.body if test else statement.orelse, active, codes, state)
+        else:
+          test = test.astype(bool)
+          active = self._exec(statement.body, active & test, codes, state) | self._exec(
+            statement.orelse, active & ~test, codes, state
+          )
+      elif not isinstance(statement, (ast.Pass, ast.Expr)):
+        raise ValueError(f"unsupported statement {ast.unparse(statement)}")
+    return active
+
+  def _eval(self, node, state):
+    df, candles, memo, profit, _, profit_nodes = state
+    is_memoized = id(node) not in profit_nodes
+    if is_memoized and id(node) in memo:
+      return memo[id(node)]
+
+    if isinstance(node, ast.Constant):
+      value = node.value
+    elif isinstance(node, ast.Name) and node.id == "current_profit":
+      value = profit
+    elif isinstance(node, ast.Subscript):
+      value = self._candle_values(node, df, candles)
+    elif isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+      value = -self._eval(node.operand, state)
+    elif isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+      value = np.logical_not(self._eval(node.operand, state))
+    elif isinstance(node, ast.BinOp) and type(node.op) in self.binary_operators:
+      value = self.binary_operators[type(node.op)](self._eval(node.left, state), self._eval(node.right, state))
+    elif isinstance(node, ast.Compare):
+      value = True
+      left = self._eval(node.left, state)
+      for op, comparator in zip(node.ops, node.comparators):
+        right = self._eval(comparator, state)
+        value = np.logical_and(value, self.compare_operators[type(op)](left, right))
+        if np.ndim(value) == 0 and not value:
+          break
+        left = right
+    elif isinstance(node, ast.BoolOp):
+      is_and = isinstance(node.op, ast.And)
+      value = is_and
+      for operand in node.values:
+        operand_value = self._eval(operand, state)
+        if np.ndim(operand_value) == 0:
+          operand_value = bool(operand_value)
+        else:
+          operand_value = operand_value.astype(bool)
+        value = np.logical_and(value, operand_value) if is_and else np.logical_or(value, operand_value)
+        if np.ndim(value) == 0 and bool(value) != is_and:
+          break
+    elif (
+      isinstance(node, ast.Call)
+      and isinstance(node.func, ast.Name)
+      and node.func.id == "isinstance"
+      and isinstance(node.args[0], ast.Subscript)
+      and ast.unparse(node.args[1]) == "np.float64"
+    ):
+      column = df[node.args[0].slice.value]
+      if column.dtype == np.float64:
+        value = np.ones(len(df), dtype=bool)
+      elif column.dtype == object:
+        value = np.fromiter((isinstance(v, np.float64) for v in column), dtype=bool, count=len(df))
+      else:
+        value = np.zeros(len(df), dtype=bool)
+    else:
+      raise ValueError(f"unsupported expression {ast.unparse(node)}")
+
+    if is_memoized:
+      memo[id(node)] = value
+    return value
+
+  def _candle_values(self, node: ast.Subscript, df: DataFrame, candles: dict) -> np.ndarray:
+    if not (
+      isinstance(node.value, ast.Name)
+      and node.value.id in self.candle_shifts
+      and isinstance(node.slice, ast.Constant)
+      and isinstance(node.slice.value, str)
+    ):
+      raise ValueError(f"unsupported candle access {ast.unparse(node)}")
+    key = (node.value.id, node.slice.value)
+    if key not in candles:
+      shift = self.candle_shifts[node.value.id]
+      column = df[node.slice.value]
+      candles[key] = (column.shift(shift) if shift else column).to_numpy()
+    return candles[key]
+
+  def lookup(self, function_name: str, fallback):
+    """Returns a drop in replacement of the exit function, reading the precomputed exit codes."""
+    _, thresholds, templates, _, _ = self.functions[function_name]
+    column_prefix = f"{self.column_prefix}{function_name}_"
+
+    def precomputed_exit(mode_name, current_profit, max_profit, max_loss, last_candle, *args, **kwargs):
+      code = last_candle.get(f"{column_prefix}{self.band(thresholds, current_profit)}")
+      if code is None:
+        return fallback(mode_name, current_profit, max_profit, max_loss, last_candle, *args, **kwargs)
+      if code < 0:
+        return False, None
+      return True, templates[code].format(mode_name=mode_name)
+
+    return precomputed_exit
+
+
 # Cache Class
 # ---------------------------------------------------------------------------------------------
 class Cache:
@@ -57959,7 +59445,9 @@ class Cache:
     self.path = path
     self.data = {}
     self._mtime = None
-    self._previous_data = {}
+    # Bumped on every change, the data is written only when it differs from the saved version
+    self._version = 0
+    self._saved_version = 0
     try:
       self.load()
     except FileNotFoundError:
@@ -57978,9 +59466,19 @@ class Cache:
       self._load()
 
   def save(self):
-    if self.data != self._previous_data:
+    if self._version != self._saved_version:
       self._save()
 
+  def set(self, key, value):
+    self.data[key] = value
+    self._version += 1
+
+  def pop(self, key):
+    if key in self.data:
+      self._version += 1
+      return self.data.pop(key)
+    return None
+
   def process_loaded_data(self, data):
     return data
 
@@ -57993,17 +59491,28 @@ class Cache:
         log.error("Failed to load JSON from %s: %s", self.path, exc)
       else:
         self.data = self.process_loaded_data(data)
-        self._previous_data = copy.deepcopy(self.data)
+        self._saved_version = self._version
         self._mtime = self.path.stat().st_mtime_ns
 
   def _save(self):
     # This method only exists to simplify unit testing
-    rapidjson.dump(self.data, self.path.open("w"), **self.rapidjson_dump_kwargs())
-    self._mtime = self.path.stat().st_mtime
-    self._previous_data = copy.deepcopy(self.data)
+    # Write to a temporary file and rename it, so a crash never leaves a truncated file behind
+    tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+    with tmp_path.open("w") as wfh:
+      rapidjson.dump(self.data, wfh, **self.rapidjson_dump_kwargs())
+    os.replace(tmp_path, self.path)
+    self._mtime = self.path.stat().st_mtime_ns
+    self._saved_version = self._version
 
 
 class HoldsCache(Cache):
+  def __init__(self, path, open_trades_index=None):
+    self.open_trades_index = open_trades_index
+    # Parsed hold targets (profit ratio) by trade id and by pair
+    self.trade_ids = {}
+    self.trade_pairs = {}
+    super().__init__(path)
+
   @staticmethod
   def rapidjson_load_kwargs():
     return {
@@ -58027,11 +59536,17 @@ class HoldsCache(Cache):
     trade_pairs = data.get("trade_pairs")
 
     if not trade_ids and not trade_pairs:
+      self.trade_ids = {}
+      self.trade_pairs = {}
       return data
 
     open_trades = {}
-    for trade in Trade.get_trades_proxy(is_open=True):
-      open_trades[trade.id] = open_trades[trade.pair] = trade
+    if self.open_trades_index is not None and self.open_trades_index.is_built:
+      open_trades.update(self.open_trades_index.trades_by_id)
+      open_trades.update(self.open_trades_index.trades_by_pair)
+    else:
+      for trade in Trade.get_trades_proxy(is_open=True):
+        open_trades[trade.id] = open_trades[trade.pair] = trade
 
     r_trade_ids = {}
     if trade_ids:
@@ -58125,6 +59640,9 @@ class HoldsCache(Cache):
           )
         r_trade_pairs[trade_pair] = profit_ratio
 
+    self.trade_ids = r_trade_ids
+    self.trade_pairs = r_trade_pairs
+
     r_data = {}
     if r_trade_ids:
       r_data["trade_ids"] = r_trade_ids
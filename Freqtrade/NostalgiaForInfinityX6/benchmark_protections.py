@@ -0,0 +1,77 @@
+# Benchmark of the NFI X6 global protections on multi-year 5m candles.
+#
+# Compares the original chained (a | b) & (c | d) pandas expressions (protections_reference) with
+# evaluate_protections on the PROTECTIONS_LONG_GLOBAL, PROTECTIONS_SHORT_GLOBAL_PUMP and
+# PROTECTIONS_SHORT_GLOBAL_DUMP tables: same column, time and peak memory (tracemalloc, allocations made
+# during the call; the result column itself is 1 byte per row).
+# The indicators are random, the gain depends on how fast the rows fail a clause (printed as rows still true).
+#
+# Usage: python benchmark_protections.py [years]
+
+import importlib.util
+import pathlib
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+import protections_reference
+
+STRATEGY_FILE = pathlib.Path(__file__).resolve().parent / "NostalgiaForInfinityX6.py"
+
+# Original expression -> table
+REFERENCE_TABLES = {
+  "protections_long_global": "PROTECTIONS_LONG_GLOBAL",
+  "global_protections_short_pump": "PROTECTIONS_SHORT_GLOBAL_PUMP",
+  "global_protections_short_dump": "PROTECTIONS_SHORT_GLOBAL_DUMP",
+}
+
+
+def load_strategy_module():
+  spec = importlib.util.spec_from_file_location("NostalgiaForInfinityX6", STRATEGY_FILE)
+  module = importlib.util.module_from_spec(spec)
+  spec.loader.exec_module(module)
+  return module
+
+
+def make_indicators(module, years: float, seed: int = 1) -> pd.DataFrame:
+  rng = np.random.default_rng(seed)
+  num = int(years * 365 * 288)
+  columns = set().union(*(module.protection_columns(clauses) for clauses in module.PROTECTIONS_TABLES.values()))
+  return pd.DataFrame({column: rng.normal(50.0, 40.0, num) for column in sorted(columns)})
+
+
+def measured(func, *args):
+  """Result, duration and peak memory allocated during the call"""
+  tracemalloc.start()
+  start = time.perf_counter()
+  result = func(*args)
+  duration = time.perf_counter() - start
+  peak = tracemalloc.get_traced_memory()[1]
+  tracemalloc.stop()
+  return result, duration, peak
+
+
+def main():
+  years = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+  module = load_strategy_module()
+  df = make_indicators(module, years)
+  print(f"{len(df)} candles ({years} years of 5m)")
+
+  for function_name, table_name in REFERENCE_TABLES.items():
+    clauses = getattr(module, table_name)
+    num_conditions = sum(len(clause) for clause in clauses)
+    expected, reference_duration, reference_peak = measured(getattr(protections_reference, function_name), df)
+    result, duration, peak = measured(module.evaluate_protections, df, clauses)
+    assert np.array_equal(result, expected.to_numpy()), f"{table_name} differs"
+
+    print(f"\n{table_name}: {len(clauses)} clauses, {num_conditions} conditions, rows still true: {result.mean():.1%}")
+    print(f"  pandas expression:    {reference_duration:8.3f}s, peak {reference_peak / 1048576:8.1f} MB")
+    print(f"  evaluate_protections: {duration:8.3f}s, peak {peak / 1048576:8.1f} MB")
+    print(f"  x{reference_duration / duration:.1f} faster, x{reference_peak / peak:.1f} less peak memory")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,1155 @@
+"""
+Golden reference for the protections test: the protections_long_global, global_protections_short_pump and
+global_protections_short_dump expressions as they were written in NostalgiaForInfinityX6.populate_indicators,
+before the conditions moved to the PROTECTIONS_LONG_GLOBAL, PROTECTIONS_SHORT_GLOBAL_PUMP and
+PROTECTIONS_SHORT_GLOBAL_DUMP tables.
+
+Kept verbatim (only re-indented), do not regenerate it from the tables.
+"""
+
+
+def protections_long_global(df):
+  return (
+    # 5m & 4h & 1d down move, 15m & 1h & 4h still not low enough, 1d still high
+    (
+      (df["RSI_3"] > 1.0)
+      | (df["RSI_3_4h"] > 10.0)
+      | (df["RSI_3_1d"] > 35.0)
+      | (df["RSI_14_15m"] < 30.0)
+      | (df["RSI_14_1h"] < 30.0)
+      | (df["RSI_14_4h"] < 30.0)
+      | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+      | (df["STOCHRSIk_14_14_3_3_1d"] < 50.0)
+    )
+    # 1h & 4h down move, 15m & 1h & 4h downtrend, 1h still high
+    & (
+      (df["RSI_3"] > 5.0)
+      | (df["RSI_3_15m"] > 10.0)
+      | (df["RSI_3_1h"] > 40.0)
+      | (df["RSI_3_4h"] > 55.0)
+      | (df["CMF_20_15m"] > -0.25)
+      | (df["AROONU_14_4h"] < 60.0)
+      | (df["ROC_9_1d"] < 80.0)
+    )
+    # 5m & 15m & 1h & 4h down move, 4h high
+    & (
+      (df["RSI_3"] > 5.0)
+      | (df["RSI_3_15m"] > 15.0)
+      | (df["RSI_3_1h"] > 45.0)
+      | (df["RSI_3_4h"] > 55.0)
+      | (df["RSI_14_4h"] < 50.0)
+      | (df["AROONU_14_4h"] < 80.0)
+      | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+    )
+    # 15m & 1h & 4h down move, 15m & 1h downtrend, 4h still high
+    & (
+      (df["RSI_3_15m"] > 5.0)
+      | (df["RSI_3_1h"] > 5.0)
+      | (df["RSI_14_1h"] < 20.0)
+      | (df["CMF_20_15m"] > -0.25)
+      | (df["CMF_20_15m"] > -0.40)
+      | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+    )
+    # 15m & 1h down move, 1h & 4h high
+    & (
+      (df["RSI_3_15m"] > 5.0)
+      | (df["RSI_3_1h"] > 20.0)
+      | (df["RSI_14_1h"] < 50.0)
+      | (df["RSI_14_4h"] < 70.0)
+      | (df["AROONU_14_1h"] < 80.0)
+      | (df["AROONU_14_4h"] < 100.0)
+    )
+    # 15m & 1h & 4h & 1d down move, 15m downtrend
+    & (
+      (df["RSI_3_15m"] > 5.0)
+      | (df["RSI_3_1h"] > 20.0)
+      | (df["RSI_3_4h"] > 25.0)
+      | (df["RSI_3_1d"] > 5.0)
+      | (df["CMF_20_15m"] > -0.40)
+    )
+    # 15m & 1h & 4h down move, 1h & 4h still high, 15m downtrend
+    & (
+      (df["RSI_3_15m"] > 5.0)
+      | (df["RSI_3_1h"] > 30.0)
+      | (df["RSI_3_4h"] > 50.0)
+      | (df["RSI_14_1h"] < 40.0)
+      | (df["RSI_14_4h"] < 50.0)
+      | (df["CMF_20_15m"] > -0.30)
+      | (df["AROONU_14_4h"] < 50.0)
+      | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+    )
+    # 15m & 1h & 3h down move, 1h & 4h still not low enough, 15m downtrend, 1h still high
+    & (
+      (df["RSI_3_15m"] > 5.0)
+      | (df["RSI_3_1h"] > 35.0)
+      | (df["RSI_3_4h"] > 35.0)
+      | (df["RSI_14_1h"] < 30.0)
+      | (df["RSI_14_4h"] < 30.0)
+      | (df["CMF_20_15m"] > -0.30)
+      | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+    )
+    # 15m & 1h & 4h down move, 1h downtrend, 4h high
+    & (
+      (df["RSI_3_15m"] > 10.0)
+      | (df["RSI_3_1h"] > 15.0)
+      | (df["RSI_3_4h"] > 55.0)
+      | (df["RSI_14_4h"] < 50.0)
+      | (df["CMF_20_1h"] > -0.4)
+      | (df["AROONU_14_4h"] < 80.0)
+      | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+    )
+    # 15m & 1h & 4h down move, 15m still not low enough, 1h & 4h high
+    & (
+      (df["RSI_3_15m"] > 10.0)
+      | (df["RSI_3_1h"] > 20.0)
+      | (df["RSI_3_4h"] > 25.0)
+      | (df["AROONU_14_15m"] < 30.0)
+      | (df["AROONU_14_1h"] < 60.0)
+      | (df["AROONU_14_4h"] < 100.0)
+    )
+    # 15m & 1h & 4h down move, 15m still not low enough, 1h & 4h still high, 4h overbought
+    & (
+      (df["RSI_3_15m"] > 10.0)
+      | (df["RSI_3_1h"] > 20.0)
+      | (df["RSI_3_4h"] > 35.0)
+      | (df["RSI_14_15m"] < 30.0)
+      | (df["RSI_14_1h"] < 40.0)
+      | (df["RSI_14_4h"] < 40.0)
+      | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+      | (df["ROC_9_4h"] < 10.0)
+    )
+    # 15m & 1h & 4h down move, 1h & 4h not low enouhg, 15m downtrend, 4h high, 1d overbought
+    & (
+      (df["RSI_3_15m"] > 10.0)
+      | (df["RSI_3_1h"] > 25.0)
+      | (df["RSI_3_4h"] > 25.0)
+      | (df["RSI_14_1h"] < 30.0)
+      | (df["RSI_14_4h"] < 30.0)
+      | (df["CMF_20_15m"] > -0.30)
+      | (df["AROONU_14_4h"] < 60.0)
+      | (df["ROC_9_1d"] < 25.0)
+    )
+    # 15m & 1h down move, 4h high, 1d downtrend, 1h still not low enough, 1d overbought
+    & (
+      (df["RSI_3_15m"] > 10.0)
+      | (df["RSI_3_1h"] > 30.0)
+      | (df["RSI_14_4h"] < 70.0)
+      | (df["CMF_20_1d"] > -0.3)
+      | (df["AROONU_14_1h"] < 30.0)
+      | (df["ROC_9_1d"] < 100.0)
+    )
+    # 15m & 1h & 4h & 1d down move, 15m & 1h not low enough, 4h high
+    & (
+      (df["RSI_3_15m"] > 10.0)
+      | (df["RSI_3_1h"] > 35.0)
+      | (df["RSI_3_4h"] > 35.0)
+      | (df["RSI_3_1d"] > 15.0)
+      | (df["RSI_14_15m"] < 30.0)
+      | (df["RSI_14_1h"] < 35.0)
+      | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0)
+      | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+    )
+    # 15m & 1h down move, 4h still high, 15m downtrend, 1h & 1d high
+    & (
+      (df["RSI_3_15m"] > 10.0)
+      | (df["RSI_3_1h"] > 40.0)
+      | (df["RSI_14_4h"] < 50.0)
+      | (df["CMF_20_15m"] > -0.3)
+      | (df["AROONU_14_1h"] < 60.0)
+      | (df["AROONU_14_1d"] < 90.0)
+      | (df["STOCHRSIk_14_14_3_3_1d"] < 80.0)
+    )
+    # 15m & 1h down move, 15m & 1h still high, 1h & 4h high, 1d overbought
+    & (
+      (df["RSI_3_15m"] > 10.0)
+      | (df["RSI_3_1h"] > 40.0)
+      | (df["RSI_14_15m"] < 40.0)
+      | (df["RSI_14_1h"] < 50.0)
+      | (df["RSI_14_4h"] < 70.0)
+      | (df["AROONU_14_1h"] < 80.0)
+      | (df["AROONU_14_4h"] < 100.0)
+      | (df["ROC_9_1d"] < 50.0)
+    )
+    # 15m & 1h & 4h down move, 15m & 1h & 4h still high, 1h & 4h high, 4h overbought
+    & (
+      (df["RSI_3_15m"] > 10.0)
+      | (df["RSI_3_1h"] > 45.0)
+      | (df["RSI_3_4h"] > 60.0)
+      | (df["RSI_14_15m"] < 40.0)
+      | (df["RSI_14_1h"] < 50.0)
+      | (df["RSI_14_4h"] < 50.0)
+      | (df["AROONU_14_1h"] < 70.0)
+      | (df["AROONU_14_4h"] < 100.0)
+      | (df["ROC_9_4h"] < 25.0)
+    )
+    # 15m & 1h down move, 15m still not low enough, 1h & 4h high, 4h overbought
+    & (
+      (df["RSI_3_15m"] > 10.0)
+      | (df["RSI_3_1h"] > 50.0)
+      | (df["RSI_14_4h"] < 70.0)
+      | (df["AROONU_14_15m"] < 20.0)
+      | (df["AROONU_14_1h"] < 80.0)
+      | (df["AROONU_14_4h"] < 100.0)
+      | (df["ROC_9_4h"] < 30.0)
+    )
+    # 15m & 1h & 4h down move, 1h & 4h downtrend, 15m still high, 1h high
+    & (
+      (df["RSI_3_15m"] > 10.0)
+      | (df["RSI_3_1h"] > 55.0)
+      | (df["RSI_3_4h"] > 55.0)
+      | (df["CMF_20_1h"] > -0.0)
+      | (df["CMF_20_4h"] > -0.4)
+      | (df["AROONU_14_15m"] < 50.0)
+      | (df["STOCHRSIk_14_14_3_3_1h"] < 90.0)
+    )
+    # 15m & 1h down move, 15m & 4h high, 4h overbought
+    & (
+      (df["RSI_3_15m"] > 10.0)
+      | (df["RSI_3_1h"] > 65.0)
+      | (df["AROONU_14_15m"] < 80.0)
+      | (df["AROONU_14_4h"] < 85.0)
+      | (df["ROC_9_4h"] < 100.0)
+    )
+    # 15m & 1h & 4h down move, 1h still not low enough, 4h high, 1h downtrend
+    & (
+      (df["RSI_3_15m"] > 15.0)
+      | (df["RSI_3_1h"] > 15.0)
+      | (df["RSI_3_4h"] > 45.0)
+      | (df["RSI_14_1h"] < 30.0)
+      | (df["RSI_14_4h"] < 45.0)
+      | (df["AROONU_14_1h"] < 40.0)
+      | (df["AROONU_14_4h"] < 90.0)
+      | (df["ROC_9_1h"] > -30.0)
+    )
+    # 15m & 1h & 4h down move, 4h high, 1d overbought
+    & (
+      (df["RSI_3_15m"] > 15.0)
+      | (df["RSI_3_1h"] > 15.0)
+      | (df["RSI_3_4h"] > 45.0)
+      | (df["AROONU_14_4h"] < 80.0)
+      | (df["ROC_9_1d"] < 150.0)
+    )
+    # 15m & 1h & 4h down move, 1h still high, 4h high, 4h & 1d overbought
+    & (
+      (df["RSI_3_15m"] > 15.0)
+      | (df["RSI_3_1h"] > 30.0)
+      | (df["RSI_3_4h"] > 45.0)
+      | (df["RSI_14_1h"] < 35.0)
+      | (df["RSI_14_4h"] < 50.0)
+      | (df["AROONU_14_4h"] < 70.0)
+      | (df["ROC_9_4h"] < 25.0)
+      | (df["ROC_9_1d"] < 100.0)
+    )
+    # 15m & 1h down move, 15m still not low enough, 1h still high, 4h high
+    & (
+      (df["RSI_3_15m"] > 15.0)
+      | (df["RSI_3_1h"] > 30.0)
+      | (df["RSI_14_15m"] < 30.0)
+      | (df["RSI_14_1h"] < 50.0)
+      | (df["RSI_14_4h"] < 70.0)
+      | (df["AROONU_14_1h"] < 60.0)
+      | (df["AROONU_14_4h"] < 100.0)
+    )
+    # 15m & 1h down move, 15m still high, 1h & dh high, 1d overbought
+    & (
+      (df["RSI_3_15m"] > 15.0)
+      | (df["RSI_3_1h"] > 30.0)
+      | (df["RSI_14_15m"] < 40.0)
+      | (df["AROONU_14_1h"] < 70.0)
+      | (df["AROONU_14_4h"] < 100.0)
+      | (df["ROC_9_1d"] < 50.0)
+    )
+    # 15m & 1h & 4h & 1d down move, 1h still high, 4h still not low enough, 4h downtrend
+    & (
+      (df["RSI_3_15m"] > 15.0)
+      | (df["RSI_3_1h"] > 40.0)
+      | (df["RSI_3_4h"] > 20.0)
+      | (df["RSI_3_1d"] > 30.0)
+      | (df["RSI_14_1h"] < 30.0)
+      | (df["RSI_14_4h"] < 30.0)
+      | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+      | (df["CCI_20_1h"] < -250.0)
+      | (df["CCI_20_4h"] < -250.0)
+      | (df["ROC_9_4h"] > -15.0)
+    )
+    # 15m & 1h & 1d down move, 15m still not low enough, 1h & 4h still high, 1d overbought
+    & (
+      (df["RSI_3_15m"] > 15.0)
+      | (df["RSI_3_1h"] > 60.0)
+      | (df["RSI_3_1d"] > 60.0)
+      | (df["RSI_14_15m"] < 30.0)
+      | (df["RSI_14_1h"] < 50.0)
+      | (df["RSI_14_4h"] < 50.0)
+      | (df["AROONU_14_1h"] < 70.0)
+      | (df["ROC_9_1d"] < 80.0)
+    )
+    # 15m & 4h & 1d down move, 15m & 1h & 4h still not low enough, 15m & 1d downtrend
+    & (
+      (df["RSI_3_15m"] > 15.0)
+      | (df["RSI_3_4h"] > 15.0)
+      | (df["RSI_3_1d"] > 25.0)
+      | (df["RSI_14_15m"] > 25.0)
+      | (df["RSI_14_1h"] < 30.0)
+      | (df["RSI_14_4h"] < 30.0)
+      | (df["CMF_20_15m"] > -0.3)
+      | (df["CMF_20_1d"] > -0.3)
+      | (df["AROONU_14_15m"] < 30.0)
+    )
+    # 15m & 1d down move, 15m still not low enough, 1h & 4h high
+    & (
+      (df["RSI_3_15m"] > 15.0)
+      | (df["RSI_3_1d"] > 5.0)
+      | (df["RSI_14_15m"] < 30.0)
+      | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+      | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+    )
+    # 15m down move, 15m still not low enough, 1h & 4h high, 1d overbought
+    & (
+      (df["RSI_3_15m"] > 15.0)
+      | (df["AROONU_14_15m"] < 30.0)
+      | (df["AROONU_14_1h"] < 85.0)
+      | (df["AROONU_14_4h"] < 100.0)
+      | (df["ROC_9_1d"] < 250.0)
+    )
+    # 15m & 1h down move, 15m still not low enough, 1h & 4h still high, 1d overbought
+    & (
+      (df["RSI_3_15m"] > 20.0)
+      | (df["RSI_3_1h"] > 25.0)
+      | (df["RSI_14_15m"] < 30.0)
+      | (df["RSI_14_1h"] < 40.0)
+      | (df["RSI_14_4h"] < 50.0)
+      | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+      | (df["ROC_9_1d"] < 150.0)
+    )
+    # 15m & 1h & 1d down move, 1h & 4h still high, 15m downtrend, 1d overbought
+    & (
+      (df["RSI_3_15m"] > 20.0)
+      | (df["RSI_3_1h"] > 25.0)
+      | (df["RSI_3_1d"] > 55.0)
+      | (df["RSI_14_1h"] < 40.0)
+      | (df["RSI_14_4h"] < 50.0)
+      | (df["CMF_20_15m"] > -0.3)
+      | (df["ROC_9_1d"] < 80.0)
+    )
+    # 15m & 1h & 4h & 1d down move, 1d still high, 1h still high, 4h high
+    & (
+      (df["RSI_3_15m"] > 20.0)
+      | (df["RSI_3_1h"] > 35.0)
+      | (df["RSI_3_4h"] > 45.0)
+      | (df["RSI_3_1d"] > 25.0)
+      | (df["MFI_14_1d"] < 50.0)
+      | (df["AROONU_14_1h"] < 50.0)
+      | (df["AROONU_14_4h"] < 85.0)
+    )
+    # 15m & 1h & 4h down move, 15m still not low enough, 1h still high, 4h high & overbought
+    & (
+      (df["RSI_3_15m"] > 20.0)
+      | (df["RSI_3_1h"] > 40.0)
+      | (df["RSI_3_4h"] > 60.0)
+      | (df["RSI_14_15m"] < 30.0)
+      | (df["AROONU_14_15m"] < 30.0)
+      | (df["AROONU_14_1h"] < 50.0)
+      | (df["AROONU_14_4h"] < 85.0)
+      | (df["ROC_9_4h"] < 30.0)
+    )
+    # 15m & 1h & 4h down move, 1h & 4h high, 4h & 1d overbought
+    & (
+      (df["RSI_3_15m"] > 20.0)
+      | (df["RSI_3_1h"] > 45.0)
+      | (df["RSI_3_4h"] > 60.0)
+      | (df["RSI_14_1h"] < 40.0)
+      | (df["RSI_14_4h"] < 60.0)
+      | (df["AROONU_14_4h"] < 75.0)
+      | (df["ROC_9_4h"] < 25.0)
+      | (df["ROC_9_1d"] < 150.0)
+    )
+    # 15m & 1h down move, 15m still high, 1h high & overbought
+    & (
+      (df["RSI_3_15m"] > 20.0)
+      | (df["RSI_3_1h"] > 60.0)
+      | (df["RSI_14_15m"] < 40.0)
+      | (df["RSI_14_1h"] < 50.0)
+      | (df["AROONU_14_1h"] < 70.0)
+      | (df["ROC_9_1h"] < 80.0)
+    )
+    # 15m & 1h down move, 15m still not low enough, 1h still high, 4h high & overbought
+    & (
+      (df["RSI_3_15m"] > 25.0)
+      | (df["RSI_3_1h"] > 30.0)
+      | (df["RSI_14_15m"] < 30.0)
+      | (df["RSI_14_1h"] < 40.0)
+      | (df["RSI_14_4h"] < 70.0)
+      | (df["AROONU_14_1h"] < 70.0)
+      | (df["AROONU_14_4h"] < 100.0)
+      | (df["ROC_9_4h"] < 50.0)
+    )
+    # 15m & 1h & 1d down move, 4h & 1d downtrend, 1h & 4h high, 1d downtrend
+    & (
+      (df["RSI_3_15m"] > 25.0)
+      | (df["RSI_3_1h"] > 35.0)
+      | (df["RSI_3_1d"] > 35.0)
+      | (df["CMF_20_4h"] > -0.1)
+      | (df["CMF_20_1d"] > -0.1)
+      | (df["AROONU_14_1h"] < 75.0)
+      | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+      | (df["ROC_2_1d"] > -20.0)
+    )
+    # 15m & 1h down move, 1h & 4h high, 4h overbought
+    & (
+      (df["RSI_3_15m"] > 25.0)
+      | (df["RSI_3_1h"] > 60.0)
+      | (df["RSI_14_1h"] < 50.0)
+      | (df["RSI_14_4h"] < 70.0)
+      | (df["AROONU_14_1h"] < 80.0)
+      | (df["AROONU_14_4h"] < 90.0)
+      | (df["ROC_9_4h"] < 120.0)
+    )
+    # 15m down move, 15m still high, 1h & 4h high, 1d downtrend, 4h overbought
+    & (
+      (df["RSI_3_15m"] > 25.0)
+      | (df["RSI_14_15m"] < 40.0)
+      | (df["RSI_14_1h"] < 70.0)
+      | (df["RSI_14_4h"] < 75.0)
+      | (df["CMF_20_1d"] > -0.0)
+      | (df["AROONU_14_4h"] < 90.0)
+      | (df["ROC_9_4h"] < 50.0)
+    )
+    # 15m & 1h down move, 15m still high, 1h & 4h high & overbought
+    & (
+      (df["RSI_3_15m"] > 30.0)
+      | (df["RSI_3_1h"] > 60.0)
+      | (df["RSI_14_15m"] < 40.0)
+      | (df["RSI_14_1h"] < 50.0)
+      | (df["RSI_14_4h"] < 80.0)
+      | (df["AROONU_14_1h"] < 60.0)
+      | (df["AROONU_14_4h"] < 90.0)
+      | (df["ROC_9_1h"] < 50.0)
+      | (df["ROC_9_4h"] < 100.0)
+    )
+    # 15m & 1h down move, 15m still high, 1h & 4h high, 4h overbought
+    & (
+      (df["RSI_3_15m"] > 30.0)
+      | (df["RSI_3_1h"] > 65.0)
+      | (df["RSI_14_15m"] < 40.0)
+      | (df["RSI_14_1h"] < 60.0)
+      | (df["RSI_14_4h"] < 80.0)
+      | (df["AROONU_14_4h"] < 90.0)
+      | (df["ROC_9_4h"] < 130.0)
+    )
+    # 15m & 1h down move, 15m & 1h & 4h high, 1h overbought
+    & (
+      (df["RSI_3_15m"] > 35.0)
+      | (df["RSI_3_1h"] > 65.0)
+      | (df["RSI_14_15m"] < 50.0)
+      | (df["AROONU_14_1h"] < 80.0)
+      | (df["AROONU_14_4h"] < 90.0)
+      | (df["ROC_9_1h"] < 30.0)
+    )
+    # 1h & 4h down move, 1h & 4h downtrend
+    & ((df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 10.0) | (df["CMF_20_1h"] > -0.5) | (df["CMF_20_4h"] > -0.5))
+    # 1h & 4h down move, 1h still high, 4h high, 1d overbought
+    & (
+      (df["RSI_3_1h"] > 5.0)
+      | (df["RSI_3_4h"] > 30.0)
+      | (df["AROONU_14_1h"] < 50.0)
+      | (df["AROONU_14_4h"] < 85.0)
+      | (df["ROC_9_1d"] < 50.0)
+    )
+    # 5m & 15m & 1h & 4h down move, 15m downtrend, 4h high, 1d overbought
+    & (
+      (df["RSI_3_1h"] > 25.0)
+      | (df["RSI_3_4h"] > 25.0)
+      | (df["CMF_20_15m"] > -0.5)
+      | (df["CMF_20_1h"] > -0.3)
+      | (df["CMF_20_4h"] > -0.3)
+      | (df["AROONU_14_1h"] < 50.0)
+    )
+    # 1h & 1d down move, 1h & 4h & 1d still high, 1h & 4h high, 4h overbought
+    & (
+      (df["RSI_3_1h"] > 60.0)
+      | (df["RSI_3_1d"] > 25.0)
+      | (df["RSI_14_1h"] < 50.0)
+      | (df["RSI_14_4h"] < 60.0)
+      | (df["MFI_14_1d"] < 50.0)
+      | (df["AROONU_14_1h"] < 70.0)
+      | (df["AROONU_14_4h"] < 90.0)
+      | (df["ROC_9_4h"] < 25.0)
+    )
+    # 4h down move, 1h & 4h downtrend, 15m high
+    & (
+      (df["RSI_3_4h"] > 3.0)
+      | (df["CMF_20_1h"] > -0.25)
+      | (df["CMF_20_4h"] > -0.30)
+      | (df["STOCHRSIk_14_14_3_3_15m"] < 70.0)
+    )
+    # 1d down move, 15m high, 1h & 4h downtrend
+    & (
+      (df["RSI_3_1d"] > 5.0)
+      | (df["STOCHRSIk_14_14_3_3_15m"] < 70.0)
+      | (df["ROC_9_1h"] > -60.0)
+      | (df["ROC_9_4h"] > -60.0)
+    )
+    # 4h green with top wick, 15m & 1h down move, 15m still not low enough, 1h & 4h high
+    & (
+      (df["change_pct_4h"] < 10.0)
+      | (df["top_wick_pct_4h"] < 10.0)
+      | (df["RSI_3_15m"] > 5.0)
+      | (df["RSI_3_1h"] > 40.0)
+      | (df["RSI_14_15m"] < 30.0)
+      | (df["RSI_14_1h"] < 50.0)
+      | (df["RSI_14_4h"] < 50.0)
+      | (df["AROONU_14_1h"] < 60.0)
+      | (df["AROONU_14_4h"] < 90.0)
+    )
+    # 4h green with top wick, 1h down move, 1h still high, 4h high, 1d overbought
+    & (
+      (df["change_pct_4h"] < 10.0)
+      | (df["top_wick_pct_4h"] < 10.0)
+      | (df["RSI_3_1h"] > 45.0)
+      | (df["RSI_14_1h"] < 40.0)
+      | (df["RSI_14_4h"] < 60.0)
+      | (df["AROONU_14_1h"] < 70.0)
+      | (df["AROONU_14_4h"] < 90.0)
+      | (df["ROC_9_1d"] < 20.0)
+    )
+    # 4h green with top wick, 15m & 1h down move, 1h still high, 4h high
+    & (
+      (df["change_pct_4h"] < 15.0)
+      | (df["top_wick_pct_4h"] < 15.0)
+      | (df["RSI_3_15m"] > 10.0)
+      | (df["RSI_3_1h"] > 35.0)
+      | (df["AROONU_14_1h"] < 50.0)
+      | (df["AROONU_14_4h"] < 100.0)
+    )
+    # 4h green with top wick, 15m & 1h down move, 1h & 4h high
+    & (
+      (df["change_pct_4h"] < 15.0)
+      | (df["top_wick_pct_4h"] < 10.0)
+      | (df["RSI_3_15m"] > 20.0)
+      | (df["RSI_3_1h"] > 40.0)
+      | (df["AROONU_14_1h"] < 80.0)
+      | (df["AROONU_14_4h"] < 100.0)
+    )
+    # 1d red, 1h & 4h down move, 1h still high, 4d downtrend
+    & (
+      (df["change_pct_1d"] > -40.0)
+      | (df["RSI_3_1h"] > 55.0)
+      | (df["RSI_3_4h"] > 10.0)
+      | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+      | (df["ROC_9_4h"] > -35.0)
+    )
+    # 1d P&D, 15m & 1h & 4h & 1d down move, 4h still not low enough
+    & (
+      (df["change_pct_1d"] > -10.0)
+      | (df["change_pct_1d"].shift(288) < 10.0)
+      | (df["RSI_3_15m"] > 10.0)
+      | (df["RSI_3_1h"] > 25.0)
+      | (df["RSI_3_4h"] > 10.0)
+      | (df["RSI_3_1d"] > 40.0)
+      | (df["RSI_14_4h"] < 30.0)
+    )
+    # 1d red with top wick, 15m & 1h down move, 1h downtrend, 1h high
+    & (
+      (df["change_pct_1d"] > -10.0)
+      | (df["top_wick_pct_1d"] < 10.0)
+      | (df["RSI_3_15m"] > 10.0)
+      | (df["RSI_3_1h"] > 25.0)
+      | (df["CMF_20_1h"] > -0.2)
+      | (df["AROONU_14_1h"] < 70.0)
+      | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+    )
+    # 1d P&D, 15m & 1h down move, 15m still not low enough, 1h & 4h still high, 1d overbought
+    & (
+      (df["change_pct_1d"] > -5.0)
+      | (df["change_pct_1d"].shift(288) < 10.0)
+      | (df["RSI_3_15m"] > 20.0)
+      | (df["RSI_3_1h"] > 45.0)
+      | (df["RSI_14_15m"] < 30.0)
+      | (df["RSI_14_1h"] < 40.0)
+      | (df["RSI_14_4h"] < 50.0)
+      | (df["ROC_9_1d"] < 100.0)
+    )
+    # 1d P&D, 15m & 1h & 4h down move, 1h & 4h still not low enough, 1h & 4h downtrend, 1d overbought
+    & (
+      (df["change_pct_1d"] > -5.0)
+      | (df["change_pct_1d"].shift(288) < 10.0)
+      | (df["RSI_3_15m"] > 25.0)
+      | (df["RSI_3_1h"] > 30.0)
+      | (df["RSI_3_4h"] > 30.0)
+      | (df["AROONU_14_1h"] < 30.0)
+      | (df["AROONU_14_4h"] < 30.0)
+      | (df["ROC_9_1h"] > -25.0)
+      | (df["ROC_9_4h"] > -25.0)
+      | (df["ROC_9_1d"] < 50.0)
+    )
+    # 1d green with top wick, 15m down move, 1h & 4h high, 1d overbought
+    & (
+      (df["change_pct_1d"] < 10.0)
+      | (df["top_wick_pct_1d"] < 10.0)
+      | (df["RSI_3_15m"] > 10.0)
+      | (df["RSI_14_1h"] < 70.0)
+      | (df["RSI_14_4h"] < 80.0)
+      | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+      | (df["ROC_9_1d"] < 40.0)
+    )
+    # 1d green with top wick, 1h & 4h down move, 1h & 4h still high
+    & (
+      (df["change_pct_1d"] < 10.0)
+      | (df["top_wick_pct_1d"] < 10.0)
+      | (df["RSI_3_1h"] > 55.0)
+      | (df["RSI_3_4h"] > 55.0)
+      | (df["AROONU_14_1h"] < 50.0)
+      | (df["AROONU_14_4h"] < 50.0)
+    )
+    # 1d green with top wick, 15m & 1h & 4h down move, 15m still not low enough, 4h high, 1d overbought
+    & (
+      (df["change_pct_1d"] < 30.0)
+      | (df["top_wick_pct_1d"] < 10.0)
+      | (df["RSI_3_15m"] > 30.0)
+      | (df["RSI_3_1h"] > 30.0)
+      | (df["RSI_3_4h"] > 70.0)
+      | (df["RSI_14_4h"] < 60.0)
+      | (df["AROONU_14_15m"] < 25.0)
+      | (df["AROONU_14_4h"] < 70.0)
+      | (df["ROC_9_1d"] < 40.0)
+    )
+    # 1d green with top wick, 15m & 1h & 4h down move, 1h still not low enough, 4h still high, 1d overbought
+    & (
+      (df["change_pct_1d"] < 30.0)
+      | (df["top_wick_pct_1d"] < 20.0)
+      | (df["RSI_3_15m"] > 10.0)
+      | (df["RSI_3_1h"] > 40.0)
+      | (df["RSI_3_4h"] > 40.0)
+      | (df["AROONU_14_1h"] < 20.0)
+      | (df["AROONU_14_4h"] < 50.0)
+      | (df["ROC_9_1d"] < 100.0)
+    )
+    # 1d green with top wick, 1h down move, 1h still high, 4h high & overbought, 1d overbought
+    & (
+      (df["change_pct_1d"] < 30.0)
+      | (df["top_wick_pct_1d"] < 20.0)
+      | (df["RSI_3_1h"] > 50.0)
+      | (df["RSI_14_1h"] < 40.0)
+      | (df["RSI_14_4h"] < 60.0)
+      | (df["AROONU_14_4h"] < 70.0)
+      | (df["ROC_9_4h"] < 40.0)
+      | (df["ROC_9_1d"] < 50.0)
+    )
+    # 1d top wick, 1h & 4h down move, 15m downtrend, 4h still high, 1d overbought
+    & (
+      (df["top_wick_pct_1d"] < 20.0)
+      | (df["RSI_3_1h"] > 10.0)
+      | (df["RSI_3_4h"] > 45.0)
+      | (df["CMF_20_15m"] > -0.2)
+      | (df["AROONU_14_4h"] < 50.0)
+      | (df["ROC_9_1d"] < 80.0)
+    )
+    # 1d top wick, 4h down move, 4h still high, 1d overbought
+    & (
+      (df["top_wick_pct_1d"] < 25.0)
+      | (df["RSI_3_4h"] > 25.0)
+      | (df["RSI_14_4h"] < 45.0)
+      | (df["AROONU_14_4h"] < 40.0)
+      | (df["ROC_9_1d"] < 200.0)
+    )
+    # 1d top wick, 15m & 1h & 4h down move, 15m & 1h downtrend, 4h still high
+    & (
+      (df["top_wick_pct_1d"] < 25.0)
+      | (df["RSI_3_15m"] > 10.0)
+      | (df["RSI_3_1h"] > 30.0)
+      | (df["RSI_3_4h"] > 50.0)
+      | (df["CMF_20_15m"] > -0.25)
+      | (df["CMF_20_1h"] > -0.25)
+      | (df["AROONU_14_4h"] < 50.0)
+    )
+    # pump, drop but not yet near the previous lows, 15m & 1h & 4h & 1d down move, 1d overbought
+    & (
+      (((df["high_max_6_1d"] - df["low_min_6_1d"]) / df["low_min_6_1d"]) < 1.5)
+      | (df["close"] > (df["high_max_6_4h"] * 0.70))
+      | (df["close"] < (df["low_min_6_1d"] * 1.25))
+      | (df["RSI_3_15m"] > 15.0)
+      | (df["RSI_3_1h"] > 25.0)
+      | (df["RSI_3_4h"] > 25.0)
+      | (df["RSI_3_1d"] > 45.0)
+      | (df["ROC_9_1d"] < 20.0)
+    )
+    # drop in last 12 hours, 1h & 4h down move, 1h & 4h downtrend
+    & (
+      (df["close"] > (df["high_max_12_1h"] * 0.35))
+      | (df["RSI_3_1h"] > 15.0)
+      | (df["RSI_3_4h"] > 5.0)
+      | (df["ROC_9_1h"] > -50.0)
+      | (df["ROC_9_4h"] > -50.0)
+    )
+    # drop in last 4 days, 15m & 1h & 4h down move, 15m still not low enough, 1h still high, 4h overbought
+    & (
+      (df["close"] > (df["high_max_24_4h"] * 0.40))
+      | (df["RSI_3_15m"] > 10.0)
+      | (df["RSI_3_1h"] > 25.0)
+      | (df["RSI_3_4h"] > 50.0)
+      | (df["RSI_14_15m"] < 30.0)
+      | (df["RSI_14_1h"] < 40.0)
+      | (df["ROC_9_4h"] < 20.0)
+    )
+    # drop in last 4 days, 15m & 1h & 4h & 1d down move, 4h high
+    & (
+      (df["close"] > (df["high_max_24_4h"] * 0.40))
+      | (df["RSI_3_15m"] > 10.0)
+      | (df["RSI_3_1h"] > 40.0)
+      | (df["RSI_3_4h"] > 60.0)
+      | (df["RSI_3_1d"] > 10.0)
+      | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0)
+    )
+    # drop in last 6 days, 15m & 1h & 4h & 1d down move, 1d high, 4h downtrend
+    & (
+      (df["close"] > (df["high_max_24_4h"] * 0.35))
+      | (df["RSI_3_15m"] > 5.0)
+      | (df["RSI_3_1h"] > 25.0)
+      | (df["RSI_3_4h"] > 25.0)
+      | (df["RSI_3_1d"] > 30.0)
+      | (df["AROONU_14_1d"] < 80.0)
+      | (df["ROC_9_4h"] > -40.0)
+    )
+    # drop in last 4 days, 15m & 1d down move, 15m still not low enough, 1h still high, 1d high, 4h downtrend
+    & (
+      (df["close"] > (df["high_max_24_4h"] * 0.35))
+      | (df["RSI_3_15m"] > 15.0)
+      | (df["RSI_3_1d"] > 30.0)
+      | (df["AROONU_14_15m"] < 25.0)
+      | (df["AROONU_14_1h"] < 40.0)
+      | (df["AROONU_14_1d"] < 80.0)
+      | (df["ROC_9_4h"] > -50.0)
+    )
+    # drop in last 4 days, 1h & 5h & 1d down move, 1h still high, 1h & 4h downtrend
+    & (
+      (df["close"] > (df["high_max_24_4h"] * 0.25))
+      | (df["RSI_3_1h"] > 20.0)
+      | (df["RSI_3_4h"] > 25.0)
+      | (df["RSI_3_1d"] > 25.0)
+      | (df["AROONU_14_1h"] < 50.0)
+      | (df["ROC_9_1h"] > -20.0)
+      | (df["ROC_9_4h"] > -35.0)
+    )
+    # drop in last 4 days, 1d down move, 1h & 4h downtrend, 15m & 4h downtrend
+    & (
+      (df["close"] > (df["high_max_24_4h"] * 0.25))
+      | (df["RSI_3_1d"] > 15.0)
+      | (df["CMF_20_1h"] > -0.20)
+      | (df["CMF_20_4h"] > -0.20)
+      | (df["ROC_9_15m"] > -15.0)
+      | (df["ROC_9_4h"] > -20.0)
+    )
+    # drop in last 6 days, 15m & 1d down move, 1h still high, 4h high, 4h downtrend
+    & (
+      (df["close"] > (df["high_max_6_1d"] * 0.25))
+      | (df["RSI_3_15m"] > 15.0)
+      | (df["RSI_3_1d"] > 15.0)
+      | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+      | (df["STOCHRSIk_14_14_3_3_4h"] < 60.0)
+      | (df["ROC_9_4h"] > -25.0)
+    )
+    # drop in last 6 days, 15m & 1h down move, 15m & 1h still not low enough, 15m & 1h & 4h & 1d downtrend
+    & (
+      (df["close"] > (df["high_max_6_1d"] * 0.25))
+      | (df["RSI_3_15m"] > 25.0)
+      | (df["RSI_3_1h"] > 30.0)
+      | (df["RSI_14_15m"] < 30.0)
+      | (df["CMF_20_15m"] > -0.10)
+      | (df["CMF_20_1h"] > -0.10)
+      | (df["CMF_20_4h"] > -0.40)
+      | (df["CMF_20_1d"] > -0.50)
+      | (df["AROONU_14_1h"] < 30.0)
+    )
+    # drop in last 4 days, 1d down move, 1d downtrendm 1h still high, 1d downtrend
+    & (
+      (df["close"] > (df["high_max_24_4h"] * 0.15))
+      | (df["RSI_3_1d"] > 20.0)
+      | (df["CMF_20_1d"] > -0.30)
+      | (df["AROONU_14_1h"] < 50.0)
+      | (df["ROC_2_1d"] > -40.0)
+    )
+    # drop in last 6 days, 1d down move, 1h & 4h & 1d downtrend, 1d still high, 4h downtrend
+    & (
+      (df["close"] > (df["high_max_6_1d"] * 0.15))
+      | (df["RSI_3_1d"] > 20.0)
+      | (df["CMF_20_1h"] > -0.10)
+      | (df["CMF_20_4h"] > -0.40)
+      | (df["CMF_20_1d"] > -0.50)
+      | (df["AROONU_14_1d"] < 50.0)
+      | (df["ROC_9_4h"] > -30.0)
+    )
+    # drop in last 12 days, 15m & 1h down move, 1h still not low enough, 4h high
+    & (
+      (df["close"] > (df["high_max_12_1d"] * 0.25))
+      | (df["RSI_3_15m"] > 15.0)
+      | (df["RSI_3_1h"] > 30.0)
+      | (df["RSI_14_1h"] < 30.0)
+      | (df["RSI_14_4h"] < 30.0)
+      | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+      | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+    )
+    # drop in last 20 days, 15m & 1h & 1d down move, 15m still not low enough, 1h high
+    & (
+      (df["close"] > (df["high_max_20_1d"] * 0.05))
+      | (df["RSI_3_15m"] > 10.0)
+      | (df["RSI_3_1h"] > 25.0)
+      | (df["RSI_3_1d"] > 25.0)
+      | (df["AROONU_14_15m"] < 30.0)
+      | (df["AROONU_14_1h"] < 80.0)
+    )
+    # drop in last 30 days, 15m & 1h down move, 1h still high, 4h high & overbought
+    & (
+      (df["close"] > (df["high_max_30_1d"] * 0.10))
+      | (df["RSI_3_15m"] > 10.0)
+      | (df["RSI_3_1h"] > 55.0)
+      | (df["AROONU_14_1h"] < 40.0)
+      | (df["AROONU_14_4h"] < 85.0)
+      | (df["ROC_9_4h"] < 80.0)
+    )
+    # drop in last 30 days, 15m down move, 15m & 1h high
+    & (
+      (df["close"] > (df["high_max_30_1d"] * 0.05))
+      | (df["RSI_3_15m"] > 15.0)
+      | (df["RSI_3_4h"] > 50.0)
+      | (df["AROONU_14_15m"] < 80.0)
+      | (df["STOCHRSIk_14_14_3_3_1h"] < 85.0)
+    )
+  )
+
+
+def global_protections_short_pump(df):
+  return (
+    # 15m & 1h & 4h & 1d up move, 15m & 1h & 4h still not high enough, 1d still not high enough & uptrend
+    (
+      (df["RSI_3_15m"] < 40.0)
+      | (df["RSI_3_1h"] < 40.0)
+      | (df["RSI_3_4h"] < 85.0)
+      | (df["RSI_3_1d"] < 85.0)
+      | (df["RSI_14_15m"] > 70.0)
+      | (df["CCI_20_15m"] > 350.0)
+      | (df["RSI_14_1h"] > 75.0)
+      | (df["CCI_20_1h"] > 250.0)
+      | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0)
+      | (df["RSI_14_4h"] > 95.0)
+      | (df["AROOND_14_4h"] < 50.0)
+      | (df["CCI_20_4h"] > 250.0)
+      | (df["RSI_14_1d"] > 60.0)
+      | (df["AROOND_14_1d"] < 75.0)
+      | (df["STOCHRSIk_14_14_3_3_1d"] > 70.0)
+      | (df["ROC_9_1d"] < 40.0)
+    )
+    # 15m & 1h & 4h & 1d up move, 15m & 1h & 4h still not high enough, 1d still not high enough & uptrend
+    & (
+      (df["RSI_3_15m"] < 60.0)
+      | (df["RSI_3_1h"] < 60.0)
+      | (df["RSI_3_4h"] < 80.0)
+      | (df["RSI_3_1d"] < 90.0)
+      | (df["RSI_14_15m"] > 90.0)
+      | (df["CCI_20_15m"] > 350.0)
+      | (df["RSI_14_1h"] > 90.0)
+      | (df["CCI_20_1h"] > 300.0)
+      | (df["RSI_14_4h"] > 80.0)
+      | (df["CCI_20_4h"] > 200.0)
+      | (df["RSI_14_1d"] > 95.0)
+      | (df["ROC_9_1d"] < 80.0)
+    )
+    # 1d green, 15m & 1h & 4h & 1d up move, 4h & 1d still not high enough & uptrend
+    & (
+      (df["RSI_3_15m"] < 60.0)
+      | (df["RSI_3_1h"] < 70.0)
+      | (df["RSI_3_4h"] < 70.0)
+      | (df["RSI_3_1d"] < 80.0)
+      | (df["RSI_14_4h"] > 70.0)
+      | (df["WILLR_14_4h"] > -10.0)
+      | (df["STOCHRSIk_14_14_3_3_4h"] > 80.0)
+      | (df["ROC_9_4h"] < 40.0)
+      | (df["RSI_14_1d"] > 80.0)
+      | (df["ROC_9_1d"] < 100.0)
+    )
+    # 15m & 1h & 1d up move, 15m & 1h & 4h still not high enough, 1d still not high enough & uptrend
+    & (
+      (df["RSI_3_15m"] < 65.0)
+      | (df["RSI_3_1h"] < 70.0)
+      | (df["RSI_3_1d"] < 60.0)
+      | (df["RSI_14_15m"] > 90.0)
+      | (df["CMF_20_15m"] > 0.40)
+      | (df["WILLR_14_15m"] > -10.0)
+      | (df["CCI_20_15m"] > 450.0)
+      | (df["STOCHk_14_3_3_15m"] > 90.0)
+      | (df["RSI_14_1h"] > 90.0)
+      | (df["CMF_20_1h"] > 0.20)
+      | (df["WILLR_14_1h"] > -5.0)
+      | (df["CCI_20_1h"] > 250.0)
+      | (df["RSI_14_4h"] > 90.0)
+      | (df["CMF_20_4h"] > 0.10)
+      | (df["CCI_20_4h"] > 250.0)
+      | (df["RSI_14_1d"] > 90.0)
+      | (df["ROC_9_1d"] < 25.0)
+    )
+    # 15m & 1h & 4h & 1d up move, 15m & 1h & 4h & 1d still not high enough, 1d uptrend
+    & (
+      (df["RSI_3_15m"] < 70.0)
+      | (df["RSI_3_1h"] < 80.0)
+      | (df["RSI_3_4h"] < 80.0)
+      | (df["RSI_3_1d"] < 80.0)
+      | (df["MFI_14_15m"] > 90.0)
+      | (df["STOCHRSIk_14_14_3_3_15m"] > 90.0)
+      | (df["MFI_14_1h"] > 90.0)
+      | (df["MFI_14_4h"] > 80.0)
+      | (df["WILLR_14_4h"] > -5.0)
+      | (df["AROOND_14_4h"] < 50.0)
+      | (df["ROC_9_1d"] < 40.0)
+    )
+    # 15m & 1h up move, 15m & 1h & 4h still not high enough, 1d still not high enough & uptrend
+    & (
+      (df["RSI_3_15m"] < 70.0)
+      | (df["RSI_3_1h"] < 85.0)
+      | (df["MFI_14_15m"] > 90.0)
+      | (df["STOCHRSIk_14_14_3_3_15m"] > 80.0)
+      | (df["RSI_14_1h"] > 80.0)
+      | (df["MFI_14_1h"] > 80.0)
+      | (df["STOCHRSIk_14_14_3_3_1h"] > 70.0)
+      | (df["RSI_14_4h"] > 80.0)
+      | (df["RSI_14_1d"] > 80.0)
+      | (df["ROC_9_1d"] < 40.0)
+    )
+    # 15m & 1h & 4h & 1d up move, 15m & 1h still not high enough, 4h & 1d stil not high enough & uptrend
+    & (
+      (df["RSI_3_15m"] < 80.0)
+      | (df["RSI_3_1h"] < 80.0)
+      | (df["RSI_3_4h"] < 80.0)
+      | (df["RSI_3_1d"] < 95.0)
+      | (df["RSI_14_15m"] > 85.0)
+      | (df["CCI_20_15m"] > 250.0)
+      | (df["RSI_14_1h"] > 85.0)
+      | (df["CCI_20_1h"] > 250.0)
+      | (df["CCI_20_change_pct_1h"] < -0.0)
+      | (df["STOCHRSIk_14_14_3_3_1h"] > 90.0)
+      | (df["RSI_14_4h"] > 85.0)
+      | (df["CCI_20_4h"] > 250.0)
+      | (df["CCI_20_change_pct_4h"] < -0.0)
+      | (df["STOCHRSIk_14_14_3_3_4h"] > 90.0)
+      | (df["ROC_9_4h"] < 30.0)
+      | (df["RSI_14_1d"] > 90.0)
+      | (df["WILLR_14_1d"] > -10.0)
+      | (df["ROC_9_1d"] < 50.0)
+    )
+    # 15m & 1h & 4h up move, 15m & 1h still not high enough, 4h still not high enough & uptrend
+    & (
+      (df["RSI_3_15m"] < 80.0)
+      | (df["RSI_3_1h"] < 80.0)
+      | (df["RSI_3_4h"] < 90.0)
+      | (df["RSI_14_15m"] > 90.0)
+      | (df["CCI_20_15m"] > 400.0)
+      | (df["RSI_14_1h"] > 90.0)
+      | (df["CCI_20_1h"] > 400.0)
+      | (df["CCI_20_4h"] > 400.0)
+      | (df["ROC_9_4h"] < 200.0)
+    )
+    # 15m & 1h up move, 15m & 1h & 4h still not high enough, 1d still not high enough & uptrend
+    & (
+      (df["RSI_3_15m"] < 80.0)
+      | (df["RSI_3_1h"] < 90.0)
+      | (df["RSI_14_15m"] > 85.0)
+      | (df["CCI_20_15m"] > 250.0)
+      | (df["RSI_14_1h"] > 75.0)
+      | (df["AROOND_14_1h"] < 50.0)
+      | (df["CCI_20_1h"] > 350.0)
+      | (df["CCI_20_change_pct_1h"] < -0.0)
+      | (df["RSI_14_4h"] > 85.0)
+      | (df["CCI_20_4h"] > 150.0)
+      | (df["CCI_20_change_pct_4h"] < -0.0)
+      | (df["STOCHRSIk_14_14_3_3_4h"] > 70.0)
+      | (df["RSI_14_1d"] > 85.0)
+      | (df["ROC_9_1d"] < 50.0)
+    )
+    # 15m & 1h & 4h & 1d up move, 15m & 1h & 4h & 1d still not high enough
+    & (
+      (df["RSI_3_15m"] < 80.0)
+      | (df["RSI_3_1h"] < 90.0)
+      | (df["RSI_3_4h"] < 70.0)
+      | (df["RSI_3_1d"] < 70.0)
+      | (df["RSI_14_15m"] > 85.0)
+      | (df["RSI_14_1h"] > 85.0)
+      | (df["CCI_20_1h"] > 250.0)
+      | (df["CCI_20_change_pct_1h"] < -0.0)
+      | (df["RSI_14_4h"] > 70.0)
+      | (df["AROOND_14_4h"] < 75.0)
+      | (df["CCI_20_4h"] > 200.0)
+      | (df["CCI_20_change_pct_4h"] < -0.0)
+      | (df["STOCHk_14_3_3_4h"] > 70.0)
+      | (df["RSI_14_1d"] > 70.0)
+    )
+    # 15m & 1h & 4h & 1d up move, 1h still not high enough, 1d still low, 4h & 1d uptrend
+    & (
+      (df["RSI_3_15m"] < 80.0)
+      | (df["RSI_3_1h"] < 85.0)
+      | (df["RSI_3_4h"] < 90.0)
+      | (df["RSI_3_1d"] < 95.0)
+      | (df["STOCHRSIk_14_14_3_3_1h"] > 60.0)
+      | (df["AROOND_14_1d"] < 50.0)
+      | (df["ROC_9_4h"] < 100.0)
+      | (df["ROC_9_1d"] < 100.0)
+    )
+    # 15m & 1h & 4h & 1d up move, 15m & 1h still not high enough, 4h & 1d still not high enough & uptrend
+    & (
+      (df["RSI_3_15m"] < 80.0)
+      | (df["RSI_3_1h"] < 80.0)
+      | (df["RSI_3_4h"] < 90.0)
+      | (df["RSI_3_1d"] < 95.0)
+      | (df["RSI_14_15m"] > 85.0)
+      | (df["STOCHk_14_3_3_15m"] > 90.0)
+      | (df["RSI_14_1h"] > 90.0)
+      | (df["STOCHk_14_3_3_1h"] > 90.0)
+      | (df["RSI_14_4h"] > 95.0)
+      | (df["STOCHk_14_3_3_4h"] > 90.0)
+      | (df["ROC_9_4h"] < 50.0)
+      | (df["RSI_14_1d"] > 95.0)
+      | (df["STOCHk_14_3_3_1d"] > 70.0)
+      | (df["AROOND_14_1d"] < 50.0)
+      | (df["ROC_9_1d"] < 50.0)
+    )
+    # 15m & 1h & 4h up move, 1h & 4h still not high enough, 1d uptrend
+    & (
+      (df["RSI_3_15m"] < 85.0)
+      | (df["RSI_3_1h"] < 80.0)
+      | (df["RSI_3_4h"] < 60.0)
+      | (df["WILLR_14_1h"] > -5.0)
+      | (df["AROOND_14_1h"] < 25.0)
+      | (df["WILLR_14_4h"] > -10.0)
+      | (df["AROOND_14_4h"] < 50.0)
+      | (df["STOCHRSIk_14_14_3_3_4h"] > 60.0)
+      | (df["ROC_9_1d"] < 50.0)
+    )
+    # 15m & 1h & 4h up move, 15m still not high enough, 1h & 4h still not high enough & uptrend, 1d still not high enough
+    & (
+      (df["RSI_3_15m"] < 85.0)
+      | (df["RSI_3_1h"] < 85.0)
+      | (df["RSI_3_4h"] < 90.0)
+      | (df["RSI_14_15m"] > 95.0)
+      | (df["CMF_20_15m"] > 0.50)
+      | (df["UO_7_14_28_15m"] > 80.0)
+      | (df["UO_7_14_28_change_pct_15m"] < -0.0)
+      | (df["CCI_20_15m"] > 250.0)
+      | (df["STOCHk_14_3_3_15m"] > 90.0)
+      | (df["RSI_14_1h"] > 95.0)
+      | (df["CMF_20_1h"] > 0.50)
+      | (df["UO_7_14_28_1h"] > 80.0)
+      | (df["CCI_20_1h"] > 350.0)
+      | (df["ROC_9_1h"] < 10.0)
+      | (df["RSI_14_4h"] > 90.0)
+      | (df["CMF_20_4h"] > 0.35)
+      | (df["UO_7_14_28_4h"] > 75.0)
+      | (df["CCI_20_4h"] > 500.0)
+      | (df["ROC_2_4h"] < 10.0)
+      | (df["ROC_9_4h"] < 10.0)
+      | (df["RSI_14_1d"] > 70.0)
+    )
+    # 15m & 1h & 4h up move, 15m & 1h & 4h still not high enough, 1d still not high enough & overbought
+    & (
+      (df["RSI_3_15m"] < 90.0)
+      | (df["RSI_3_1h"] < 60.0)
+      | (df["RSI_3_4h"] < 60.0)
+      | (df["RSI_14_15m"] > 85.0)
+      | (df["CCI_20_15m"] > 250.0)
+      | (df["RSI_14_1h"] > 70.0)
+      | (df["CCI_20_1h"] > 200.0)
+      | (df["STOCHk_14_3_3_1h"] > 90.0)
+      | (df["RSI_14_4h"] > 65.0)
+      | (df["CCI_20_4h"] > 200.0)
+      | (df["STOCHk_14_3_3_4h"] > 90.0)
+      | (df["RSI_14_1d"] > 65.0)
+      | (df["STOCHk_14_3_3_1d"] > 70.0)
+      | (df["ROC_9_1d"] < 30.0)
+    )
+    # 15m & 1h & 4h & 1d up move, 15m & 1h & 4h still not high enough. 1d still not high enough & uptrend
+    & (
+      (df["RSI_3_15m"] < 95.0)
+      | (df["RSI_3_1h"] < 80.0)
+      | (df["RSI_3_4h"] < 80.0)
+      | (df["RSI_3_1d"] < 80.0)
+      | (df["RSI_14_15m"] > 90.0)
+      | (df["RSI_14_1h"] > 90.0)
+      | (df["STOCHRSIk_14_14_3_3_1h"] > 70.0)
+      | (df["RSI_14_4h"] > 90.0)
+      | (df["WILLR_14_4h"] > -5.0)
+      | (df["RSI_14_1d"] > 80.0)
+      | (df["STOCHRSIk_14_14_3_3_1d"] > 80.0)
+      | (df["ROC_9_1d"] < 40.0)
+    )
+    # 15m & 1h & 4h up move, 15m & 1h still not high enough, 4h still not high enough & uptrend
+    & (
+      (df["RSI_3_15m"] < 95.0)
+      | (df["RSI_3_1h"] < 90.0)
+      | (df["RSI_3_4h"] < 90.0)
+      | (df["RSI_14_15m"] > 90.0)
+      | (df["CCI_20_15m"] > 250.0)
+      | (df["RSI_14_1h"] > 90.0)
+      | (df["AROOND_14_1h"] < 25.0)
+      | (df["CCI_20_1h"] > 300.0)
+      | (df["STOCHk_14_3_3_1h"] > 90.0)
+      | (df["RSI_14_4h"] > 95.0)
+      | (df["CCI_20_4h"] > 300.0)
+      | (df["ROC_9_4h"] < 20.0)
+    )
+    # 1h & 4h & 1d up move, 15m still not high enough, 1h & 4h & 1d still not high enough, 1d uptrend
+    & (
+      (df["RSI_3_1h"] < 80.0)
+      | (df["RSI_3_4h"] < 60.0)
+      | (df["RSI_3_1d"] < 90.0)
+      | (df["STOCHRSIk_14_14_3_3_15m"] > 80.0)
+      | (df["WILLR_14_1h"] > -20.0)
+      | (df["WILLR_14_4h"] > -25.0)
+      | (df["STOCHRSIk_14_14_3_3_4h"] > 20.0)
+      | (df["AROOND_14_1d"] < 50.0)
+      | (df["ROC_9_1d"] < 20.0)
+    )
+  )
+
+
+def global_protections_short_dump(df):
+  return (
+    # 15m & 1h up move, 15m & 1h still not high enough, 4h still low, 1d still low & downtrend
+    (
+      (df["RSI_3_15m"] < 80.0)
+      | (df["RSI_3_1h"] < 70.0)
+      | (df["RSI_14_15m"] > 80.0)
+      | (df["CCI_20_15m"] > 400.0)
+      | (df["RSI_14_1h"] > 75.0)
+      | (df["CCI_20_1h"] > 250.0)
+      | (df["RSI_14_4h"] > 60.0)
+      | (df["AROOND_14_4h"] < 50.0)
+      | (df["CCI_20_4h"] > 200.0)
+      | (df["RSI_14_1d"] > 50.0)
+      | (df["AROOND_14_1d"] < 75.0)
+      | (df["ROC_9_1d"] > -30.0)
+    )
+    # 15m up move, 15m still low, 1h & 4h & 1d still not high
+    & (
+      (df["RSI_3_15m"] < 85.0)
+      | (df["AROOND_14_15m"] < 50.0)
+      | (df["RSI_14_1h"] > 70.0)
+      | (df["WILLR_14_1h"] > -50.0)
+      | (df["STOCHRSIk_14_14_3_3_1h"] > 80.0)
+      | (df["AROOND_14_1h"] < 75.0)
+      | (df["RSI_14_4h"] > 70.0)
+      | (df["WILLR_14_4h"] > -50.0)
+      | (df["AROOND_14_4h"] < 25.0)
+      | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0)
+      | (df["RSI_14_1d"] > 70.0)
+    )
+    # 1h & 4h up move, 15m & 1h & 4h still not high enough, 1d still low & downtrend
+    & (
+      (df["RSI_3_1h"] < 70.0)
+      | (df["RSI_3_4h"] < 90.0)
+      | (df["RSI_14_15m"] > 95.0)
+      | (df["CCI_20_15m"] > 600.0)
+      | (df["RSI_14_1h"] > 95.0)
+      | (df["CCI_20_1h"] > 600.0)
+      | (df["RSI_14_4h"] > 95.0)
+      | (df["WILLR_14_4h"] > -10.0)
+      | (df["CCI_20_4h"] > 600.0)
+      | (df["RSI_14_1d"] > 40.0)
+      | (df["ROC_9_1d"] > -20.0)
+    )
+  )
@@ -0,0 +1,50 @@
+"""
+Indicator pruning: the entry and exit signals must not change when the indicator functions are
+replaced with the pruned copies.
+
+Runs the strategy on the synthetic candles twice (prune_unused_indicators off/on) and compares
+the enter_*/exit_* columns and the exit functions results for the last candles.
+"""
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("talib")
+pytest.importorskip("pandas_ta")
+pytest.importorskip("freqtrade")
+
+from test_memory_compact_mode import FakeDataProvider, analyze, exit_results, load_strategy_module
+
+
+SIGNAL_COLUMNS = ["enter_long", "enter_short", "enter_tag", "exit_long", "exit_short"]
+
+
+def make_strategy(module, tmp_path, prune_unused_indicators):
+  config = {
+    "exchange": {"name": "binance"},
+    "stake_currency": "USDT",
+    "max_open_trades": 6,
+    "trading_mode": "spot",
+    "runmode": FakeDataProvider.runmode,
+    "user_data_dir": tmp_path,
+    "nfi_parameters": {"prune_unused_indicators": prune_unused_indicators},
+  }
+  strategy = module.NostalgiaForInfinityX6(config)
+  strategy.dp = FakeDataProvider()
+  return strategy
+
+
+def test_pruned_indicators_keep_signals(tmp_path):
+  module = load_strategy_module()
+  full_strategy = make_strategy(module, tmp_path, False)
+  pruned_strategy = make_strategy(module, tmp_path, True)
+
+  full_df = analyze(full_strategy)
+  pruned_df = analyze(pruned_strategy)
+
+  # Some columns are skipped, the signals are the same
+  assert set(pruned_df.columns) < set(full_df.columns)
+  for column in SIGNAL_COLUMNS:
+    pd.testing.assert_series_equal(full_df[column], pruned_df[column])
+
+  assert exit_results(full_strategy, full_df) == exit_results(pruned_strategy, pruned_df)
@@ -0,0 +1,126 @@
+"""
+Informative frames cache: when the candles window moves on (new candles while running, or while
+the bot was down), only the new candles and a warmup tail before them are computed.
+
+Runs the strategy 1h informative indicators on a window, moves the window by a few candles (also
+through a save/load, as after a restart) and checks what was computed and the stitched frame.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+pytest.importorskip("talib")
+pytest.importorskip("pandas_ta")
+pytest.importorskip("freqtrade")
+
+from test_memory_compact_mode import PAIR, FakeDataProvider, load_strategy_module
+
+
+TIMEFRAME = "1h"
+WINDOW = 900
+WARMUP = 200
+NUM_NEW = 3
+
+
+class WindowDataProvider(FakeDataProvider):
+  """The last WINDOW candles up to end (the live candles window)"""
+
+  def __init__(self):
+    super().__init__()
+    self.end = WINDOW
+
+  def get_pair_dataframe(self, pair, timeframe):
+    candles = self.candles[pair][timeframe]
+    if timeframe == TIMEFRAME:
+      candles = candles.iloc[self.end - WINDOW : self.end].reset_index(drop=True)
+    return candles.copy()
+
+
+def make_strategy(module, tmp_path):
+  config = {
+    "exchange": {"name": "binance"},
+    "stake_currency": "USDT",
+    "max_open_trades": 6,
+    "trading_mode": "spot",
+    "runmode": FakeDataProvider.runmode,
+    "user_data_dir": tmp_path,
+    "nfi_parameters": {"cache_informative_frames": True},
+  }
+  strategy = module.NostalgiaForInfinityX6(config)
+  strategy.dp = WindowDataProvider()
+  strategy.informative_frames.warmup_candles = WARMUP
+  # The pair frames are only cached in live/dry-run
+  strategy.is_backtest_mode = lambda: False
+  return strategy
+
+
+def counted_compute(strategy, calls):
+  compute = strategy.info_switcher_compute
+
+  def info_switcher_compute(metadata, info_timeframe):
+    candles = strategy.dp.get_pair_dataframe(metadata["pair"], info_timeframe)
+    calls.append((info_timeframe, len(candles)))
+    return compute(metadata, info_timeframe)
+
+  strategy.info_switcher_compute = info_switcher_compute
+
+
+def test_only_new_candles_are_computed(tmp_path):
+  module = load_strategy_module()
+  strategy = make_strategy(module, tmp_path)
+  calls = []
+  counted_compute(strategy, calls)
+  metadata = {"pair": PAIR}
+
+  first = strategy.info_switcher(metadata, TIMEFRAME)
+  assert calls == [(TIMEFRAME, WINDOW)]
+  pd.testing.assert_frame_equal(strategy.info_switcher(metadata, TIMEFRAME), first)
+  assert len(calls) == 1, "unchanged candles reuse the frame"
+
+  # Restart: saved at shutdown, loaded by a new instance, NUM_NEW candles while the bot was down
+  strategy.informative_frames.save()
+  strategy = make_strategy(module, tmp_path)
+  strategy.informative_frames.load()
+  calls = []
+  counted_compute(strategy, calls)
+  strategy.dp.end += NUM_NEW
+
+  frame = strategy.info_switcher(metadata, TIMEFRAME)
+  assert calls == [(TIMEFRAME, WARMUP + NUM_NEW)], "only the new candles and the warmup tail are computed"
+  assert isinstance(strategy.dp, WindowDataProvider), "the DataProvider is restored"
+
+  candles = strategy.dp.get_pair_dataframe(PAIR, TIMEFRAME)
+  assert len(frame) == WINDOW
+  assert (frame["date"].to_numpy() == candles["date"].to_numpy()).all()
+  # Cached rows still in the window, unchanged
+  pd.testing.assert_frame_equal(frame.iloc[: WINDOW - NUM_NEW], first.iloc[NUM_NEW:].reset_index(drop=True))
+  # New rows, as computed from the warmup tail
+  tail_candles = candles.iloc[-(WARMUP + NUM_NEW) :].reset_index(drop=True)
+  tail = strategy.compute_on_candles(
+    PAIR, TIMEFRAME, tail_candles, lambda: strategy.info_switcher_compute(metadata, TIMEFRAME)
+  )
+  pd.testing.assert_frame_equal(
+    frame.iloc[-NUM_NEW:].reset_index(drop=True), tail.iloc[-NUM_NEW:].reset_index(drop=True)
+  )
+
+
+def test_changed_candles_are_fully_computed(tmp_path):
+  module = load_strategy_module()
+  strategy = make_strategy(module, tmp_path)
+  calls = []
+  counted_compute(strategy, calls)
+  metadata = {"pair": PAIR}
+  strategy.info_switcher(metadata, TIMEFRAME)
+
+  # A cached candle changed (exchange correction): no overlap with the cache
+  candles = strategy.dp.candles[PAIR][TIMEFRAME]
+  candles.loc[WINDOW - 10, "close"] *= 1.01
+  strategy.info_switcher(metadata, TIMEFRAME)
+  assert calls == [(TIMEFRAME, WINDOW), (TIMEFRAME, WINDOW)]
+
+  # Too many new candles for the tail to be cheaper
+  strategy.informative_frames.warmup_candles = WINDOW - NUM_NEW
+  strategy.dp.end += NUM_NEW
+  strategy.info_switcher(metadata, TIMEFRAME)
+  assert calls[-1] == (TIMEFRAME, WINDOW)
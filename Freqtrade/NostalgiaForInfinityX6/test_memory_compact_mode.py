@@ -0,0 +1,180 @@
+"""
+Memory compact mode: the entry and exit signals must not change when the analyzed
+dataframe is compacted.
+
+Runs the strategy on synthetic candles twice (memory_compact_mode off/on) and compares
+the entry columns and the exit functions results for the last candles.
+"""
+
+import importlib.util
+import pathlib
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+pytest.importorskip("talib")
+pytest.importorskip("pandas_ta")
+pytest.importorskip("freqtrade")
+
+from freqtrade.enums import RunMode
+
+
+STRATEGY_FILE = pathlib.Path(__file__).resolve().parent / "NostalgiaForInfinityX6.py"
+PAIR = "ETH/USDT"
+BTC_PAIR = "BTC/USDT"
+INFO_TIMEFRAMES = {"5m": "5min", "15m": "15min", "1h": "1h", "4h": "4h", "1d": "1D"}
+EXIT_FUNCTIONS = [
+  "long_exit_signals",
+  "long_exit_main",
+  "long_exit_williams_r",
+  "long_exit_dec",
+  "short_exit_signals",
+  "short_exit_main",
+  "short_exit_williams_r",
+  "short_exit_dec",
+]
+EXIT_PROFITS = [-0.05, 0.005, 0.015, 0.03, 0.06, 0.12]
+NUM_CHECKED_CANDLES = 300
+
+
+def load_strategy_module():
+  spec = importlib.util.spec_from_file_location("NostalgiaForInfinityX6", STRATEGY_FILE)
+  module = importlib.util.module_from_spec(spec)
+  spec.loader.exec_module(module)
+  return module
+
+
+def make_candles(seed, num_days=40):
+  rng = np.random.default_rng(seed)
+  num = num_days * 288
+  dates = pd.date_range("2024-01-01", periods=num, freq="5min", tz="UTC")
+  close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.004, num)))
+  open_ = np.concatenate([[close[0]], close[:-1]])
+  spread = np.abs(rng.normal(0.0, 0.002, num)) * close
+  candles = pd.DataFrame(
+    {
+      "date": dates,
+      "open": open_,
+      "high": np.maximum(open_, close) + spread,
+      "low": np.minimum(open_, close) - spread,
+      "close": close,
+      "volume": rng.uniform(100.0, 1000.0, num),
+    }
+  )
+  resampled = {}
+  for timeframe, rule in INFO_TIMEFRAMES.items():
+    resampled[timeframe] = (
+      candles.set_index("date")
+      .resample(rule)
+      .agg({"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"})
+      .dropna()
+      .reset_index()
+    )
+  return resampled
+
+
+class FakeDataProvider:
+  runmode = RunMode.BACKTEST
+
+  def __init__(self):
+    self.candles = {PAIR: make_candles(1), BTC_PAIR: make_candles(2)}
+
+  def get_pair_dataframe(self, pair, timeframe):
+    return self.candles[pair][timeframe].copy()
+
+  def current_whitelist(self):
+    return [PAIR]
+
+
+def make_strategy(module, tmp_path, memory_compact_mode):
+  config = {
+    "exchange": {"name": "binance"},
+    "stake_currency": "USDT",
+    "max_open_trades": 6,
+    "trading_mode": "spot",
+    "runmode": RunMode.BACKTEST,
+    "user_data_dir": tmp_path,
+    "nfi_parameters": {"memory_compact_mode": memory_compact_mode},
+  }
+  strategy = module.NostalgiaForInfinityX6(config)
+  strategy.dp = FakeDataProvider()
+  return strategy
+
+
+def analyze(strategy):
+  metadata = {"pair": PAIR}
+  df = strategy.dp.get_pair_dataframe(PAIR, strategy.timeframe)
+  df = strategy.populate_indicators(df, metadata)
+  df = strategy.populate_entry_trend(df, metadata)
+  df = strategy.populate_exit_trend(df, metadata)
+  return df
+
+
+def exit_results(strategy, df):
+  results = []
+  for index in range(len(df) - NUM_CHECKED_CANDLES, len(df)):
+    candles = [df.iloc[index - offset] for offset in range(6)]
+    current_time = candles[0]["date"].to_pydatetime()
+    for exit_function in EXIT_FUNCTIONS:
+      mode_name = "long_normal" if exit_function.startswith("long") else "short_normal"
+      for profit in EXIT_PROFITS:
+        results.append(
+          getattr(strategy, exit_function)(
+            mode_name, profit, max(profit, 0.0), min(profit, 0.0), *candles, None, current_time, "1"
+          )
+        )
+  return results
+
+
+def test_memory_compact_mode_keeps_signals(tmp_path):
+  module = load_strategy_module()
+  full_strategy = make_strategy(module, tmp_path, False)
+  compact_strategy = make_strategy(module, tmp_path, True)
+
+  full_df = analyze(full_strategy)
+  compact_df = analyze(compact_strategy)
+
+  # Entry signals
+  for column in ["enter_long", "enter_short", "enter_tag"]:
+    pd.testing.assert_series_equal(full_df[column], compact_df[column])
+
+  # Exit signals
+  assert exit_results(full_strategy, full_df) == exit_results(compact_strategy, compact_df)
+
+  # Every kept value is exactly the full precision one (no threshold can flip)
+  for column in compact_df.columns:
+    if compact_df[column].dtype == np.float32:
+      assert np.array_equal(
+        compact_df[column].to_numpy().astype(np.float64), full_df[column].to_numpy(), equal_nan=True
+      ), column
+
+  # Memory report
+  bytes_before, bytes_after = compact_strategy.memory_compact_stats[PAIR]
+  assert bytes_after < bytes_before
+  assert int(compact_df.memory_usage(deep=True).sum()) == bytes_after
+  assert compact_df["protections_long_global"].dtype == bool
+  # Type checked by the exit logic with isinstance(..., np.float64)
+  assert compact_df["ROC_9_1d"].dtype == np.float64
+
+
+def test_compact_dataframe_keeps_threshold_values():
+  module = load_strategy_module()
+  # 29.999999999 rounds to 30.0 in float32: rsi_14 < 30.0 would flip
+  df = pd.DataFrame(
+    {
+      "RSI_14": [29.999999999, 50.0, np.nan],
+      "CTI_20": [-0.8000000001, 0.25, 0.5],
+      "count": [1.0, 2.0, 3.0],
+      "dropped": [1.0, 2.0, 3.0],
+    }
+  )
+  compact_df = module.compact_dataframe(df, {"RSI_14", "CTI_20", "count"})
+
+  assert "dropped" not in compact_df.columns
+  assert compact_df["RSI_14"].dtype == np.float64
+  assert compact_df["CTI_20"].dtype == np.float64
+  assert (compact_df["RSI_14"] < 30.0).tolist() == (df["RSI_14"] < 30.0).tolist()
+  assert (compact_df["CTI_20"] < -0.8).tolist() == (df["CTI_20"] < -0.8).tolist()
+  # Lossless
+  assert compact_df["count"].dtype == np.float32
@@ -0,0 +1,54 @@
+"""
+Exit signals precompute: the exit codes looked up from the precomputed candle columns must match
+the original exit functions, for every profit band (the thresholds themselves and the ranges between).
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("pandas")
+pytest.importorskip("talib")
+pytest.importorskip("pandas_ta")
+pytest.importorskip("freqtrade")
+
+from test_memory_compact_mode import EXIT_FUNCTIONS, PAIR, FakeDataProvider, analyze, load_strategy_module
+
+
+NUM_CHECKED_CANDLES = 100
+
+
+def make_strategy(module, tmp_path, precompute_exit_signals):
+  config = {
+    "exchange": {"name": "binance"},
+    "stake_currency": "USDT",
+    "max_open_trades": 6,
+    "trading_mode": "spot",
+    "runmode": FakeDataProvider.runmode,
+    "user_data_dir": tmp_path,
+    "nfi_parameters": {"precompute_exit_signals": precompute_exit_signals},
+  }
+  strategy = module.NostalgiaForInfinityX6(config)
+  strategy.dp = FakeDataProvider()
+  return strategy
+
+
+def test_precomputed_exit_signals_match(tmp_path):
+  module = load_strategy_module()
+  strategy = make_strategy(module, tmp_path, True)
+  precompute = strategy.exit_signals_precompute
+  assert set(precompute.functions) == set(EXIT_FUNCTIONS)
+
+  df = analyze(strategy)
+  assert set(precompute.columns()) <= set(df.columns)
+
+  original_strategy = make_strategy(module, tmp_path, False)
+  for index in range(len(df) - NUM_CHECKED_CANDLES, len(df)):
+    candles = [df.iloc[index - offset] for offset in range(6)]
+    current_time = candles[0]["date"].to_pydatetime()
+    for exit_function in EXIT_FUNCTIONS:
+      mode_name = "long_normal" if exit_function.startswith("long") else "short_normal"
+      thresholds = precompute.functions[exit_function][1]
+      for band in range(2 * len(thresholds) + 1):
+        profit = precompute.band_profit(thresholds, band)
+        args = (mode_name, profit, max(profit, 0.0), min(profit, 0.0), *candles, None, current_time, "1")
+        assert getattr(strategy, exit_function)(*args) == getattr(original_strategy, exit_function)(*args)
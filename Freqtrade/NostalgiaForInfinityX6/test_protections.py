@@ -0,0 +1,124 @@
+"""
+Protections: evaluate_protections must give the same column as the chained (a | b) & (c | d) pandas
+expression of the same clauses, and as the original protections_long_global, global_protections_short_pump
+and global_protections_short_dump expressions (golden reference, catches transcription errors in the tables).
+"""
+
+import ast
+import inspect
+import re
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+pytest.importorskip("talib")
+pytest.importorskip("pandas_ta")
+pytest.importorskip("freqtrade")
+
+import protections_reference
+from test_memory_compact_mode import load_strategy_module
+
+# Original expression -> table
+REFERENCE_TABLES = {
+  "protections_long_global": "PROTECTIONS_LONG_GLOBAL",
+  "global_protections_short_pump": "PROTECTIONS_SHORT_GLOBAL_PUMP",
+  "global_protections_short_dump": "PROTECTIONS_SHORT_GLOBAL_DUMP",
+}
+
+def make_indicators(module, num_rows=5000, seed=3):
+  rng = np.random.default_rng(seed)
+  columns = set().union(*(module.protection_columns(clauses) for clauses in module.PROTECTIONS_TABLES.values()))
+  df = pd.DataFrame({column: rng.normal(50.0, 40.0, num_rows) for column in sorted(columns)})
+  # Missing values (indicator warmup), every comparison with NaN is False
+  df.iloc[rng.integers(0, num_rows, num_rows // 20), rng.integers(0, len(df.columns), num_rows // 20)] = np.nan
+  return df
+
+
+def reference_protections(module, df, clauses):
+  def series(name):
+    match = module.PROTECTIONS_SHIFT_RE.match(name)
+    if match:
+      return df[match.group(1)].shift(int(match.group(2)))
+    return df[name]
+
+  result = pd.Series(True, index=df.index)
+  for clause in clauses:
+    clause_result = pd.Series(False, index=df.index)
+    for condition in clause:
+      code, names = module.compile_protection_condition(condition)
+      clause_result = clause_result | eval(code, {}, {name: series(name) for name in names})
+    result = result & clause_result
+  return result.to_numpy()
+
+
+def test_evaluate_protections_matches_pandas(monkeypatch):
+  module = load_strategy_module()
+  df = make_indicators(module)
+  shifted = (("RSI_3__shift_3 > 60.0", "close > high_max_30_1d__shift_288 * 0.5"), ("RSI_3 < 90.0",))
+  # The first clauses alone, to also check rows that stay true
+  for clauses in (module.PROTECTIONS_LONG_GLOBAL, module.PROTECTIONS_LONG_GLOBAL[:3], shifted):
+    expected = reference_protections(module, df, clauses)
+    # Blocks: one, several (the shifted rows cross the first blocks), not a divisor of the rows
+    for block_rows in (16384, 1000, 97):
+      monkeypatch.setattr(module, "PROTECTIONS_BLOCK_ROWS", block_rows)
+      result = module.evaluate_protections(df, clauses)
+      assert result.dtype == bool
+      np.testing.assert_array_equal(result, expected)
+
+
+def make_threshold_indicators(module, num_rows=5000, seed=4):
+  """
+  Indicators spread around the thresholds they are compared with ("RSI_3 > 1.0"), some rows exactly on a
+  threshold, so that a wrong threshold or operator in the table changes the result of the condition.
+  """
+  rng = np.random.default_rng(seed)
+  df = make_indicators(module, num_rows, seed)
+  thresholds = {}
+  for clause in (clause for clauses in module.PROTECTIONS_TABLES.values() for clause in clauses):
+    for condition in clause:
+      match = re.match(r"^(\w+) [<>]=? (-?[\d.]+)$", condition)
+      if match:
+        shift_match = module.PROTECTIONS_SHIFT_RE.match(match.group(1))
+        column = shift_match.group(1) if shift_match else match.group(1)
+        thresholds.setdefault(column, set()).add(float(match.group(2)))
+  for column, values in thresholds.items():
+    centers = rng.choice(sorted(values), num_rows)
+    noise = rng.normal(0.0, 0.2, num_rows) * np.maximum(np.abs(centers), 0.5)
+    df[column] = np.where(rng.random(num_rows) < 0.1, centers, centers + noise)
+  return df
+
+
+def reference_conditions(function_name):
+  """The original expression split in its clauses (& operands) and their conditions (| operands), as AST nodes."""
+
+  def operands(node, op_type):
+    if isinstance(node, ast.BinOp) and isinstance(node.op, op_type):
+      return operands(node.left, op_type) + operands(node.right, op_type)
+    return [node]
+
+  tree = ast.parse(inspect.getsource(protections_reference))
+  function = next(node for node in tree.body if isinstance(node, ast.FunctionDef) and node.name == function_name)
+  return [operands(clause, ast.BitOr) for clause in operands(function.body[0].value, ast.BitAnd)]
+
+
+def evaluate_reference(node, df):
+  return eval(compile(ast.Expression(node), "<protections>", "eval"), {}, {"df": df})
+
+
+@pytest.mark.parametrize("function_name", list(REFERENCE_TABLES))
+def test_protections_table_matches_original_expression(function_name):
+  module = load_strategy_module()
+  table = getattr(module, REFERENCE_TABLES[function_name])
+  df = make_threshold_indicators(module)
+  reference = reference_conditions(function_name)
+  assert [len(clause) for clause in reference] == [len(clause) for clause in table]
+  # Condition by condition, the whole expression is false on most rows of random data
+  for reference_clause, clause in zip(reference, table):
+    for node, condition in zip(reference_clause, clause):
+      expected = evaluate_reference(node, df).to_numpy()
+      result = module.evaluate_protections(df, ((condition,),))
+      np.testing.assert_array_equal(result, expected, err_msg=condition)
+
+  expected = getattr(protections_reference, function_name)(df).to_numpy()
+  np.testing.assert_array_equal(module.evaluate_protections(df, table), expected)
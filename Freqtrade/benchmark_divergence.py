@@ -0,0 +1,119 @@
+# Benchmark of the divergence_claude simple divergence detectors on multi-year 5m candles.
+#
+# Compares the previous pandas rolling + nested Python loop detector with the compiled scan, and times
+# the one pass RSI/MACD/OBV scan and the multi-pair batch (same signals: see test_divergence_claude.py).
+#
+# Usage: python benchmark_divergence.py [years]
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from divergence_claude import DivergenceEngine
+
+
+def make_candles(years: float, seed: int = 1) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    num = int(years * 365 * 288)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.004, num)))
+    return pd.DataFrame({
+        'close': close,
+        'volume': rng.uniform(100.0, 1000.0, num),
+    }, index=pd.date_range('2020-01-01', periods=num, freq='5min', tz='UTC'))
+
+
+def make_indicators(df: pd.DataFrame) -> dict:
+    delta = df['close'].diff()
+    gain = delta.clip(lower=0).ewm(alpha=1 / 14, adjust=False).mean()
+    loss = (-delta.clip(upper=0)).ewm(alpha=1 / 14, adjust=False).mean()
+    ema_fast = df['close'].ewm(span=12, adjust=False).mean()
+    ema_slow = df['close'].ewm(span=26, adjust=False).mean()
+    return {
+        'rsi': 100 - 100 / (1 + gain / loss),
+        'macd': ema_fast - ema_slow,
+        'obv': (np.sign(delta).fillna(0) * df['volume']).cumsum(),
+    }
+
+
+def reference_detect(engine: DivergenceEngine, price_series: pd.Series, indicator_series: pd.Series,
+                     is_bullish: bool, mode: str) -> pd.Series:
+    """The detector before the compiled scan: pandas rolling extremes and a nested Python loop"""
+    signals = pd.Series(False, index=price_series.index)
+    lookback = engine._simple_lookback
+    min_spacing = engine._min_spacing
+    if is_bullish:
+        price_extremes = price_series.rolling(engine._rolling_period).min()
+        indicator_extremes = indicator_series.rolling(engine._rolling_period).min()
+    else:
+        price_extremes = price_series.rolling(engine._rolling_period).max()
+        indicator_extremes = indicator_series.rolling(engine._rolling_period).max()
+
+    for i in range(lookback + engine._rolling_period, len(price_series)):
+        current_price = price_extremes.iloc[i]
+        current_indicator = indicator_extremes.iloc[i]
+        if pd.isna(current_price) or pd.isna(current_indicator):
+            continue
+        for j in range(i - lookback, i - min_spacing):
+            if j < 0:
+                continue
+            past_price = price_extremes.iloc[j]
+            past_indicator = indicator_extremes.iloc[j]
+            if pd.isna(past_price) or pd.isna(past_indicator):
+                continue
+            if is_bullish == (mode == 'regular'):
+                is_divergence = current_price < past_price and current_indicator > past_indicator
+            else:
+                is_divergence = current_price > past_price and current_indicator < past_indicator
+            if is_divergence:
+                signals.iloc[i] = True
+                break
+    return signals
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    years = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    df = make_candles(years)
+    indicators = make_indicators(df)
+    engine = DivergenceEngine()
+    print(f"{len(df)} candles ({years} years of 5m)")
+
+    # Compile outside of the timings
+    engine.get_multi_signals(df['close'].iloc[:100], {name: series.iloc[:100] for name, series in indicators.items()})
+
+    compiled_total = 0.0
+    reference_total = 0.0
+    for name, indicator in indicators.items():
+        for is_bullish in (True, False):
+            _, compiled_duration = timed(engine._detect_simple, df['close'], [indicator], is_bullish, 'regular')
+            _, reference_duration = timed(reference_detect, engine, df['close'], indicator, is_bullish, 'regular')
+            compiled_total += compiled_duration
+            reference_total += reference_duration
+            print(f"{name:>5} {'bullish' if is_bullish else 'bearish'}: "
+                  f"reference {reference_duration:8.3f}s, compiled {compiled_duration:8.4f}s")
+
+    _, multi_duration = timed(engine.get_multi_signals, df['close'], indicators)
+    print(f"total: reference {reference_total:.3f}s, compiled {compiled_total:.4f}s "
+          f"(x{reference_total / compiled_total:.0f}), one pass RSI/MACD/OBV {multi_duration:.4f}s")
+
+    # Whole whitelist in one call: the same candles shifted per pair
+    num_pairs = 20
+    price = np.stack([np.roll(df['close'].to_numpy(), 288 * pair) for pair in range(num_pairs)])
+    batch = np.stack([
+        np.stack([np.roll(indicator.to_numpy(), 288 * pair) for pair in range(num_pairs)])
+        for indicator in indicators.values()
+    ])
+    engine.get_batch_signals(price[:, :100], batch[:, :, :100])
+    _, batch_duration = timed(engine.get_batch_signals, price, batch)
+    print(f"batch: {num_pairs} pairs x {len(indicators)} indicators {batch_duration:.4f}s")
+
+
+if __name__ == '__main__':
+    main()
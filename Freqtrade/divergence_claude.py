@@ -2,7 +2,8 @@
 
 import pandas as pd
 import numpy as np
-from typing import Tuple, Literal, Callable
+from numba import njit, prange
+from typing import Dict, Tuple, Literal, Callable
 from freqtrade.strategy import IStrategy, timeframe_to_minutes, merge_informative_pair
 
 # --- ADD THIS SNIPPET TO SILENCE NUMBA ---
@@ -11,6 +12,87 @@ import logging
 logging.getLogger('numba').setLevel(logging.WARNING)
 # -----------------------------------------
 
+# ==============================================================================
+# |                  COMPILED ROLLING DIVERGENCE SCAN                           |
+# ==============================================================================
+
+@njit
+def _rolling_extreme(values: np.array, window: int, is_min: bool) -> np.array:
+    """
+    Rolling min/max with a monotonic deque, O(n). Same output as pandas rolling(window).min()/max():
+    NaN until the window is full, and for any window containing a NaN.
+    """
+    n = len(values)
+    result = np.full(n, np.nan)
+    deque = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    last_nan = -1
+    for i in range(n):
+        value = values[i]
+        if np.isnan(value):
+            last_nan = i
+        else:
+            # Drop the candidates that can't be the extreme anymore
+            while tail > head and ((values[deque[tail - 1]] >= value) if is_min else (values[deque[tail - 1]] <= value)):
+                tail -= 1
+            deque[tail] = i
+            tail += 1
+        while tail > head and deque[head] <= i - window:
+            head += 1
+        if i >= window - 1 and last_nan <= i - window and tail > head:
+            result[i] = values[deque[head]]
+    return result
+
+@njit
+def _scan_divergences(price_extremes: np.array, indicator_extremes: np.array, start: int,
+                      lookback: int, min_spacing: int, is_bullish: bool, is_regular: bool) -> np.array:
+    """
+    For each candle i, looks back at the candles j in [i - lookback, i - min_spacing) for a divergence
+    between the rolling price extremes and the rolling indicator extremes (one row per indicator).
+    """
+    num_indicators, n = indicator_extremes.shape
+    signals = np.zeros((num_indicators, n), dtype=np.bool_)
+    for k in range(num_indicators):
+        for i in range(start, n):
+            current_price = price_extremes[i]
+            current_indicator = indicator_extremes[k, i]
+            if np.isnan(current_price) or np.isnan(current_indicator):
+                continue
+            for j in range(max(i - lookback, 0), i - min_spacing):
+                past_price = price_extremes[j]
+                past_indicator = indicator_extremes[k, j]
+                if np.isnan(past_price) or np.isnan(past_indicator):
+                    continue
+                # Bullish lows / bearish highs: regular when price and indicator disagree one way,
+                # hidden when they disagree the other way
+                if is_bullish == is_regular:
+                    is_divergence = current_price < past_price and current_indicator > past_indicator
+                else:
+                    is_divergence = current_price > past_price and current_indicator < past_indicator
+                if is_divergence:
+                    signals[k, i] = True
+                    break
+    return signals
+
+@njit(parallel=True)
+def _scan_batch_divergences(price: np.array, indicators: np.array, window: int, start: int,
+                            lookback: int, min_spacing: int, is_bullish: bool, is_regular: bool) -> np.array:
+    """
+    Batched scan: price is pairs x time, indicators is indicators x pairs x time.
+    The price rolling extremes of each pair are computed once and shared, pairs run in parallel.
+    """
+    num_indicators, num_pairs, n = indicators.shape
+    signals = np.zeros((num_indicators, num_pairs, n), dtype=np.bool_)
+    for pair in prange(num_pairs):
+        price_extremes = _rolling_extreme(price[pair], window, is_bullish)
+        indicator_extremes = np.empty((num_indicators, n))
+        for k in range(num_indicators):
+            indicator_extremes[k] = _rolling_extreme(indicators[k, pair], window, is_bullish)
+        signals[:, pair, :] = _scan_divergences(price_extremes, indicator_extremes, start,
+                                                lookback, min_spacing, is_bullish, is_regular)
+    return signals
+
 # ==============================================================================
 # |            EXACT DROP-IN REPLACEMENT - SAME INTERFACE                       |
 # ==============================================================================
@@ -43,83 +125,66 @@ class DivergenceEngine:
         
         return self._detect_simple_bearish(primary_series, secondary_series, mode)
     
+    def get_multi_signals(self, price_series: pd.Series, indicators: Dict[str, pd.Series],
+                          mode: Literal['regular', 'hidden'] = 'regular') -> Dict[str, Tuple[pd.Series, pd.Series]]:
+        """
+        Bullish and bearish signals for several indicators (RSI, MACD, OBV...) against the same price,
+        in one pass: the price rolling extremes are computed once and all the indicators are scanned
+        in the same compiled call. Returns indicator name -> (bullish signals, bearish signals).
+        """
+        empty = pd.Series(False, index=price_series.index)
+        if len(price_series) < 50 or not indicators:
+            return {name: (empty.copy(), empty.copy()) for name in indicators}
+
+        bullish = self._detect_simple(price_series, list(indicators.values()), True, mode)
+        bearish = self._detect_simple(price_series, list(indicators.values()), False, mode)
+        return {name: (bullish[k], bearish[k]) for k, name in enumerate(indicators)}
+
+    def get_batch_signals(self, price: np.array, indicators: np.array,
+                          mode: Literal['regular', 'hidden'] = 'regular') -> Tuple[np.array, np.array]:
+        """
+        Batch API for a whole whitelist in one compiled call: price is a pairs x time array, indicators
+        an indicators x pairs x time array (RSI, MACD, OBV...). Returns the bullish and bearish signals,
+        both indicators x pairs x time bool arrays, the same as get_bullish_signals/get_bearish_signals.
+        """
+        price = np.ascontiguousarray(price, dtype=np.float64)
+        indicators = np.ascontiguousarray(indicators, dtype=np.float64)
+        if price.shape[-1] < 50:
+            empty = np.zeros(indicators.shape, dtype=bool)
+            return empty, empty.copy()
+
+        start = self._simple_lookback + self._rolling_period
+        return tuple(
+            _scan_batch_divergences(price, indicators, self._rolling_period, start, self._simple_lookback,
+                                    self._min_spacing, is_bullish, mode == 'regular')
+            for is_bullish in (True, False)
+        )
+
+    def _detect_simple(self, price_series: pd.Series, indicator_series: list, is_bullish: bool,
+                       mode: str) -> list:
+        """Simple divergence on rolling extremes, one signal series per indicator"""
+        price = price_series.to_numpy(dtype=np.float64)
+        price_extremes = _rolling_extreme(price, self._rolling_period, is_bullish)
+        indicator_extremes = np.empty((len(indicator_series), len(price)))
+        for k, series in enumerate(indicator_series):
+            indicator_extremes[k] = _rolling_extreme(series.to_numpy(dtype=np.float64), self._rolling_period, is_bullish)
+        signals = _scan_divergences(
+            price_extremes, indicator_extremes, self._simple_lookback + self._rolling_period,
+            self._simple_lookback, self._min_spacing, is_bullish, mode == 'regular'
+        )
+        return [pd.Series(row, index=price_series.index) for row in signals]
+
     def _detect_simple_bullish(self, price_series: pd.Series, indicator_series: pd.Series, mode: str) -> pd.Series:
         """Simple bullish divergence without complex pivots"""
-        signals = pd.Series(False, index=price_series.index)
-        
-        # Use rolling minimums instead of pivot detection
-        price_lows = price_series.rolling(window=self._rolling_period, center=False).min()
-        indicator_lows = indicator_series.rolling(window=self._rolling_period, center=False).min()
-        
-        for i in range(self._simple_lookback + self._rolling_period, len(price_series)):
-            current_price_low = price_lows.iloc[i]
-            current_indicator_low = indicator_lows.iloc[i]
-            
-            if pd.isna(current_price_low) or pd.isna(current_indicator_low):
-                continue
-                
-            # Look back for comparison
-            for j in range(i - self._simple_lookback, i - self._min_spacing):
-                if j < 0:
-                    continue
-                    
-                past_price_low = price_lows.iloc[j]
-                past_indicator_low = indicator_lows.iloc[j]
-                
-                if pd.isna(past_price_low) or pd.isna(past_indicator_low):
-                    continue
-                
-                # Regular bullish: price lower low, indicator higher low
-                if mode == 'regular':
-                    if current_price_low < past_price_low and current_indicator_low > past_indicator_low:
-                        signals.iloc[i] = True
-                        break
-                # Hidden bullish: price higher low, indicator lower low  
-                else:
-                    if current_price_low > past_price_low and current_indicator_low < past_indicator_low:
-                        signals.iloc[i] = True
-                        break
-                        
-        return signals
-    
+        # Regular bullish: price lower low, indicator higher low
+        # Hidden bullish: price higher low, indicator lower low
+        return self._detect_simple(price_series, [indicator_series], True, mode)[0]
+
     def _detect_simple_bearish(self, price_series: pd.Series, indicator_series: pd.Series, mode: str) -> pd.Series:
         """Simple bearish divergence without complex pivots"""
-        signals = pd.Series(False, index=price_series.index)
-        
-        # Use rolling maximums instead of pivot detection
-        price_highs = price_series.rolling(window=self._rolling_period, center=False).max()
-        indicator_highs = indicator_series.rolling(window=self._rolling_period, center=False).max()
-        
-        for i in range(self._simple_lookback + self._rolling_period, len(price_series)):
-            current_price_high = price_highs.iloc[i]
-            current_indicator_high = indicator_highs.iloc[i]
-            
-            if pd.isna(current_price_high) or pd.isna(current_indicator_high):
-                continue
-                
-            # Look back for comparison
-            for j in range(i - self._simple_lookback, i - self._min_spacing):
-                if j < 0:
-                    continue
-                    
-                past_price_high = price_highs.iloc[j]
-                past_indicator_high = indicator_highs.iloc[j]
-                
-                if pd.isna(past_price_high) or pd.isna(past_indicator_high):
-                    continue
-                
-                # Regular bearish: price higher high, indicator lower high
-                if mode == 'regular':
-                    if current_price_high > past_price_high and current_indicator_high < past_indicator_high:
-                        signals.iloc[i] = True
-                        break
-                # Hidden bearish: price lower high, indicator higher high
-                else:
-                    if current_price_high < past_price_high and current_indicator_high > past_indicator_high:
-                        signals.iloc[i] = True
-                        break
-                        
-        return signals
+        # Regular bearish: price higher high, indicator lower high
+        # Hidden bearish: price lower high, indicator higher high
+        return self._detect_simple(price_series, [indicator_series], False, mode)[0]
 
 class InformativeDivergenceProvider:
     """
@@ -1,9 +1,18 @@
 # user_data/strategies/helpers/DivergenceHelper.py
+"""
+Bias-free divergence detection for the informative timeframes.
+
+Behaviour change: the candle by candle replay ran scipy find_peaks on each prefix of the candles,
+and find_peaks never reports the last element of a series, so the divergence at the latest candle
+was never set and the engine produced no signals at all. The pivots are now the strict extremum of
+a +/- pivot_distance window, with a prominence against the running mean of the primary series,
+and a divergence is signalled at the candle confirming the pivot (pivot_distance candles later).
+Strategies using DivergenceEngine will now get bull_div/bear_div signals where they had none.
+"""
 
 import pandas as pd
 import numpy as np
-from scipy.signal import find_peaks
-from numba import njit
+from numba import njit, prange
 from typing import Tuple, Literal, Callable
 from freqtrade.strategy import IStrategy, timeframe_to_minutes, merge_informative_pair
 
@@ -60,6 +69,88 @@ def _find_divergence_signals_sequential(primary_series: np.array, secondary_seri
                 
     return signals
 
+@njit
+def _find_confirmed_pivots(series: np.array, left_bars: int, right_bars: int,
+                           prominence_pct: float, is_valley: bool) -> np.array:
+    """
+    Incremental pivot detection, in a single pass over the candles.
+    A pivot at index p is the strict extremum of the window [p - left_bars, p + right_bars], with a
+    prominence of at least prominence_pct of the mean of the candles known so far. It is only
+    confirmed (visible) at index p + right_bars, once the right side of the window has passed.
+    """
+    n = len(series)
+    pivots = np.empty(n, dtype=np.int64)
+    num_pivots = 0
+    running_sum = 0.0
+    running_count = 0
+    for t in range(n):
+        if not np.isnan(series[t]):
+            running_sum += series[t]
+            running_count += 1
+        p = t - right_bars
+        if p < left_bars or np.isnan(series[p]) or running_count == 0:
+            continue
+        value = series[p]
+        is_pivot = True
+        # Highest (valley) / lowest (peak) value on each side, for the prominence
+        left_extreme = value
+        right_extreme = value
+        for k in range(p - left_bars, t + 1):
+            if k == p or np.isnan(series[k]):
+                continue
+            if is_valley:
+                if series[k] <= value:
+                    is_pivot = False
+                    break
+                if k < p:
+                    left_extreme = max(left_extreme, series[k])
+                else:
+                    right_extreme = max(right_extreme, series[k])
+            else:
+                if series[k] >= value:
+                    is_pivot = False
+                    break
+                if k < p:
+                    left_extreme = min(left_extreme, series[k])
+                else:
+                    right_extreme = min(right_extreme, series[k])
+        if not is_pivot:
+            continue
+        if is_valley:
+            prominence = min(left_extreme, right_extreme) - value
+        else:
+            prominence = value - max(left_extreme, right_extreme)
+        if prominence >= (running_sum / running_count) * prominence_pct:
+            pivots[num_pivots] = p
+            num_pivots += 1
+    return pivots[:num_pivots]
+
+@njit(parallel=True)
+def _find_batch_signals(primary: np.array, secondaries: np.array, pivot_distance: int, prominence_pct: float,
+                        is_valley: bool, mode: str, lookback: int, min_data_points: int) -> np.array:
+    """
+    Batched _get_signals: primary is pairs x time, secondaries is indicators x pairs x time.
+    The pivots of each pair are found once and shared by all its indicators, pairs run in parallel.
+    """
+    num_indicators, num_pairs, n = secondaries.shape
+    signals = np.zeros((num_indicators, num_pairs, n), dtype=np.bool_)
+    for pair in prange(num_pairs):
+        pivot_indices = _find_confirmed_pivots(primary[pair], pivot_distance, pivot_distance,
+                                               prominence_pct, is_valley)
+        if len(pivot_indices) < 2:
+            continue
+        num_valid = np.cumsum(~np.isnan(primary[pair]))
+        for k in range(num_indicators):
+            pivot_signals = _find_divergence_signals_sequential(
+                primary[pair], secondaries[k, pair], pivot_indices, lookback, mode
+            )
+            for pivot in pivot_indices:
+                confirmation = pivot + pivot_distance
+                if (pivot_signals[pivot] != 0 and confirmation >= min_data_points - 1
+                        and num_valid[confirmation] >= 50):
+                    signals[k, pair, confirmation] = True
+    return signals
+
 class DivergenceEngine:
     """
     Sophisticated divergence detection that processes data as if in real-time.
@@ -80,112 +171,75 @@ class DivergenceEngine:
     def get_bullish_signals(self, primary_series: pd.Series, secondary_series: pd.Series,
                            mode: Literal['regular', 'hidden'] = 'regular') -> pd.Series:
         """
-        Process data sequentially to simulate real-time pivot detection.
-        This is the key to maintaining sophistication without lookahead bias.
+        Bullish divergences between the valleys of the primary series, as seen in real-time.
         """
         bullish_mode_str = 'hidden_bullish' if mode == 'hidden' else 'bullish'
-        signals = pd.Series(False, index=primary_series.index)
-        
-        if len(primary_series) < self.min_data_points:
-            return signals
-        
-        # Process data sequentially - this is the crucial difference
-        # We simulate getting new candles one by one, like in live trading
-        for current_idx in range(self.min_data_points, len(primary_series)):
-            # Only use data available "up to now" - no future data!
-            historical_primary = primary_series.iloc[:current_idx].dropna()
-            historical_secondary = secondary_series.iloc[:current_idx]
-            
-            if len(historical_primary) < 50:
-                continue
-                
-            # Find pivots in ONLY the historical data we have so far
-            try:
-                absolute_prominence = historical_primary.mean() * self.bullish_pivot_prominence_pct
-                valley_indices_local, _ = find_peaks(
-                    -historical_primary, 
-                    prominence=absolute_prominence, 
-                    distance=self.bullish_pivot_distance
-                )
-                
-                if len(valley_indices_local) < 2:
-                    continue
-                    
-                # Convert to global indices
-                valley_indices_labels = historical_primary.index[valley_indices_local]
-                valley_indices_np = primary_series.index.get_indexer(valley_indices_labels)
-                
-                # Check for divergence using only the pivots we've found so far
-                current_signals = _find_divergence_signals_sequential(
-                    primary_series.iloc[:current_idx].to_numpy(), 
-                    secondary_series.iloc[:current_idx].to_numpy(),
-                    valley_indices_np, 
-                    self.lookback_period, 
-                    bullish_mode_str
-                )
-                
-                # Only update the signal for the current position if there's a new signal
-                if current_signals[-1] == 1:  # Signal at the latest position
-                    signals.iloc[current_idx-1] = True
-                    
-            except Exception:
-                # If pivot detection fails, continue to next iteration
-                continue
-                
-        return signals
+        return self._get_signals(primary_series, secondary_series, self.bullish_pivot_distance,
+                                 self.bullish_pivot_prominence_pct, True, bullish_mode_str)
 
     def get_bearish_signals(self, primary_series: pd.Series, secondary_series: pd.Series,
                            mode: Literal['regular', 'hidden'] = 'regular') -> pd.Series:
         """
-        Process data sequentially for bearish signals.
+        Bearish divergences between the peaks of the primary series, as seen in real-time.
         """
         bearish_mode_str = 'hidden_bearish' if mode == 'hidden' else 'bearish'
+        return self._get_signals(primary_series, secondary_series, self.bearish_pivot_distance,
+                                 self.bearish_pivot_prominence_pct, False, bearish_mode_str)
+
+    def get_batch_signals(self, primary: np.array, secondaries: np.array,
+                          mode: Literal['regular', 'hidden'] = 'regular') -> Tuple[np.array, np.array]:
+        """
+        Batch API for a whole whitelist in one compiled call: primary is a pairs x time array, secondaries
+        an indicators x pairs x time array (RSI, MACD...). Pairs with a shorter history are left-padded
+        with NaN. Returns the bullish and bearish signals, both indicators x pairs x time bool arrays,
+        the same as get_bullish_signals/get_bearish_signals on each row.
+        """
+        primary = np.ascontiguousarray(primary, dtype=np.float64)
+        secondaries = np.ascontiguousarray(secondaries, dtype=np.float64)
+        if primary.shape[-1] < self.min_data_points:
+            empty = np.zeros(secondaries.shape, dtype=bool)
+            return empty, empty.copy()
+
+        bullish = _find_batch_signals(
+            primary, secondaries, self.bullish_pivot_distance, self.bullish_pivot_prominence_pct, True,
+            'hidden_bullish' if mode == 'hidden' else 'bullish', self.lookback_period, self.min_data_points
+        )
+        bearish = _find_batch_signals(
+            primary, secondaries, self.bearish_pivot_distance, self.bearish_pivot_prominence_pct, False,
+            'hidden_bearish' if mode == 'hidden' else 'bearish', self.lookback_period, self.min_data_points
+        )
+        return bullish, bearish
+
+    def _get_signals(self, primary_series: pd.Series, secondary_series: pd.Series, pivot_distance: int,
+                     prominence_pct: float, is_valley: bool, mode_str: str) -> pd.Series:
+        """
+        Single pass (O(n)) version of replaying the candles one by one: the pivots are confirmed
+        pivot_distance candles after they formed, and a divergence is only signalled at that
+        confirmation candle, using the pivots already confirmed before it. No future data is used.
+        """
         signals = pd.Series(False, index=primary_series.index)
-        
         if len(primary_series) < self.min_data_points:
             return signals
-        
-        # Process data sequentially
-        for current_idx in range(self.min_data_points, len(primary_series)):
-            # Only use historical data
-            historical_primary = primary_series.iloc[:current_idx].dropna()
-            historical_secondary = secondary_series.iloc[:current_idx]
-            
-            if len(historical_primary) < 50:
-                continue
-                
-            # Find peaks in historical data only
-            try:
-                absolute_prominence = historical_primary.mean() * self.bearish_pivot_prominence_pct
-                peak_indices_local, _ = find_peaks(
-                    historical_primary, 
-                    prominence=absolute_prominence, 
-                    distance=self.bearish_pivot_distance
-                )
-                
-                if len(peak_indices_local) < 2:
-                    continue
-                    
-                # Convert to global indices
-                peak_indices_labels = historical_primary.index[peak_indices_local]
-                peak_indices_np = primary_series.index.get_indexer(peak_indices_labels)
-                
-                # Check for divergence
-                current_signals = _find_divergence_signals_sequential(
-                    primary_series.iloc[:current_idx].to_numpy(), 
-                    secondary_series.iloc[:current_idx].to_numpy(),
-                    peak_indices_np, 
-                    self.lookback_period, 
-                    bearish_mode_str
-                )
-                
-                # Only update if there's a new signal
-                if current_signals[-1] == -1:
-                    signals.iloc[current_idx-1] = True
-                    
-            except Exception:
-                continue
-                
+
+        primary = primary_series.to_numpy(dtype=np.float64)
+        secondary = secondary_series.to_numpy(dtype=np.float64)
+        pivot_indices = _find_confirmed_pivots(primary, pivot_distance, pivot_distance,
+                                               prominence_pct, is_valley)
+        if len(pivot_indices) < 2:
+            return signals
+
+        # Divergence of each pivot against the previous ones, known at its confirmation candle
+        pivot_signals = _find_divergence_signals_sequential(
+            primary, secondary, pivot_indices, self.lookback_period, mode_str
+        )
+        confirmation_indices = pivot_indices[pivot_signals[pivot_indices] != 0] + pivot_distance
+
+        # Same warmup as the candle by candle replay: enough candles, and 50 valid primary values
+        num_valid = np.cumsum(~np.isnan(primary))
+        confirmation_indices = confirmation_indices[
+            (confirmation_indices >= self.min_data_points - 1) & (num_valid[confirmation_indices] >= 50)
+        ]
+        signals.iloc[confirmation_indices] = True
         return signals
 
 class InformativeDivergenceProvider:
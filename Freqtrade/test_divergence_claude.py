@@ -0,0 +1,53 @@
+"""
+divergence_claude DivergenceEngine: the compiled scan, get_multi_signals and get_batch_signals give
+the same signals as the pandas rolling + nested Python loop detector they replaced.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+pytest.importorskip("numba")
+pytest.importorskip("freqtrade")
+
+from benchmark_divergence import make_candles, make_indicators, reference_detect
+from divergence_claude import DivergenceEngine
+
+
+YEARS = 0.01
+
+
+@pytest.mark.parametrize("mode", ["regular", "hidden"])
+def test_signals_match_reference(mode):
+    engine = DivergenceEngine()
+    df = make_candles(YEARS)
+    indicators = make_indicators(df)
+    multi = engine.get_multi_signals(df['close'], indicators, mode)
+    assert list(multi) == list(indicators)
+
+    for name, indicator in indicators.items():
+        bullish = reference_detect(engine, df['close'], indicator, True, mode)
+        bearish = reference_detect(engine, df['close'], indicator, False, mode)
+        assert bullish.any() and bearish.any()
+        pd.testing.assert_series_equal(engine.get_bullish_signals(df['close'], indicator, mode), bullish)
+        pd.testing.assert_series_equal(engine.get_bearish_signals(df['close'], indicator, mode), bearish)
+        pd.testing.assert_series_equal(multi[name][0], bullish, obj=f"{name} bullish")
+        pd.testing.assert_series_equal(multi[name][1], bearish, obj=f"{name} bearish")
+
+
+@pytest.mark.parametrize("mode", ["regular", "hidden"])
+def test_batch_signals_match_single_pair(mode):
+    engine = DivergenceEngine()
+    candles = [make_candles(YEARS, seed) for seed in range(1, 4)]
+    indicators = [make_indicators(df) for df in candles]
+    names = list(indicators[0])
+    price = np.stack([df['close'].to_numpy() for df in candles])
+    batch = np.stack([np.stack([pair_indicators[name].to_numpy() for pair_indicators in indicators]) for name in names])
+
+    bullish, bearish = engine.get_batch_signals(price, batch, mode)
+    assert bullish.shape == bearish.shape == batch.shape
+    for pair, df in enumerate(candles):
+        for k, name in enumerate(names):
+            indicator = indicators[pair][name]
+            assert np.array_equal(bullish[k, pair], engine.get_bullish_signals(df['close'], indicator, mode).to_numpy())
+            assert np.array_equal(bearish[k, pair], engine.get_bearish_signals(df['close'], indicator, mode).to_numpy())
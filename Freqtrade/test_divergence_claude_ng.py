@@ -0,0 +1,55 @@
+"""
+divergence_claude_ng DivergenceEngine: the pivots and the divergence signals must not use future
+candles, the signals on the first k candles are the first k signals of the full series.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+pytest.importorskip("numba")
+pytest.importorskip("freqtrade")
+
+from divergence_claude_ng import DivergenceEngine, _find_confirmed_pivots
+
+
+# Valleys at 2, 7 and 12, the last one is the shallowest (prominence 1.5)
+VALLEYS = np.array([10, 9, 8, 9, 10, 11, 10, 7, 10, 11, 12, 11, 10.5, 11, 12], dtype=np.float64)
+
+
+def make_series(seed: int, n: int = 600):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2024-01-01", periods=n, freq="1h", tz="UTC")
+    primary = pd.Series(100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.04, n))), index=index)
+    secondary = pd.Series(rng.uniform(20.0, 80.0, n), index=index)
+    return primary, secondary
+
+
+def test_pivot_positions():
+    assert list(_find_confirmed_pivots(VALLEYS, 2, 2, 0.1, True)) == [2, 7, 12]
+    # The valley at 12 is below 20% of the mean
+    assert list(_find_confirmed_pivots(VALLEYS, 2, 2, 0.2, True)) == [2, 7]
+    # A pivot is only known pivot_distance candles after it
+    assert list(_find_confirmed_pivots(VALLEYS[:9], 2, 2, 0.1, True)) == [2]
+    assert list(_find_confirmed_pivots(VALLEYS[:10], 2, 2, 0.1, True)) == [2, 7]
+    # Peaks of the mirrored series
+    assert list(_find_confirmed_pivots(20.0 - VALLEYS, 2, 2, 0.01, False)) == [2, 7, 12]
+    # A flat bottom is not a strict extremum
+    flat = VALLEYS.copy()
+    flat[6] = 7.0
+    assert list(_find_confirmed_pivots(flat, 2, 2, 0.1, True)) == [2, 12]
+
+
+@pytest.mark.parametrize("mode", ["regular", "hidden"])
+def test_signals_prefix_invariant(mode):
+    engine = DivergenceEngine()
+    primary, secondary = make_series(2)
+    bullish = engine.get_bullish_signals(primary, secondary, mode)
+    bearish = engine.get_bearish_signals(primary, secondary, mode)
+    assert bullish.any() and bearish.any()
+
+    for k in range(engine.min_data_points, len(primary) + 1):
+        prefix_bullish = engine.get_bullish_signals(primary.iloc[:k], secondary.iloc[:k], mode)
+        prefix_bearish = engine.get_bearish_signals(primary.iloc[:k], secondary.iloc[:k], mode)
+        pd.testing.assert_series_equal(prefix_bullish, bullish.iloc[:k])
+        pd.testing.assert_series_equal(prefix_bearish, bearish.iloc[:k])
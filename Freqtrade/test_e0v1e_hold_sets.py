@@ -0,0 +1,110 @@
+"""
+E0V1E_53_Sharpe per trade exit state: after a backtest every trade is closed, so no trade id
+may be left in tmp_hold / tmp_hold1.
+
+Backtesting calls order_filled before trade.close(), the closing fill has to be detected from
+the order. Runs a short backtest on synthetic 5m candles (markets are given to the exchange
+directly, nothing is downloaded).
+"""
+
+import pathlib
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+pytest.importorskip("talib")
+pytest.importorskip("pandas_ta")
+pytest.importorskip("freqtrade")
+
+from freqtrade.enums import RunMode
+from freqtrade.exchange import Exchange
+from freqtrade.optimize.backtesting import Backtesting
+
+
+STRATEGY_DIR = pathlib.Path(__file__).resolve().parent
+PAIRS = ["AAA/USDT", "BBB/USDT"]
+NUM_CANDLES = 6000
+
+
+def make_market(pair: str) -> dict:
+    base, quote = pair.split("/")
+    return {
+        "id": base + quote, "symbol": pair, "base": base, "quote": quote,
+        "active": True, "spot": True, "type": "spot",
+        "precision": {"price": 1e-8, "amount": 1e-8},
+        "limits": {
+            "amount": {"min": None, "max": None},
+            "cost": {"min": None, "max": None},
+            "price": {"min": None, "max": None},
+            "leverage": {"min": None, "max": None},
+        },
+        "info": {},
+    }
+
+
+def make_candles(seed: int) -> dict:
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2024-01-01", periods=NUM_CANDLES, freq="5min", tz="UTC")
+    candles = {}
+    for pair in PAIRS:
+        close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.006, NUM_CANDLES)))
+        open_ = np.concatenate([[close[0]], close[:-1]])
+        spread = np.abs(rng.normal(0.0, 0.002, NUM_CANDLES)) * close
+        candles[pair] = pd.DataFrame({
+            "date": dates,
+            "open": open_,
+            "high": np.maximum(open_, close) + spread,
+            "low": np.minimum(open_, close) - spread,
+            "close": close,
+            "volume": rng.uniform(100.0, 1000.0, NUM_CANDLES),
+        })
+    return candles
+
+
+def make_backtesting(tmp_path) -> Backtesting:
+    config = {
+        "runmode": RunMode.BACKTEST,
+        "strategy": "E0V1E_53_Sharpe",
+        "strategy_path": str(STRATEGY_DIR),
+        "user_data_dir": tmp_path,
+        "datadir": tmp_path,
+        "exchange": {"name": "binance", "pair_whitelist": PAIRS, "pair_blacklist": []},
+        "pairlists": [{"method": "StaticPairList"}],
+        "stake_currency": "USDT",
+        "stake_amount": 100,
+        "dry_run_wallet": 1000,
+        "max_open_trades": len(PAIRS),
+        "timeframe": "5m",
+        "dry_run": True,
+        "fee": 0.001,
+        "trading_mode": "spot",
+        "margin_mode": "",
+        "entry_pricing": {"price_side": "other"},
+        "exit_pricing": {"price_side": "other"},
+        "export": "none",
+    }
+    exchange = Exchange(config, validate=False)
+    exchange._markets = {pair: make_market(pair) for pair in PAIRS}
+    return Backtesting(config, exchange=exchange)
+
+
+def test_backtest_leaves_no_hold_ids(tmp_path):
+    backtesting = make_backtesting(tmp_path)
+    strategy = backtesting.strategylist[0]
+    backtesting._set_strategy(strategy)
+    processed = strategy.advise_all_indicators(make_candles(3))
+    dates = processed[PAIRS[0]]["date"]
+
+    results = backtesting.backtest(
+        processed=processed,
+        start_date=dates.iat[strategy.startup_candle_count].to_pydatetime(),
+        end_date=dates.iat[-1].to_pydatetime(),
+    )["results"]
+
+    # Trades went through custom_exit and closed on other exits than the ones consuming the ids
+    assert len(results) > 0
+    assert not results["is_open"].any()
+    assert set(results["exit_reason"]) - {"ma120_sell", "cross_120_or_240_sell"}
+    assert strategy.tmp_hold == set()
+    assert strategy.tmp_hold1 == set()
@@ -0,0 +1,99 @@
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import ccxt
+
+from signal_generator import get_account_status
+
+BALANCE_FIELDS = ('walletBalance', 'availableBalance', 'unrealizedProfit')
+
+
+def _positions_by_key(account_status: Optional[Dict[str, Any]]) -> Dict[tuple, Dict[str, Any]]:
+    if not account_status:
+        return {}
+    return {(p['symbol'], p['side']): p for p in account_status['open_positions']}
+
+
+def diff_account_status(previous: Optional[Dict[str, Any]], current: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    比较两次账户快照：新开 / 已平 / 数量变化的仓位，以及余额各项的变化量。
+    changed 只反映仓位增减和钱包余额变化；未实现盈亏（及随之变化的可用余额）随价格波动，不计入。
+    """
+    previous_positions = _positions_by_key(previous)
+    current_positions = _positions_by_key(current)
+
+    opened = [p for key, p in current_positions.items() if key not in previous_positions]
+    closed = [p for key, p in previous_positions.items() if key not in current_positions]
+    resized = [
+        p for key, p in current_positions.items()
+        if key in previous_positions and p['size'] != previous_positions[key]['size']
+    ]
+
+    previous_balance = previous['usdt_balance'] if previous else {}
+    balance_delta = {}
+    for field in BALANCE_FIELDS:
+        delta = float(current['usdt_balance'].get(field) or 0) - float(previous_balance.get(field) or 0)
+        if delta != 0:
+            balance_delta[field] = delta
+
+    return {
+        'opened': opened,
+        'closed': closed,
+        'resized': resized,
+        'balance_delta': balance_delta,
+        'changed': bool(opened or closed or resized or 'walletBalance' in balance_delta),
+    }
+
+
+class AccountState:
+    """
+    进程内共享的账户状态快照（余额 + 未平仓头寸）。
+
+    仓位监控按自己的频率刷新；分析任务读取时快照足够新就直接复用，
+    同一进程内不会对同一账户重复调用 fetch_balance / fetch_positions。
+    每次刷新与上一次快照比较，记录新开 / 已平 / 数量变化的仓位和钱包余额变化的日志；
+    refresh_with_diff 把这份差异交给仓位监控，用来决定哪些仓位需要重新评估。
+    """
+
+    def __init__(self, exchange: ccxt.Exchange):
+        self.exchange = exchange
+        self.logger = logging.getLogger("AccountState")
+        self.snapshot: Optional[Dict[str, Any]] = None
+        self.updated_at = 0.0
+        self._lock = threading.Lock()
+
+    def refresh(self) -> Dict[str, Any]:
+        """从交易所拉取最新账户状态；失败时返回带 error 的结果，不覆盖上一次的快照"""
+        return self.refresh_with_diff()[0]
+
+    def refresh_with_diff(self) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """同 refresh，另外返回与上一次快照的差异（diff_account_status）；拉取失败时差异为 None"""
+        with self._lock:
+            account_status = get_account_status(self.exchange)
+            if 'error' in account_status:
+                return account_status, None
+            diff = diff_account_status(self.snapshot, account_status)
+            self.snapshot = account_status
+            self.updated_at = time.monotonic()
+            if diff['changed']:
+                self._log_diff(diff)
+            return account_status, diff
+
+    def get(self, max_age_seconds: float) -> Dict[str, Any]:
+        """快照不超过 max_age_seconds 秒时直接返回，否则刷新"""
+        with self._lock:
+            if self.snapshot is not None and time.monotonic() - self.updated_at <= max_age_seconds:
+                return self.snapshot
+        return self.refresh()
+
+    def _log_diff(self, diff: Dict[str, Any]):
+        for p in diff['opened']:
+            self.logger.info(f"新仓位: {p['symbol']} {p['side'].upper()} 数量 {p['size']} 开仓价 {p['entryPrice']}")
+        for p in diff['closed']:
+            self.logger.info(f"仓位已平: {p['symbol']} {p['side'].upper()}")
+        for p in diff['resized']:
+            self.logger.info(f"仓位数量变化: {p['symbol']} {p['side'].upper()} -> {p['size']}")
+        if 'walletBalance' in diff['balance_delta']:
+            self.logger.info(f"钱包余额变化: {diff['balance_delta']['walletBalance']:+.4f} USDT")
@@ -1,22 +1,34 @@
-import schedule
-import time
+import asyncio
 import logging
 import json
+import threading
 import ccxt
-import subprocess
-import sys
 
 import config
-from signal_generator import SignalGenerator, get_account_status, get_atr_info
+from signal_generator import SignalGenerator, get_account_status, get_atr_info, cached_closes, prune_closed_candle_cache
+from universe_screener import screen_universe
+from candle_clock import CandleClock
+from account_state import AccountState
+from portfolio_risk import RETURNS_TIMEFRAME, apply_portfolio_limits
+from position_monitor import (
+    check_positions, forget_changed_positions, monitor_interval, update_high_profit_flag,
+)
 from dingtalk_notifier import send_dingtalk_markdown
-from logger_config import setup_main_logger
+from logger_config import setup_main_logger, setup_position_monitor_logger
 from notification_system import (
     emit_trade_signal, emit_position_update, emit_market_analysis,
     StrategyType, TradeDirection
 )
 
 # --- 新的事件驱动通知系统已替换原有的日志解析方式 ---
-def manage_virtual_trade(symbol, final_decision, analysis_data, decision_reason=""):
+def submit_trade_signal(signals, **signal):
+    """开仓信号：传入 signals 列表时收集起来交给组合风控统一调整仓位，否则直接发送"""
+    if signals is None:
+        emit_trade_signal(**signal)
+    else:
+        signals.append(signal)
+
+def manage_virtual_trade(symbol, final_decision, analysis_data, decision_reason="", signals=None):
     """
     管理虚拟交易：根据信号开仓，或根据市场情况调整现有仓位的止损。
     """
@@ -82,7 +94,8 @@ def manage_virtual_trade(symbol, final_decision, analysis_data, decision_reason=
             # 使用新的通知系统发送反转信号
             signal_reason = f"检测到反转信号 - 当前持仓: {position_side.upper()}, 新信号: {direction.value}"
             
-            emit_trade_signal(
+            submit_trade_signal(
+                signals,
                 symbol=symbol,
                 strategy_type=StrategyType.POSITION_REVERSAL,
                 direction=direction,
@@ -222,7 +235,8 @@ def manage_virtual_trade(symbol, final_decision, analysis_data, decision_reason=
         if not decision_reason:
             decision_reason = "趋势跟踪策略 - 三重时间框架共振确认"
         
-        emit_trade_signal(
+        submit_trade_signal(
+            signals,
             symbol=symbol,
             strategy_type=StrategyType.TREND_FOLLOWING,
             direction=direction,
@@ -244,7 +258,7 @@ def manage_virtual_trade(symbol, final_decision, analysis_data, decision_reason=
         
         logger.warning(f"新开仓信号: {symbol} {direction.value}")  # 简化日志
 
-def manage_reversal_virtual_trade(symbol, final_decision, analysis_data, decision_reason=""):
+def manage_reversal_virtual_trade(symbol, final_decision, analysis_data, decision_reason="", signals=None):
     """
     管理激进反转策略的虚拟交易：使用更小的风险敞口和更紧的止损。
     """
@@ -300,7 +314,8 @@ def manage_reversal_virtual_trade(symbol, final_decision, analysis_data, decisio
     if not decision_reason:
         decision_reason = "激进反转策略 - RSI极值 + 布林带突破"
     
-    emit_trade_signal(
+    submit_trade_signal(
+        signals,
         symbol=symbol,
         strategy_type=StrategyType.REVERSAL,
         direction=direction,
@@ -322,142 +337,202 @@ def manage_reversal_virtual_trade(symbol, final_decision, analysis_data, decisio
     
     logger.warning(f"激进反转信号: {symbol} {direction.value}")  # 简化日志
 
-def run_multi_symbol_analysis():
-    """遍历多个交易对，执行三重时间周期信号分析 (1d, 4h, 1h)。"""
-    # --- 1. 初始化交易所并获取一次性数据 ---
-    logger = logging.getLogger("Analyzer")
-    logger.info("初始化交易所实例...")
+def create_exchange() -> ccxt.binance:
+    """创建币安期货交易所实例"""
     exchange_config = {
         'apiKey': config.API_KEY,
         'secret': config.SECRET_KEY,
         'options': {'defaultType': 'future'},
     }
     if config.PROXY:
-        logger.info(f"使用代理: {config.PROXY}")
+        logging.getLogger("Analyzer").info(f"使用代理: {config.PROXY}")
         exchange_config['proxies'] = {'http': config.PROXY, 'https': config.PROXY}
-    
-    exchange = ccxt.binance(exchange_config)
+    return ccxt.binance(exchange_config)
+
+class SharedExchange:
+    """
+    分析任务与仓位监控共用的交易所客户端：同一个 ccxt 实例（同一份限速额度），
+    来自不同线程的请求逐个执行（ccxt 同步客户端不保证线程安全）。
+    """
+
+    def __init__(self, exchange: ccxt.Exchange):
+        self._exchange = exchange
+        self._lock = threading.RLock()
+
+    def __getattr__(self, name):
+        attr = getattr(self._exchange, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            with self._lock:
+                return attr(*args, **kwargs)
+        return call
+
+def run_multi_symbol_analysis(close_time_ms=None, exchange=None, account_state=None):
+    """
+    遍历多个交易对，执行三重时间周期信号分析 (1d, 4h, 1h)。
+    close_time_ms 为触发本轮分析的K线收盘时刻（交易所时间），各周期只分析截至该时刻已收盘的K线。
+    exchange / account_state 由运行时传入时复用共享的交易所客户端和账户快照。
+    """
+    # --- 1. 初始化交易所并获取一次性数据 ---
+    logger = logging.getLogger("Analyzer")
+    if exchange is None:
+        logger.info("初始化交易所实例...")
+        exchange = create_exchange()
     
     logger.info("获取当前账户状态...")
-    account_status = get_account_status(exchange)
+    if account_state is not None:
+        # 仓位监控最多每 MONITOR_INTERVAL_NO_POSITION 秒刷新一次，快照足够新时不再重复请求
+        account_status = account_state.get(config.MONITOR_INTERVAL_NO_POSITION)
+    else:
+        account_status = get_account_status(exchange)
     if 'error' in account_status:
         logger.error(f"无法获取账户状态，分析中止: {account_status['error']}")
-        return
-
-    # --- 2. 循环分析每个交易对 ---
-    logging.info(f"开始分析 {len(config.SYMBOLS_TO_ANALYZE)} 个交易对: {', '.join(config.SYMBOLS_TO_ANALYZE)}")
+        return 0
+
+    # --- 2. 预筛选本轮要分析的交易对 ---
+    symbols = config.SYMBOLS_TO_ANALYZE
+    funding_rates = {}
+    if config.UNIVERSE_SCREEN_CONFIG["enabled"]:
+        try:
+            candidates = screen_universe(exchange)
+            symbols = [c['symbol'] for c in candidates]
+            funding_rates = {c['symbol']: {'fundingRate': c['funding_rate']} for c in candidates}
+        except Exception as e:
+            logger.error(f"预筛选失败，改用 SYMBOLS_TO_ANALYZE: {e}", exc_info=True)
+
+    # 已收盘K线缓存只保留本轮交易对和持仓（仓位监控取 ATR）
+    removed = prune_closed_candle_cache([*symbols, *(p['symbol'] for p in account_status.get('open_positions', []))])
+    if removed:
+        logger.debug(f"清理 {removed} 条不在本轮的K线缓存")
+
+    # --- 3. 循环分析每个交易对 ---
+    logging.info(f"开始分析 {len(symbols)} 个交易对: {', '.join(symbols)}")
+    # 开启组合风控时先收集本轮所有开仓信号，分析结束后统一调整仓位再发送
+    signals = [] if config.PORTFOLIO_RISK_CONFIG["enabled"] else None
     
-    for symbol in config.SYMBOLS_TO_ANALYZE:
-        logging.info(f"=== 开始分析: {symbol} ")
-        
-        # 为当前交易对获取ATR信息
-        logging.info(f"--- 0. [{symbol}] 获取ATR信息 ---")
-        atr_info = get_atr_info(symbol, exchange)
-        if 'error' in atr_info:
-            logging.warning(f"无法获取 [{symbol}] 的ATR信息: {atr_info['error']}，将继续分析。")
-        else:
-            atr_val = atr_info.get('atr')
-            tf = atr_info.get('timeframe')
-            length = atr_info.get('length')
-            logging.info(f"[{symbol}] 的ATR(周期:{tf}, 长度:{length})值为: {atr_val}")
-
-        # 1. 战略层面：日线图 (1d)
-        logging.info(f"--- 1. [{symbol}] 分析战略层面 (日线图) ---")
-        daily_signal_gen = SignalGenerator(symbol=symbol, timeframe='1d', exchange=exchange)
-        daily_analysis = daily_signal_gen.generate_signal(account_status, atr_info)
-        if not (daily_analysis and 'error' not in daily_analysis):
-            logging.error(f"无法完成 [{symbol}] 的战略层面分析，已跳过。")
-            continue
-
-        # 创建不包含账户信息的分析结果副本用于日志输出
-        daily_analysis_log = {k: v for k, v in daily_analysis.items() if k not in ['account_status']}
-        daily_analysis_str = json.dumps(daily_analysis_log, indent=4, default=str, ensure_ascii=False)
-        logging.info(f"[{symbol}] 日线分析结果: {daily_analysis_str}")
-        is_long_term_bullish = daily_analysis.get('total_score', 0) > 0
-        long_term_direction = "看多" if is_long_term_bullish else "看空/震荡"
-        logging.info(f"[{symbol}] 长期趋势判断: {long_term_direction}")
-
-        # 2. 战术层面：4小时图 (4h)
-        logging.info(f"--- 2. [{symbol}] 分析战术层面 (4小时图) ---")
-        h4_signal_gen = SignalGenerator(symbol=symbol, timeframe='4h', exchange=exchange)
-        h4_analysis = h4_signal_gen.generate_signal(account_status, atr_info)
-        if not (h4_analysis and 'error' not in h4_analysis):
-            logging.error(f"无法完成 [{symbol}] 的战术层面分析，已跳过。")
-            continue
-
-        # 创建不包含账户信息的分析结果副本用于日志输出
-        h4_analysis_log = {k: v for k, v in h4_analysis.items() if k not in ['account_status']}
-        h4_analysis_str = json.dumps(h4_analysis_log, indent=4, default=str, ensure_ascii=False)
-        logging.info(f"[{symbol}] 4小时线分析结果: {h4_analysis_str}")
-        is_mid_term_bullish = h4_analysis.get('total_score', 0) > 0
-
-        # 3. 执行层面：1小时图 (1h)
-        logging.info(f"--- 3. [{symbol}] 分析执行层面 (1小时图) ---")
-        h1_signal_gen = SignalGenerator(symbol=symbol, timeframe='1h', exchange=exchange)
-        h1_analysis = h1_signal_gen.generate_signal(account_status, atr_info)
-        if not (h1_analysis and 'error' not in h1_analysis):
-            logging.error(f"无法完成 [{symbol}] 的执行层面分析，已跳过。")
-            continue
-
-        # 创建不包含账户信息的分析结果副本用于日志输出
-        h1_analysis_log = {k: v for k, v in h1_analysis.items() if k not in ['account_status']}
-        h1_analysis_str = json.dumps(h1_analysis_log, indent=4, default=str, ensure_ascii=False)
-        logging.info(f"[{symbol}] 1小时线分析结果: {h1_analysis_str}")
-        h1_signal = h1_analysis.get('signal', 'NEUTRAL')
-
-        # 4. 最终决策：三重时间周期过滤 + 激进策略
-        logging.info(f"--- 4. [{symbol}] 最终决策 (三重过滤 + 激进策略) ---")
-        final_decision = "HOLD"
-        reversal_signal = h1_analysis.get('reversal_signal', 'NONE')
+    try:
+        for symbol in symbols:
+            logging.info(f"=== 开始分析: {symbol} ")
         
-        decision_reason = ""  # 初始化决策原因
+            # 为当前交易对获取ATR信息
+            logging.info(f"--- 0. [{symbol}] 获取ATR信息 ---")
+            atr_info = get_atr_info(symbol, exchange, close_time_ms)
+            if 'error' in atr_info:
+                logging.warning(f"无法获取 [{symbol}] 的ATR信息: {atr_info['error']}，将继续分析。")
+            else:
+                atr_val = atr_info.get('atr')
+                tf = atr_info.get('timeframe')
+                length = atr_info.get('length')
+                logging.info(f"[{symbol}] 的ATR(周期:{tf}, 长度:{length})值为: {atr_val}")
+
+            # 1. 战略层面：日线图 (1d)
+            logging.info(f"--- 1. [{symbol}] 分析战略层面 (日线图) ---")
+            daily_signal_gen = SignalGenerator(symbol=symbol, timeframe='1d', exchange=exchange, close_time_ms=close_time_ms)
+            daily_analysis = daily_signal_gen.generate_signal(account_status, atr_info, funding_rates.get(symbol))
+            if not (daily_analysis and 'error' not in daily_analysis):
+                logging.error(f"无法完成 [{symbol}] 的战略层面分析，已跳过。")
+                continue
+
+            # 创建不包含账户信息的分析结果副本用于日志输出
+            daily_analysis_log = {k: v for k, v in daily_analysis.items() if k not in ['account_status']}
+            daily_analysis_str = json.dumps(daily_analysis_log, indent=4, default=str, ensure_ascii=False)
+            logging.info(f"[{symbol}] 日线分析结果: {daily_analysis_str}")
+            is_long_term_bullish = daily_analysis.get('total_score', 0) > 0
+            long_term_direction = "看多" if is_long_term_bullish else "看空/震荡"
+            logging.info(f"[{symbol}] 长期趋势判断: {long_term_direction}")
+
+            # 2. 战术层面：4小时图 (4h)
+            logging.info(f"--- 2. [{symbol}] 分析战术层面 (4小时图) ---")
+            h4_signal_gen = SignalGenerator(symbol=symbol, timeframe='4h', exchange=exchange, close_time_ms=close_time_ms)
+            h4_analysis = h4_signal_gen.generate_signal(account_status, atr_info, funding_rates.get(symbol))
+            if not (h4_analysis and 'error' not in h4_analysis):
+                logging.error(f"无法完成 [{symbol}] 的战术层面分析，已跳过。")
+                continue
+
+            # 创建不包含账户信息的分析结果副本用于日志输出
+            h4_analysis_log = {k: v for k, v in h4_analysis.items() if k not in ['account_status']}
+            h4_analysis_str = json.dumps(h4_analysis_log, indent=4, default=str, ensure_ascii=False)
+            logging.info(f"[{symbol}] 4小时线分析结果: {h4_analysis_str}")
+            is_mid_term_bullish = h4_analysis.get('total_score', 0) > 0
+
+            # 3. 执行层面：1小时图 (1h)
+            logging.info(f"--- 3. [{symbol}] 分析执行层面 (1小时图) ---")
+            h1_signal_gen = SignalGenerator(symbol=symbol, timeframe='1h', exchange=exchange, close_time_ms=close_time_ms)
+            h1_analysis = h1_signal_gen.generate_signal(account_status, atr_info, funding_rates.get(symbol))
+            if not (h1_analysis and 'error' not in h1_analysis):
+                logging.error(f"无法完成 [{symbol}] 的执行层面分析，已跳过。")
+                continue
+
+            # 创建不包含账户信息的分析结果副本用于日志输出
+            h1_analysis_log = {k: v for k, v in h1_analysis.items() if k not in ['account_status']}
+            h1_analysis_str = json.dumps(h1_analysis_log, indent=4, default=str, ensure_ascii=False)
+            logging.info(f"[{symbol}] 1小时线分析结果: {h1_analysis_str}")
+            h1_signal = h1_analysis.get('signal', 'NEUTRAL')
+
+            # 4. 最终决策：三重时间周期过滤 + 激进策略
+            logging.info(f"--- 4. [{symbol}] 最终决策 (三重过滤 + 激进策略) ---")
+            final_decision = "HOLD"
+            reversal_signal = h1_analysis.get('reversal_signal', 'NONE')
         
-        # 主策略：三重时间周期过滤
-        if is_long_term_bullish and is_mid_term_bullish and h1_signal in ['STRONG_BUY', 'WEAK_BUY']:
-            final_decision = "EXECUTE_LONG"
-            decision_reason = f"[{symbol}] 1d, 4h趋势看多，且1h出现买入信号"
-            logging.warning(f"决策: {final_decision} - 原因: {decision_reason}")
-        elif not is_long_term_bullish and not is_mid_term_bullish and h1_signal in ['STRONG_SELL', 'WEAK_SELL']:
-            final_decision = "EXECUTE_SHORT"
-            decision_reason = f"[{symbol}] 1d, 4h趋势看空，且1h出现卖出信号"
-            logging.warning(f"决策: {final_decision} - 原因: {decision_reason}")
+            decision_reason = ""  # 初始化决策原因
         
-        # 激进策略：反转交易（独立于主策略）
-        elif reversal_signal in ['EXECUTE_REVERSAL_LONG', 'EXECUTE_REVERSAL_SHORT']:
-            if reversal_signal == 'EXECUTE_REVERSAL_LONG':
+            # 主策略：三重时间周期过滤
+            if is_long_term_bullish and is_mid_term_bullish and h1_signal in ['STRONG_BUY', 'WEAK_BUY']:
                 final_decision = "EXECUTE_LONG"
-                decision_reason = f"[{symbol}] 激进反转策略 - RSI严重超卖且触及布林下轨"
+                decision_reason = f"[{symbol}] 1d, 4h趋势看多，且1h出现买入信号"
                 logging.warning(f"决策: {final_decision} - 原因: {decision_reason}")
-            else:
+            elif not is_long_term_bullish and not is_mid_term_bullish and h1_signal in ['STRONG_SELL', 'WEAK_SELL']:
                 final_decision = "EXECUTE_SHORT"
-                decision_reason = f"[{symbol}] 激进反转策略 - RSI严重超买且触及布林上轨"
+                decision_reason = f"[{symbol}] 1d, 4h趋势看空，且1h出现卖出信号"
                 logging.warning(f"决策: {final_decision} - 原因: {decision_reason}")
         
-        else:
-            reason = f"1d({long_term_direction}) | 4h({'看多' if is_mid_term_bullish else '看空'}) | 1h({h1_signal}) | 反转({reversal_signal})"
-            logging.info(f"决策: {final_decision} - 原因: [{symbol}] 无符合条件的交易信号 ({reason})。建议观望。")
+            # 激进策略：反转交易（独立于主策略）
+            elif reversal_signal in ['EXECUTE_REVERSAL_LONG', 'EXECUTE_REVERSAL_SHORT']:
+                if reversal_signal == 'EXECUTE_REVERSAL_LONG':
+                    final_decision = "EXECUTE_LONG"
+                    decision_reason = f"[{symbol}] 激进反转策略 - RSI严重超卖且触及布林下轨"
+                    logging.warning(f"决策: {final_decision} - 原因: {decision_reason}")
+                else:
+                    final_decision = "EXECUTE_SHORT"
+                    decision_reason = f"[{symbol}] 激进反转策略 - RSI严重超买且触及布林上轨"
+                    logging.warning(f"决策: {final_decision} - 原因: {decision_reason}")
+        
+            else:
+                reason = f"1d({long_term_direction}) | 4h({'看多' if is_mid_term_bullish else '看空'}) | 1h({h1_signal}) | 反转({reversal_signal})"
+                logging.info(f"决策: {final_decision} - 原因: [{symbol}] 无符合条件的交易信号 ({reason})。建议观望。")
             
-            # 详细调试信息
-            daily_score = daily_analysis.get('total_score', 0)
-            h4_score = h4_analysis.get('total_score', 0)
-            logging.info(f"[{symbol}] 详细评分: 日线={daily_score}, 4h线={h4_score}, 1h信号={h1_signal}")
-            logging.info(f"[{symbol}] 做多条件检查: 1d看多({is_long_term_bullish}) && 4h看多({is_mid_term_bullish}) && 1h买入({h1_signal in ['STRONG_BUY', 'WEAK_BUY']})")
-            logging.info(f"[{symbol}] 做空条件检查: 1d看空({not is_long_term_bullish}) && 4h看空({not is_mid_term_bullish}) && 1h卖出({h1_signal in ['STRONG_SELL', 'WEAK_SELL']})")
+                # 详细调试信息
+                daily_score = daily_analysis.get('total_score', 0)
+                h4_score = h4_analysis.get('total_score', 0)
+                logging.info(f"[{symbol}] 详细评分: 日线={daily_score}, 4h线={h4_score}, 1h信号={h1_signal}")
+                logging.info(f"[{symbol}] 做多条件检查: 1d看多({is_long_term_bullish}) && 4h看多({is_mid_term_bullish}) && 1h买入({h1_signal in ['STRONG_BUY', 'WEAK_BUY']})")
+                logging.info(f"[{symbol}] 做空条件检查: 1d看空({not is_long_term_bullish}) && 4h看空({not is_mid_term_bullish}) && 1h卖出({h1_signal in ['STRONG_SELL', 'WEAK_SELL']})")
             
-        # 5. 管理虚拟交易（开仓或追踪止损）
-        # 创建包含正确ATR信息的分析数据（使用原始atr_info，不是h1时间框架的ATR）
-        trade_analysis_data = h1_analysis.copy()
-        trade_analysis_data['atr_info'] = atr_info  # 使用正确的ATR配置（可能是1d或4h）
+            # 5. 管理虚拟交易（开仓或追踪止损）
+            # 创建包含正确ATR信息的分析数据（使用原始atr_info，不是h1时间框架的ATR）
+            trade_analysis_data = h1_analysis.copy()
+            trade_analysis_data['atr_info'] = atr_info  # 使用正确的ATR配置（可能是1d或4h）
         
-        # 为激进策略使用不同的风险参数
-        if reversal_signal in ['EXECUTE_REVERSAL_LONG', 'EXECUTE_REVERSAL_SHORT']:
-            manage_reversal_virtual_trade(symbol, final_decision, trade_analysis_data, decision_reason)
-        else:
-            manage_virtual_trade(symbol, final_decision, trade_analysis_data, decision_reason)
+            # 为激进策略使用不同的风险参数
+            if reversal_signal in ['EXECUTE_REVERSAL_LONG', 'EXECUTE_REVERSAL_SHORT']:
+                manage_reversal_virtual_trade(symbol, final_decision, trade_analysis_data, decision_reason, signals)
+            else:
+                manage_virtual_trade(symbol, final_decision, trade_analysis_data, decision_reason, signals)
 
-        logging.info(f"==完成分析: {symbol} \n")
+            logging.info(f"==完成分析: {symbol} \n")
+    finally:
+        # --- 4. 组合风控：按相关性、总敞口和保证金统一调整本轮开仓信号的仓位 ---
+        # 中途某个交易对出错时，已收集的信号照常发送，异常仍交给 run_analysis_and_notify 记录
+        if signals:
+            closes = {s['symbol']: cached_closes(s['symbol'], RETURNS_TIMEFRAME) for s in signals}
+            for signal in apply_portfolio_limits(signals, account_status, closes):
+                emit_trade_signal(**signal)
 
-def run_analysis_and_notify():
+    return len(symbols)
+
+def run_analysis_and_notify(close_time_ms=None, exchange=None, account_state=None):
     """
     简化的包装器函数：执行分析并发送市场摘要。
     交易信号和持仓更新现在通过独立的通知系统发送。
@@ -465,11 +540,12 @@ def run_analysis_and_notify():
     signals_count = 0
     alerts_count = 0
     errors_count = 0
+    analyzed_symbols_count = 0
     
     try:
         # 执行核心分析函数
         logging.info("开始执行多交易对分析...")
-        run_multi_symbol_analysis()
+        analyzed_symbols_count = run_multi_symbol_analysis(close_time_ms, exchange, account_state)
         logging.info("多交易对分析完成")
         
     except Exception as e:
@@ -477,7 +553,6 @@ def run_analysis_and_notify():
         errors_count = 1
     
     # 发送简化的市场分析摘要
-    analyzed_symbols_count = len(config.SYMBOLS_TO_ANALYZE)
     
     # 只在没有重要信号时发送摘要（重要信号已通过独立通知系统发送）
     emit_market_analysis(
@@ -487,9 +562,75 @@ def run_analysis_and_notify():
         errors_count=errors_count
     )
 
+async def analysis_task(clock, exchange, account_state):
+    """每根1h K线收盘时（交易所时间）执行一次分析；4h/1d 收盘与整点重合"""
+    loop = asyncio.get_running_loop()
+    close_time_ms = clock.now_ms()  # 立即执行一次（分析最近已收盘的K线）
+    while True:
+        # 拉取K线和计算指标在线程池中执行，不阻塞仓位监控
+        await loop.run_in_executor(None, run_analysis_and_notify, close_time_ms, exchange, account_state)
+        close_time_ms = await clock.wait_for_close('1h')
+
+async def monitor_task(clock, exchange, account_state):
+    """
+    仓位监控：刷新共享的账户快照，检查止损并给出追踪止损建议。
+    每轮都检查每个仓位的止损单；新开 / 数量变化的仓位（账户快照差异）、止损价变化或标记价格
+    变动超过阈值的仓位才重新评估（请求行情和ATR）。
+    """
+    logger = logging.getLogger("PositionMonitor")
+    logger.info("--- 智能仓位监控任务已启动 (可获取真实止损位) ---")
+    loop = asyncio.get_running_loop()
+    last_checked = {}
+    has_high_profit_position = False
+    while True:
+        interval = config.MONITOR_INTERVAL_SECONDS
+        try:
+            account_status, account_diff = await loop.run_in_executor(None, account_state.refresh_with_diff)
+            open_positions = account_status.get('open_positions', [])
+            if 'error' in account_status:
+                logger.error(f"无法获取账户状态: {account_status['error']}")
+                # 期间分析任务可能刷新过快照，这几轮的差异没有经过监控，恢复后全部重新评估
+                last_checked.clear()
+                interval = 60
+            elif not open_positions:
+                last_checked.clear()
+                logger.info("当前无持仓，降低监控频率...")
+                interval = config.MONITOR_INTERVAL_NO_POSITION
+            else:
+                forget_changed_positions(account_diff, last_checked)
+                checked_flag, evaluated_keys = await loop.run_in_executor(
+                    None, check_positions, exchange, open_positions, clock.now_ms(), last_checked
+                )
+                has_high_profit_position = update_high_profit_flag(
+                    has_high_profit_position, checked_flag, len(evaluated_keys), len(open_positions)
+                )
+                interval = monitor_interval(has_high_profit_position)
+        except ccxt.NetworkError as e:
+            logger.error(f"监控时发生网络错误: {e}")
+            last_checked.clear()  # 评估中断，下一轮全部重新检查
+        except Exception as e:
+            logger.error(f"监控循环发生未知错误: {e}", exc_info=True)
+            last_checked.clear()
+        await asyncio.sleep(interval)
+
+async def run_runtime():
+    """
+    分析任务与仓位监控作为同一进程中的两个协程运行：
+    共用一个交易所客户端（一份限速额度）、一份账户快照和K线缓存。
+    """
+    exchange = SharedExchange(create_exchange())
+    loop = asyncio.get_running_loop()
+    clock = await loop.run_in_executor(None, CandleClock, exchange)
+    account_state = AccountState(exchange)
+    logging.info(f"主分析任务将在每根1h K线收盘后执行（本地时钟偏差 {clock.offset_ms:.0f}ms）...")
+    await asyncio.gather(
+        analysis_task(clock, exchange, account_state),
+        monitor_task(clock, exchange, account_state),
+    )
+
 # --- 主程序入口 (修改定时任务的目标) ---
 def main():
-    """主函数 - 设置定时任务并启动独立监控进程"""
+    """主函数 - 在同一进程中运行定时分析和仓位监控"""
     # --- 使用新的日志配置系统 ---
     logger = setup_main_logger()
     
@@ -500,34 +641,17 @@ def main():
 
     logging.info("=== 交易信号分析系统启动 (主程序) ===")
 
-    # --- 启动独立的监控脚本作为子进程 ---
-    monitor_process = None
-    try:
-        logging.info("正在启动独立的仓位监控进程...")
-        monitor_process = subprocess.Popen([sys.executable, "position_monitor.py"])
-        logging.info(f"仓位监控进程已启动，PID: {monitor_process.pid}")
-
-        # --- 设置并运行主分析任务的定时调度 ---
-        logging.info(f"主分析任务将每小时的{config.RUN_AT_MINUTE}分执行一次分析...")
-        
-        # --- 关键修改：将定时任务的目标指向新的包装器函数 ---
-        run_analysis_and_notify() # 立即执行一次
-        schedule.every().hour.at(config.RUN_AT_MINUTE).do(run_analysis_and_notify)
-        
-        while True:
-            schedule.run_pending()
-            time.sleep(1)
+    # 仓位监控的日志仍写入单独的日志文件
+    monitor_logger = logging.getLogger("PositionMonitor")
+    monitor_logger.handlers = setup_position_monitor_logger().handlers
+    monitor_logger.propagate = False
 
+    try:
+        asyncio.run(run_runtime())
     except KeyboardInterrupt:
         logging.info("\n\n主程序被手动停止运行")
     except Exception as e:
         logging.error(f"主程序发生严重错误: {e}", exc_info=True)
-    finally:
-        if monitor_process:
-            logging.info("正在终止仓位监控进程...")
-            monitor_process.terminate()
-            monitor_process.wait()
-            logging.info("仓位监控进程已终止。")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,65 @@
+import asyncio
+import logging
+import time
+
+import ccxt
+
+import config
+
+
+def timeframe_ms(timeframe: str) -> int:
+    return ccxt.Exchange.parse_timeframe(timeframe) * 1000
+
+
+def last_closed_candle(timeframe: str, close_time_ms: int) -> int:
+    """在 close_time_ms（交易所时间）时刻，最近一根已收盘K线的开盘时间戳"""
+    tf_ms = timeframe_ms(timeframe)
+    return (close_time_ms // tf_ms - 1) * tf_ms
+
+
+class CandleClock:
+    """
+    以交易所服务器时间为准的K线收盘时钟。
+
+    本地时钟可能有漂移，按本地整点调度会在K线收盘前触发（拿到未收盘K线）或白白多等。
+    这里用 fetch_time 估算本地与服务器的时间差（取请求往返的中点），
+    先粗略等待到收盘前，再重新对时后精确等待到收盘时刻。
+    """
+
+    def __init__(self, exchange: ccxt.Exchange):
+        self.exchange = exchange
+        self.logger = logging.getLogger("CandleClock")
+        self.offset_ms = 0
+        self.sync()
+
+    def sync(self):
+        """与交易所对时，失败时保留上一次的时间差"""
+        try:
+            local_before = time.time() * 1000
+            server_time = self.exchange.fetch_time()
+            local_after = time.time() * 1000
+            self.offset_ms = server_time - (local_before + local_after) / 2
+            self.logger.debug(f"交易所对时完成，本地时钟偏差 {self.offset_ms:.0f}ms，往返 {local_after - local_before:.0f}ms")
+        except Exception as e:
+            self.logger.warning(f"交易所对时失败，沿用上次偏差 {self.offset_ms:.0f}ms: {e}")
+
+    def now_ms(self) -> int:
+        return int(time.time() * 1000 + self.offset_ms)
+
+    async def wait_for_close(self, timeframe: str = '1h') -> int:
+        """等待到下一根K线收盘（交易所时间），返回收盘时刻的时间戳(ms)"""
+        loop = asyncio.get_running_loop()
+        tf_ms = timeframe_ms(timeframe)
+        now_ms = self.now_ms()
+        close_time = (now_ms // tf_ms + 1) * tf_ms
+
+        # 粗等待：到收盘前 resync 秒重新对时，修正长时间睡眠累积的漂移
+        coarse_wait = close_time - now_ms - config.CANDLE_CLOCK_CONFIG["resync_before_close_ms"]
+        if coarse_wait > 0:
+            await asyncio.sleep(coarse_wait / 1000)
+            await loop.run_in_executor(None, self.sync)
+
+        remaining = close_time + config.CANDLE_CLOCK_CONFIG["close_delay_ms"] - self.now_ms()
+        if remaining > 0:
+            await asyncio.sleep(remaining / 1000)
+        return close_time
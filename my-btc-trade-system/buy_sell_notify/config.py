@@ -36,15 +36,33 @@ SYMBOLS_TO_ANALYZE = [
     # 'WIF/USDT'
 ]
 
+# --- Universe Screening Settings ---
+# 每轮分析前用两次批量请求（24h行情 + 资金费率）对全部USDT永续合约预筛选，
+# 只分析得分最高的 top_k 个；SYMBOLS_TO_ANALYZE 中的交易对始终保留。
+UNIVERSE_SCREEN_CONFIG = {
+    "enabled": True,
+    "top_k": 16,                      # 每轮进入多周期分析的交易对数量
+    "min_quote_volume": 50_000_000,   # 24h成交额下限(USDT)，过滤流动性差的合约
+    "weights": {
+        "volume": 1.0,                # 成交额排名
+        "volatility": 1.0,            # 24h振幅排名（ATR的近似）
+        "funding": 0.5,               # 资金费率绝对值排名（情绪极端）
+    },
+}
+
 # --- Scheduler Settings ---
-# Time to run the analysis every hour. Use ":01" for the 1st minute of the hour.
-RUN_AT_MINUTE = ":01"
+# 分析在每根1h K线收盘时触发，以币安服务器时间为准（不依赖本地时钟）
+CANDLE_CLOCK_CONFIG = {
+    "close_delay_ms": 200,            # 收盘后等待的毫秒数，留给交易所完成K线
+    "resync_before_close_ms": 5000,   # 收盘前多久重新对时
+}
 
 # --- Monitoring Settings ---
 # 智能监控频率：有持仓时更频繁，无持仓时降低频率节省资源
 MONITOR_INTERVAL_SECONDS = 10  # 基础监控间隔10秒 (原15秒)
 MONITOR_INTERVAL_NO_POSITION = 60  # 无持仓时60秒检查一次
 MONITOR_INTERVAL_HIGH_PROFIT = 5   # 高盈利时5秒检查一次
+MONITOR_PRICE_TOLERANCE = 0.001    # 止损价不变且标记价格变动不超过0.1%的仓位只检查止损单，不重新评估
 
 # --- Data Fetching Settings ---
 # Number of historical candles to fetch for analysis
@@ -159,6 +177,19 @@ VIRTUAL_TRADE_CONFIG = {
 }
 
 
+# --- Portfolio Risk Settings ---
+# 每轮分析结束后，对本轮所有开仓信号统一计算仓位（考虑相关性和已有持仓）
+PORTFOLIO_RISK_CONFIG = {
+    "enabled": True,
+    "returns_lookback": 168,              # 计算相关性/协方差的1h收益率数量（7天）
+    "max_portfolio_volatility_pct": 3.0,  # 新开仓组合的日波动不超过钱包余额的3%
+    "max_total_exposure": 3.0,            # 已有持仓+新开仓名义价值不超过钱包余额的3倍
+    "max_margin_usage": 0.5,              # 新开仓保证金不超过可用余额的50%
+    "leverage": 5,                        # 计算保证金占用时假设的杠杆
+    "min_position_scale": 0.1,            # 缩放后低于原仓位10%的信号不再发送
+}
+
+
 # --- Reversal (Aggressive) Strategy Settings ---
 # Settings for the aggressive, counter-trend strategy.
 REVERSAL_STRATEGY_CONFIG = {
@@ -0,0 +1,165 @@
+# backtest_runner.py - 多策略并行回测对比
+
+"""
+用同一份已下载的数据、同一个时间范围并行回测多个策略，输出一张对比表（收益、回撤、交易次数、耗时）。
+
+数据只读一次：主进程把白名单交易对的K线（含合约的 funding_rate/mark）转成 feather 写到 /dev/shm
+（共享内存，没有时用临时目录），各个回测进程都从这里读，不再各自解析原始数据文件。
+替代逐个执行 freqtrade backtesting 的做法。
+
+用法:
+    python backtest_runner.py --config config/config_trend.json --timerange 20240101-20241201
+    python backtest_runner.py --config config/config_trend.json --strategies TripleTimeframeTrendStrategyV2_1 TripleTimeframeTrendStrategyV2_4
+"""
+
+import argparse
+import csv
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from freqtrade.commands.optimize_commands import setup_optimize_configuration
+from freqtrade.data.history import get_datahandler
+from freqtrade.enums import RunMode
+from freqtrade.optimize.backtesting import Backtesting
+
+STRATEGIES_DIR = Path(__file__).resolve().parent / 'strategies'
+
+DEFAULT_STRATEGIES = [
+    'TripleTimeframeTrendStrategy',
+    'TripleTimeframeTrendStrategyV2',
+    'TripleTimeframeTrendStrategyV2_1',
+    'TripleTimeframeTrendStrategyV2_2',
+    'TripleTimeframeTrendStrategyV2_3',
+    'TripleTimeframeTrendStrategyV2_4',
+    'TripleTimeframeTrendStrategyOptimized',
+    'AggressiveReversalStrategy',
+]
+
+COMPARISON_COLUMNS = ['strategy', 'trades', 'profit_pct', 'profit_abs', 'max_drawdown_pct', 'winrate_pct', 'runtime_s']
+
+
+def load_config(config_path: str, strategy: str, timerange: Optional[str], datadir: Optional[str] = None) -> Dict:
+    """与 freqtrade backtesting 命令行相同的配置加载（校验、默认值）"""
+    args = {
+        'config': [config_path],
+        'strategy': strategy,
+        'strategy_path': str(STRATEGIES_DIR),
+        'timerange': timerange,
+        'export': 'none',
+    }
+    if datadir:
+        args['datadir'] = datadir
+        args['dataformat_ohlcv'] = 'feather'
+    return setup_optimize_configuration(args, RunMode.BACKTEST)
+
+
+def prepare_shared_data(config: Dict, shared_root: Path) -> Path:
+    """把白名单交易对的所有周期数据一次性转存为 feather 到共享内存目录，返回新的 datadir"""
+    source = get_datahandler(config['datadir'], config.get('dataformat_ohlcv'))
+    shared_datadir = shared_root / 'data'
+    target = get_datahandler(shared_datadir, 'feather')
+    whitelist = set(config['exchange']['pair_whitelist'])
+
+    for pair, timeframe, candle_type in source.ohlcv_get_available_data(config['datadir'], config['trading_mode']):
+        if pair not in whitelist:
+            continue
+        candles = source.ohlcv_load(pair, timeframe, timerange=None, candle_type=candle_type)
+        target.ohlcv_store(pair, timeframe, candles, candle_type)
+    return shared_datadir
+
+
+def backtest_results(backtesting: Backtesting, strategy: str, runtime: float) -> Dict:
+    stats = backtesting.results['strategy'][strategy]
+    trades = stats.get('total_trades', 0)
+    winrate = stats.get('winrate')
+    if winrate is None:
+        winrate = stats.get('wins', 0) / trades if trades else 0.0
+    return {
+        'strategy': strategy,
+        'trades': trades,
+        'profit_pct': round(stats.get('profit_total', 0.0) * 100, 2),
+        'profit_abs': round(stats.get('profit_total_abs', 0.0), 2),
+        'max_drawdown_pct': round(stats.get('max_drawdown_account', 0.0) * 100, 2),
+        'winrate_pct': round(winrate * 100, 2),
+        'runtime_s': round(runtime, 1),
+    }
+
+
+def run_strategy_backtest(config_path: str, strategy: str, timerange: Optional[str], datadir: str) -> Dict:
+    """回测进程：从共享数据目录读取K线，回测单个策略"""
+    start = time.perf_counter()
+    config = load_config(config_path, strategy, timerange, datadir)
+    backtesting = Backtesting(config)
+    backtesting.start()
+    return backtest_results(backtesting, strategy, time.perf_counter() - start)
+
+
+def format_comparison(rows: List[Dict], columns: List[str] = COMPARISON_COLUMNS) -> str:
+    widths = {column: max(len(column), *(len(str(row[column])) for row in rows)) for column in columns}
+    lines = ['  '.join(column.ljust(widths[column]) for column in columns)]
+    lines.append('  '.join('-' * widths[column] for column in columns))
+    for row in rows:
+        lines.append('  '.join(str(row[column]).ljust(widths[column]) for column in columns))
+    return '\n'.join(lines)
+
+
+def write_comparison(rows: List[Dict], path: Path, columns: List[str] = COMPARISON_COLUMNS):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open('w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def shared_memory_dir() -> Path:
+    # /dev/shm 是内存文件系统，各进程读取不经过磁盘
+    base = '/dev/shm' if os.path.isdir('/dev/shm') else None
+    return Path(tempfile.mkdtemp(prefix='backtest_runner_', dir=base))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='多策略并行回测对比')
+    parser.add_argument('--config', required=True, help='freqtrade 配置文件')
+    parser.add_argument('--strategies', nargs='+', default=DEFAULT_STRATEGIES, help='要对比的策略')
+    parser.add_argument('--timerange', default=None, help='回测时间范围，例如 20240101-20241201')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='并行进程数')
+    parser.add_argument('--output', default=None, help='对比表 CSV 路径（默认 user_data/backtest_results/strategy_comparison.csv）')
+    args = parser.parse_args()
+
+    config = load_config(args.config, args.strategies[0], args.timerange)
+    shared_root = shared_memory_dir()
+    try:
+        start = time.perf_counter()
+        shared_datadir = prepare_shared_data(config, shared_root)
+        print(f"数据已载入共享内存: {shared_datadir} ({time.perf_counter() - start:.1f}s)")
+
+        with ProcessPoolExecutor(max_workers=min(args.workers, len(args.strategies))) as executor:
+            futures = [
+                executor.submit(run_strategy_backtest, args.config, strategy, args.timerange, str(shared_datadir))
+                for strategy in args.strategies
+            ]
+            rows = []
+            for strategy, future in zip(args.strategies, futures):
+                try:
+                    rows.append(future.result())
+                except Exception as e:
+                    print(f"[ERROR] {strategy} 回测失败: {e}")
+    finally:
+        shutil.rmtree(shared_root, ignore_errors=True)
+
+    if not rows:
+        return
+    rows.sort(key=lambda row: row['profit_pct'], reverse=True)
+    print(format_comparison(rows))
+    output = Path(args.output) if args.output else Path(config['user_data_dir']) / 'backtest_results' / 'strategy_comparison.csv'
+    write_comparison(rows, output)
+    print(f"对比表已保存: {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+# benchmark_hyperopt.py - V2_4 hyperopt 每个 epoch 的信号计算耗时
+
+"""
+比较 TripleTimeframeTrendStrategyV2_4 在 hyperopt 中每个 epoch 的信号计算吞吐量（epochs/分钟）：
+
+- 逐 epoch 计算指标（参数网格之前的做法，相当于 --analyze-per-epoch）：每个 epoch 按当前参数值
+  重新计算所有交易对的 1h/4h/1d 指标，再计算评分和买卖信号；
+- 参数网格：populate_indicators 只在开始时算一次整个参数范围的指标列和评分分项，每个 epoch 只选列相加。
+
+使用 14 个交易对（pair_weights 里的币种）的模拟K线，随机抽取 buy 空间的参数值。
+只统计策略计算部分，不包括 freqtrade 每个 epoch 的回测撮合（两种做法相同）。
+
+用法:
+    python benchmark_hyperopt.py [天数] [epochs]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from freqtrade.enums import HyperoptState, RunMode
+from freqtrade.optimize.hyperopt_tools import HyperoptStateContainer
+
+STRATEGIES_DIR = Path(__file__).resolve().parent / 'strategies'
+sys.path.insert(0, str(STRATEGIES_DIR))
+
+from indicator_library import clear_indicator_cache  # noqa: E402
+from TripleTimeframeTrendStrategyV2_4 import TripleTimeframeTrendStrategyV2_4  # noqa: E402
+
+INFO_TIMEFRAMES = {'4h': '4h', '1d': '1D'}
+
+
+def make_candles(days: int, seed: int) -> dict:
+    rng = np.random.default_rng(seed)
+    num = days * 24
+    dates = pd.date_range('2024-01-01', periods=num, freq='1h', tz='UTC')
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, num)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0.0, 0.004, num)) * close
+    candles = pd.DataFrame({
+        'date': dates,
+        'open': open_,
+        'high': np.maximum(open_, close) + spread,
+        'low': np.minimum(open_, close) - spread,
+        'close': close,
+        'volume': rng.uniform(100.0, 1000.0, num),
+    })
+    frames = {'1h': candles}
+    for timeframe, rule in INFO_TIMEFRAMES.items():
+        frames[timeframe] = (
+            candles.set_index('date')
+            .resample(rule)
+            .agg({'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'})
+            .dropna()
+            .reset_index()
+        )
+    return frames
+
+
+class FakeDataProvider:
+    runmode = RunMode.HYPEROPT
+
+    def __init__(self, candles: dict):
+        self.candles = candles
+
+    def get_pair_dataframe(self, pair: str, timeframe: str) -> pd.DataFrame:
+        return self.candles[pair][timeframe].copy()
+
+    def current_whitelist(self):
+        return list(self.candles)
+
+
+def make_strategy(candles: dict, hyperopt: bool) -> TripleTimeframeTrendStrategyV2_4:
+    config = {
+        'exchange': {'name': 'binance'},
+        'stake_currency': 'USDT',
+        'max_open_trades': 5,
+        'trading_mode': 'futures',
+        'margin_mode': 'isolated',
+        'runmode': RunMode.HYPEROPT,
+        'spaces': ['buy'],
+    }
+    strategy = TripleTimeframeTrendStrategyV2_4(config)
+    strategy.dp = FakeDataProvider(candles)
+    # hyperopt=True 时 buy 空间参数的 .range 是整个取值范围
+    strategy.ft_load_hyper_params(hyperopt=hyperopt)
+    return strategy
+
+
+def random_parameters(strategy: TripleTimeframeTrendStrategyV2_4, rng: np.random.Generator):
+    for _, parameter in strategy.enumerate_parameters('buy'):
+        parameter.value = int(rng.integers(parameter.low, parameter.high + 1))
+
+
+def analyze_signals(strategy: TripleTimeframeTrendStrategyV2_4, dataframe: pd.DataFrame, pair: str) -> pd.DataFrame:
+    metadata = {'pair': pair}
+    dataframe = strategy.populate_entry_trend(dataframe, metadata)
+    return strategy.populate_exit_trend(dataframe, metadata)
+
+
+def run_per_epoch_indicators(candles: dict, epochs: int) -> float:
+    """每个 epoch 都重新计算指标，返回总耗时"""
+    strategy = make_strategy(candles, hyperopt=False)
+    rng = np.random.default_rng(1)
+    start = time.perf_counter()
+    for _ in range(epochs):
+        random_parameters(strategy, rng)
+        clear_indicator_cache()
+        for pair in candles:
+            dataframe = strategy.populate_indicators(strategy.dp.get_pair_dataframe(pair, '1h'), {'pair': pair})
+            analyze_signals(strategy, dataframe, pair)
+    return time.perf_counter() - start
+
+
+def run_indicator_grid(candles: dict, epochs: int):
+    """参数网格只算一次，返回 (网格计算耗时, epochs 总耗时)"""
+    strategy = make_strategy(candles, hyperopt=True)
+    rng = np.random.default_rng(1)
+    clear_indicator_cache()
+    # 与 hyperopt 相同：计算指标阶段 .range 是整个取值范围，优化阶段只有当前值
+    HyperoptStateContainer.set_state(HyperoptState.INDICATORS)
+    start = time.perf_counter()
+    processed = {
+        pair: strategy.populate_indicators(strategy.dp.get_pair_dataframe(pair, '1h'), {'pair': pair})
+        for pair in candles
+    }
+    grid_duration = time.perf_counter() - start
+    HyperoptStateContainer.set_state(HyperoptState.OPTIMIZE)
+
+    start = time.perf_counter()
+    for _ in range(epochs):
+        random_parameters(strategy, rng)
+        for pair, dataframe in processed.items():
+            analyze_signals(strategy, dataframe.copy(), pair)
+    return grid_duration, time.perf_counter() - start
+
+
+def main():
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 365
+    epochs = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    pairs = list(TripleTimeframeTrendStrategyV2_4.pair_weights)
+    candles = {pair: make_candles(days, seed) for seed, pair in enumerate(pairs)}
+    print(f"{len(pairs)} 个交易对，每个 {days * 24} 根1h K线，{epochs} 个 epoch")
+
+    per_epoch_duration = run_per_epoch_indicators(candles, epochs)
+    grid_duration, epochs_duration = run_indicator_grid(candles, epochs)
+
+    before = epochs / per_epoch_duration * 60
+    after = epochs / epochs_duration * 60
+    print(f"逐 epoch 计算指标: {per_epoch_duration / epochs:.3f}s/epoch, {before:.0f} epochs/分钟")
+    print(f"参数网格:          {epochs_duration / epochs:.3f}s/epoch, {after:.0f} epochs/分钟"
+          f"（网格指标一次性计算 {grid_duration:.1f}s）")
+    print(f"吞吐量 x{after / before:.1f}")
+
+
+if __name__ == '__main__':
+    main()
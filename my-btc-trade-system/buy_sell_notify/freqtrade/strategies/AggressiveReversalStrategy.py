@@ -4,11 +4,12 @@ from freqtrade.strategy.interface import IStrategy
 from typing import Dict, List
 from functools import reduce
 
-import talib.abstract as ta
 import numpy as np  
 import pandas as pd
 from pandas import DataFrame
 
+from indicator_library import CachedIndicators
+
 class AggressiveReversalStrategy(IStrategy):
     """
     激进反转策略
@@ -77,23 +78,25 @@ class AggressiveReversalStrategy(IStrategy):
         """
         计算技术指标
         """
+        indicators = CachedIndicators(dataframe, metadata['pair'], self.timeframe)
+
         # RSI
-        dataframe['rsi'] = ta.RSI(dataframe, timeperiod=self.rsi_period)
+        dataframe['rsi'] = indicators.RSI(timeperiod=self.rsi_period)
         
         # 布林带
-        bollinger = ta.BBANDS(dataframe, timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
+        bollinger = indicators.BBANDS(timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
         dataframe['bb_lower'] = bollinger['lowerband']
         dataframe['bb_middle'] = bollinger['middleband']
         dataframe['bb_upper'] = bollinger['upperband']
         
         # ATR - 用于动态止损
-        dataframe['atr'] = ta.ATR(dataframe, timeperiod=self.atr_period)
+        dataframe['atr'] = indicators.ATR(timeperiod=self.atr_period)
         
         # 价格与布林带关系
         dataframe['bb_percent'] = (dataframe['close'] - dataframe['bb_lower']) / (dataframe['bb_upper'] - dataframe['bb_lower'])
         
         # 成交量相关指标
-        dataframe['volume_sma'] = ta.SMA(dataframe['volume'], timeperiod=20)
+        dataframe['volume_sma'] = indicators.SMA(timeperiod=20, price='volume')
         
         # 价格波动率
         dataframe['price_change'] = dataframe['close'].pct_change()
@@ -4,11 +4,12 @@ from freqtrade.strategy.interface import IStrategy
 from typing import Dict, List
 from functools import reduce
 
-import talib.abstract as ta
 import numpy as np  
 import pandas as pd
 from pandas import DataFrame
 
+from indicator_library import CachedIndicators
+
 class TripleTimeframeTrendStrategy(IStrategy):
     """
     三重时间框架趋势跟踪策略
@@ -106,33 +107,35 @@ class TripleTimeframeTrendStrategy(IStrategy):
         # 获取额外时间框架的数据
         inf_1d = self.dp.get_pair_dataframe(pair=metadata['pair'], timeframe='1d')
         inf_4h = self.dp.get_pair_dataframe(pair=metadata['pair'], timeframe='4h')
+        indicators = CachedIndicators(dataframe, metadata['pair'], self.timeframe)
+        indicators_1d = CachedIndicators(inf_1d, metadata['pair'], '1d')
+        indicators_4h = CachedIndicators(inf_4h, metadata['pair'], '4h')
         
         # === 1小时指标计算 (执行层面) ===
         
         # SMA
-        dataframe['sma_short'] = ta.SMA(dataframe, timeperiod=self.sma_short_period)
-        dataframe['sma_long'] = ta.SMA(dataframe, timeperiod=self.sma_long_period)
+        dataframe['sma_short'] = indicators.SMA(timeperiod=self.sma_short_period)
+        dataframe['sma_long'] = indicators.SMA(timeperiod=self.sma_long_period)
         
         # MACD
-        macd = ta.MACD(dataframe, fastperiod=self.macd_fast, slowperiod=self.macd_slow, signalperiod=self.macd_signal)
+        macd = indicators.MACD(fastperiod=self.macd_fast, slowperiod=self.macd_slow, signalperiod=self.macd_signal)
         dataframe['macd'] = macd['macd']
         dataframe['macdsignal'] = macd['macdsignal'] 
         dataframe['macdhist'] = macd['macdhist']
         
         # RSI
-        dataframe['rsi'] = ta.RSI(dataframe, timeperiod=self.rsi_period)
+        dataframe['rsi'] = indicators.RSI(timeperiod=self.rsi_period)
         
         # 布林带
-        bollinger = ta.BBANDS(dataframe, timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
+        bollinger = indicators.BBANDS(timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
         dataframe['bb_lower'] = bollinger['lowerband']
         dataframe['bb_middle'] = bollinger['middleband']
         dataframe['bb_upper'] = bollinger['upperband']
         
         # 一目均衡表
-        ichimoku = self.ichimoku(dataframe, 
-                               conversion_line_period=self.ichimoku_conversion,
-                               base_line_period=self.ichimoku_base,
-                               lagging_span_period=self.ichimoku_lagging)
+        ichimoku = indicators.ichimoku(conversion_line_period=self.ichimoku_conversion,
+                                       base_line_period=self.ichimoku_base,
+                                       lagging_span_period=self.ichimoku_lagging)
         dataframe['tenkan'] = ichimoku['tenkan_sen']
         dataframe['kijun'] = ichimoku['kijun_sen']
         dataframe['senkou_a'] = ichimoku['senkou_span_a'] 
@@ -140,7 +143,7 @@ class TripleTimeframeTrendStrategy(IStrategy):
         dataframe['chikou'] = ichimoku['chikou_span']
         
         # ATR
-        dataframe['atr'] = ta.ATR(dataframe, timeperiod=self.atr_period)
+        dataframe['atr'] = indicators.ATR(timeperiod=self.atr_period)
         
         # === 计算1小时综合评分 ===
         dataframe['h1_score'] = self.calculate_timeframe_score(dataframe)
@@ -148,15 +151,15 @@ class TripleTimeframeTrendStrategy(IStrategy):
         # === 处理日线数据 (战略层面) ===
         if len(inf_1d) > 0:
             # 计算日线指标
-            inf_1d['sma_short'] = ta.SMA(inf_1d, timeperiod=self.sma_short_period)
-            inf_1d['sma_long'] = ta.SMA(inf_1d, timeperiod=self.sma_long_period) 
-            inf_1d['rsi'] = ta.RSI(inf_1d, timeperiod=self.rsi_period)
+            inf_1d['sma_short'] = indicators_1d.SMA(timeperiod=self.sma_short_period)
+            inf_1d['sma_long'] = indicators_1d.SMA(timeperiod=self.sma_long_period) 
+            inf_1d['rsi'] = indicators_1d.RSI(timeperiod=self.rsi_period)
             
-            macd_1d = ta.MACD(inf_1d, fastperiod=self.macd_fast, slowperiod=self.macd_slow, signalperiod=self.macd_signal)
+            macd_1d = indicators_1d.MACD(fastperiod=self.macd_fast, slowperiod=self.macd_slow, signalperiod=self.macd_signal)
             inf_1d['macd'] = macd_1d['macd']
             inf_1d['macdsignal'] = macd_1d['macdsignal']
             
-            bollinger_1d = ta.BBANDS(inf_1d, timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
+            bollinger_1d = indicators_1d.BBANDS(timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
             inf_1d['bb_lower'] = bollinger_1d['lowerband']
             inf_1d['bb_middle'] = bollinger_1d['middleband'] 
             inf_1d['bb_upper'] = bollinger_1d['upperband']
@@ -171,15 +174,15 @@ class TripleTimeframeTrendStrategy(IStrategy):
         # === 处理4小时数据 (战术层面) ===
         if len(inf_4h) > 0:
             # 计算4小时指标  
-            inf_4h['sma_short'] = ta.SMA(inf_4h, timeperiod=self.sma_short_period)
-            inf_4h['sma_long'] = ta.SMA(inf_4h, timeperiod=self.sma_long_period)
-            inf_4h['rsi'] = ta.RSI(inf_4h, timeperiod=self.rsi_period)
+            inf_4h['sma_short'] = indicators_4h.SMA(timeperiod=self.sma_short_period)
+            inf_4h['sma_long'] = indicators_4h.SMA(timeperiod=self.sma_long_period)
+            inf_4h['rsi'] = indicators_4h.RSI(timeperiod=self.rsi_period)
             
-            macd_4h = ta.MACD(inf_4h, fastperiod=self.macd_fast, slowperiod=self.macd_slow, signalperiod=self.macd_signal)
+            macd_4h = indicators_4h.MACD(fastperiod=self.macd_fast, slowperiod=self.macd_slow, signalperiod=self.macd_signal)
             inf_4h['macd'] = macd_4h['macd'] 
             inf_4h['macdsignal'] = macd_4h['macdsignal']
             
-            bollinger_4h = ta.BBANDS(inf_4h, timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
+            bollinger_4h = indicators_4h.BBANDS(timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
             inf_4h['bb_lower'] = bollinger_4h['lowerband']
             inf_4h['bb_middle'] = bollinger_4h['middleband']
             inf_4h['bb_upper'] = bollinger_4h['upperband']
@@ -219,41 +222,6 @@ class TripleTimeframeTrendStrategy(IStrategy):
         
         return score
 
-    def ichimoku(self, dataframe: DataFrame, conversion_line_period: int = 9, 
-                 base_line_period: int = 26, lagging_span_period: int = 52) -> Dict:
-        """
-        一目均衡表指标计算
-        """
-        high = dataframe['high']
-        low = dataframe['low'] 
-        close = dataframe['close']
-        
-        # 转换线 (Tenkan-sen)
-        tenkan_sen = (high.rolling(window=conversion_line_period).max() + 
-                     low.rolling(window=conversion_line_period).min()) / 2
-        
-        # 基准线 (Kijun-sen) 
-        kijun_sen = (high.rolling(window=base_line_period).max() + 
-                    low.rolling(window=base_line_period).min()) / 2
-        
-        # 先行带A (Senkou Span A)
-        senkou_span_a = ((tenkan_sen + kijun_sen) / 2).shift(base_line_period)
-        
-        # 先行带B (Senkou Span B)
-        senkou_span_b = ((high.rolling(window=lagging_span_period).max() + 
-                         low.rolling(window=lagging_span_period).min()) / 2).shift(base_line_period)
-        
-        # 滞后线 (Chikou Span)
-        chikou_span = close.shift(-base_line_period)
-        
-        return {
-            'tenkan_sen': tenkan_sen,
-            'kijun_sen': kijun_sen, 
-            'senkou_span_a': senkou_span_a,
-            'senkou_span_b': senkou_span_b,
-            'chikou_span': chikou_span
-        }
-
     def populate_entry_trend(self, dataframe: DataFrame, metadata: Dict) -> DataFrame:
         """
         买入信号：三重时间框架过滤
@@ -4,11 +4,13 @@ from freqtrade.strategy.interface import IStrategy
 from typing import Dict, List, Optional
 from functools import reduce
 
-import talib.abstract as ta
 import numpy as np  
 import pandas as pd
 from pandas import DataFrame
 
+from indicator_library import CachedIndicators, trend_score
+from informative_merge import merge_informative_columns
+
 class TripleTimeframeTrendStrategyOptimized(IStrategy):
     """
     三重时间框架趋势跟踪策略 - 优化版本
@@ -133,34 +135,36 @@ class TripleTimeframeTrendStrategyOptimized(IStrategy):
         # 获取额外时间框架的数据
         inf_1d = self.dp.get_pair_dataframe(pair=metadata['pair'], timeframe='1d')
         inf_4h = self.dp.get_pair_dataframe(pair=metadata['pair'], timeframe='4h')
+        indicators = CachedIndicators(dataframe, metadata['pair'], self.timeframe)
+        indicators_1d = CachedIndicators(inf_1d, metadata['pair'], '1d')
+        indicators_4h = CachedIndicators(inf_4h, metadata['pair'], '4h')
         
         # === 1小时指标计算 (执行层面) ===
         
         # 优化的SMA
-        dataframe['sma_short'] = ta.SMA(dataframe, timeperiod=self.sma_short_period)
-        dataframe['sma_long'] = ta.SMA(dataframe, timeperiod=self.sma_long_period)
+        dataframe['sma_short'] = indicators.SMA(timeperiod=self.sma_short_period)
+        dataframe['sma_long'] = indicators.SMA(timeperiod=self.sma_long_period)
         
         # 优化的MACD
-        macd = ta.MACD(dataframe, fastperiod=self.macd_fast, slowperiod=self.macd_slow, signalperiod=self.macd_signal)
+        macd = indicators.MACD(fastperiod=self.macd_fast, slowperiod=self.macd_slow, signalperiod=self.macd_signal)
         dataframe['macd'] = macd['macd']
         dataframe['macdsignal'] = macd['macdsignal'] 
         dataframe['macdhist'] = macd['macdhist']
         
         # RSI
-        dataframe['rsi'] = ta.RSI(dataframe, timeperiod=self.rsi_period)
+        dataframe['rsi'] = indicators.RSI(timeperiod=self.rsi_period)
         
         # 布林带
-        bollinger = ta.BBANDS(dataframe, timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
+        bollinger = indicators.BBANDS(timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
         dataframe['bb_lower'] = bollinger['lowerband']
         dataframe['bb_middle'] = bollinger['middleband']
         dataframe['bb_upper'] = bollinger['upperband']
         dataframe['bb_percent'] = (dataframe['close'] - dataframe['bb_lower']) / (dataframe['bb_upper'] - dataframe['bb_lower'])
         
         # 一目均衡表
-        ichimoku = self.ichimoku(dataframe, 
-                               conversion_line_period=self.ichimoku_conversion,
-                               base_line_period=self.ichimoku_base,
-                               lagging_span_period=self.ichimoku_lagging)
+        ichimoku = indicators.ichimoku(conversion_line_period=self.ichimoku_conversion,
+                                       base_line_period=self.ichimoku_base,
+                                       lagging_span_period=self.ichimoku_lagging)
         dataframe['tenkan'] = ichimoku['tenkan_sen']
         dataframe['kijun'] = ichimoku['kijun_sen']
         dataframe['senkou_a'] = ichimoku['senkou_span_a'] 
@@ -168,19 +172,19 @@ class TripleTimeframeTrendStrategyOptimized(IStrategy):
         dataframe['chikou'] = ichimoku['chikou_span']
         
         # ATR
-        dataframe['atr'] = ta.ATR(dataframe, timeperiod=self.atr_period)
+        dataframe['atr'] = indicators.ATR(timeperiod=self.atr_period)
         
         # 新增: 市场状态指标
         dataframe['market_volatility'] = dataframe['close'].rolling(self.market_volatility_period).std() / dataframe['close'].rolling(self.market_volatility_period).mean()
         dataframe['is_trending'] = dataframe['market_volatility'] > self.trending_threshold
         
         # 新增: 成交量指标
-        dataframe['volume_sma'] = ta.SMA(dataframe['volume'], timeperiod=20)
+        dataframe['volume_sma'] = indicators.SMA(timeperiod=20, price='volume')
         dataframe['volume_ratio'] = dataframe['volume'] / dataframe['volume_sma']
         
         # 新增: 动量指标
-        dataframe['momentum'] = ta.MOM(dataframe, timeperiod=10)
-        dataframe['roc'] = ta.ROC(dataframe, timeperiod=10)
+        dataframe['momentum'] = indicators.MOM(timeperiod=10)
+        dataframe['roc'] = indicators.ROC(timeperiod=10)
         
         # === 计算1小时优化评分 ===
         dataframe['h1_score'] = self.calculate_optimized_score(dataframe)
@@ -188,16 +192,16 @@ class TripleTimeframeTrendStrategyOptimized(IStrategy):
         # === 处理日线数据 (战略层面) ===
         if len(inf_1d) > 0:
             # 计算日线指标
-            inf_1d['sma_short'] = ta.SMA(inf_1d, timeperiod=self.sma_short_period)
-            inf_1d['sma_long'] = ta.SMA(inf_1d, timeperiod=self.sma_long_period) 
-            inf_1d['rsi'] = ta.RSI(inf_1d, timeperiod=self.rsi_period)
+            inf_1d['sma_short'] = indicators_1d.SMA(timeperiod=self.sma_short_period)
+            inf_1d['sma_long'] = indicators_1d.SMA(timeperiod=self.sma_long_period) 
+            inf_1d['rsi'] = indicators_1d.RSI(timeperiod=self.rsi_period)
             
-            macd_1d = ta.MACD(inf_1d, fastperiod=self.macd_fast, slowperiod=self.macd_slow, signalperiod=self.macd_signal)
+            macd_1d = indicators_1d.MACD(fastperiod=self.macd_fast, slowperiod=self.macd_slow, signalperiod=self.macd_signal)
             inf_1d['macd'] = macd_1d['macd']
             inf_1d['macdsignal'] = macd_1d['macdsignal']
             inf_1d['macdhist'] = macd_1d['macdhist']
             
-            bollinger_1d = ta.BBANDS(inf_1d, timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
+            bollinger_1d = indicators_1d.BBANDS(timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
             inf_1d['bb_lower'] = bollinger_1d['lowerband']
             inf_1d['bb_middle'] = bollinger_1d['middleband'] 
             inf_1d['bb_upper'] = bollinger_1d['upperband']
@@ -206,22 +210,21 @@ class TripleTimeframeTrendStrategyOptimized(IStrategy):
             inf_1d['daily_score'] = self.calculate_optimized_score(inf_1d)
             
             # 合并到主数据框
-            dataframe = pd.merge(dataframe, inf_1d[['date', 'daily_score']], on='date', how='left')
-            dataframe['daily_score'] = dataframe['daily_score'].fillna(method='ffill')
+            dataframe = merge_informative_columns(dataframe, inf_1d, ['daily_score'], self.timeframe, '1d')
         
         # === 处理4小时数据 (战术层面) ===
         if len(inf_4h) > 0:
             # 计算4小时指标  
-            inf_4h['sma_short'] = ta.SMA(inf_4h, timeperiod=self.sma_short_period)
-            inf_4h['sma_long'] = ta.SMA(inf_4h, timeperiod=self.sma_long_period)
-            inf_4h['rsi'] = ta.RSI(inf_4h, timeperiod=self.rsi_period)
+            inf_4h['sma_short'] = indicators_4h.SMA(timeperiod=self.sma_short_period)
+            inf_4h['sma_long'] = indicators_4h.SMA(timeperiod=self.sma_long_period)
+            inf_4h['rsi'] = indicators_4h.RSI(timeperiod=self.rsi_period)
             
-            macd_4h = ta.MACD(inf_4h, fastperiod=self.macd_fast, slowperiod=self.macd_slow, signalperiod=self.macd_signal)
+            macd_4h = indicators_4h.MACD(fastperiod=self.macd_fast, slowperiod=self.macd_slow, signalperiod=self.macd_signal)
             inf_4h['macd'] = macd_4h['macd'] 
             inf_4h['macdsignal'] = macd_4h['macdsignal']
             inf_4h['macdhist'] = macd_4h['macdhist']
             
-            bollinger_4h = ta.BBANDS(inf_4h, timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
+            bollinger_4h = indicators_4h.BBANDS(timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
             inf_4h['bb_lower'] = bollinger_4h['lowerband']
             inf_4h['bb_middle'] = bollinger_4h['middleband']
             inf_4h['bb_upper'] = bollinger_4h['upperband']
@@ -230,8 +233,7 @@ class TripleTimeframeTrendStrategyOptimized(IStrategy):
             inf_4h['h4_score'] = self.calculate_optimized_score(inf_4h)
             
             # 合并到主数据框
-            dataframe = pd.merge(dataframe, inf_4h[['date', 'h4_score']], on='date', how='left') 
-            dataframe['h4_score'] = dataframe['h4_score'].fillna(method='ffill')
+            dataframe = merge_informative_columns(dataframe, inf_4h, ['h4_score'], self.timeframe, '4h')
             
         # 填充缺失值
         dataframe['daily_score'] = dataframe['daily_score'].fillna(0)
@@ -246,53 +248,7 @@ class TripleTimeframeTrendStrategyOptimized(IStrategy):
         """
         优化的综合评分计算 - 加权更合理，更敏感
         """
-        score = pd.Series(0.0, index=df.index)
-        
-        # SMA 趋势评分 (+3/-3) - 加权提高
-        sma_trend = np.where(
-            (df['close'] > df['sma_short']) & (df['sma_short'] > df['sma_long']), 3,
-            np.where(
-                (df['close'] < df['sma_short']) & (df['sma_short'] < df['sma_long']), -3,
-                np.where(df['close'] > df['sma_short'], 1, -1)  # 至少要突破短期均线
-            )
-        )
-        score += sma_trend
-        
-        # MACD 评分 (+2/-2) - 加权提高
-        if 'macdhist' in df.columns:
-            macd_score = np.where(
-                (df['macd'] > df['macdsignal']) & (df['macdhist'] > 0), 2,
-                np.where(
-                    (df['macd'] < df['macdsignal']) & (df['macdhist'] < 0), -2,
-                    np.where(df['macd'] > df['macdsignal'], 1, -1)
-                )
-            )
-        else:
-            # 如果没有macdhist列，只用macd和signal线比较
-            macd_score = np.where(df['macd'] > df['macdsignal'], 1, -1)
-        score += macd_score
-        
-        # RSI 评分 - 优化阈值
-        rsi_score = np.where(
-            df['rsi'] > 60, 1,
-            np.where(df['rsi'] < 40, -1, 0)
-        )
-        score += rsi_score
-        
-        # 布林带评分 - 新增位置判断
-        if 'bb_upper' in df.columns and 'bb_lower' in df.columns:
-            bb_score = np.where(
-                df['close'] > df['bb_upper'], 1,
-                np.where(df['close'] < df['bb_lower'], -1, 0)
-            )
-            score += bb_score
-        
-        # 新增: 动量评分
-        if 'momentum' in df.columns:
-            momentum_score = np.where(df['momentum'] > 0, 1, -1)
-            score += momentum_score * 0.5  # 权重0.5
-        
-        return score
+        return trend_score(df, sma_weight=3, bb_weight=1, momentum_weight=0.5)
 
     def calculate_signal_strength(self, dataframe: DataFrame) -> pd.Series:
         """
@@ -318,41 +274,6 @@ class TripleTimeframeTrendStrategyOptimized(IStrategy):
         
         return strength
 
-    def ichimoku(self, dataframe: DataFrame, conversion_line_period: int = 9, 
-                 base_line_period: int = 26, lagging_span_period: int = 52) -> Dict:
-        """
-        一目均衡表指标计算
-        """
-        high = dataframe['high']
-        low = dataframe['low'] 
-        close = dataframe['close']
-        
-        # 转换线 (Tenkan-sen)
-        tenkan_sen = (high.rolling(window=conversion_line_period).max() + 
-                     low.rolling(window=conversion_line_period).min()) / 2
-        
-        # 基准线 (Kijun-sen) 
-        kijun_sen = (high.rolling(window=base_line_period).max() + 
-                    low.rolling(window=base_line_period).min()) / 2
-        
-        # 先行带A (Senkou Span A)
-        senkou_span_a = ((tenkan_sen + kijun_sen) / 2).shift(base_line_period)
-        
-        # 先行带B (Senkou Span B)
-        senkou_span_b = ((high.rolling(window=lagging_span_period).max() + 
-                         low.rolling(window=lagging_span_period).min()) / 2).shift(base_line_period)
-        
-        # 滞后线 (Chikou Span)
-        chikou_span = close.shift(-base_line_period)
-        
-        return {
-            'tenkan_sen': tenkan_sen,
-            'kijun_sen': kijun_sen, 
-            'senkou_span_a': senkou_span_a,
-            'senkou_span_b': senkou_span_b,
-            'chikou_span': chikou_span
-        }
-
     def populate_entry_trend(self, dataframe: DataFrame, metadata: Dict) -> DataFrame:
         """
         优化的买入信号：分级信号系统
@@ -4,11 +4,13 @@ from freqtrade.strategy.interface import IStrategy
 from typing import Dict, List, Optional
 from functools import reduce
 
-import talib.abstract as ta
 import numpy as np  
 import pandas as pd
 from pandas import DataFrame
 
+from indicator_library import CachedIndicators, trend_score
+from informative_merge import merge_informative_columns
+
 class TripleTimeframeTrendStrategyV2_2(IStrategy):
     """
     三重时间框架趋势跟踪策略 V2.2 - 平衡优化版
@@ -127,28 +129,31 @@ class TripleTimeframeTrendStrategyV2_2(IStrategy):
     def populate_indicators(self, dataframe: DataFrame, metadata: Dict) -> DataFrame:
         inf_1d = self.dp.get_pair_dataframe(pair=metadata['pair'], timeframe='1d')
         inf_4h = self.dp.get_pair_dataframe(pair=metadata['pair'], timeframe='4h')
+        indicators = CachedIndicators(dataframe, metadata['pair'], self.timeframe)
+        indicators_1d = CachedIndicators(inf_1d, metadata['pair'], '1d')
+        indicators_4h = CachedIndicators(inf_4h, metadata['pair'], '4h')
         
         # 1小时指标
-        dataframe['sma_short'] = ta.SMA(dataframe, timeperiod=self.sma_short_period)
-        dataframe['sma_long'] = ta.SMA(dataframe, timeperiod=self.sma_long_period)
+        dataframe['sma_short'] = indicators.SMA(timeperiod=self.sma_short_period)
+        dataframe['sma_long'] = indicators.SMA(timeperiod=self.sma_long_period)
         
-        macd = ta.MACD(dataframe, fastperiod=self.macd_fast, slowperiod=self.macd_slow, signalperiod=self.macd_signal)
+        macd = indicators.MACD(fastperiod=self.macd_fast, slowperiod=self.macd_slow, signalperiod=self.macd_signal)
         dataframe['macd'] = macd['macd']
         dataframe['macdsignal'] = macd['macdsignal'] 
         dataframe['macdhist'] = macd['macdhist']
         
-        dataframe['rsi'] = ta.RSI(dataframe, timeperiod=self.rsi_period)
+        dataframe['rsi'] = indicators.RSI(timeperiod=self.rsi_period)
         
-        bollinger = ta.BBANDS(dataframe, timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
+        bollinger = indicators.BBANDS(timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
         dataframe['bb_lower'] = bollinger['lowerband']
         dataframe['bb_middle'] = bollinger['middleband']
         dataframe['bb_upper'] = bollinger['upperband']
         dataframe['bb_percent'] = (dataframe['close'] - dataframe['bb_lower']) / (dataframe['bb_upper'] - dataframe['bb_lower'])
         
-        dataframe['atr'] = ta.ATR(dataframe, timeperiod=self.atr_period)
+        dataframe['atr'] = indicators.ATR(timeperiod=self.atr_period)
         
         # 市场状态指标
-        dataframe['volume_sma'] = ta.SMA(dataframe['volume'], timeperiod=20)
+        dataframe['volume_sma'] = indicators.SMA(timeperiod=20, price='volume')
         dataframe['volume_ratio'] = dataframe['volume'] / dataframe['volume_sma']
         dataframe['market_volatility'] = dataframe['close'].rolling(self.market_volatility_period).std() / dataframe['close'].rolling(self.market_volatility_period).mean()
         dataframe['is_trending'] = dataframe['market_volatility'] > self.trending_threshold
@@ -163,45 +168,43 @@ class TripleTimeframeTrendStrategyV2_2(IStrategy):
         
         # 处理日线数据
         if len(inf_1d) > 0:
-            inf_1d['sma_short'] = ta.SMA(inf_1d, timeperiod=self.sma_short_period)
-            inf_1d['sma_long'] = ta.SMA(inf_1d, timeperiod=self.sma_long_period) 
-            inf_1d['rsi'] = ta.RSI(inf_1d, timeperiod=self.rsi_period)
+            inf_1d['sma_short'] = indicators_1d.SMA(timeperiod=self.sma_short_period)
+            inf_1d['sma_long'] = indicators_1d.SMA(timeperiod=self.sma_long_period) 
+            inf_1d['rsi'] = indicators_1d.RSI(timeperiod=self.rsi_period)
             
-            macd_1d = ta.MACD(inf_1d, fastperiod=self.macd_fast, slowperiod=self.macd_slow, signalperiod=self.macd_signal)
+            macd_1d = indicators_1d.MACD(fastperiod=self.macd_fast, slowperiod=self.macd_slow, signalperiod=self.macd_signal)
             inf_1d['macd'] = macd_1d['macd']
             inf_1d['macdsignal'] = macd_1d['macdsignal']
             inf_1d['macdhist'] = macd_1d['macdhist']
             
-            bollinger_1d = ta.BBANDS(inf_1d, timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
+            bollinger_1d = indicators_1d.BBANDS(timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
             inf_1d['bb_lower'] = bollinger_1d['lowerband']
             inf_1d['bb_middle'] = bollinger_1d['middleband'] 
             inf_1d['bb_upper'] = bollinger_1d['upperband']
             
             inf_1d['daily_score'] = self.calculate_enhanced_score(inf_1d)
             
-            dataframe = pd.merge(dataframe, inf_1d[['date', 'daily_score']], on='date', how='left')
-            dataframe['daily_score'] = dataframe['daily_score'].fillna(method='ffill')
+            dataframe = merge_informative_columns(dataframe, inf_1d, ['daily_score'], self.timeframe, '1d')
         
         # 处理4小时数据
         if len(inf_4h) > 0:
-            inf_4h['sma_short'] = ta.SMA(inf_4h, timeperiod=self.sma_short_period)
-            inf_4h['sma_long'] = ta.SMA(inf_4h, timeperiod=self.sma_long_period)
-            inf_4h['rsi'] = ta.RSI(inf_4h, timeperiod=self.rsi_period)
+            inf_4h['sma_short'] = indicators_4h.SMA(timeperiod=self.sma_short_period)
+            inf_4h['sma_long'] = indicators_4h.SMA(timeperiod=self.sma_long_period)
+            inf_4h['rsi'] = indicators_4h.RSI(timeperiod=self.rsi_period)
             
-            macd_4h = ta.MACD(inf_4h, fastperiod=self.macd_fast, slowperiod=self.macd_slow, signalperiod=self.macd_signal)
+            macd_4h = indicators_4h.MACD(fastperiod=self.macd_fast, slowperiod=self.macd_slow, signalperiod=self.macd_signal)
             inf_4h['macd'] = macd_4h['macd'] 
             inf_4h['macdsignal'] = macd_4h['macdsignal']
             inf_4h['macdhist'] = macd_4h['macdhist']
             
-            bollinger_4h = ta.BBANDS(inf_4h, timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
+            bollinger_4h = indicators_4h.BBANDS(timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
             inf_4h['bb_lower'] = bollinger_4h['lowerband']
             inf_4h['bb_middle'] = bollinger_4h['middleband']
             inf_4h['bb_upper'] = bollinger_4h['upperband']
             
             inf_4h['h4_score'] = self.calculate_enhanced_score(inf_4h)
             
-            dataframe = pd.merge(dataframe, inf_4h[['date', 'h4_score']], on='date', how='left') 
-            dataframe['h4_score'] = dataframe['h4_score'].fillna(method='ffill')
+            dataframe = merge_informative_columns(dataframe, inf_4h, ['h4_score'], self.timeframe, '4h')
             
         dataframe['daily_score'] = dataframe['daily_score'].fillna(0)
         dataframe['h4_score'] = dataframe['h4_score'].fillna(0)
@@ -212,47 +215,7 @@ class TripleTimeframeTrendStrategyV2_2(IStrategy):
 
     def calculate_enhanced_score(self, df: DataFrame) -> pd.Series:
         """增强的评分计算 - 更精细的权重分配"""
-        score = pd.Series(0.0, index=df.index)
-        
-        # SMA趋势评分：±2分
-        sma_trend = np.where(
-            (df['close'] > df['sma_short']) & (df['sma_short'] > df['sma_long']), 2,
-            np.where(
-                (df['close'] < df['sma_short']) & (df['sma_short'] < df['sma_long']), -2,
-                np.where(df['close'] > df['sma_short'], 1, -1)
-            )
-        )
-        score += sma_trend
-        
-        # MACD评分：±2分
-        if 'macdhist' in df.columns:
-            macd_score = np.where(
-                (df['macd'] > df['macdsignal']) & (df['macdhist'] > 0), 2,
-                np.where(
-                    (df['macd'] < df['macdsignal']) & (df['macdhist'] < 0), -2,
-                    np.where(df['macd'] > df['macdsignal'], 1, -1)
-                )
-            )
-        else:
-            macd_score = np.where(df['macd'] > df['macdsignal'], 1, -1)
-        score += macd_score
-        
-        # RSI评分：±1分 - 平衡权重
-        rsi_score = np.where(
-            df['rsi'] > 65, 1,
-            np.where(df['rsi'] < 35, -1, 0)
-        )
-        score += rsi_score
-        
-        # 布林带评分：±0.5分 - 降低权重避免过敏
-        if 'bb_upper' in df.columns and 'bb_lower' in df.columns:
-            bb_score = np.where(
-                df['close'] > df['bb_upper'], 0.5,
-                np.where(df['close'] < df['bb_lower'], -0.5, 0)
-            )
-            score += bb_score
-        
-        return score
+        return trend_score(df, rsi_upper=65, rsi_lower=35)
 
     def calculate_signal_strength(self, dataframe: DataFrame) -> pd.Series:
         """计算信号强度 (0-10分)"""
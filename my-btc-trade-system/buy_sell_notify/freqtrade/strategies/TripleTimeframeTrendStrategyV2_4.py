@@ -1,14 +1,70 @@
 # pragma pylint: disable=missing-docstring, invalid-name, pointless-string-statement
 
 from freqtrade.strategy.interface import IStrategy
+from freqtrade.strategy import IntParameter
+from freqtrade.exchange import timeframe_to_minutes
+from freqtrade.persistence import Trade
 from typing import Dict, List, Optional
-from functools import reduce
+from datetime import datetime, timedelta, timezone
 
-import talib.abstract as ta
 import numpy as np  
 import pandas as pd
 from pandas import DataFrame
 
+from indicator_library import CachedIndicators, bollinger_score, macdhist_score, rsi_score, sma_trend_score
+from informative_merge import merge_informative_columns
+
+class EmergencyLevelTracker:
+    """
+    应急等级追踪：记录全局和每个交易对的最后开仓时间，按无交易天数逐级升级
+    只在开仓确认和每轮循环开始时更新，查询只是一次时间差比较（O(1)），不访问 Trade 表；
+    时间都来自 freqtrade 回调的 current_time。用于止损/止盈/仓位/杠杆回调
+
+    注意与开仓信号的应急等级是两个定义：开仓信号按K线计算（candle_emergency_levels），
+    计数的是本交易对距上一个开仓"信号"的K线数，只依赖 dataframe；这里计数的是全局距上一笔
+    实际"成交"开仓的时间（被 max_open_trades、余额等挡掉的信号不算）。同一笔交易的开仓等级
+    （开仓K线的 emergency_level 列）和止损/止盈/仓位/杠杆看到的等级可能不同
+    """
+
+    def __init__(self, l1_days: int, l2_days: int, l3_days: int):
+        # 从高到低检查：(无交易时长, 应急等级)
+        self.levels = [(timedelta(days=l3_days), 3), (timedelta(days=l2_days), 2), (timedelta(days=l1_days), 1)]
+        self.reset()
+
+    def reset(self):
+        self.start_time: Optional[datetime] = None
+        self.current_time: Optional[datetime] = None
+        self.last_entry_time: Optional[datetime] = None
+        self.pair_last_entry_time: Dict[str, datetime] = {}
+
+    def update_time(self, current_time: datetime):
+        # 时间倒退说明同一个策略实例开始了新的回测（hyperopt -j 1、walk_forward 的各个窗口），重新开始
+        if self.current_time is not None and current_time < self.current_time:
+            self.reset()
+        # 还没有任何开仓时，从开始运行的时间算起
+        if self.start_time is None:
+            self.start_time = current_time
+        self.current_time = current_time
+
+    def record_entry(self, pair: str, entry_time: datetime):
+        if self.last_entry_time is None or entry_time > self.last_entry_time:
+            self.last_entry_time = entry_time
+        if pair not in self.pair_last_entry_time or entry_time > self.pair_last_entry_time[pair]:
+            self.pair_last_entry_time[pair] = entry_time
+
+    def level(self, current_time: Optional[datetime] = None, pair: Optional[str] = None) -> int:
+        """0=正常, 1=轻度, 2=中度, 3=重度；指定 pair 时按该交易对的最后开仓时间"""
+        now = current_time or self.current_time
+        last_entry_time = self.pair_last_entry_time.get(pair) if pair else self.last_entry_time
+        reference = last_entry_time or self.start_time
+        if now is None or reference is None:
+            return 0
+        idle = now - reference
+        for duration, level in self.levels:
+            if idle >= duration:
+                return level
+        return 0
+
 class TripleTimeframeTrendStrategyV2_4(IStrategy):
     """
     三重时间框架趋势跟踪策略 V2.4 - 终极融合版
@@ -64,17 +120,18 @@ class TripleTimeframeTrendStrategyV2_4(IStrategy):
     trailing_stop_positive_offset = 0.04  # 追踪止损偏移4%
     trailing_only_offset_is_reached = True
 
-    # V2_1的核心技术指标参数（高收益保证）
-    sma_short_period = 18    
-    sma_long_period = 46     
+    # V2_1的核心技术指标参数（高收益保证），默认值即 V2_1 手动调优的结果，可用 hyperopt 调整
+    # 周期类参数的整个取值网格在 populate_indicators 里一次算好，hyperopt 每个 epoch 只重新选列评分
+    sma_short_period = IntParameter(14, 22, default=18, space='buy')
+    sma_long_period = IntParameter(40, 52, default=46, space='buy')
     
-    macd_fast = 11      
-    macd_slow = 25      
-    macd_signal = 9     
+    macd_fast = IntParameter(9, 13, default=11, space='buy')
+    macd_slow = IntParameter(23, 27, default=25, space='buy')
+    macd_signal = IntParameter(8, 10, default=9, space='buy')
     
-    rsi_period = 14
-    rsi_overbought = 71  # V2_1的黄金参数
-    rsi_oversold = 29    # V2_1的黄金参数
+    rsi_period = IntParameter(10, 18, default=14, space='buy')
+    rsi_overbought = IntParameter(65, 78, default=71, space='buy')  # V2_1的黄金参数
+    rsi_oversold = IntParameter(22, 35, default=29, space='buy')    # V2_1的黄金参数
     
     bb_period = 20
     bb_std = 2.0
@@ -110,8 +167,8 @@ class TripleTimeframeTrendStrategyV2_4(IStrategy):
     
     # V2_4双模式参数系统
     # 正常模式（V2_1参数）
-    normal_strong_threshold = 3    # V2_1的成功参数
-    normal_weak_threshold = 1      # V2_1的成功参数
+    normal_strong_threshold = IntParameter(2, 4, default=3, space='buy')    # V2_1的成功参数
+    normal_weak_threshold = IntParameter(0, 2, default=1, space='buy')      # V2_1的成功参数
     
     # 应急模式参数（渐进式）
     emergency_l1_threshold = 2     # 轻度应急：3天无交易
@@ -124,15 +181,35 @@ class TripleTimeframeTrendStrategyV2_4(IStrategy):
     no_trade_l3_days = 7          # 第三级应急触发
     emergency_mode_duration = 48   # 应急模式持续48小时
     
-    # 交易状态追踪
-    last_trade_time = None
-    emergency_level = 0           # 0=正常, 1=轻度, 2=中度, 3=重度
-    emergency_start_time = None
-    
     # 市场状态参数
     market_volatility_period = 50
     trending_threshold = 0.02     # V2_1的成功参数
 
+    def __init__(self, config: dict) -> None:
+        super().__init__(config)
+        # 交易状态追踪（最后开仓时间 -> 应急等级）
+        self.emergency_tracker = EmergencyLevelTracker(self.no_trade_l1_days, self.no_trade_l2_days,
+                                                       self.no_trade_l3_days)
+
+    def bot_start(self, **kwargs) -> None:
+        # 策略实例可能被多次回测复用，不沿用上一次的开仓时间
+        self.emergency_tracker.reset()
+
+    def bot_loop_start(self, current_time: Optional[datetime] = None, **kwargs) -> None:
+        if current_time is None:
+            current_time = datetime.now(timezone.utc)
+        if self.emergency_tracker.start_time is None and self.dp.runmode.value in ('live', 'dry_run'):
+            # 实盘重启时从历史交易恢复最后开仓时间，之后只在 confirm_trade_entry 里增量更新
+            for trade in Trade.get_trades_proxy():
+                self.emergency_tracker.record_entry(trade.pair, trade.open_date_utc)
+        self.emergency_tracker.update_time(current_time)
+
+    def confirm_trade_entry(self, pair: str, order_type: str, amount: float, rate: float,
+                            time_in_force: str, current_time: datetime, entry_tag: Optional[str],
+                            side: str, **kwargs) -> bool:
+        self.emergency_tracker.record_entry(pair, current_time)
+        return True
+
     def informative_pairs(self):
         pairs = self.dp.current_whitelist()
         informative_pairs = []
@@ -146,28 +223,23 @@ class TripleTimeframeTrendStrategyV2_4(IStrategy):
     def populate_indicators(self, dataframe: DataFrame, metadata: Dict) -> DataFrame:
         inf_1d = self.dp.get_pair_dataframe(pair=metadata['pair'], timeframe='1d')
         inf_4h = self.dp.get_pair_dataframe(pair=metadata['pair'], timeframe='4h')
+        indicators = CachedIndicators(dataframe, metadata['pair'], self.timeframe)
+        indicators_1d = CachedIndicators(inf_1d, metadata['pair'], '1d')
+        indicators_4h = CachedIndicators(inf_4h, metadata['pair'], '4h')
         
-        # V2_1的核心指标计算（保持高收益）
-        dataframe['sma_short'] = ta.SMA(dataframe, timeperiod=self.sma_short_period)
-        dataframe['sma_long'] = ta.SMA(dataframe, timeperiod=self.sma_long_period)
-        
-        macd = ta.MACD(dataframe, fastperiod=self.macd_fast, slowperiod=self.macd_slow, signalperiod=self.macd_signal)
-        dataframe['macd'] = macd['macd']
-        dataframe['macdsignal'] = macd['macdsignal'] 
-        dataframe['macdhist'] = macd['macdhist']
-        
-        dataframe['rsi'] = ta.RSI(dataframe, timeperiod=self.rsi_period)
+        # V2_1的核心指标计算（保持高收益）：SMA/MACD/RSI 按参数网格算成列，评分在 populate_scores 里
+        dataframe = self.populate_indicator_grid(dataframe, indicators)
         
-        bollinger = ta.BBANDS(dataframe, timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
+        bollinger = indicators.BBANDS(timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
         dataframe['bb_lower'] = bollinger['lowerband']
         dataframe['bb_middle'] = bollinger['middleband']
         dataframe['bb_upper'] = bollinger['upperband']
         dataframe['bb_percent'] = (dataframe['close'] - dataframe['bb_lower']) / (dataframe['bb_upper'] - dataframe['bb_lower'])
         
-        dataframe['atr'] = ta.ATR(dataframe, timeperiod=self.atr_period)
+        dataframe['atr'] = indicators.ATR(timeperiod=self.atr_period)
         
         # V2_1的市场状态指标
-        dataframe['volume_sma'] = ta.SMA(dataframe['volume'], timeperiod=20)
+        dataframe['volume_sma'] = indicators.SMA(timeperiod=20, price='volume')
         dataframe['volume_ratio'] = dataframe['volume'] / dataframe['volume_sma']
         dataframe['market_volatility'] = dataframe['close'].rolling(self.market_volatility_period).std() / dataframe['close'].rolling(self.market_volatility_period).mean()
         dataframe['is_trending'] = dataframe['market_volatility'] > self.trending_threshold
@@ -175,137 +247,192 @@ class TripleTimeframeTrendStrategyV2_4(IStrategy):
         # V2_3的增强指标（应急时使用）
         dataframe['price_momentum'] = dataframe['close'].pct_change(5)
         dataframe['volume_momentum'] = dataframe['volume'].pct_change(3)
-        dataframe['market_trend'] = np.where(
-            dataframe['sma_short'] > dataframe['sma_long'], 1,
-            np.where(dataframe['sma_short'] < dataframe['sma_long'], -1, 0)
-        )
-        
-        # V2_1的核心评分系统
-        dataframe['h1_score'] = self.calculate_v2_1_score(dataframe)
         
-        # 处理日线数据
-        if len(inf_1d) > 0:
-            inf_1d['sma_short'] = ta.SMA(inf_1d, timeperiod=self.sma_short_period)
-            inf_1d['sma_long'] = ta.SMA(inf_1d, timeperiod=self.sma_long_period) 
-            inf_1d['rsi'] = ta.RSI(inf_1d, timeperiod=self.rsi_period)
-            
-            macd_1d = ta.MACD(inf_1d, fastperiod=self.macd_fast, slowperiod=self.macd_slow, signalperiod=self.macd_signal)
-            inf_1d['macd'] = macd_1d['macd']
-            inf_1d['macdsignal'] = macd_1d['macdsignal']
-            inf_1d['macdhist'] = macd_1d['macdhist']
-            
-            bollinger_1d = ta.BBANDS(inf_1d, timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
-            inf_1d['bb_lower'] = bollinger_1d['lowerband']
-            inf_1d['bb_middle'] = bollinger_1d['middleband'] 
-            inf_1d['bb_upper'] = bollinger_1d['upperband']
-            
-            inf_1d['daily_score'] = self.calculate_v2_1_score(inf_1d)
+        # 每组参数的评分分项（见 score_grid），hyperopt 每个 epoch 只需相加
+        score_grid = self.score_grid(dataframe, np.ones(len(dataframe), dtype=bool), '')
+        
+        # 日线/4小时数据：同样的网格列按收盘时间对齐到1小时K线，只保留评分分项（加 _1d/_4h 后缀）
+        for inf_df, inf_indicators, inf_timeframe in ((inf_1d, indicators_1d, '1d'), (inf_4h, indicators_4h, '4h')):
+            if len(inf_df) == 0:
+                continue
+            inf_df = self.populate_indicator_grid(inf_df, inf_indicators)
+            bollinger_inf = inf_indicators.BBANDS(timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
+            inf_df['bb_lower'] = bollinger_inf['lowerband']
+            inf_df['bb_upper'] = bollinger_inf['upperband']
             
-            dataframe = pd.merge(dataframe, inf_1d[['date', 'daily_score']], on='date', how='left')
-            dataframe['daily_score'] = dataframe['daily_score'].fillna(method='ffill')
-        
-        # 处理4小时数据
-        if len(inf_4h) > 0:
-            inf_4h['sma_short'] = ta.SMA(inf_4h, timeperiod=self.sma_short_period)
-            inf_4h['sma_long'] = ta.SMA(inf_4h, timeperiod=self.sma_long_period)
-            inf_4h['rsi'] = ta.RSI(inf_4h, timeperiod=self.rsi_period)
-            
-            macd_4h = ta.MACD(inf_4h, fastperiod=self.macd_fast, slowperiod=self.macd_slow, signalperiod=self.macd_signal)
-            inf_4h['macd'] = macd_4h['macd'] 
-            inf_4h['macdsignal'] = macd_4h['macdsignal']
-            inf_4h['macdhist'] = macd_4h['macdhist']
-            
-            bollinger_4h = ta.BBANDS(inf_4h, timeperiod=self.bb_period, nbdevup=float(self.bb_std), nbdevdn=float(self.bb_std))
-            inf_4h['bb_lower'] = bollinger_4h['lowerband']
-            inf_4h['bb_middle'] = bollinger_4h['middleband']
-            inf_4h['bb_upper'] = bollinger_4h['upperband']
-            
-            inf_4h['h4_score'] = self.calculate_v2_1_score(inf_4h)
-            
-            dataframe = pd.merge(dataframe, inf_4h[['date', 'h4_score']], on='date', how='left') 
-            dataframe['h4_score'] = dataframe['h4_score'].fillna(method='ffill')
-            
-        dataframe['daily_score'] = dataframe['daily_score'].fillna(0)
-        dataframe['h4_score'] = dataframe['h4_score'].fillna(0)
-        
-        dataframe['signal_strength'] = self.calculate_signal_strength(dataframe)
+            informative = merge_informative_columns(
+                dataframe[['date']].copy(), inf_df, ['close', 'bb_lower', 'bb_upper'] + self.indicator_grid_columns(),
+                self.timeframe, inf_timeframe
+            )
+            for column in ('close', 'bb_lower', 'bb_upper'):
+                dataframe[f'{column}_{inf_timeframe}'] = informative[column]
+            # 大周期K线收盘前没有评分
+            score_grid.update(self.score_grid(informative, informative['close'].notna().to_numpy(), f'_{inf_timeframe}'))
         
-        return dataframe
+        # 逐列写入后列块是碎片化的，合并一次：hyperopt 每个 epoch 读取/复制数据时不用再逐块合并
+        return pd.concat([dataframe, DataFrame(score_grid, index=dataframe.index)], axis=1).copy()
 
-    def calculate_v2_1_score(self, df: DataFrame) -> pd.Series:
-        """V2_1的原始评分算法（高收益保证）"""
-        score = pd.Series(0.0, index=df.index)
-        
-        # V2_1的SMA趋势评分
-        sma_trend = np.where(
-            (df['close'] > df['sma_short']) & (df['sma_short'] > df['sma_long']), 2,
-            np.where(
-                (df['close'] < df['sma_short']) & (df['sma_short'] < df['sma_long']), -2,
-                np.where(df['close'] > df['sma_short'], 1, -1)
-            )
+    def indicator_grid_columns(self) -> List[str]:
+        """参数网格的列名：hyperopt 时 .range 是整个取值范围，其余模式只有当前值"""
+        sma_periods = sorted(set(self.sma_short_period.range) | set(self.sma_long_period.range))
+        return (
+            [f'sma_{period}' for period in sma_periods]
+            + [f'rsi_{period}' for period in self.rsi_period.range]
+            + [f'macdhist_{fast}_{slow}_{signal}'
+               for fast in self.macd_fast.range
+               for slow in self.macd_slow.range
+               for signal in self.macd_signal.range]
         )
-        score += sma_trend
-        
-        # V2_1的MACD评分
-        if 'macdhist' in df.columns:
-            macd_score = np.where(
-                (df['macd'] > df['macdsignal']) & (df['macdhist'] > 0), 2,
-                np.where(
-                    (df['macd'] < df['macdsignal']) & (df['macdhist'] < 0), -2,
-                    np.where(df['macd'] > df['macdsignal'], 1, -1)
+
+    def populate_indicator_grid(self, df: DataFrame, indicators: CachedIndicators) -> DataFrame:
+        """一次算好参数网格里所有 SMA/RSI/MACD 周期的指标列"""
+        grid = {}
+        for column in self.indicator_grid_columns():
+            name, *periods = column.split('_')
+            periods = [int(period) for period in periods]
+            if name == 'sma':
+                grid[column] = indicators.SMA(timeperiod=periods[0])
+            elif name == 'rsi':
+                grid[column] = indicators.RSI(timeperiod=periods[0])
+            else:
+                grid[column] = indicators.MACD(fastperiod=periods[0], slowperiod=periods[1],
+                                               signalperiod=periods[2])['macdhist']
+        return pd.concat([df, DataFrame(grid, index=df.index)], axis=1)
+
+    def score_grid(self, df: DataFrame, available: np.ndarray, suffix: str) -> Dict[str, np.ndarray]:
+        """
+        V2_1的原始评分算法（trend_score，高收益保证）按参数网格拆成分项：SMA 趋势（短/长周期组合）、
+        MACD、RSI、布林带各自只依赖一部分参数，每组参数的评分就是四个分项之和。
+        available 为 False 的K线（大周期K线收盘前）各分项为 0，评分也是 0
+        """
+        close = df['close'].to_numpy()
+        
+        def part(values: np.ndarray, dtype=np.int8) -> np.ndarray:
+            return np.where(available, values, 0).astype(dtype)
+        
+        grid = {}
+        for short in self.sma_short_period.range:
+            for long in self.sma_long_period.range:
+                grid[f'score_sma_{short}_{long}{suffix}'] = part(
+                    sma_trend_score(close, df[f'sma_{short}'].to_numpy(), df[f'sma_{long}'].to_numpy())
                 )
+        for column in self.indicator_grid_columns():
+            if column.startswith('rsi_'):
+                grid[f'score_{column}{suffix}'] = part(rsi_score(df[column].to_numpy()))
+            elif column.startswith('macdhist_'):
+                grid[f'score_{column}{suffix}'] = part(macdhist_score(df[column].to_numpy()))
+        grid[f'score_bb{suffix}'] = part(
+            bollinger_score(close, df['bb_lower'].to_numpy(), df['bb_upper'].to_numpy()), np.float64
+        )
+        return grid
+
+    def populate_scores(self, dataframe: DataFrame) -> DataFrame:
+        """
+        按当前参数值从网格中选列，计算三个时间框架的评分和信号强度
+        评分是预先算好的分项之和，hyperopt 每个 epoch 只重跑这里，不重新计算指标
+        """
+        macd_column = f'macdhist_{self.macd_fast.value}_{self.macd_slow.value}_{self.macd_signal.value}'
+        
+        def score(suffix: str) -> np.ndarray:
+            if f'score_bb{suffix}' not in dataframe.columns:
+                return np.zeros(len(dataframe))
+            return (
+                dataframe[f'score_sma_{self.sma_short_period.value}_{self.sma_long_period.value}{suffix}']
+                .to_numpy(dtype=np.float64)
+                + dataframe[f'score_{macd_column}{suffix}'].to_numpy()
+                + dataframe[f'score_rsi_{self.rsi_period.value}{suffix}'].to_numpy()
+                + dataframe[f'score_bb{suffix}'].to_numpy()
             )
-        else:
-            macd_score = np.where(df['macd'] > df['macdsignal'], 1, -1)
-        score += macd_score
         
-        # V2_1的RSI评分
-        rsi_score = np.where(
-            df['rsi'] > 60, 1,
-            np.where(df['rsi'] < 40, -1, 0)
+        dataframe['sma_short'] = dataframe[f'sma_{self.sma_short_period.value}']
+        dataframe['sma_long'] = dataframe[f'sma_{self.sma_long_period.value}']
+        dataframe['rsi'] = dataframe[f'rsi_{self.rsi_period.value}']
+        dataframe['macdhist'] = dataframe[macd_column]
+        dataframe['market_trend'] = np.where(
+            dataframe['sma_short'] > dataframe['sma_long'], 1,
+            np.where(dataframe['sma_short'] < dataframe['sma_long'], -1, 0)
         )
-        score += rsi_score
         
-        # V2_1的布林带评分
-        if 'bb_upper' in df.columns and 'bb_lower' in df.columns:
-            bb_score = np.where(
-                df['close'] > df['bb_upper'], 0.5,
-                np.where(df['close'] < df['bb_lower'], -0.5, 0)
-            )
-            score += bb_score
+        # V2_1的核心评分系统
+        h1_score = score('')
+        daily_score = score('_1d')
+        h4_score = score('_4h')
+        dataframe['h1_score'] = h1_score
+        dataframe['daily_score'] = daily_score
+        dataframe['h4_score'] = h4_score
+        dataframe['signal_strength'] = self.calculate_signal_strength(
+            daily_score, h4_score, h1_score, dataframe['volume_ratio'].to_numpy()
+        )
         
-        return score
+        return dataframe
 
-    def calculate_signal_strength(self, dataframe: DataFrame) -> pd.Series:
+    def calculate_signal_strength(self, daily_score: np.ndarray, h4_score: np.ndarray, h1_score: np.ndarray,
+                                  volume_ratio: np.ndarray) -> np.ndarray:
         """V2_1的信号强度计算（稍作优化）"""
-        strength = pd.Series(0.0, index=dataframe.index)
-        
         # V2_1的三时间框架权重
-        daily_weight = abs(dataframe['daily_score']) * 0.4
-        h4_weight = abs(dataframe['h4_score']) * 0.3  
-        h1_weight = abs(dataframe['h1_score']) * 0.3   
+        daily_weight = np.abs(daily_score) * 0.4
+        h4_weight = np.abs(h4_score) * 0.3  
+        h1_weight = np.abs(h1_score) * 0.3   
         
         # V2_1的成交量确认
-        volume_confirm = np.where(dataframe['volume_ratio'] > 1.0, 0.5, 0)
+        volume_confirm = np.where(volume_ratio > 1.0, 0.5, 0)
         
         strength = daily_weight + h4_weight + h1_weight + volume_confirm
         
         return np.clip(strength, 0, 10)
 
-    def get_emergency_level(self) -> int:
-        """智能应急等级判断"""
-        # 这里简化实现，实际应该检查最近的交易记录
+    def get_emergency_level(self, current_time: Optional[datetime] = None) -> int:
+        """智能应急等级判断：全局连续 3/5/7 天无开仓升级为 1/2/3 级"""
         # 返回 0=正常, 1=轻度应急, 2=中度应急, 3=重度应急
-        return 0  # 简化实现，实际需要根据交易记录动态判断
+        return self.emergency_tracker.level(current_time)
+
+    def candle_emergency_levels(self, entries_by_level: List[np.ndarray]) -> np.ndarray:
+        """
+        每根K线的应急等级：距本交易对上一个开仓信号的K线数按 no_trade_l1/l2/l3_days 升级，
+        这根K线按该等级的条件判断是否开仓，开仓信号把计数清零（数据开头从第一根K线开始计数）。
+        entries_by_level[等级] 是按该等级条件得到的开仓信号；只依赖 dataframe，回测和实盘一致
+
+        不逐根K线循环：从计数清零的K线起，各等级覆盖的K线区间是固定的，用"下一个开仓信号的位置"
+        数组直接找到区间内的第一个开仓；间隔都不到 l1 的一串0级开仓一次跳过，循环次数只和升级次数有关
+        """
+        candles_per_day = 1440 // timeframe_to_minutes(self.timeframe)
+        # 计数清零后，等级 k 从第 thresholds[k] 根K线开始
+        thresholds = [0, self.no_trade_l1_days * candles_per_day, self.no_trade_l2_days * candles_per_day,
+                      self.no_trade_l3_days * candles_per_day]
+        num_candles = len(entries_by_level[0])
+        levels = np.zeros(num_candles, dtype=np.int8)
+        positions = np.arange(num_candles)
+        # next_entry[等级][i]：第 i 根K线及之后该等级的第一个开仓信号（没有为 num_candles）
+        next_entry = [np.minimum.accumulate(np.where(entries, positions, num_candles)[::-1])[::-1]
+                      for entries in entries_by_level]
+        # 0级开仓中，到下一个0级开仓的计数达到 l1 的位置（一串0级开仓在这里结束）
+        level_0_entries = np.flatnonzero(entries_by_level[0])
+        chain_ends = np.flatnonzero(np.diff(level_0_entries) - 1 >= thresholds[1])
 
-    def get_adaptive_thresholds(self, pair_weight: float) -> tuple:
+        start = 0
+        while start < num_candles:
+            entry = num_candles
+            for level in range(4):
+                level_start = min(start + thresholds[level], num_candles)
+                level_end = min(start + thresholds[level + 1], num_candles) if level < 3 else num_candles
+                entry = next_entry[level][level_start] if level_start < num_candles else num_candles
+                if entry < level_end:
+                    levels[level_start:entry + 1] = level
+                    break
+                levels[level_start:level_end] = level
+            if entry < num_candles and level == 0:
+                # 后面间隔不到 l1 的0级开仓之间都是0级（levels 初始就是0），直接到这一串的最后一个
+                chain = np.searchsorted(chain_ends, np.searchsorted(level_0_entries, entry))
+                entry = level_0_entries[chain_ends[chain]] if chain < len(chain_ends) else level_0_entries[-1]
+            start = entry + 1
+        return levels
+
+    def get_adaptive_thresholds(self, pair_weight: float, emergency_level: int) -> tuple:
         """V2_4智能阈值获取"""
-        emergency_level = self.get_emergency_level()
-        
         if emergency_level == 0:
             # 正常模式：使用V2_1的成功参数
-            strong_threshold = self.normal_strong_threshold
-            weak_threshold = self.normal_weak_threshold
+            strong_threshold = self.normal_strong_threshold.value
+            weak_threshold = self.normal_weak_threshold.value
         elif emergency_level == 1:
             # 轻度应急：稍微放宽
             strong_threshold = self.emergency_l1_threshold
@@ -331,187 +458,167 @@ class TripleTimeframeTrendStrategyV2_4(IStrategy):
 
     def populate_entry_trend(self, dataframe: DataFrame, metadata: Dict) -> DataFrame:
         """V2_4智能双模式入场系统"""
+        dataframe = self.populate_scores(dataframe)
+        
         pair = metadata['pair']
         pair_weight = self.pair_weights.get(pair, 1.0)
         
-        # 获取当前模式的自适应阈值
-        current_strong_threshold, current_weak_threshold = self.get_adaptive_thresholds(pair_weight)
-        emergency_level = self.get_emergency_level()
-        
-        conditions_long = []
-        conditions_short = []
-        conditions_weak_long = []
-        conditions_emergency = []
-        
-        # === 核心做多信号（基于V2_1成功逻辑）===
-        conditions_long.append(dataframe['daily_score'] > 0)      # V2_1成功参数
-        conditions_long.append(dataframe['h4_score'] > 0)        # V2_1成功参数 
-        conditions_long.append(dataframe['h1_score'] >= current_strong_threshold)
-        
-        # === 弱做多信号（V2_1优化）===
-        if pair_weight >= 1.1:  # V2_1验证的高权重币种
-            weak_threshold = current_weak_threshold
-        elif pair_weight >= 0.8:  # V2_1验证的中等权重币种
-            weak_threshold = current_weak_threshold + 1  
-        else:  # V2_1验证的低权重币种
-            weak_threshold = current_weak_threshold + 2
-            
-        weak_long_cond_1 = (
-            (dataframe['daily_score'] >= 0) & 
-            (dataframe['h4_score'] >= 0) & 
-            (dataframe['h1_score'] >= weak_threshold) &
-            (dataframe['signal_strength'] >= 3)  # V2_1水平
-        )
-        
-        weak_long_cond_2 = (
-            (dataframe['is_trending']) &
-            (dataframe['daily_score'] > 1) &
-            (dataframe['h1_score'] >= current_weak_threshold) &
-            (dataframe['signal_strength'] >= 4)  # V2_1水平
-        )
-        
-        conditions_weak_long.append(weak_long_cond_1)
-        conditions_weak_long.append(weak_long_cond_2)
-        
-        # === V2_4创新：分级应急交易系统 ===
-        if emergency_level >= 2:  # 中度以上应急
-            # 应急模式1：单时间框架突破（V2_3逻辑）
-            emergency_cond_1 = (
-                (dataframe['h1_score'] >= 0) &  
-                (dataframe['rsi'] < 75) &       
-                (dataframe['signal_strength'] >= 1.5)
-            )
-            
-            # 应急模式2：动量突破（V2_3逻辑）
-            emergency_cond_2 = (
-                (dataframe.get('price_momentum', 0) > 0.005) &
-                (dataframe['volume_ratio'] > 0.7) &
-                (dataframe['rsi'] < 75)
-            )
-            
-            conditions_emergency.extend([emergency_cond_1, emergency_cond_2])
-        
-        if emergency_level == 3:  # 重度应急：极限放宽
-            emergency_cond_3 = (
-                (dataframe['rsi'] < 80) &
-                (dataframe['volume_ratio'] > 0.5) &
-                (dataframe['close'] > dataframe['sma_short'])  # 最基本的趋势要求
-            )
-            conditions_emergency.append(emergency_cond_3)
+        # 每个应急等级的开仓信号（与等级无关的条件只算一次），再按每根K线的应急等级选用
+        conditions = self.entry_conditions(dataframe, pair_weight)
+        signals = [self.entry_signals(conditions, pair_weight, level) for level in range(4)]
+        levels = self.candle_emergency_levels([tag_codes > 0 for tag_codes, _ in signals])
+        dataframe['emergency_level'] = levels
+        
+        tag_codes = np.choose(levels, [level_tag_codes for level_tag_codes, _ in signals])
+        strong_short = np.zeros(len(dataframe), dtype=bool)
+        for level, (_, level_short) in enumerate(signals):
+            if level_short is not None:
+                strong_short |= (levels == level) & level_short
+        
+        is_buy = tag_codes > 0
+        dataframe.loc[is_buy, 'buy'] = 1
+        dataframe.loc[is_buy, 'buy_tag'] = np.array(self.entry_tags, dtype=object)[tag_codes[is_buy]]
+        if strong_short.any():
+            dataframe.loc[strong_short, 'sell'] = 1
+            dataframe.loc[strong_short, 'sell_tag'] = 'strong_short_v2_4'
         
-        # === 做空信号（V2_1逻辑）===
-        # 只在明确熊市信号时做空
-        if dataframe['daily_score'].iloc[-1] <= -1 and dataframe['h4_score'].iloc[-1] <= -1:
-            conditions_short.append(dataframe['daily_score'] <= -1)
-            conditions_short.append(dataframe['h4_score'] <= -1) 
-            conditions_short.append(dataframe['h1_score'] <= -current_strong_threshold)
+        return dataframe
+
+    # entry_signals 返回的开仓标签编号（0 为无信号）；应急开仓的编号是 1 + 应急等级
+    entry_tags = [None, 'strong_long_v2_4', 'weak_long_v2_4', 'emergency_L2_v2_4', 'emergency_L3_v2_4']
+
+    def entry_conditions(self, dataframe: DataFrame, pair_weight: float) -> Dict[str, np.ndarray]:
+        """各应急等级共用的开仓条件（numpy 布尔数组），每个等级只需再比较 h1_score 阈值"""
+        daily_score = dataframe['daily_score'].to_numpy()
+        h4_score = dataframe['h4_score'].to_numpy()
+        h1_score = dataframe['h1_score'].to_numpy()
+        signal_strength = dataframe['signal_strength'].to_numpy()
+        rsi = dataframe['rsi'].to_numpy()
+        volume_ratio = dataframe['volume_ratio'].to_numpy()
         
         # === 通用过滤条件（V2_1成功经验）===
-        common_filters = [
-            dataframe['volume'] > 0,
-            dataframe['volume_ratio'] > 0.8  # V2_1成功参数
-        ]
+        common_filters = (dataframe['volume'].to_numpy() > 0) & (volume_ratio > 0.8)  # V2_1成功参数
         
         # V2_1验证的币种权重差异化RSI过滤
         if pair_weight >= 1.2:
             # 优秀币种 - V2_1验证的宽松RSI
-            rsi_filter_long = dataframe['rsi'] < 75
-            rsi_filter_short = dataframe['rsi'] > 25
+            rsi_filter_long = rsi < 75
+            rsi_filter_short = rsi > 25
         elif pair_weight >= 0.8:
             # 标准币种 - V2_1成功参数
-            rsi_filter_long = dataframe['rsi'] < self.rsi_overbought
-            rsi_filter_short = dataframe['rsi'] > self.rsi_oversold
+            rsi_filter_long = rsi < self.rsi_overbought.value
+            rsi_filter_short = rsi > self.rsi_oversold.value
         else:
             # 表现差币种 - V2_1验证的严格RSI
-            rsi_filter_long = dataframe['rsi'] < 68
-            rsi_filter_short = dataframe['rsi'] > 32
+            rsi_filter_long = rsi < 68
+            rsi_filter_short = rsi > 32
+        
+        conditions = {
+            'h1_score': h1_score,
+            'long_filters': common_filters & rsi_filter_long,
+            # === 核心做多信号（基于V2_1成功逻辑）===
+            'strong_long': (daily_score > 0) & (h4_score > 0),
+            # === 弱做多信号（V2_1优化）===
+            'weak_long_1': (daily_score >= 0) & (h4_score >= 0) & (signal_strength >= 3),  # V2_1水平
+            'weak_long_2': dataframe['is_trending'].to_numpy() & (daily_score > 1) & (signal_strength >= 4),
+            # === V2_4创新：分级应急交易系统 ===
+            # 中度以上应急：单时间框架突破 | 动量突破（V2_3逻辑）
+            'emergency': (
+                (h1_score >= 0) & (rsi < 75) & (signal_strength >= 1.5)
+                | (dataframe['price_momentum'].to_numpy() > 0.005) & (volume_ratio > 0.7) & (rsi < 75)
+            ),
+            # 重度应急：极限放宽，最基本的趋势要求
+            'emergency_l3': (rsi < 80) & (volume_ratio > 0.5)
+                            & (dataframe['close'].to_numpy() > dataframe['sma_short'].to_numpy()),
+            'short': None,
+        }
+        
+        # === 做空信号（V2_1逻辑）===
+        # 只在明确熊市信号时做空
+        if daily_score[-1] <= -1 and h4_score[-1] <= -1:
+            conditions['short'] = (daily_score <= -1) & (h4_score <= -1) & common_filters & rsi_filter_short
+        return conditions
+
+    def entry_signals(self, conditions: Dict[str, np.ndarray], pair_weight: float, emergency_level: int) -> tuple:
+        """按指定应急等级的阈值计算开仓信号，返回 (开仓标签编号数组，见 entry_tags, 做空信号或 None)"""
+        # 获取当前模式的自适应阈值
+        current_strong_threshold, current_weak_threshold = self.get_adaptive_thresholds(pair_weight, emergency_level)
+        h1_score = conditions['h1_score']
+        long_filters = conditions['long_filters']
+        
+        # 弱做多阈值按币种权重（V2_1验证的高/中等/低权重币种）
+        if pair_weight >= 1.1:
+            weak_threshold = current_weak_threshold
+        elif pair_weight >= 0.8:
+            weak_threshold = current_weak_threshold + 1  
+        else:
+            weak_threshold = current_weak_threshold + 2
         
         # === 智能执行交易信号 ===
+        tag_codes = np.zeros(len(h1_score), dtype=np.int8)
         
         # 应急模式交易（最高优先级）
-        if conditions_emergency and common_filters:
-            emergency_filters = common_filters + [rsi_filter_long]
-            emergency_signal = reduce(lambda x, y: x | y, conditions_emergency)
-            emergency_signal = emergency_signal & reduce(lambda x, y: x & y, emergency_filters)
-            dataframe.loc[emergency_signal, 'buy'] = 1
-            dataframe.loc[emergency_signal, 'buy_tag'] = f'emergency_L{emergency_level}_v2_4'
+        if emergency_level >= 2:
+            emergency_signal = conditions['emergency']
+            if emergency_level == 3:
+                emergency_signal = emergency_signal | conditions['emergency_l3']
+            tag_codes[emergency_signal & long_filters] = 1 + emergency_level
         
         # V2_1标准强信号
-        elif conditions_long and common_filters:
-            long_filters = common_filters + [rsi_filter_long]
-            strong_long = reduce(lambda x, y: x & y, conditions_long + long_filters)
-            dataframe.loc[strong_long, 'buy'] = 1
-            dataframe.loc[strong_long, 'buy_tag'] = 'strong_long_v2_4'
+        else:
+            tag_codes[conditions['strong_long'] & (h1_score >= current_strong_threshold) & long_filters] = 1
         
         # V2_1弱信号
-        if conditions_weak_long and common_filters:
-            long_filters = common_filters + [rsi_filter_long]
-            weak_long = reduce(lambda x, y: x | y, conditions_weak_long)
-            weak_long = weak_long & reduce(lambda x, y: x & y, long_filters)
-            
-            if 'buy' in dataframe.columns:
-                weak_long = weak_long & (dataframe['buy'] != 1)
-            
-            dataframe.loc[weak_long, 'buy'] = 1
-            dataframe.loc[weak_long, 'buy_tag'] = 'weak_long_v2_4'
+        weak_long = (
+            conditions['weak_long_1'] & (h1_score >= weak_threshold)
+            | conditions['weak_long_2'] & (h1_score >= current_weak_threshold)
+        )
+        tag_codes[weak_long & long_filters & (tag_codes == 0)] = 2
 
         # V2_1做空信号
-        if conditions_short and common_filters:
-            short_filters = common_filters + [rsi_filter_short]
-            strong_short = reduce(lambda x, y: x & y, conditions_short + short_filters)
-            dataframe.loc[strong_short, 'sell'] = 1
-            dataframe.loc[strong_short, 'sell_tag'] = 'strong_short_v2_4'
+        strong_short = None
+        if conditions['short'] is not None:
+            strong_short = conditions['short'] & (h1_score <= -current_strong_threshold)
 
-        return dataframe
+        return tag_codes, strong_short
 
     def populate_exit_trend(self, dataframe: DataFrame, metadata: Dict) -> DataFrame:
         """V2_1的成功退出逻辑"""
-        conditions_strong = []
-        conditions_weak = []
+        rsi = dataframe['rsi'].to_numpy()
+        h1_score = dataframe['h1_score'].to_numpy()
         
         # V2_1的强烈退出条件
-        conditions_strong.append(dataframe['daily_score'] < -1)
-        conditions_strong.append(dataframe['h4_score'] < -1)
-        conditions_strong.append(dataframe['h1_score'] <= -self.normal_strong_threshold)
+        strong_exit = (
+            (dataframe['daily_score'].to_numpy() < -1)
+            & (dataframe['h4_score'].to_numpy() < -1)
+            & (h1_score <= -self.normal_strong_threshold.value)
+        )
         
         # V2_1的保护性退出
         weak_cond_1 = (
-            (dataframe['signal_strength'] < 2) &
-            (dataframe['h1_score'] <= 0) &
-            (dataframe['rsi'] > 65)
+            (dataframe['signal_strength'].to_numpy() < 2) &
+            (h1_score <= 0) &
+            (rsi > 65)
         )
         
         weak_cond_2 = (
-            (dataframe['rsi'] > self.rsi_overbought) &
-            (dataframe['close'] > dataframe['bb_upper']) &
-            (dataframe['macdhist'] < 0)
+            (rsi > self.rsi_overbought.value) &
+            (dataframe['close'].to_numpy() > dataframe['bb_upper'].to_numpy()) &
+            (dataframe['macdhist'].to_numpy() < 0)
         )
         
-        conditions_weak.append(weak_cond_1)
-        conditions_weak.append(weak_cond_2)
-        
         # V2_1的通用过滤条件
-        common_filters = [
-            dataframe['volume'] > 0,
-            dataframe['rsi'] > self.rsi_oversold
-        ]
+        common_filters = (dataframe['volume'].to_numpy() > 0) & (rsi > self.rsi_oversold.value)
         
         # V2_1强烈退出
-        if conditions_strong and common_filters:
-            strong_exit = reduce(lambda x, y: x & y, conditions_strong + common_filters)
-            dataframe.loc[strong_exit, 'sell'] = 1
-            dataframe.loc[strong_exit, 'exit_tag'] = 'strong_bearish_v2_4'
+        strong_exit &= common_filters
+        dataframe.loc[strong_exit, 'sell'] = 1
+        dataframe.loc[strong_exit, 'exit_tag'] = 'strong_bearish_v2_4'
         
         # V2_1保护性退出
-        if conditions_weak and common_filters:
-            weak_exit = reduce(lambda x, y: x | y, conditions_weak)
-            weak_exit = weak_exit & reduce(lambda x, y: x & y, common_filters)
-            
-            if 'sell' in dataframe.columns:
-                weak_exit = weak_exit & (dataframe['sell'] != 1)
-            
-            dataframe.loc[weak_exit, 'sell'] = 1
-            dataframe.loc[weak_exit, 'exit_tag'] = 'protect_profit_v2_4'
+        weak_exit = (weak_cond_1 | weak_cond_2) & common_filters & (dataframe['sell'].to_numpy() != 1)
+        dataframe.loc[weak_exit, 'sell'] = 1
+        dataframe.loc[weak_exit, 'exit_tag'] = 'protect_profit_v2_4'
 
         return dataframe
 
@@ -524,7 +631,7 @@ class TripleTimeframeTrendStrategyV2_4(IStrategy):
             
         last_candle = dataframe.iloc[-1]
         pair_weight = self.pair_weights.get(pair, 1.0)
-        emergency_level = self.get_emergency_level()
+        emergency_level = self.get_emergency_level(current_time)
         
         if 'atr' in last_candle:
             atr_value = last_candle['atr']
@@ -562,7 +669,7 @@ class TripleTimeframeTrendStrategyV2_4(IStrategy):
         last_candle = dataframe.iloc[-1]
         signal_strength = last_candle.get('signal_strength', 5)
         pair_weight = self.pair_weights.get(pair, 1.0)
-        emergency_level = self.get_emergency_level()
+        emergency_level = self.get_emergency_level(current_time)
         
         # 基于币种权重和模式的差异化止盈（V2_1成功经验）
         if emergency_level >= 2:
@@ -600,7 +707,7 @@ class TripleTimeframeTrendStrategyV2_4(IStrategy):
         """V2_1的优秀仓位管理"""
         dataframe, _ = self.dp.get_analyzed_dataframe(pair, self.timeframe)
         pair_weight = self.pair_weights.get(pair, 1.0)
-        emergency_level = self.get_emergency_level()
+        emergency_level = self.get_emergency_level(current_time)
         
         # V2_1的基础权重调整
         base_multiplier = pair_weight
@@ -635,7 +742,7 @@ class TripleTimeframeTrendStrategyV2_4(IStrategy):
                  **kwargs) -> float:
         """V2_1的成功杠杆策略"""
         pair_weight = self.pair_weights.get(pair, 1.0)
-        emergency_level = self.get_emergency_level()
+        emergency_level = self.get_emergency_level(current_time)
         
         # 应急模式使用更保守杠杆
         if emergency_level >= 2:
@@ -0,0 +1,183 @@
+# pragma pylint: disable=missing-docstring, invalid-name, pointless-string-statement
+
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+import talib
+from pandas import DataFrame
+
+# 进程内共享的指标缓存：(交易对, 周期, 指标, 参数, K线范围) -> 指标数组
+# 同一进程里的多个策略（例如 backtesting --strategy-list）在同一交易对上只算一次；
+# 日线/4h 指标在新K线出现前也不会重复计算
+INDICATOR_CACHE_SIZE = 2048
+_indicator_cache: "OrderedDict[tuple, Tuple[np.ndarray, ...]]" = OrderedDict()
+
+
+def clear_indicator_cache():
+    _indicator_cache.clear()
+
+
+class CachedIndicators:
+    """
+    TripleTimeframe 系列策略共用的指标库，接口与 talib.abstract 一致（返回 Series / 列名相同的 dict）
+
+    按 (pair, timeframe, 参数, 最后一根K线) 缓存，结果是副本，策略修改返回值不会影响缓存。
+    """
+
+    def __init__(self, dataframe: DataFrame, pair: str, timeframe: str):
+        self.dataframe = dataframe
+        self.pair = pair
+        self.timeframe = timeframe
+
+    def _candles_key(self) -> tuple:
+        if len(self.dataframe) == 0:
+            return (0,)
+        dates = self.dataframe['date']
+        return (len(self.dataframe), dates.iloc[0], dates.iloc[-1])
+
+    def _column(self, name: str) -> np.ndarray:
+        return self.dataframe[name].to_numpy(dtype=np.float64)
+
+    def _cached(self, name: str, params: tuple, compute) -> Tuple[np.ndarray, ...]:
+        key = (self.pair, self.timeframe, name, params, self._candles_key())
+        values = _indicator_cache.get(key)
+        if values is None:
+            values = compute()
+            _indicator_cache[key] = values
+            if len(_indicator_cache) > INDICATOR_CACHE_SIZE:
+                _indicator_cache.popitem(last=False)
+        else:
+            _indicator_cache.move_to_end(key)
+        return values
+
+    def _series(self, values: np.ndarray) -> pd.Series:
+        return pd.Series(values.copy(), index=self.dataframe.index)
+
+    def SMA(self, timeperiod: int, price: str = 'close') -> pd.Series:
+        values, = self._cached('SMA', (timeperiod, price),
+                               lambda: (talib.SMA(self._column(price), timeperiod=timeperiod),))
+        return self._series(values)
+
+    def RSI(self, timeperiod: int) -> pd.Series:
+        values, = self._cached('RSI', (timeperiod,),
+                               lambda: (talib.RSI(self._column('close'), timeperiod=timeperiod),))
+        return self._series(values)
+
+    def ATR(self, timeperiod: int) -> pd.Series:
+        values, = self._cached('ATR', (timeperiod,), lambda: (
+            talib.ATR(self._column('high'), self._column('low'), self._column('close'), timeperiod=timeperiod),
+        ))
+        return self._series(values)
+
+    def MOM(self, timeperiod: int) -> pd.Series:
+        values, = self._cached('MOM', (timeperiod,),
+                               lambda: (talib.MOM(self._column('close'), timeperiod=timeperiod),))
+        return self._series(values)
+
+    def ROC(self, timeperiod: int) -> pd.Series:
+        values, = self._cached('ROC', (timeperiod,),
+                               lambda: (talib.ROC(self._column('close'), timeperiod=timeperiod),))
+        return self._series(values)
+
+    def MACD(self, fastperiod: int, slowperiod: int, signalperiod: int) -> Dict[str, pd.Series]:
+        values = self._cached('MACD', (fastperiod, slowperiod, signalperiod), lambda: talib.MACD(
+            self._column('close'), fastperiod=fastperiod, slowperiod=slowperiod, signalperiod=signalperiod
+        ))
+        return dict(zip(('macd', 'macdsignal', 'macdhist'), map(self._series, values)))
+
+    def BBANDS(self, timeperiod: int, nbdevup: float, nbdevdn: float) -> Dict[str, pd.Series]:
+        values = self._cached('BBANDS', (timeperiod, nbdevup, nbdevdn), lambda: talib.BBANDS(
+            self._column('close'), timeperiod=timeperiod, nbdevup=nbdevup, nbdevdn=nbdevdn
+        ))
+        return dict(zip(('upperband', 'middleband', 'lowerband'), map(self._series, values)))
+
+    def ichimoku(self, conversion_line_period: int = 9, base_line_period: int = 26,
+                 lagging_span_period: int = 52) -> Dict[str, pd.Series]:
+        """一目均衡表：高低点区间用 talib MAX/MIN（C 实现）代替 pandas rolling"""
+        def compute():
+            high = self._column('high')
+            low = self._column('low')
+            close = self._column('close')
+
+            def midpoint(period):
+                return (talib.MAX(high, timeperiod=period) + talib.MIN(low, timeperiod=period)) / 2
+
+            def shift(values, periods):
+                result = np.full(len(values), np.nan)
+                if periods >= 0:
+                    result[periods:] = values[:len(values) - periods]
+                else:
+                    result[:periods] = values[-periods:]
+                return result
+
+            tenkan_sen = midpoint(conversion_line_period)
+            kijun_sen = midpoint(base_line_period)
+            return (
+                tenkan_sen,
+                kijun_sen,
+                shift((tenkan_sen + kijun_sen) / 2, base_line_period),
+                shift(midpoint(lagging_span_period), base_line_period),
+                shift(close, -base_line_period),
+            )
+
+        values = self._cached('ichimoku', (conversion_line_period, base_line_period, lagging_span_period), compute)
+        names = ('tenkan_sen', 'kijun_sen', 'senkou_span_a', 'senkou_span_b', 'chikou_span')
+        return dict(zip(names, map(self._series, values)))
+
+
+def sma_trend_score(close: np.ndarray, sma_short: np.ndarray, sma_long: np.ndarray,
+                    sma_weight: float = 2) -> np.ndarray:
+    """trend_score 的 SMA 趋势分项：均线多头/空头排列 ±sma_weight，否则仅站上/跌破短均线 ±1"""
+    return np.where(
+        (close > sma_short) & (sma_short > sma_long), sma_weight,
+        np.where(
+            (close < sma_short) & (sma_short < sma_long), -sma_weight,
+            np.where(close > sma_short, 1, -1)
+        )
+    )
+
+
+def macdhist_score(macdhist: np.ndarray) -> np.ndarray:
+    """trend_score 的 MACD 分项：macdhist = macd - macdsignal，只用 macdhist 判断（与比较 macd/macdsignal 等价）"""
+    return np.where(macdhist > 0, 2, np.where(macdhist < 0, -2, -1))
+
+
+def rsi_score(rsi: np.ndarray, rsi_upper: float = 60, rsi_lower: float = 40, rsi_weight: float = 1) -> np.ndarray:
+    """trend_score 的 RSI 分项：超过上下阈值 ±rsi_weight"""
+    return np.where(rsi > rsi_upper, 1, np.where(rsi < rsi_lower, -1, 0)) * rsi_weight
+
+
+def bollinger_score(close: np.ndarray, bb_lower: np.ndarray, bb_upper: np.ndarray,
+                    bb_weight: float = 0.5) -> np.ndarray:
+    """trend_score 的布林带分项：突破上/下轨 ±bb_weight"""
+    return np.where(close > bb_upper, bb_weight, np.where(close < bb_lower, -bb_weight, 0))
+
+
+def trend_score(df: DataFrame, sma_weight: float = 2, rsi_upper: float = 60, rsi_lower: float = 40,
+                rsi_weight: float = 1, bb_weight: float = 0.5, momentum_weight: float = 0) -> pd.Series:
+    """
+    各版本共用的趋势评分：SMA 趋势 ±sma_weight（仅站上/跌破短均线 ±1），MACD ±2/±1，
+    RSI 超过上下阈值 ±rsi_weight，布林带突破 ±bb_weight，动量（有 momentum 列时）±momentum_weight
+
+    各分项可单独计算（sma_trend_score 等），按参数网格预先算好后只需相加
+    """
+    score = pd.Series(0.0, index=df.index)
+
+    score += sma_trend_score(df['close'], df['sma_short'], df['sma_long'], sma_weight)
+
+    if 'macdhist' in df.columns:
+        score += macdhist_score(df['macdhist'])
+    else:
+        score += np.where(df['macd'] > df['macdsignal'], 1, -1)
+
+    score += rsi_score(df['rsi'], rsi_upper, rsi_lower, rsi_weight)
+
+    if 'bb_upper' in df.columns and 'bb_lower' in df.columns:
+        score += bollinger_score(df['close'], df['bb_lower'], df['bb_upper'], bb_weight)
+
+    if momentum_weight and 'momentum' in df.columns:
+        score += np.where(df['momentum'] > 0, 1, -1) * momentum_weight
+
+    return score
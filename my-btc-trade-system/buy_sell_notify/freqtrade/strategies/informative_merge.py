@@ -0,0 +1,31 @@
+# pragma pylint: disable=missing-docstring, invalid-name, pointless-string-statement
+
+from typing import List
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+from freqtrade.exchange import timeframe_to_minutes
+
+
+def merge_informative_columns(dataframe: DataFrame, informative: DataFrame, columns: List[str],
+                              timeframe: str, informative_timeframe: str, suffix: str = '') -> DataFrame:
+    """
+    将大周期（1d/4h）的列一次性挂到主周期数据上，不复制主 dataframe
+
+    大周期K线只有在收盘后才可用：1d K线 00:00 开盘，要到 1h K线 23:00（收盘于次日 00:00）才能看到。
+    按精确日期 merge 会把当天尚未收盘的日线分数提前给当天所有小时K线（未来函数）。
+    这里把大周期时间戳移到收盘时刻，用一次 searchsorted 找到每根主周期K线可见的最后一根大周期K线
+    （等价于 merge_asof backward + ffill），然后按位置取值写入各列（列名加 suffix）。
+    """
+    # 大周期K线在主周期的哪根K线收盘时可见（与 freqtrade merge_informative_pair 一致）
+    offset = pd.Timedelta(minutes=timeframe_to_minutes(informative_timeframe) - timeframe_to_minutes(timeframe))
+    available_dates = pd.DatetimeIndex(informative['date'] + offset)
+    positions = available_dates.searchsorted(pd.DatetimeIndex(dataframe['date']), side='right') - 1
+    is_available = positions >= 0
+    positions = np.where(is_available, positions, 0)
+
+    for column in columns:
+        values = informative[column].to_numpy(dtype=np.float64)
+        dataframe[f'{column}{suffix}'] = np.where(is_available, values[positions], np.nan)
+    return dataframe
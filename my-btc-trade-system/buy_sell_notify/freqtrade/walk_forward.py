@@ -0,0 +1,163 @@
+# walk_forward.py - 滚动窗口（walk-forward）样本外验证
+
+"""
+把历史数据切成滚动的 训练/测试 窗口，输出每个窗口的样本内 / 样本外表现，
+用来检查策略收益是否只在某段行情里成立（单一区间的高收益往往是过拟合）。
+
+指标对全部数据只计算一次（advise_all_indicators），再对第一个训练窗口开始到最后一个测试窗口
+结束的整个区间只回测一次，耗时与一次完整回测相同。各窗口的表现按平仓时间（close_date）从这次
+回测的交易中切出：收益和回撤以窗口开始时的账户余额为基准。窗口互相重叠也不会重复回测；
+策略和账户状态在窗口之间是连续的（与实盘一样），不是每个窗口从头开始。
+
+用法:
+    python walk_forward.py --config config/config_trend.json --strategy TripleTimeframeTrendStrategyV2_4 \
+        --timerange 20240101-20241201 --train-days 120 --test-days 30
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+from freqtrade.configuration import TimeRange
+from freqtrade.data.converter import trim_dataframes
+from freqtrade.data.history import get_timerange
+from freqtrade.exchange import timeframe_to_minutes
+from freqtrade.optimize.backtesting import Backtesting
+
+from backtest_runner import format_comparison, load_config, write_comparison
+
+FOLD_COLUMNS = [
+    'fold', 'train_start', 'test_start', 'test_end',
+    'train_profit_pct', 'test_profit_pct', 'test_trades', 'test_max_drawdown_pct', 'test_winrate_pct',
+]
+
+
+def make_folds(start: datetime, end: datetime, train_days: int, test_days: int) -> List[Tuple[datetime, datetime, datetime]]:
+    """(训练开始, 测试开始, 测试结束)，每次向后滚动一个测试窗口长度"""
+    folds = []
+    train_start = start
+    while True:
+        test_start = train_start + timedelta(days=train_days)
+        test_end = test_start + timedelta(days=test_days)
+        if test_end > end:
+            break
+        folds.append((train_start, test_start, test_end))
+        train_start += timedelta(days=test_days)
+    return folds
+
+
+def slice_window(processed: Dict[str, DataFrame], start: datetime, end: datetime, startup: int) -> Dict[str, DataFrame]:
+    """按位置截取 [start, end) 的K线，并在前面保留 startup 根（回测会按 startup 数量裁掉）"""
+    window = {}
+    for pair, df in processed.items():
+        dates = pd.DatetimeIndex(df['date'])
+        first = dates.searchsorted(start, side='left')
+        last = dates.searchsorted(end, side='left')
+        if last > first:
+            window[pair] = df.iloc[max(first - startup, 0):last]
+    return window
+
+
+def window_metrics(profit_abs: np.ndarray, balance: float) -> Dict:
+    """窗口内按平仓时间排序的交易盈亏；balance 为窗口开始时的账户余额"""
+    metrics = {'trades': len(profit_abs), 'profit_pct': 0.0, 'max_drawdown_pct': 0.0, 'winrate_pct': 0.0}
+    if len(profit_abs) == 0:
+        return metrics
+
+    equity = balance + np.cumsum(profit_abs)
+    peak = np.maximum.accumulate(np.concatenate(([balance], equity)))[1:]
+    metrics['profit_pct'] = round((equity[-1] / balance - 1) * 100, 2)
+    metrics['max_drawdown_pct'] = round(float(np.max(1 - equity / peak)) * 100, 2)
+    metrics['winrate_pct'] = round(float(np.mean(profit_abs > 0)) * 100, 2)
+    return metrics
+
+
+def prepare_walk_forward(config: Dict) -> Tuple[Backtesting, Dict[str, DataFrame], datetime, datetime]:
+    """加载数据并对全部区间计算一次指标，返回可回测的起止时间（已去掉 startup K线）"""
+    backtesting = Backtesting(config)
+    data, timerange = backtesting.load_bt_data()
+    backtesting.load_bt_data_detail()
+    backtesting._set_strategy(backtesting.strategylist[0])
+    processed = backtesting.strategy.advise_all_indicators(data)
+    start, end = get_timerange(trim_dataframes(processed, timerange, backtesting.required_startup))
+    return backtesting, processed, start, end
+
+
+def run_walk_forward(backtesting: Backtesting, processed: Dict[str, DataFrame],
+                     folds: List[Tuple[datetime, datetime, datetime]]) -> List[Dict]:
+    """整个区间回测一次，按平仓时间切出每个折的训练/测试表现"""
+    start, end = folds[0][0], folds[-1][2]
+    window = slice_window(processed, start, end, backtesting.required_startup)
+    backtesting.timerange = TimeRange('date', 'date', int(start.timestamp()), int(end.timestamp()))
+    last_candle = end - timedelta(minutes=timeframe_to_minutes(backtesting.timeframe))
+    trades = backtesting.backtest(processed=window, start_date=start, end_date=last_candle)['results']
+
+    trades = trades.sort_values('close_date')
+    close_dates = pd.DatetimeIndex(trades['close_date'])
+    profit_abs = trades['profit_abs'].to_numpy(dtype=np.float64)
+    # 第 i 笔交易平仓前的账户余额
+    balances = backtesting.wallets.get_starting_balance() + np.concatenate(([0.0], np.cumsum(profit_abs)))
+
+    def metrics(window_start: datetime, window_end: datetime) -> Dict:
+        first = close_dates.searchsorted(window_start, side='left')
+        last = close_dates.searchsorted(window_end, side='left')
+        return window_metrics(profit_abs[first:last], balances[first])
+
+    rows = []
+    for index, (train_start, test_start, test_end) in enumerate(folds, 1):
+        train, test = metrics(train_start, test_start), metrics(test_start, test_end)
+        rows.append({
+            'fold': index,
+            'train_start': f'{train_start:%Y-%m-%d}',
+            'test_start': f'{test_start:%Y-%m-%d}',
+            'test_end': f'{test_end:%Y-%m-%d}',
+            'train_profit_pct': train['profit_pct'],
+            'test_profit_pct': test['profit_pct'],
+            'test_trades': test['trades'],
+            'test_max_drawdown_pct': test['max_drawdown_pct'],
+            'test_winrate_pct': test['winrate_pct'],
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='滚动窗口样本外验证')
+    parser.add_argument('--config', required=True, help='freqtrade 配置文件')
+    parser.add_argument('--strategy', default='TripleTimeframeTrendStrategyV2_4', help='策略名')
+    parser.add_argument('--timerange', default=None, help='总时间范围，例如 20240101-20241201')
+    parser.add_argument('--train-days', type=int, default=120, help='训练（样本内）窗口天数')
+    parser.add_argument('--test-days', type=int, default=30, help='测试（样本外）窗口天数，也是滚动步长')
+    parser.add_argument('--output', default=None, help='结果 CSV 路径（默认 user_data/backtest_results/{策略}-walk-forward.csv）')
+    args = parser.parse_args()
+
+    config = load_config(args.config, args.strategy, args.timerange)
+    start_time = time.perf_counter()
+    backtesting, processed, start, end = prepare_walk_forward(config)
+    folds = make_folds(start, end, args.train_days, args.test_days)
+    print(f"指标计算完成 ({time.perf_counter() - start_time:.1f}s)，{start:%Y-%m-%d} ~ {end:%Y-%m-%d}，共 {len(folds)} 个窗口")
+    if not folds:
+        print("[ERROR] 数据长度不足一个训练+测试窗口")
+        return
+
+    start_time = time.perf_counter()
+    rows = run_walk_forward(backtesting, processed, folds)
+
+    print(format_comparison(rows, FOLD_COLUMNS))
+    test_profits = [row['test_profit_pct'] for row in rows]
+    profitable = sum(profit > 0 for profit in test_profits)
+    print(f"样本外: 平均收益 {np.mean(test_profits):.2f}%，盈利窗口 {profitable}/{len(rows)}，"
+          f"回测耗时 {time.perf_counter() - start_time:.1f}s")
+
+    output = Path(args.output) if args.output else \
+        Path(config['user_data_dir']) / 'backtest_results' / f'{args.strategy}-walk-forward.csv'
+    write_comparison(rows, output, FOLD_COLUMNS)
+    print(f"结果已保存: {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+import logging
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+import config
+from notification_system import TradeDirection
+
+# 收益率使用 1h 已收盘K线（分析时已缓存），换算日波动率
+RETURNS_TIMEFRAME = '1h'
+PERIODS_PER_DAY = 24
+
+
+def returns_matrix(closes: List[Optional[np.ndarray]], lookback: int) -> np.ndarray:
+    """
+    各候选交易对最近 lookback 期收益率，按列排列 (T x n)，末端对齐（同一根收盘K线）。
+    没有缓存K线的交易对整列为 0（不参与相关性和波动率计算）。
+    """
+    available = [c for c in closes if c is not None and len(c) > 2]
+    if not available:
+        return np.zeros((0, len(closes)))
+    length = min(min(len(c) for c in available), lookback + 1)
+    returns = np.zeros((length - 1, len(closes)))
+    for i, c in enumerate(closes):
+        if c is not None and len(c) > 2:
+            window = np.asarray(c[-length:], dtype=np.float64)
+            returns[:, i] = np.diff(window) / window[:-1]
+    return returns
+
+
+def correlation_matrix(returns: np.ndarray) -> np.ndarray:
+    """收益率相关系数矩阵；无波动（无数据）的列与其他列相关系数为 0"""
+    n = returns.shape[1]
+    corr = np.eye(n)
+    if returns.shape[0] < 2:
+        return corr
+    valid = np.flatnonzero(returns.std(axis=0) > 0)
+    if len(valid) > 1:
+        sub = np.corrcoef(returns[:, valid], rowvar=False)
+        corr[np.ix_(valid, valid)] = np.nan_to_num(sub)
+        np.fill_diagonal(corr, 1.0)
+    return corr
+
+
+def apply_portfolio_limits(signals: List[Dict[str, Any]], account_status: Dict[str, Any],
+                           closes: Dict[str, Optional[np.ndarray]]) -> List[Dict[str, Any]]:
+    """
+    组合层面的仓位调整：一次性计算本轮所有开仓信号（emit_trade_signal 的参数）的仓位。
+
+    1. 相关性：同向且正相关的信号分摊风险，仓位除以 Σ max(方向×相关系数, 0)（不相关时不变）；
+    2. 组合日波动率（协方差矩阵）不超过钱包余额的 max_portfolio_volatility_pct；
+    3. 已有持仓 + 新开仓的名义价值不超过钱包余额的 max_total_exposure 倍；
+    4. 新开仓占用保证金不超过可用余额的 max_margin_usage。
+    2-4 对所有信号统一缩放；缩放后低于原仓位 min_position_scale 的信号不再发送。
+    """
+    logger = logging.getLogger("PortfolioRisk")
+    if not signals:
+        return []
+    risk_config = config.PORTFOLIO_RISK_CONFIG
+    balance = account_status.get('usdt_balance', {})
+    wallet_balance = float(balance.get('walletBalance') or 0)
+    available_balance = float(balance.get('availableBalance') or 0)
+
+    symbols = [s['symbol'] for s in signals]
+    price = np.array([s['entry_price'] for s in signals], dtype=np.float64)
+    size_coin = np.array([s['position_size_coin'] for s in signals], dtype=np.float64)
+    side = np.array([1.0 if s['direction'] == TradeDirection.LONG else -1.0 for s in signals])
+    notional = size_coin * price
+
+    # 1. 相关性分摊
+    returns = returns_matrix([closes.get(symbol) for symbol in symbols], risk_config["returns_lookback"])
+    corr = correlation_matrix(returns)
+    crowding = np.clip(corr * np.outer(side, side), 0, None).sum(axis=1)
+    scale = 1.0 / crowding
+
+    limits = {}
+    # 2. 组合日波动率（USDT）
+    if returns.shape[0] >= 2:
+        cov = np.atleast_2d(np.cov(returns, rowvar=False))
+        exposure = side * notional * scale
+        daily_vol = np.sqrt(max(exposure @ cov @ exposure, 0.0) * PERIODS_PER_DAY)
+        if daily_vol > 0:
+            limits['波动率'] = wallet_balance * risk_config["max_portfolio_volatility_pct"] / 100 / daily_vol
+
+    new_notional = float((notional * scale).sum())
+    if new_notional > 0:
+        # 3. 总敞口（同一交易对的已有持仓会被反转信号替换，不重复计入）
+        existing_notional = sum(
+            abs(p['size']) * p['markPrice'] for p in account_status.get('open_positions', [])
+            if p['symbol'].split(':')[0] not in symbols
+        )
+        exposure_room = risk_config["max_total_exposure"] * wallet_balance - existing_notional
+        limits['总敞口'] = max(exposure_room, 0.0) / new_notional
+        # 4. 保证金
+        new_margin = new_notional / risk_config["leverage"]
+        limits['保证金'] = available_balance * risk_config["max_margin_usage"] / new_margin
+
+    global_scale = min([1.0, *limits.values()])
+    scale *= global_scale
+    if global_scale < 1.0:
+        binding = min(limits, key=limits.get)
+        logger.warning(f"组合风控: {binding}限制，本轮 {len(signals)} 个信号仓位统一缩放至 {global_scale:.0%}")
+
+    adjusted = []
+    for signal, factor in zip(signals, scale.tolist()):
+        if factor < risk_config["min_position_scale"]:
+            logger.warning(f"组合风控: [{signal['symbol']}] 仓位缩放至 {factor:.0%}，低于下限，不发送信号")
+            continue
+        signal = dict(signal)
+        signal['position_size_coin'] *= factor
+        signal['position_size_usd'] *= factor
+        signal['risk_amount_usd'] *= factor
+        signal['risk_percent'] *= factor
+        if factor < 1.0:
+            signal['decision_reason'] = f"{signal['decision_reason']}（组合风控：仓位调整为 {factor:.0%}）"
+            logger.info(f"组合风控: [{signal['symbol']}] 仓位调整为原计划的 {factor:.0%}")
+        adjusted.append(signal)
+    return adjusted
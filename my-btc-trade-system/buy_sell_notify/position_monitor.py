@@ -4,6 +4,7 @@ import ccxt
 import math
 
 import config
+from account_state import diff_account_status
 from signal_generator import get_account_status, get_atr_info
 from dingtalk_notifier import send_dingtalk_markdown
 from logger_config import setup_position_monitor_logger
@@ -28,73 +29,86 @@ def find_associated_stop_loss_order(open_orders, position):
             return order
     return None
 
-def monitor_existing_positions(exchange: ccxt.Exchange):
+def needs_evaluation(position, stop_price, checked, price_tolerance):
+    """上次完整评估后止损价变化、或标记价格变动超过 price_tolerance 时需要重新评估"""
+    if checked is None:
+        return True
+    checked_mark_price, checked_stop_price = checked
+    return (
+        stop_price != checked_stop_price or
+        abs(position['markPrice'] - checked_mark_price) > checked_mark_price * price_tolerance
+    )
+
+def check_positions(exchange: ccxt.Exchange, open_positions, close_time_ms=None, last_checked=None, price_tolerance=None):
     """
-    高频运行的监控函数，获取真实止损位并提供智能追踪止损建议。
+    检查每个真实仓位的止损单，必要时发出追踪止损建议。
+    返回 (是否存在高盈利仓位, 完整评估过的仓位 {(symbol, side)})；
+    没有止损单或获取 ATR 失败而中途跳过的仓位不在其中。
+    close_time_ms 为交易所当前时间时，ATR 按最近已收盘K线计算并复用缓存。
+
+    last_checked 为 {(symbol, side): (markPrice, stopPrice)} 时，每个仓位仍然检查止损单是否还在
+    （止损单被取消立即报警），但止损价不变且标记价格相对上次评估变动不超过 price_tolerance 的仓位
+    不再请求行情和ATR；完整评估过的仓位写入 last_checked，没有止损单的仓位从中移除。
     """
     logger = logging.getLogger("PositionMonitor")
-    logger.info("--- 智能仓位监控程序已启动 (可获取真实止损位) ---")
-
-    while True:
-        try:
-            account_status = get_account_status(exchange)
-            if 'error' in account_status:
-                logger.error(f"无法获取账户状态: {account_status['error']}"); time.sleep(60); continue
-
-            open_positions = account_status.get('open_positions', [])
-            if not open_positions:
-                logger.info("当前无持仓，降低监控频率..."); time.sleep(config.MONITOR_INTERVAL_NO_POSITION); continue
-
-            # logger.info(f"监控 {len(open_positions)} 个真实仓位...")
-            has_high_profit_position = False  # 用于判断是否需要高频监控
-
-            for position in open_positions:
-                symbol = position['symbol']
-                side = position['side']
-                entry_price = float(position['entryPrice'])
-
-                open_orders_for_symbol = exchange.fetch_open_orders(symbol)
-                stop_loss_order = find_associated_stop_loss_order(open_orders_for_symbol, position)
-
-                if not stop_loss_order:
-                    logger.error(f"!!! 持仓无保护 !!! [{symbol}] {side.upper()} 仓位没有找到关联的止损订单。")
-                    continue
-                
-                current_stop_price = float(stop_loss_order['stopPrice'])
-                ticker = exchange.fetch_ticker(symbol)
-                current_price = ticker['last']
-                atr_info = get_atr_info(symbol, exchange)
-                if 'error' in atr_info or not atr_info.get('atr'):
-                    logger.warning(f"无法为 [{symbol}] 获取ATR，跳过追踪止损检查。")
-                    continue
-
-                # --- 获取特定于交易对的虚拟交易配置 ---
-                trade_config = config.VIRTUAL_TRADE_CONFIG.get(symbol, config.VIRTUAL_TRADE_CONFIG["DEFAULT"])
-                stop_loss_distance = atr_info['atr'] * trade_config["ATR_MULTIPLIER_FOR_SL"]
-                
-                new_suggested_sl = None
-                if side == 'long' and current_price > entry_price + stop_loss_distance:
-                    potential_new_sl = current_price - stop_loss_distance
-                    if potential_new_sl > current_stop_price:
-                        new_suggested_sl = potential_new_sl
-                
-                elif side == 'short' and current_price < entry_price - stop_loss_distance:
-                    potential_new_sl = current_price + stop_loss_distance
-                    if potential_new_sl < current_stop_price:
-                        new_suggested_sl = potential_new_sl
-
-                if new_suggested_sl:
-                    # 计算盈利情况判断是否为高盈利仓位
-                    profit_ratio = 0
-                    if side == 'long':
-                        profit_ratio = (current_price - entry_price) / entry_price
-                    else:
-                        profit_ratio = (entry_price - current_price) / entry_price
-                    
-                    if profit_ratio >= 0.10:  # 盈利10%以上视为高盈利
-                        has_high_profit_position = True
-                    
-                    log_message = f"""
+    if price_tolerance is None:
+        price_tolerance = config.MONITOR_PRICE_TOLERANCE
+    has_high_profit_position = False  # 用于判断是否需要高频监控
+    evaluated_keys = set()
+
+    for position in open_positions:
+        symbol = position['symbol']
+        side = position['side']
+        key = (symbol, side)
+        entry_price = float(position['entryPrice'])
+
+        open_orders_for_symbol = exchange.fetch_open_orders(symbol)
+        stop_loss_order = find_associated_stop_loss_order(open_orders_for_symbol, position)
+
+        if not stop_loss_order:
+            logger.error(f"!!! 持仓无保护 !!! [{symbol}] {side.upper()} 仓位没有找到关联的止损订单。")
+            if last_checked is not None:
+                last_checked.pop(key, None)
+            continue
+        
+        current_stop_price = float(stop_loss_order['stopPrice'])
+        if last_checked is not None and not needs_evaluation(position, current_stop_price, last_checked.get(key), price_tolerance):
+            continue
+
+        ticker = exchange.fetch_ticker(symbol)
+        current_price = ticker['last']
+        atr_info = get_atr_info(symbol, exchange, close_time_ms)
+        if 'error' in atr_info or not atr_info.get('atr'):
+            logger.warning(f"无法为 [{symbol}] 获取ATR，跳过追踪止损检查。")
+            continue
+
+        # --- 获取特定于交易对的虚拟交易配置 ---
+        trade_config = config.VIRTUAL_TRADE_CONFIG.get(symbol, config.VIRTUAL_TRADE_CONFIG["DEFAULT"])
+        stop_loss_distance = atr_info['atr'] * trade_config["ATR_MULTIPLIER_FOR_SL"]
+        
+        new_suggested_sl = None
+        if side == 'long' and current_price > entry_price + stop_loss_distance:
+            potential_new_sl = current_price - stop_loss_distance
+            if potential_new_sl > current_stop_price:
+                new_suggested_sl = potential_new_sl
+        
+        elif side == 'short' and current_price < entry_price - stop_loss_distance:
+            potential_new_sl = current_price + stop_loss_distance
+            if potential_new_sl < current_stop_price:
+                new_suggested_sl = potential_new_sl
+
+        if new_suggested_sl:
+            # 计算盈利情况判断是否为高盈利仓位
+            profit_ratio = 0
+            if side == 'long':
+                profit_ratio = (current_price - entry_price) / entry_price
+            else:
+                profit_ratio = (entry_price - current_price) / entry_price
+            
+            if profit_ratio >= 0.10:  # 盈利10%以上视为高盈利
+                has_high_profit_position = True
+            
+            log_message = f"""
     ------------------------------------------------------------
     |             >>> TRAILING STOP-LOSS UPDATE <<<              |
     ------------------------------------------------------------
@@ -107,12 +121,12 @@ def monitor_existing_positions(exchange: ccxt.Exchange):
     | ACTION:           Cancel old order and create a new one.
     ------------------------------------------------------------
     """
-                    logger.warning(log_message)
+            logger.warning(log_message)
 
-                    # --- 发送钉钉通知 ---
-                    title = f"止损更新建议: {symbol}"
-                    profit_indicator = "🔥高盈利" if profit_ratio >= 0.10 else "📈盈利中"
-                    markdown_text = f"""### **止损更新建议: {symbol}** {profit_indicator}
+            # --- 发送钉钉通知 ---
+            title = f"止损更新建议: {symbol}"
+            profit_indicator = "🔥高盈利" if profit_ratio >= 0.10 else "📈盈利中"
+            markdown_text = f"""### **止损更新建议: {symbol}** {profit_indicator}
 
 - **持仓方向**: {side.upper()}
 - **开仓价格**: {entry_price:,.4f}
@@ -121,30 +135,83 @@ def monitor_existing_positions(exchange: ccxt.Exchange):
 - **<font color='#FF0000'>建议新止损</font>**: **{new_suggested_sl:,.4f}**
 - **操作建议**: 取消旧订单({stop_loss_order['id']})，创建新止损单。
 """
-                    send_dingtalk_markdown(title, markdown_text)
-                else:
-                    # 检查现有持仓是否为高盈利（即使不需要调整止损）
-                    profit_ratio = 0
-                    if side == 'long':
-                        profit_ratio = (current_price - entry_price) / entry_price
-                    else:
-                        profit_ratio = (entry_price - current_price) / entry_price
-                    if profit_ratio >= 0.10:
-                        has_high_profit_position = True
+            send_dingtalk_markdown(title, markdown_text)
+        else:
+            # 检查现有持仓是否为高盈利（即使不需要调整止损）
+            profit_ratio = 0
+            if side == 'long':
+                profit_ratio = (current_price - entry_price) / entry_price
+            else:
+                profit_ratio = (entry_price - current_price) / entry_price
+            if profit_ratio >= 0.10:
+                has_high_profit_position = True
+        evaluated_keys.add(key)
+        if last_checked is not None:
+            last_checked[key] = (position['markPrice'], current_stop_price)
+
+    return has_high_profit_position, evaluated_keys
+
+def forget_changed_positions(account_diff, last_checked):
+    """
+    按账户快照差异（diff_account_status）移除新开 / 已平 / 数量变化仓位的评估记录，下一轮完整评估；
+    没有差异可用（account_diff 为 None）时全部重新评估。
+    """
+    if account_diff is None:
+        last_checked.clear()
+        return
+    for position in account_diff['opened'] + account_diff['closed'] + account_diff['resized']:
+        last_checked.pop((position['symbol'], position['side']), None)
+
+def update_high_profit_flag(previous_flag: bool, checked_flag: bool, checked_count: int, total_count: int) -> bool:
+    """未重新评估的仓位沿用上一次的高盈利判断"""
+    if checked_count == 0:
+        return previous_flag
+    return checked_flag or (previous_flag and checked_count < total_count)
+
+def monitor_interval(has_high_profit_position: bool) -> int:
+    """智能睡眠间隔：根据持仓情况动态调整"""
+    if has_high_profit_position:
+        logging.getLogger("PositionMonitor").debug(f"检测到高盈利仓位，提高监控频率至{config.MONITOR_INTERVAL_HIGH_PROFIT}秒")
+        return config.MONITOR_INTERVAL_HIGH_PROFIT
+    return config.MONITOR_INTERVAL_SECONDS
+
+def monitor_existing_positions(exchange: ccxt.Exchange):
+    """
+    高频运行的监控函数，获取真实止损位并提供智能追踪止损建议。
+    """
+    logger = logging.getLogger("PositionMonitor")
+    logger.info("--- 智能仓位监控程序已启动 (可获取真实止损位) ---")
+
+    last_checked = {}
+    previous_status = None
+    has_high_profit_position = False
+    while True:
+        try:
+            account_status = get_account_status(exchange)
+            if 'error' in account_status:
+                logger.error(f"无法获取账户状态: {account_status['error']}"); time.sleep(60); continue
+
+            open_positions = account_status.get('open_positions', [])
+            if not open_positions:
+                last_checked.clear()
+                logger.info("当前无持仓，降低监控频率..."); time.sleep(config.MONITOR_INTERVAL_NO_POSITION); continue
+
+            # logger.info(f"监控 {len(open_positions)} 个真实仓位...")
+            forget_changed_positions(diff_account_status(previous_status, account_status), last_checked)
+            previous_status = account_status
+            checked_flag, evaluated_keys = check_positions(exchange, open_positions, last_checked=last_checked)
+            has_high_profit_position = update_high_profit_flag(
+                has_high_profit_position, checked_flag, len(evaluated_keys), len(open_positions)
+            )
 
         except ccxt.NetworkError as e:
             logger.error(f"监控时发生网络错误: {e}")
+            last_checked.clear()  # 评估中断，下一轮全部重新检查
         except Exception as e:
             logger.error(f"监控循环发生未知错误: {e}", exc_info=True)
+            last_checked.clear()
         
-        # 智能睡眠间隔：根据持仓情况动态调整
-        if has_high_profit_position:
-            sleep_time = config.MONITOR_INTERVAL_HIGH_PROFIT
-            logger.debug(f"检测到高盈利仓位，提高监控频率至{sleep_time}秒")
-        else:
-            sleep_time = config.MONITOR_INTERVAL_SECONDS
-        
-        time.sleep(sleep_time)
+        time.sleep(monitor_interval(has_high_profit_position))
 
 
 if __name__ == "__main__":
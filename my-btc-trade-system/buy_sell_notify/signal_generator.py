@@ -1,10 +1,12 @@
 import ccxt
+import numpy as np
 import pandas as pd
 import pandas_ta as ta
 from typing import Dict, Any, List, Optional
 import logging
 import json
 import config
+from candle_clock import last_closed_candle, timeframe_ms
 
 # 日志由主程序 app.py 统一配置
 # logging.basicConfig(
@@ -14,6 +16,40 @@ import config
 #     encoding='utf-8'
 # )
 
+# 已收盘K线缓存：(交易对, 周期) -> (最后一根已收盘K线的开盘时间, 数据)
+# 1d/4h K线在收盘前不会变化，每小时运行时直接复用，不再重复拉取和计算指标
+_closed_candle_cache: Dict[tuple, tuple] = {}
+
+OHLCV_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+
+def cached_closes(symbol: str, timeframe: str) -> Optional[np.ndarray]:
+    """最近一次分析缓存的已收盘K线收盘价，没有缓存时返回 None"""
+    cached = _closed_candle_cache.get((symbol, timeframe))
+    if cached is None:
+        return None
+    return cached[1]['close'].to_numpy(dtype=np.float64)
+
+
+def prune_closed_candle_cache(symbols) -> int:
+    """
+    只保留 symbols 的缓存，返回移除的条目数。
+    预筛选每轮换一批交易对（约300个永续合约轮换），不清理时缓存会随运行时间无限增长。
+    """
+    keep = set(symbols)
+    # 仓位监控线程可能同时写入，先取键的快照
+    stale = [key for key in list(_closed_candle_cache) if key[0] not in keep]
+    for key in stale:
+        _closed_candle_cache.pop(key, None)
+    return len(stale)
+
+
+def _closed_candle_params(timeframe: str, close_time_ms: Optional[int]) -> Dict[str, Any]:
+    """按收盘时刻请求K线：endTime 截止到刚收盘的K线，不包含正在形成的K线"""
+    if close_time_ms is None:
+        return {}
+    return {'endTime': last_closed_candle(timeframe, close_time_ms) + timeframe_ms(timeframe) - 1}
+
 def get_account_status(exchange: ccxt.Exchange) -> Dict[str, Any]:
     """获取币安期货账户的余额信息和当前未平仓的头寸。"""
     logger = logging.getLogger("AccountStatus")
@@ -23,9 +59,22 @@ def get_account_status(exchange: ccxt.Exchange) -> Dict[str, Any]:
         balance_data = exchange.fetch_balance()
         usdt_balance = next((item for item in balance_data['info']['assets'] if item['asset'] == 'USDT'), {})
         
-        # 2. 获取未平仓头寸
+        # 2. 获取未平仓头寸（只转换非零仓位，positionAmt 只解析一次）
         positions_data = exchange.fetch_positions()
-        open_positions = [p for p in positions_data if float(p['info']['positionAmt']) != 0]
+        open_positions = []
+        for p in positions_data:
+            size = float(p['info']['positionAmt'])
+            if size == 0:
+                continue
+            open_positions.append({
+                'symbol': p['symbol'],
+                'side': 'long' if size > 0 else 'short',
+                'size': size,
+                'entryPrice': float(p['entryPrice']),
+                'markPrice': float(p['markPrice']),
+                'unrealizedPnl': float(p['unrealizedPnl']),
+                'leverage': int(p['leverage']),
+            })
         
         logger.debug(f"发现 {len(open_positions)} 个未平仓头寸。")
 
@@ -36,17 +85,7 @@ def get_account_status(exchange: ccxt.Exchange) -> Dict[str, Any]:
                 'availableBalance': usdt_balance.get('availableBalance'),
                 'unrealizedProfit': usdt_balance.get('unrealizedProfit')
             },
-            "open_positions": [
-                {
-                    'symbol': p['symbol'],
-                    'side': 'long' if float(p['info']['positionAmt']) > 0 else 'short',
-                    'size': float(p['info']['positionAmt']),
-                    'entryPrice': float(p['entryPrice']),
-                    'markPrice': float(p['markPrice']),
-                    'unrealizedPnl': float(p['unrealizedPnl']),
-                    'leverage': int(p['leverage']),
-                } for p in open_positions
-            ]
+            "open_positions": open_positions
         }
     except ccxt.AuthenticationError as e:
         logger.error(f"API密钥认证失败: {e}")
@@ -58,8 +97,11 @@ def get_account_status(exchange: ccxt.Exchange) -> Dict[str, Any]:
         logger.error(f"获取账户信息时发生未知错误: {e}", exc_info=True)
         return {"error": str(e)}
 
-def get_atr_info(symbol: str, exchange: ccxt.Exchange) -> Dict[str, Any]:
-    """获取指定交易对的ATR（平均真实波幅）值，使用config中定义的参数。"""
+def get_atr_info(symbol: str, exchange: ccxt.Exchange, close_time_ms: Optional[int] = None) -> Dict[str, Any]:
+    """
+    获取指定交易对的ATR（平均真实波幅）值，使用config中定义的参数。
+    传入 close_time_ms（K线收盘时刻）时只取已收盘K线，并复用同一根K线已算好的结果。
+    """
     logger = logging.getLogger("ATR_Fetcher")
     
     # 1. 从配置读取参数
@@ -67,10 +109,16 @@ def get_atr_info(symbol: str, exchange: ccxt.Exchange) -> Dict[str, Any]:
     timeframe = atr_params["timeframe"]
     length = atr_params["length"]
     
+    cache_key = (symbol, f"ATR_{timeframe}_{length}")
+    closed_ts = last_closed_candle(timeframe, close_time_ms) if close_time_ms is not None else None
+    cached = _closed_candle_cache.get(cache_key)
+    if closed_ts is not None and cached and cached[0] == closed_ts:
+        return cached[1]
+
     logger.debug(f"开始获取 {symbol} 的ATR信息 (周期: {timeframe}, 长度: {length})...")
     try:
         # 2. 获取K线数据 (获取更多数据以保证ATR计算的准确性)
-        ohlcv = exchange.fetch_ohlcv(symbol, timeframe, limit=200)
+        ohlcv = exchange.fetch_ohlcv(symbol, timeframe, limit=200, params=_closed_candle_params(timeframe, close_time_ms))
         if not ohlcv or len(ohlcv) < length:
             logger.warning(f"无法获取足够的 {symbol} 在 {timeframe} 的K线数据。")
             return {"error": "Not enough OHLCV data"}
@@ -88,14 +136,18 @@ def get_atr_info(symbol: str, exchange: ccxt.Exchange) -> Dict[str, Any]:
             logger.error(f"无法计算 {symbol} 的ATR值。")
             return {"error": "ATR calculation failed"}
             
-        latest_atr = df[atr_col_name].iloc[-2]
+        # 按收盘时刻获取时最后一根就是已收盘K线，否则最后一根仍在形成中
+        latest_atr = df[atr_col_name].iloc[-1] if closed_ts is not None else df[atr_col_name].iloc[-2]
         
         logger.debug(f"成功获取 {symbol} 的ATR值为: {latest_atr}")
-        return {
+        atr_info = {
             "atr": round(latest_atr, 4),
             "timeframe": timeframe,
             "length": length
         }
+        if closed_ts is not None:
+            _closed_candle_cache[cache_key] = (closed_ts, atr_info)
+        return atr_info
 
     except Exception as e:
         logger.error(f"获取 {symbol} 的ATR信息时发生错误: {e}", exc_info=True)
@@ -106,9 +158,12 @@ class SignalGenerator:
     一个多维度、基于评分的交易信号生成器。
     """
 
-    def __init__(self, symbol: str, timeframe: str, exchange: ccxt.Exchange):
+    def __init__(self, symbol: str, timeframe: str, exchange: ccxt.Exchange, close_time_ms: Optional[int] = None):
         self.symbol = symbol
         self.timeframe = timeframe
+        # K线收盘时刻（交易所时间）；设置后只分析截至该时刻已收盘的K线
+        self.close_time_ms = close_time_ms
+        self.closed_ts = last_closed_candle(timeframe, close_time_ms) if close_time_ms is not None else None
         self.logger = logging.getLogger(f"SignalGenerator.{symbol}.{timeframe}")
         self.exchange = exchange
         self.history_limit = config.HISTORY_LIMIT
@@ -120,25 +175,60 @@ class SignalGenerator:
             'K_9_3', 'D_9_3', 'J_9_3'
         ]
 
-    def _fetch_data(self) -> pd.DataFrame:
+    def _fetch_data(self, cached: Optional[tuple] = None) -> pd.DataFrame:
+        """
+        获取截至已收盘K线的 history_limit 根K线。
+        cached 为上次分析缓存的 (已收盘K线时间, 数据) 时，只请求之后新收盘的K线，接到缓存K线后面。
+        """
         try:
+            if cached is not None and self.closed_ts is not None:
+                new_candles = (self.closed_ts - cached[0]) // timeframe_ms(self.timeframe)
+                if 0 < new_candles < self.history_limit:
+                    df = self._append_closed_candles(cached[1], new_candles)
+                    if df is not None:
+                        return df
             self.logger.debug(f"获取 {self.symbol} 在 {self.timeframe} 的K线...")
-            ohlcv = self.exchange.fetch_ohlcv(self.symbol, self.timeframe, limit=self.history_limit)
-            if not ohlcv: return pd.DataFrame()
-
-            df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-            # 关键修改：将UTC时间戳转换为北京时间
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms').dt.tz_localize('UTC').dt.tz_convert('Asia/Shanghai')
-            
-            numeric_cols = ['open', 'high', 'low', 'close', 'volume']
-            for col in numeric_cols: df[col] = pd.to_numeric(df[col], errors='coerce')
-            df.dropna(subset=numeric_cols, inplace=True)
-            self.logger.debug(f"成功获取并清洗 {len(df)} 条K线。")
-            return df
+            return self._fetch_ohlcv(self.history_limit)
         except Exception as e:
             self.logger.error(f"数据获取或处理失败: {e}", exc_info=True)
             return pd.DataFrame()
 
+    def _fetch_ohlcv(self, limit: int) -> pd.DataFrame:
+        ohlcv = self.exchange.fetch_ohlcv(self.symbol, self.timeframe, limit=limit,
+                                          params=_closed_candle_params(self.timeframe, self.close_time_ms))
+        if not ohlcv: return pd.DataFrame()
+        if self.closed_ts is not None and ohlcv[-1][0] != self.closed_ts:
+            # 交易所还没有这根K线时，最后一根是更早的K线，不能当作刚收盘的K线分析
+            self.logger.warning(f"最新K线 {ohlcv[-1][0]} 不是预期的已收盘K线 {self.closed_ts}，本轮不分析")
+            return pd.DataFrame()
+
+        df = pd.DataFrame(ohlcv, columns=OHLCV_COLUMNS)
+        # 关键修改：将UTC时间戳转换为北京时间
+        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms').dt.tz_localize('UTC').dt.tz_convert('Asia/Shanghai')
+        
+        numeric_cols = ['open', 'high', 'low', 'close', 'volume']
+        for col in numeric_cols: df[col] = pd.to_numeric(df[col], errors='coerce')
+        df.dropna(subset=numeric_cols, inplace=True)
+        self.logger.debug(f"成功获取并清洗 {len(df)} 条K线。")
+        return df
+
+    def _append_closed_candles(self, cached_df: pd.DataFrame, new_candles: int) -> Optional[pd.DataFrame]:
+        """
+        只请求新收盘的 new_candles 根K线和缓存的最后一根（校验衔接、数据没有被修正），
+        接到缓存K线后面并保留最近 history_limit 根，与重新获取全部K线的数据相同；不衔接时返回 None
+        """
+        df = self._fetch_ohlcv(new_candles + 1)
+        if df.empty:
+            return df
+        overlap = cached_df.iloc[-1]
+        first = df.iloc[0]
+        if len(df) != new_candles + 1 or any(first[col] != overlap[col] for col in OHLCV_COLUMNS):
+            self.logger.debug("新K线与缓存K线不衔接，重新获取全部K线。")
+            return None
+        df = pd.concat([cached_df[OHLCV_COLUMNS], df.iloc[1:]], ignore_index=True)
+        self.logger.debug(f"追加 {new_candles} 根新收盘K线。")
+        return df.iloc[-self.history_limit:].reset_index(drop=True)
+
     def _calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         self.logger.debug("开始计算技术指标...")
         try:
@@ -162,7 +252,8 @@ class SignalGenerator:
         if missing_cols: self.logger.warning(f"评分中止：缺少指标列: {missing_cols}。"); return {}
         if len(df) < 2: self.logger.warning("数据行数不足，无法评分。"); return {}
 
-        latest = df.iloc[-2]
+        # 按收盘时刻获取时最后一根就是刚收盘的K线，否则最后一根仍在形成中
+        latest = df.iloc[-1] if self.closed_ts is not None else df.iloc[-2]
         self.logger.debug(f"基于时间戳 {latest['timestamp']} 的K线进行分析。")
 
         # --- 1. 原有的趋势跟踪评分逻辑 ---
@@ -250,19 +341,30 @@ class SignalGenerator:
             "close_price": latest['close']
         }
 
-    def generate_signal(self, account_status: Optional[Dict] = None, atr_info: Optional[Dict] = None) -> Dict[str, Any]:
+    def generate_signal(self, account_status: Optional[Dict] = None, atr_info: Optional[Dict] = None,
+                        funding_rate_data: Optional[Dict] = None) -> Dict[str, Any]:
         self.logger.info("开始生成信号...")
-        df = self._fetch_data()
-        if df.empty: self.logger.warning("数据为空，中止。 "); return {"error": "无法获取K线数据"}
+        df_with_indicators = None
+        cached = _closed_candle_cache.get((self.symbol, self.timeframe))
+        if self.closed_ts is not None and cached and cached[0] == self.closed_ts:
+            self.logger.debug("K线未更新，复用已计算的指标。")
+            df_with_indicators = cached[1]
+        else:
+            df = self._fetch_data(cached)
+            if df.empty: self.logger.warning("数据为空，中止。 "); return {"error": "无法获取K线数据"}
 
-        funding_rate_data = None
-        try:
-            api_symbol = self.symbol.replace('/', '')
-            funding_rate_data = self.exchange.fetch_funding_rate(api_symbol)
-        except Exception as e:
-            self.logger.warning(f"获取资金费率失败: {e}")
+        # 预筛选阶段已批量取得资金费率时直接使用，不再单独请求
+        if funding_rate_data is None:
+            try:
+                api_symbol = self.symbol.replace('/', '')
+                funding_rate_data = self.exchange.fetch_funding_rate(api_symbol)
+            except Exception as e:
+                self.logger.warning(f"获取资金费率失败: {e}")
 
-        df_with_indicators = self._calculate_indicators(df)
+        if df_with_indicators is None:
+            df_with_indicators = self._calculate_indicators(df)
+            if self.closed_ts is not None:
+                _closed_candle_cache[(self.symbol, self.timeframe)] = (self.closed_ts, df_with_indicators)
         final_signal = self._apply_scoring_logic(df_with_indicators, funding_rate_data)
         
         if final_signal:
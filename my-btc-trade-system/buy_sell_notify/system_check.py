@@ -17,7 +17,6 @@ def check_imports():
         ('ccxt', 'CCXT交易所库'),
         ('pandas', 'Pandas数据处理'),
         ('pandas_ta', '技术指标库'),
-        ('schedule', '任务调度'),
         ('requests', 'HTTP请求库')
     ]
     
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+测试账户状态快照的变化检测
+验证仓位新开/已平/数量变化、余额变化量，以及监控按快照差异和价格只重新评估有变化的仓位、
+每轮都检查止损单（止损单被取消时价格不变也报警）
+"""
+
+import logging
+import sys
+
+# 添加当前目录到Python路径
+sys.path.insert(0, '.')
+
+from account_state import AccountState, diff_account_status
+from position_monitor import check_positions, forget_changed_positions, update_high_profit_flag
+
+
+def make_status(wallet, positions):
+    return {
+        "usdt_balance": {'walletBalance': str(wallet), 'availableBalance': str(wallet), 'unrealizedProfit': '0'},
+        "open_positions": positions,
+    }
+
+
+def make_position(symbol, side, size, mark_price):
+    return {'symbol': symbol, 'side': side, 'size': size, 'entryPrice': 100.0,
+            'markPrice': mark_price, 'unrealizedPnl': 0.0, 'leverage': 5}
+
+
+class FakeExchange:
+    """只有 stop_symbols 中的交易对挂有止损单；价格不变（不会发出止损更新建议），记录行情请求"""
+
+    def __init__(self, stop_symbols):
+        self.stop_symbols = stop_symbols
+        self.stop_price = 90.0
+        self.ticker_requests = []
+
+    def fetch_open_orders(self, symbol):
+        if symbol not in self.stop_symbols:
+            return []
+        return [{'id': '1', 'symbol': symbol, 'side': 'sell', 'type': 'stop_market', 'stopPrice': self.stop_price}]
+
+    def fetch_ticker(self, symbol):
+        self.ticker_requests.append(symbol)
+        return {'last': 100.0}
+
+    def fetch_ohlcv(self, symbol, timeframe, limit=200, params=None):
+        return [[i * 3600000, 100.0, 101.0, 99.0, 100.0, 10.0] for i in range(limit)]
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def check_round(exchange, previous, current, last_checked):
+    """监控一轮：按快照差异移除记录，检查全部仓位，返回完整评估过的仓位"""
+    forget_changed_positions(diff_account_status(previous, current), last_checked)
+    _, evaluated_keys = check_positions(exchange, current['open_positions'], last_checked=last_checked, price_tolerance=0.001)
+    return evaluated_keys
+
+
+def test_diff_account_status():
+    """测试两次快照之间的差异"""
+    print("=== 测试账户快照差异 ===\n")
+    btc = make_position('BTC/USDT:USDT', 'long', 0.01, 60000.0)
+    eth = make_position('ETH/USDT:USDT', 'short', -0.5, 3000.0)
+    previous = make_status(1000, [btc, eth])
+
+    unchanged = diff_account_status(previous, make_status(1000, [dict(btc, markPrice=60100.0), eth]))
+    assert not unchanged['changed'], "只有价格变化不应视为账户变化"
+
+    sol = make_position('SOL/USDT:USDT', 'long', 2.0, 150.0)
+    diff = diff_account_status(previous, make_status(990, [dict(btc, size=0.02), sol]))
+    print(f"差异: 新开 {len(diff['opened'])}，已平 {len(diff['closed'])}，数量变化 {len(diff['resized'])}，余额 {diff['balance_delta']}")
+    assert diff['changed']
+    assert [p['symbol'] for p in diff['opened']] == ['SOL/USDT:USDT']
+    assert [p['symbol'] for p in diff['closed']] == ['ETH/USDT:USDT']
+    assert [p['size'] for p in diff['resized']] == [0.02]
+    assert diff['balance_delta']['walletBalance'] == -10
+
+    first = diff_account_status(None, previous)
+    assert len(first['opened']) == 2, "第一次快照的所有仓位都是新仓位"
+    print("✅ 账户快照差异测试通过")
+
+
+def test_refresh_with_diff():
+    """测试刷新时返回与上一次快照的差异，失败时不覆盖快照"""
+    print("\n=== 测试刷新返回快照差异 ===\n")
+    import account_state
+    btc = make_position('BTC/USDT:USDT', 'long', 0.01, 60000.0)
+    statuses = [make_status(1000, [btc]), {'error': 'timeout'}, make_status(1000, [dict(btc, size=0.02)])]
+    get_account_status = account_state.get_account_status
+    account_state.get_account_status = lambda exchange: statuses.pop(0)
+    try:
+        state = AccountState(exchange=None)
+        _, diff = state.refresh_with_diff()
+        assert [p['symbol'] for p in diff['opened']] == ['BTC/USDT:USDT'], "第一次刷新的仓位都是新仓位"
+        status, diff = state.refresh_with_diff()
+        assert 'error' in status and diff is None, "失败时没有差异"
+        _, diff = state.refresh_with_diff()
+        assert [p['size'] for p in diff['resized']] == [0.02], "与最近一次成功的快照比较"
+    finally:
+        account_state.get_account_status = get_account_status
+    print("✅ 刷新返回快照差异测试通过")
+
+
+def test_positions_needing_check():
+    """测试监控只重新评估有变化的仓位"""
+    print("\n=== 测试仓位变化过滤 ===\n")
+    last_checked = {}
+    btc = make_position('BTC/USDT:USDT', 'long', 0.01, 100.0)
+    eth = make_position('ETH/USDT:USDT', 'long', 0.5, 100.0)
+    exchange = FakeExchange(stop_symbols={'BTC/USDT:USDT', 'ETH/USDT:USDT'})
+    status = make_status(1000, [btc, eth])
+
+    assert len(check_round(exchange, None, status, last_checked)) == 2, "首次全部评估"
+    assert check_round(exchange, status, status, last_checked) == set(), "没有变化时不评估"
+    assert len(exchange.ticker_requests) == 2, "没有变化的仓位不请求行情"
+
+    moved = dict(btc, markPrice=100.2)   # +0.2%
+    small = dict(eth, markPrice=100.05)  # +0.05%
+    previous, status = status, make_status(1000, [moved, small])
+    assert check_round(exchange, previous, status, last_checked) == {('BTC/USDT:USDT', 'long')}, "只评估价格变化超过阈值的仓位"
+
+    resized = dict(small, size=1.0)
+    previous, status = status, make_status(1000, [moved, resized])
+    assert check_round(exchange, previous, status, last_checked) == {('ETH/USDT:USDT', 'long')}, "数量变化需重新评估"
+
+    exchange.stop_price = 95.0
+    assert len(check_round(exchange, status, status, last_checked)) == 2, "止损价变化需重新评估"
+
+    previous, status = status, make_status(1000, [moved])
+    check_round(exchange, previous, status, last_checked)
+    assert ('ETH/USDT:USDT', 'long') not in last_checked, "已平仓位应被移除"
+
+    forget_changed_positions(None, last_checked)
+    assert last_checked == {}, "没有差异可用时全部重新评估"
+
+    assert update_high_profit_flag(True, False, 0, 2), "未评估任何仓位时沿用上次判断"
+    assert update_high_profit_flag(True, False, 1, 2), "未评估的仓位沿用上次判断"
+    assert not update_high_profit_flag(True, False, 2, 2), "全部重新评估时以本次结果为准"
+    print("✅ 仓位变化过滤测试通过")
+
+
+def test_unprotected_positions_rechecked():
+    """测试每轮都检查止损单：没有止损单的仓位不记录为已检查，止损单被取消时价格不变也报警"""
+    print("\n=== 测试无止损单仓位重新检查 ===\n")
+    last_checked = {}
+    btc = make_position('BTC/USDT:USDT', 'long', 0.01, 100.0)
+    eth = make_position('ETH/USDT:USDT', 'long', 0.5, 100.0)
+    status = make_status(1000, [btc, eth])
+    exchange = FakeExchange(stop_symbols={'BTC/USDT:USDT'})
+
+    evaluated_keys = check_round(exchange, None, status, last_checked)
+    assert evaluated_keys == {('BTC/USDT:USDT', 'long')}, "ETH 没有止损单，未完整评估"
+    assert list(last_checked) == [('BTC/USDT:USDT', 'long')]
+
+    exchange.stop_symbols.add('ETH/USDT:USDT')
+    assert check_round(exchange, status, status, last_checked) == {('ETH/USDT:USDT', 'long')}, "价格没变，补上止损单后评估"
+    assert check_round(exchange, status, status, last_checked) == set(), "评估后不再重复检查"
+
+    # 受保护的仓位止损单被取消，价格和数量都没变
+    logger = logging.getLogger("PositionMonitor")
+    handler = RecordingHandler()
+    logger.addHandler(handler)
+    try:
+        exchange.stop_symbols.discard('BTC/USDT:USDT')
+        check_round(exchange, status, status, last_checked)
+    finally:
+        logger.removeHandler(handler)
+    assert any('持仓无保护' in message and 'BTC/USDT:USDT' in message for message in handler.messages), "止损单被取消立即报警"
+    assert ('BTC/USDT:USDT', 'long') not in last_checked
+
+    exchange.stop_symbols.add('BTC/USDT:USDT')
+    assert check_round(exchange, status, status, last_checked) == {('BTC/USDT:USDT', 'long')}, "恢复止损单后重新评估"
+    print("✅ 无止损单仓位重新检查测试通过")
+
+
+if __name__ == "__main__":
+    test_diff_account_status()
+    test_refresh_with_diff()
+    test_positions_needing_check()
+    test_unprotected_positions_rechecked()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+测试K线收盘时钟
+验证已收盘K线时间戳计算和与交易所对时
+"""
+
+import sys
+import time
+
+# 添加当前目录到Python路径
+sys.path.insert(0, '.')
+
+from candle_clock import CandleClock, last_closed_candle
+
+HOUR_MS = 3600 * 1000
+DAY_MS = 24 * HOUR_MS
+
+
+class FakeExchange:
+    """服务器时间比本地快 offset_ms"""
+
+    def __init__(self, offset_ms):
+        self.offset_ms = offset_ms
+
+    def fetch_time(self):
+        return int(time.time() * 1000 + self.offset_ms)
+
+
+def test_last_closed_candle():
+    """测试各周期最近一根已收盘K线"""
+    print("=== 测试已收盘K线时间戳 ===\n")
+    day_start = 1_700_006_400_000  # 2023-11-15 00:00 UTC
+    close_time = day_start + 8 * HOUR_MS  # 08:00 收盘时刻
+
+    assert last_closed_candle('1h', close_time) == day_start + 7 * HOUR_MS, "1h: 07:00 的K线刚收盘"
+    assert last_closed_candle('4h', close_time) == day_start + 4 * HOUR_MS, "4h: 04:00 的K线刚收盘"
+    assert last_closed_candle('1d', close_time) == day_start - DAY_MS, "1d: 当天K线仍在形成，取前一天"
+    assert last_closed_candle('1h', close_time + 1500) == day_start + 7 * HOUR_MS, "收盘后1.5秒仍是同一根"
+    print("✅ 已收盘K线时间戳测试通过")
+
+
+def test_clock_sync():
+    """测试与交易所对时"""
+    print("\n=== 测试交易所对时 ===\n")
+    clock = CandleClock(FakeExchange(offset_ms=-3000))
+    print(f"本地时钟偏差: {clock.offset_ms:.0f}ms")
+    assert abs(clock.offset_ms + 3000) < 50, "应估算出约 -3000ms 的偏差"
+    assert abs(clock.now_ms() - FakeExchange(offset_ms=-3000).fetch_time()) < 50, "now_ms 应为交易所时间"
+
+    # 对时失败时沿用上次偏差
+    clock.exchange = None
+    clock.sync()
+    assert abs(clock.offset_ms + 3000) < 50, "对时失败不应重置偏差"
+    print("✅ 交易所对时测试通过")
+
+
+if __name__ == "__main__":
+    test_last_closed_candle()
+    test_clock_sync()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+测试已收盘K线缓存
+验证预筛选轮换交易对后，不在本轮的交易对缓存被移除，本轮交易对的缓存保留；
+新K线收盘后只请求新K线，追加到缓存后的指标与重新获取全部K线相同
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+# 添加当前目录到Python路径
+sys.path.insert(0, '.')
+
+import config
+import signal_generator
+from candle_clock import timeframe_ms
+from signal_generator import SignalGenerator, cached_closes, prune_closed_candle_cache
+
+HOUR_MS = timeframe_ms('1h')
+START_MS = 1_700_000_000_000 // HOUR_MS * HOUR_MS
+
+
+class FakeExchange:
+    """按 endTime 返回确定的1h K线，available 之后的K线交易所还没有"""
+
+    def __init__(self, num_candles):
+        rng = np.random.default_rng(1)
+        close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, num_candles)))
+        self.candles = [
+            [START_MS + i * HOUR_MS, c * 0.999, c * 1.004, c * 0.996, c, float(rng.uniform(100, 1000))]
+            for i, c in enumerate(close)
+        ]
+        self.available = num_candles
+        self.limits = []
+
+    def fetch_ohlcv(self, symbol, timeframe, limit, params):
+        self.limits.append(limit)
+        end = min((params['endTime'] - START_MS) // HOUR_MS + 1, self.available)
+        return [list(candle) for candle in self.candles[max(end - limit, 0):end]]
+
+
+def test_prune_closed_candle_cache():
+    """测试按本轮交易对清理缓存"""
+    print("=== 测试K线缓存清理 ===\n")
+    cache = signal_generator._closed_candle_cache
+    cache.clear()
+    for symbol in ['BTC/USDT', 'ETH/USDT', 'DOGE/USDT', 'BTC/USDT:USDT']:
+        cache[(symbol, '1h')] = (0, None)
+        cache[(symbol, 'ATR_4h_14')] = (0, {'atr': 1.0})
+
+    removed = prune_closed_candle_cache(['BTC/USDT', 'ETH/USDT', 'BTC/USDT:USDT'])
+    assert removed == 2, "DOGE/USDT 的两条缓存应被移除"
+    assert {key[0] for key in cache} == {'BTC/USDT', 'ETH/USDT', 'BTC/USDT:USDT'}, "本轮交易对和持仓的缓存应保留"
+    assert cached_closes('DOGE/USDT', '1h') is None, "已移除的交易对没有缓存"
+
+    assert prune_closed_candle_cache([]) == 6, "没有交易对时清空缓存"
+    assert not cache
+    print("✅ K线缓存清理测试通过")
+
+
+def test_append_closed_candles():
+    """测试新K线收盘后只请求新K线"""
+    print("=== 测试K线增量获取 ===\n")
+    signal_generator._closed_candle_cache.clear()
+    exchange = FakeExchange(config.HISTORY_LIMIT + 10)
+
+    def analyze(index):
+        """在第 index 根K线收盘时分析，返回缓存的指标数据"""
+        close_time = START_MS + (index + 1) * HOUR_MS
+        result = SignalGenerator('BTC/USDT', '1h', exchange, close_time).generate_signal(funding_rate_data={})
+        assert 'error' not in result, result
+        return signal_generator._closed_candle_cache[('BTC/USDT', '1h')][1]
+
+    first = config.HISTORY_LIMIT + 5
+    analyze(first)
+    assert exchange.limits == [config.HISTORY_LIMIT]
+    analyze(first + 1)
+    assert exchange.limits[-1] == 2, "只请求新收盘的K线和缓存的最后一根"
+    appended = analyze(first + 3)
+    assert exchange.limits[-1] == 3, "错过的K线一起补上"
+    assert len(appended) == config.HISTORY_LIMIT
+    assert analyze(first + 3) is appended and len(exchange.limits) == 3, "同一根K线直接复用缓存"
+
+    signal_generator._closed_candle_cache.clear()
+    full = analyze(first + 3)
+    assert exchange.limits[-1] == config.HISTORY_LIMIT, "没有缓存时获取全部K线"
+    pd.testing.assert_frame_equal(appended, full, obj="追加K线后的指标应与重新获取全部K线相同")
+
+    # 交易所还没有刚收盘的K线：不分析上一根K线
+    exchange.available = first + 4
+    close_time = START_MS + (first + 5) * HOUR_MS
+    result = SignalGenerator('BTC/USDT', '1h', exchange, close_time).generate_signal(funding_rate_data={})
+    assert 'error' in result, "最新K线不是刚收盘的K线时应返回错误"
+    print("✅ K线增量获取测试通过")
+
+
+if __name__ == "__main__":
+    test_prune_closed_candle_cache()
+    test_append_closed_candles()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+测试组合风控
+验证相关信号分摊风险、对冲信号不受影响，以及总敞口限制下的统一缩放
+"""
+
+import sys
+
+import numpy as np
+
+# 添加当前目录到Python路径
+sys.path.insert(0, '.')
+
+import config
+from notification_system import StrategyType, TradeDirection
+from portfolio_risk import apply_portfolio_limits
+
+ACCOUNT = {
+    "usdt_balance": {'walletBalance': '1000', 'availableBalance': '1000', 'unrealizedProfit': '0'},
+    "open_positions": [],
+}
+
+
+def make_signal(symbol, direction, size_usd=500.0, price=100.0):
+    return {
+        'symbol': symbol, 'strategy_type': StrategyType.TREND_FOLLOWING, 'direction': direction,
+        'entry_price': price, 'stop_loss_price': price * 0.95,
+        'position_size_coin': size_usd / price, 'position_size_usd': size_usd, 'risk_amount_usd': 25.0,
+        'target_price_2r': price * 1.1, 'target_price_3r': price * 1.15, 'atr_value': 2.5,
+        'atr_multiplier': 2.0, 'atr_timeframe': '4h', 'atr_length': 14,
+        'decision_reason': '测试', 'account_balance': 1000.0, 'risk_percent': 0.025,
+    }
+
+
+def closes_from(returns):
+    return 100.0 * np.cumprod(np.concatenate(([1.0], 1.0 + np.asarray(returns))))
+
+
+def test_portfolio_limits():
+    print("=== 测试组合风控 ===\n")
+    saved = config.PORTFOLIO_RISK_CONFIG
+    try:
+        config.PORTFOLIO_RISK_CONFIG = {
+            "enabled": True, "returns_lookback": 168, "max_portfolio_volatility_pct": 100.0,
+            "max_total_exposure": 3.0, "max_margin_usage": 1.0, "leverage": 5, "min_position_scale": 0.1,
+        }
+        pattern_a = np.tile([0.01, -0.01, 0.01, -0.01], 40)
+        pattern_b = np.tile([0.01, 0.01, -0.01, -0.01], 40)
+        long_a = make_signal('A/USDT', TradeDirection.LONG)
+        long_b = make_signal('B/USDT', TradeDirection.LONG)
+
+        # 不相关：仓位不变
+        result = apply_portfolio_limits([long_a, long_b], ACCOUNT,
+                                        {'A/USDT': closes_from(pattern_a), 'B/USDT': closes_from(pattern_b)})
+        assert np.allclose([s['position_size_usd'] for s in result], [500.0, 500.0]), "不相关的信号仓位不变"
+
+        # 完全相关且同向：各自减半
+        result = apply_portfolio_limits([long_a, long_b], ACCOUNT,
+                                        {'A/USDT': closes_from(pattern_a), 'B/USDT': closes_from(pattern_a)})
+        assert np.allclose([s['position_size_usd'] for s in result], [250.0, 250.0]), "同向相关的信号应分摊风险"
+        assert np.isclose(result[0]['risk_amount_usd'], 12.5)
+        assert '组合风控' in result[0]['decision_reason']
+
+        # 完全相关但方向相反（对冲）：仓位不变
+        short_b = make_signal('B/USDT', TradeDirection.SHORT)
+        result = apply_portfolio_limits([long_a, short_b], ACCOUNT,
+                                        {'A/USDT': closes_from(pattern_a), 'B/USDT': closes_from(pattern_a)})
+        assert np.allclose([s['position_size_usd'] for s in result], [500.0, 500.0]), "对冲信号不应缩减"
+
+        # 总敞口：钱包 1000 x 3 = 3000，已有持仓 1000，新开仓 2 x 2000 -> 缩放至 50%
+        account = dict(ACCOUNT, open_positions=[
+            {'symbol': 'C/USDT:USDT', 'side': 'long', 'size': 10.0, 'markPrice': 100.0},
+        ])
+        big_a = make_signal('A/USDT', TradeDirection.LONG, size_usd=2000.0)
+        big_b = make_signal('B/USDT', TradeDirection.LONG, size_usd=2000.0)
+        result = apply_portfolio_limits([big_a, big_b], account, {})
+        print(f"总敞口缩放后仓位: {[s['position_size_usd'] for s in result]}")
+        assert np.allclose([s['position_size_usd'] for s in result], [1000.0, 1000.0]), "超出总敞口时应统一缩放"
+        assert np.isclose(result[0]['position_size_coin'], 10.0)
+
+        # 没有剩余敞口：信号不再发送
+        full = dict(ACCOUNT, open_positions=[
+            {'symbol': 'C/USDT:USDT', 'side': 'long', 'size': 30.0, 'markPrice': 100.0},
+        ])
+        assert apply_portfolio_limits([big_a], full, {}) == [], "敞口已满时不发送新开仓信号"
+    finally:
+        config.PORTFOLIO_RISK_CONFIG = saved
+    print("✅ 组合风控测试通过")
+
+
+if __name__ == "__main__":
+    test_portfolio_limits()
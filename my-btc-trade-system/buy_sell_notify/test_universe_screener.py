@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+测试交易对预筛选
+验证只保留USDT永续、按成交额过滤、固定交易对始终入选，以及 top_k 数量限制
+"""
+
+import logging
+import sys
+
+# 添加当前目录到Python路径
+sys.path.insert(0, '.')
+
+import config
+from universe_screener import screen_universe
+
+
+class FakeExchange:
+    """只提供预筛选用到的两个批量接口"""
+
+    def fapiPublicGetTicker24hr(self):
+        return [
+            {'symbol': 'BTCUSDT', 'lastPrice': '60000', 'highPrice': '61000', 'lowPrice': '59000', 'quoteVolume': '9000000000'},
+            {'symbol': 'ETHUSDT', 'lastPrice': '3000', 'highPrice': '3100', 'lowPrice': '2950', 'quoteVolume': '10000000'},
+            {'symbol': 'SOLUSDT', 'lastPrice': '150', 'highPrice': '165', 'lowPrice': '140', 'quoteVolume': '800000000'},
+            {'symbol': 'WIFUSDT', 'lastPrice': '2', 'highPrice': '2.4', 'lowPrice': '1.8', 'quoteVolume': '300000000'},
+            {'symbol': 'DOGEUSDT', 'lastPrice': '0.1', 'highPrice': '0.101', 'lowPrice': '0.099', 'quoteVolume': '60000000'},
+            {'symbol': 'TINYUSDT', 'lastPrice': '1', 'highPrice': '2', 'lowPrice': '0.5', 'quoteVolume': '1000'},
+            {'symbol': 'BTCUSDT_250328', 'lastPrice': '61000', 'highPrice': '62000', 'lowPrice': '60000', 'quoteVolume': '500000000'},
+            {'symbol': 'ETHBUSD', 'lastPrice': '3000', 'highPrice': '3100', 'lowPrice': '2950', 'quoteVolume': '500000000'},
+        ]
+
+    def fapiPublicGetPremiumIndex(self):
+        return [
+            {'symbol': 'BTCUSDT', 'lastFundingRate': '0.0001'},
+            {'symbol': 'ETHUSDT', 'lastFundingRate': '0.0001'},
+            {'symbol': 'SOLUSDT', 'lastFundingRate': '0.0005'},
+            {'symbol': 'WIFUSDT', 'lastFundingRate': '-0.0010'},
+            {'symbol': 'DOGEUSDT', 'lastFundingRate': '0.0000'},
+            {'symbol': 'TINYUSDT', 'lastFundingRate': '0.0030'},
+            {'symbol': 'BTCUSDT_250328', 'lastFundingRate': ''},
+            {'symbol': 'ETHBUSD', 'lastFundingRate': '0.0001'},
+        ]
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def test_screen_universe():
+    """测试预筛选结果"""
+    print("=== 测试交易对预筛选 ===\n")
+
+    saved = (config.SYMBOLS_TO_ANALYZE, config.UNIVERSE_SCREEN_CONFIG)
+    logger = logging.getLogger("UniverseScreener")
+    handler = RecordingHandler()
+    logger.addHandler(handler)
+    try:
+        config.SYMBOLS_TO_ANALYZE = ['ETH/USDT', 'GONE/USDT']
+        config.UNIVERSE_SCREEN_CONFIG = {
+            "enabled": True,
+            "top_k": 3,
+            "min_quote_volume": 50_000_000,
+            "weights": {"volume": 1.0, "volatility": 1.0, "funding": 0.5},
+        }
+
+        candidates = screen_universe(FakeExchange())
+        symbols = [c['symbol'] for c in candidates]
+        print(f"入选交易对: {symbols}")
+
+        assert len(symbols) == 3, "入选数量应等于 top_k"
+        assert symbols[0] == 'ETH/USDT', "固定交易对应始终入选（成交额低于下限也保留）"
+        assert 'TINY/USDT' not in symbols, "成交额低于下限的合约应被过滤"
+        assert all('_' not in s and s.endswith('/USDT') for s in symbols), "只保留USDT永续合约"
+        assert set(symbols[1:]) == {'SOL/USDT', 'WIF/USDT'}, "高振幅、资金费率极端的合约应排在前面"
+        assert any('GONE/USDT' in message for message in handler.messages), "没有行情的固定交易对应记录日志"
+
+        wif = next(c for c in candidates if c['symbol'] == 'WIF/USDT')
+        assert wif['funding_rate'] == -0.001
+        assert wif['range_pct'] == 0.3
+    finally:
+        config.SYMBOLS_TO_ANALYZE, config.UNIVERSE_SCREEN_CONFIG = saved
+        logger.removeHandler(handler)
+
+    print("✅ 预筛选测试通过")
+
+
+if __name__ == "__main__":
+    test_screen_universe()
@@ -0,0 +1,67 @@
+import logging
+from typing import Any, Dict, List
+
+import ccxt
+import pandas as pd
+
+import config
+
+
+def _to_symbol(market_id: str) -> str:
+    """'BTCUSDT' -> 'BTC/USDT'，与 SYMBOLS_TO_ANALYZE 的写法一致"""
+    return f"{market_id[:-4]}/USDT"
+
+
+def screen_universe(exchange: ccxt.Exchange) -> List[Dict[str, Any]]:
+    """
+    预筛选：两次批量请求（全部合约24h行情 + 全部溢价指数/资金费率）给所有USDT永续合约打分，
+    只把排名前 top_k 的交易对交给多周期分析。
+
+    评分为各项的百分位排名加权：成交额（流动性）、24h振幅（ATR的近似）、资金费率绝对值（情绪极端）。
+    SYMBOLS_TO_ANALYZE 中的交易对始终保留。返回 [{symbol, quote_volume, range_pct, funding_rate, score}]。
+    """
+    logger = logging.getLogger("UniverseScreener")
+    screen_config = config.UNIVERSE_SCREEN_CONFIG
+    weights = screen_config["weights"]
+
+    tickers = pd.DataFrame(exchange.fapiPublicGetTicker24hr())
+    premium = pd.DataFrame(exchange.fapiPublicGetPremiumIndex())
+
+    # 只保留USDT永续（交割合约带 _YYMMDD 后缀）
+    tickers = tickers[tickers['symbol'].str.endswith('USDT') & ~tickers['symbol'].str.contains('_')]
+    df = tickers.merge(premium[['symbol', 'lastFundingRate']], on='symbol', how='inner')
+    for col in ['lastPrice', 'highPrice', 'lowPrice', 'quoteVolume', 'lastFundingRate']:
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+    df = df.dropna(subset=['lastPrice', 'highPrice', 'lowPrice', 'quoteVolume'])
+    df = df[df['lastPrice'] > 0]
+    df['lastFundingRate'] = df['lastFundingRate'].fillna(0.0)
+
+    df['symbol'] = df['symbol'].map(_to_symbol)
+    missing = [symbol for symbol in config.SYMBOLS_TO_ANALYZE if symbol not in set(df['symbol'])]
+    if missing:
+        logger.warning(f"预筛选: 固定交易对没有USDT永续合约行情，本轮不分析: {', '.join(missing)}")
+    df['range_pct'] = (df['highPrice'] - df['lowPrice']) / df['lastPrice']
+    pinned = df['symbol'].isin(config.SYMBOLS_TO_ANALYZE)
+    df = df[pinned | (df['quoteVolume'] >= screen_config["min_quote_volume"])]
+
+    df['score'] = (
+        df['quoteVolume'].rank(pct=True) * weights["volume"]
+        + df['range_pct'].rank(pct=True) * weights["volatility"]
+        + df['lastFundingRate'].abs().rank(pct=True) * weights["funding"]
+    )
+    df = df.sort_values('score', ascending=False)
+
+    selected = df[df['symbol'].isin(config.SYMBOLS_TO_ANALYZE)]
+    others = df[~df['symbol'].isin(config.SYMBOLS_TO_ANALYZE)]
+    selected = pd.concat([selected, others.head(max(screen_config["top_k"] - len(selected), 0))])
+    logger.info(f"预筛选: {len(tickers)} 个USDT永续合约，入选 {len(selected)} 个: {', '.join(selected['symbol'])}")
+
+    return [
+        {
+            'symbol': row.symbol,
+            'quote_volume': float(row.quoteVolume),
+            'range_pct': round(float(row.range_pct), 4),
+            'funding_rate': float(row.lastFundingRate),
+            'score': round(float(row.score), 4),
+        } for row in selected.itertuples()
+    ]